@@ -0,0 +1 @@
+"""Microbenchmarks of pipeline hot paths, see benchmarks/run.py."""
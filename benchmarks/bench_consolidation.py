@@ -0,0 +1,136 @@
+"""Benchmarks of consolidation hot paths: title matching, identity hashing,
+checkpoint saves and OpenAlex enrichment against the local stand-in."""
+
+import queue
+import shutil
+import tempfile
+from pathlib import Path
+
+from compute_forecast.pipeline.consolidation.checkpoint_manager import (
+    ConsolidationCheckpointManager,
+)
+from compute_forecast.pipeline.consolidation.identity import (
+    _CACHE_ATTRIBUTE,
+    IDENTITY_HASH_ALGORITHMS,
+)
+from compute_forecast.pipeline.consolidation.parallel.openalex_worker import (
+    OpenAlexWorker,
+)
+from compute_forecast.pipeline.consolidation.sources.base import SourceConfig
+from compute_forecast.pipeline.consolidation.sources.openalex import OpenAlexSource
+from compute_forecast.pipeline.consolidation.sources.title_matcher import (
+    TitleMatcher,
+)
+from compute_forecast.utils.rate_governor import RateGovernor
+
+from .data import mock_papers, title_variants
+from .http_standin import OpenAlexStandIn
+
+
+class TitleMatcherSuite:
+    params = [1000]
+    param_names = ["papers"]
+
+    def setup(self, size):
+        self.matcher = TitleMatcher()
+        papers = mock_papers(size)
+        self.titles = title_variants(papers)
+        self.pairs = [
+            (variant, paper.title, paper.year, paper.year)
+            for variant, paper in zip(self.titles, papers)
+        ]
+
+    def time_normalize_title(self, size):
+        for title in self.titles:
+            self.matcher.normalize_title(title)
+
+    def time_calculate_similarity(self, size):
+        for title1, title2, year1, year2 in self.pairs:
+            self.matcher.calculate_similarity(title1, title2, year1, year2)
+
+
+class PaperHashSuite:
+    params = list(IDENTITY_HASH_ALGORITHMS)
+    param_names = ["algorithm"]
+
+    def setup(self, algorithm):
+        self.worker = OpenAlexWorker(
+            queue.Queue(),
+            queue.Queue(),
+            queue.Queue(),
+            identity_hash_algorithm=algorithm,
+        )
+        self.papers = mock_papers(1000)
+
+    def time_get_paper_hash(self, algorithm):
+        for paper in self.papers:
+            # Drop the key cached on the paper to measure hashing itself
+            paper.__dict__.pop(_CACHE_ATTRIBUTE, None)
+            self.worker._get_paper_hash(paper)
+
+    def time_get_paper_hash_cached(self, algorithm):
+        for paper in self.papers:
+            self.worker._get_paper_hash(paper)
+
+
+class CheckpointSuite:
+    params = [1000, 10000]
+    param_names = ["papers"]
+
+    def setup(self, size):
+        self.directory = Path(tempfile.mkdtemp(prefix="cf_bench_"))
+        self.manager = ConsolidationCheckpointManager(
+            session_id="benchmark",
+            checkpoint_dir=self.directory,
+            checkpoint_interval_minutes=0,
+        )
+        self.papers = mock_papers(size)
+        self.sources_state = {
+            "openalex": {"papers_processed": size, "api_calls": size // 50}
+        }
+
+    def teardown(self, size):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_save_checkpoint(self, size):
+        self.manager.save_checkpoint(
+            input_file="papers.json",
+            total_papers=size,
+            sources_state=self.sources_state,
+            papers=self.papers,
+            force=True,
+        )
+
+    def time_save_checkpoint_state_only(self, size):
+        self.manager.save_checkpoint(
+            input_file="papers.json",
+            total_papers=size,
+            sources_state=self.sources_state,
+            papers=None,
+            force=True,
+        )
+
+    def time_save_papers_shard(self, size):
+        self.manager.save_papers_shard(0, self.papers[: size // 10])
+
+
+class OpenAlexEnrichmentSuite:
+    params = [200]
+    param_names = ["works"]
+
+    def setup(self, size):
+        self.server = OpenAlexStandIn().start()
+        self.source = OpenAlexSource(SourceConfig(rate_limit=1e6))
+        self.source.base_url = self.server.url
+        # A governor of its own, the process-wide one keeps the most
+        # conservative rate registered by other benchmarks
+        self.source.governor = RateGovernor()
+        self.source.governor.register(self.source.name, 1e6)
+        self.work_ids = [f"W{index:08d}" for index in range(size)]
+
+    def teardown(self, size):
+        self.source.close()
+        self.server.stop()
+
+    def time_fetch_all_fields(self, size):
+        self.source.fetch_all_fields(self.work_ids)
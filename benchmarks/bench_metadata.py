@@ -0,0 +1,95 @@
+"""Benchmarks of metadata collection hot paths: venue normalization, keyword
+scoring, paper serialization and collection checkpoints."""
+
+import os
+import shutil
+import tempfile
+
+from compute_forecast.cli.commands.collect import save_checkpoint
+from compute_forecast.pipeline.metadata_collection.models import Paper
+from compute_forecast.pipeline.metadata_collection.processors.breakthrough_detector import (
+    BreakthroughDetector,
+)
+from compute_forecast.pipeline.metadata_collection.processors.venue_normalizer import (
+    VenueNormalizer,
+)
+from compute_forecast.pipeline.metadata_collection.sources.scrapers.models import (
+    SimplePaper,
+)
+
+from .data import VENUE_VARIANTS, mock_papers
+
+
+class VenueNormalizerSuite:
+    def setup(self):
+        self.normalizer = VenueNormalizer(update_mappings_live=False)
+        self.venues = [paper.venue for paper in mock_papers(500)] + VENUE_VARIANTS
+
+    def time_normalize_venue(self):
+        for venue in self.venues:
+            self.normalizer.normalize_venue(venue)
+
+    def time_normalize_venue_uncached(self):
+        # Fuzzy matches are cached per venue string
+        self.normalizer._fuzzy_cache.clear()
+        for venue in self.venues:
+            self.normalizer.normalize_venue(venue)
+
+
+class KeywordScoreSuite:
+    params = [1000]
+    param_names = ["papers"]
+
+    def setup(self, size):
+        self.detector = BreakthroughDetector()
+        self.papers = mock_papers(size)
+
+    def time_calculate_keyword_score(self, size):
+        for paper in self.papers:
+            self.detector._calculate_keyword_score(paper)
+
+
+class PaperSerializationSuite:
+    params = [1000]
+    param_names = ["papers"]
+
+    def setup(self, size):
+        self.papers = mock_papers(size)
+        self.dicts = [paper.to_dict() for paper in self.papers]
+
+    def time_to_dict(self, size):
+        for paper in self.papers:
+            paper.to_dict()
+
+    def time_from_dict(self, size):
+        for data in self.dicts:
+            Paper.from_dict(data)
+
+
+class CollectCheckpointSuite:
+    params = [1000, 10000]
+    param_names = ["papers"]
+
+    def setup(self, size):
+        # Collection checkpoints are written below the working directory
+        self.previous_directory = os.getcwd()
+        self.directory = tempfile.mkdtemp(prefix="cf_bench_")
+        os.chdir(self.directory)
+        self.papers = [
+            SimplePaper(
+                title=paper.title,
+                authors=[author.name for author in paper.authors],
+                venue=paper.venue,
+                year=paper.year,
+                paper_id=paper.paper_id,
+                source_url=f"https://example.org/{paper.paper_id}",
+            )
+            for paper in mock_papers(size)
+        ]
+
+    def teardown(self, size):
+        os.chdir(self.previous_directory)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_save_checkpoint(self, size):
+        save_checkpoint("neurips", 2024, self.papers)
@@ -0,0 +1,63 @@
+"""Benchmarks of PDF hot paths: fuzzy deduplication of discovered PDFs and
+PDF processing of locally generated documents."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from compute_forecast.pipeline.content_extraction.parser.core.processor import (
+    OptimizedPDFProcessor,
+)
+from compute_forecast.pipeline.content_extraction.parser.extractors.pymupdf_extractor import (
+    PyMuPDFExtractor,
+)
+from compute_forecast.pipeline.pdf_acquisition.discovery.deduplication.matchers import (
+    PaperFuzzyMatcher,
+)
+
+from .data import mock_papers, pdf_records_with_duplicates, write_pdf
+
+
+class FuzzyDeduplicationSuite:
+    # Every pair of records is compared
+    params = [100, 250]
+    param_names = ["records"]
+
+    def setup(self, size):
+        self.matcher = PaperFuzzyMatcher()
+        self.records, self.record_to_paper = pdf_records_with_duplicates(size)
+
+    def time_find_duplicates_fuzzy(self, size):
+        self.matcher.find_duplicates_fuzzy(self.records, dict(self.record_to_paper))
+
+
+class PDFProcessingSuite:
+    params = [2, 8]
+    param_names = ["pages"]
+
+    def setup(self, pages):
+        self.directory = Path(tempfile.mkdtemp(prefix="cf_bench_"))
+        self.papers = mock_papers(5)
+        self.pdfs = [
+            write_pdf(self.directory / f"{paper.paper_id}.pdf", paper, pages=pages)
+            for paper in self.papers
+        ]
+        self.metadata = [
+            {
+                "title": paper.title,
+                "authors": [author.name for author in paper.authors],
+            }
+            for paper in self.papers
+        ]
+        # PyMuPDF returns no affiliations, so processing falls through to the
+        # full text after the affiliation attempt, as it does in production
+        # without a GROBID or Google Vision extractor
+        self.processor = OptimizedPDFProcessor({})
+        self.processor.register_extractor("pymupdf", PyMuPDFExtractor(), level=1)
+
+    def teardown(self, pages):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_process_pdf(self, pages):
+        for pdf, metadata in zip(self.pdfs, self.metadata):
+            self.processor.process_pdf(pdf, metadata)
@@ -0,0 +1,123 @@
+"""Deterministic inputs for the benchmarks.
+
+Papers come from the mock data generator with a fixed seed, PDFs are written
+with PyMuPDF, so every run of a benchmark sees the same input.
+"""
+
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from compute_forecast.pipeline.metadata_collection.models import Paper
+from compute_forecast.pipeline.pdf_acquisition.discovery.core.models import PDFRecord
+from compute_forecast.testing.mock_data.configs import DataQuality, MockDataConfig
+from compute_forecast.testing.mock_data.generators import MockDataGenerator
+
+SEED = 42
+
+# Venue spellings seen in scraped and API metadata
+VENUE_VARIANTS = [
+    "NeurIPS",
+    "neurips 2023",
+    "Advances in Neural Information Processing Systems",
+    "ICML",
+    "Proceedings of the 40th International Conference on Machine Learning",
+    "ICLR 2024",
+    "International Conference on Learning Representations",
+    "CVPR",
+    "IEEE/CVF Conference on Computer Vision and Pattern Recognition",
+    "ACL 2023",
+    "Findings of the Association for Computational Linguistics",
+    "AAAI",
+    "Nature Machine Intelligence",
+    "arXiv preprint",
+    "Unknown Workshop on Things",
+]
+
+# Edits seen between versions of the same title across sources
+TITLE_VARIANTS = [
+    lambda title: title,
+    lambda title: title.upper(),
+    lambda title: title + " (Extended Abstract)",
+    lambda title: title.replace(" ", ": ", 1),
+    lambda title: title + " [arXiv v2]",
+]
+
+
+def mock_papers(size: int, quality: DataQuality = DataQuality.NORMAL) -> List[Paper]:
+    """Mock papers, the same for every call with the same size."""
+    return MockDataGenerator().generate(
+        MockDataConfig(quality=quality, size=size, seed=SEED)
+    )
+
+
+def title_variants(papers: List[Paper]) -> List[str]:
+    """Titles of papers with the edits of TITLE_VARIANTS applied in turn."""
+    return [
+        TITLE_VARIANTS[index % len(TITLE_VARIANTS)](paper.title)
+        for index, paper in enumerate(papers)
+    ]
+
+
+def pdf_records_with_duplicates(
+    size: int,
+) -> Tuple[List[PDFRecord], Dict[str, Paper]]:
+    """PDF records of mock papers, a tenth of them found again by a second
+    source under an edited title."""
+    rng = random.Random(SEED)
+    papers = mock_papers(size)
+    records = []
+    record_to_paper = {}
+    timestamp = datetime(2024, 1, 1)
+
+    def add(paper: Paper, source: str) -> None:
+        record = PDFRecord(
+            paper_id=f"{source}-{paper.paper_id}",
+            pdf_url=f"https://{source}.example.org/{paper.paper_id}.pdf",
+            source=source,
+            discovery_timestamp=timestamp,
+            confidence_score=0.9,
+            version_info={},
+            validation_status="valid",
+        )
+        records.append(record)
+        record_to_paper[record.paper_id] = paper
+
+    for paper in papers:
+        add(paper, "openreview")
+    for paper in rng.sample(papers, size // 10):
+        duplicate = Paper.from_dict(paper.to_dict())
+        duplicate.title = rng.choice(TITLE_VARIANTS[1:])(paper.title)
+        add(duplicate, "arxiv")
+    return records, record_to_paper
+
+
+def write_pdf(path: Path, paper: Paper, pages: int = 8) -> Path:
+    """Write a PDF with an affiliation header and filler body text."""
+    import fitz
+
+    rng = random.Random(f"{SEED}-{paper.paper_id}")
+    document = fitz.open()
+    header = [paper.title, ""]
+    for author in paper.authors:
+        header.append(author.name)
+        header.append(author.affiliations[0] if author.affiliations else "Mila")
+    header += ["", "Abstract", paper.get_best_abstract()]
+
+    body_words = (
+        "we train the model on 8 NVIDIA A100 GPUs for 72 hours with a batch "
+        "size of 256 using the Adam optimizer and a learning rate of 3e-4 "
+        "the dataset contains 1.2 million images and the network has 350M "
+        "parameters results improve over the baseline on every benchmark"
+    ).split()
+    for page_number in range(pages):
+        page = document.new_page()
+        lines = header if page_number == 0 else []
+        lines = lines + [
+            " ".join(rng.choice(body_words) for _ in range(14)) for _ in range(45)
+        ]
+        page.insert_textbox(page.rect + (50, 50, -50, -50), "\n".join(lines))
+    document.save(path)
+    document.close()
+    return path
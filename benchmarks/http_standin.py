@@ -0,0 +1,126 @@
+"""Local stand-in for the OpenAlex works API.
+
+Serves deterministic works for the filters and searches the consolidation
+sources send, so that benchmarks measure request handling and response
+parsing without the network or rate limits.
+"""
+
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+
+def openalex_work(work_id: str, title: str = "", year: int = 2023) -> Dict[str, Any]:
+    """An OpenAlex work with every field the enrichment reads."""
+    number = sum(ord(c) for c in work_id)
+    abstract = (
+        "we scale transformer training to thousands of accelerators and report "
+        "the compute used by every experiment"
+    ).split()
+    return {
+        "id": work_id,
+        "title": title or f"Work {work_id}",
+        "publication_year": year,
+        "cited_by_count": number % 500,
+        "abstract_inverted_index": {
+            word: [position] for position, word in enumerate(abstract)
+        },
+        "ids": {
+            "openalex": work_id,
+            "doi": f"https://doi.org/10.1234/{work_id.lower()}",
+            "mag": str(number),
+        },
+        "authorships": [
+            {
+                "author": {"display_name": f"Author {i}"},
+                "institutions": [{"display_name": f"University {number % 7}"}],
+            }
+            for i in range(3)
+        ],
+        "primary_location": {"pdf_url": f"https://example.org/{work_id}.pdf"},
+        "locations": [
+            {"pdf_url": f"https://example.org/{work_id}.pdf"},
+            {"pdf_url": f"https://mirror.example.org/{work_id}.pdf"},
+        ],
+        "concepts": [{"display_name": "Machine learning", "score": 0.9}],
+    }
+
+
+class _OpenAlexHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path != "/works":
+            self.send_error(404)
+            return
+
+        results: List[Dict[str, Any]] = []
+        filter_value = query.get("filter", "")
+        if filter_value.startswith("openalex:"):
+            results = [
+                openalex_work(work_id)
+                for work_id in filter_value[len("openalex:") :].split("|")
+            ]
+        elif filter_value.startswith("doi:"):
+            results = [
+                {"id": f"W{zlib.crc32(doi.encode())}", "doi": f"https://doi.org/{doi}"}
+                for doi in filter_value[len("doi:") :].split("|")
+            ]
+        elif "search" in query:
+            year = filter_value.partition("publication_year:")[2]
+            results = [
+                openalex_work(
+                    f"W{zlib.crc32(query['search'].encode())}",
+                    title=query["search"],
+                    year=int(year) if year.isdigit() else 2023,
+                )
+            ]
+
+        body = json.dumps({"results": results}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class OpenAlexStandIn:
+    """OpenAlex stand-in served from a background thread on localhost.
+
+    Usage:
+        with OpenAlexStandIn() as server:
+            source.base_url = server.url
+    """
+
+    def __init__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _OpenAlexHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "OpenAlexStandIn":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "OpenAlexStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,361 @@
+"""Run the microbenchmarks and record their timings per commit.
+
+Benchmarks are classes in the bench_* modules following the asv conventions:
+methods named time_* are timed after setup(*params) and before
+teardown(*params), once per combination of the class params. The suite also
+runs under asv with the asv.conf.json at the repository root; this runner
+needs nothing beyond the package itself:
+
+    python -m benchmarks.run                          # every benchmark
+    python -m benchmarks.run -b Checkpoint            # names matching a regex
+    python -m benchmarks.run --quick                  # a single timing each
+    python -m benchmarks.run --compare <commit>       # against a recorded commit
+
+Timings within one process are correlated, so each benchmark is timed in
+several fresh processes pinned to one CPU, and the timings of all processes
+make up its samples. Timings of each run are written to
+<results-dir>/<commit>.json, merged with earlier runs of the same commit.
+Comparisons use Mann-Whitney U tests and bootstrap intervals over the
+samples.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from compute_forecast.testing.integration.regression_statistics import (
+    compare_samples,
+)
+from compute_forecast.testing.integration.repeated_runs import (
+    RepeatedRunner,
+    default_cpus,
+    pin_to_cpus,
+)
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_RESULTS_DIR = BENCHMARK_DIR / "results"
+BENCHMARK_PREFIX = "time_"
+
+
+@dataclass
+class Benchmark:
+    """One timed method of a benchmark class with one set of parameters"""
+
+    suite: type
+    method: str
+    params: Tuple[Any, ...]
+    param_names: List[str]
+
+    @property
+    def name(self) -> str:
+        name = f"{self.suite.__module__.rsplit('.', 1)[-1]}.{self.suite.__name__}.{self.method}"
+        if self.params:
+            arguments = ", ".join(
+                f"{param_name}={value}"
+                for param_name, value in zip(self.param_names, self.params)
+            )
+            name += f"({arguments})"
+        return name
+
+
+def _param_combinations(suite: type) -> Tuple[List[Tuple[Any, ...]], List[str]]:
+    """Parameter tuples of a suite, following the asv params conventions"""
+    params = getattr(suite, "params", [])
+    if not params:
+        return [()], []
+    param_names = list(getattr(suite, "param_names", []))
+    # A flat list is a single parameter, a list of lists one per parameter
+    if not all(isinstance(values, (list, tuple)) for values in params):
+        params = [params]
+    if len(param_names) != len(params):
+        param_names = [f"param{index + 1}" for index in range(len(params))]
+    return list(itertools.product(*params)), param_names
+
+
+def discover(pattern: Optional[str] = None) -> List[Benchmark]:
+    """Benchmarks of the bench_* modules whose name matches pattern"""
+    benchmarks = []
+    for module_path in sorted(BENCHMARK_DIR.glob("bench_*.py")):
+        module = importlib.import_module(f"{__package__}.{module_path.stem}")
+        for _, suite in inspect.getmembers(module, inspect.isclass):
+            if suite.__module__ != module.__name__:
+                continue
+            combinations, param_names = _param_combinations(suite)
+            for method in sorted(vars(suite)):
+                if not method.startswith(BENCHMARK_PREFIX):
+                    continue
+                for params in combinations:
+                    benchmark = Benchmark(suite, method, params, param_names)
+                    if pattern is None or re.search(pattern, benchmark.name):
+                        benchmarks.append(benchmark)
+    return benchmarks
+
+
+def measure_benchmark(
+    benchmark: Benchmark, repeat: int = 5, quick: bool = False
+) -> Dict[str, Any]:
+    """Time a benchmark, seconds per call of its method.
+
+    The number of calls per timing is chosen by timeit so that a timing
+    lasts at least 0.2 seconds, which also warms the benchmark up.
+    """
+    instance = benchmark.suite()
+    if hasattr(instance, "setup"):
+        instance.setup(*benchmark.params)
+    try:
+        method = getattr(instance, benchmark.method)
+        timer = timeit.Timer(lambda: method(*benchmark.params))
+        if quick:
+            number, samples = 1, timer.repeat(repeat=1, number=1)
+        else:
+            number, _ = timer.autorange()
+            samples = timer.repeat(repeat=repeat, number=number)
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*benchmark.params)
+
+    per_call = [sample / number for sample in samples]
+    return {
+        "samples": per_call,
+        "median": statistics.median(per_call),
+        "number": number,
+    }
+
+
+def measure_benchmarks(
+    pattern: Optional[str], repeat: int = 5, quick: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Time the benchmarks matching pattern in this process"""
+    # Log records are still created, but not written out during timings
+    logging.getLogger().addHandler(logging.NullHandler())
+
+    results = {}
+    for benchmark in discover(pattern):
+        results[benchmark.name] = measure_benchmark(benchmark, repeat, quick)
+        print(f"  {benchmark.name} {_format_time(results[benchmark.name]['median'])}")
+    return results
+
+
+def merge_measurements(
+    measurements: List[Dict[str, Dict[str, Any]]],
+) -> Dict[str, Dict[str, Any]]:
+    """Combine the timings of each benchmark from several processes"""
+    merged = {}
+    for name in measurements[0]:
+        samples = [
+            sample
+            for measurement in measurements
+            for sample in measurement[name]["samples"]
+        ]
+        merged[name] = {
+            "samples": samples,
+            "median": statistics.median(samples),
+            "number": [measurement[name]["number"] for measurement in measurements],
+            "processes": len(measurements),
+        }
+    return merged
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=BENCHMARK_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def current_commit() -> str:
+    """Short hash of HEAD, marked dirty when tracked files are modified"""
+    commit = _git("rev-parse", "--short=12", "HEAD") or "unknown"
+    if _git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+    return commit
+
+
+def record_results(
+    results: Dict[str, Dict[str, Any]], results_dir: Path, commit: str
+) -> Path:
+    """Merge results into the results file of commit"""
+    results_dir.mkdir(parents=True, exist_ok=True)
+    path = results_dir / f"{commit}.json"
+    record: Dict[str, Any] = {"results": {}}
+    if path.exists():
+        with open(path) as f:
+            record = json.load(f)
+
+    record.update(
+        {
+            "commit": commit,
+            "date": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "machine": {
+                "node": platform.node(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "cpu_count": os.cpu_count(),
+            },
+        }
+    )
+    record["results"].update(results)
+
+    temp_path = path.with_suffix(".json.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(record, f, indent=2, sort_keys=True)
+    temp_path.replace(path)
+    return path
+
+
+def load_results(results_dir: Path, commit: str) -> Dict[str, Dict[str, Any]]:
+    """Recorded results of the commit whose hash starts with commit"""
+    matches = sorted(results_dir.glob(f"{commit}*.json"))
+    if len(matches) > 1:
+        # Prefer the clean results of a commit over its dirty runs
+        matches = [
+            match
+            for match in matches
+            if match.stem == commit or not match.stem.endswith("-dirty")
+        ]
+    if not matches:
+        raise FileNotFoundError(f"No results recorded for {commit} in {results_dir}")
+    if len(matches) > 1:
+        names = ", ".join(match.stem for match in matches)
+        raise ValueError(f"Commit {commit} is ambiguous: {names}")
+    with open(matches[0]) as f:
+        results: Dict[str, Dict[str, Any]] = json.load(f)["results"]
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> List[Tuple[str, str]]:
+    """Print a comparison of the benchmarks in both results.
+
+    Returns:
+        (name, verdict) of every compared benchmark
+    """
+    verdicts = []
+    names = sorted(set(baseline) & set(current))
+    width = max((len(name) for name in names), default=9)
+    print(
+        f"\n{'benchmark':<{width}} {'before':>10} {'after':>10} {'change':>8}  verdict"
+    )
+    for name in names:
+        comparison = compare_samples(
+            name, baseline[name]["samples"], current[name]["samples"]
+        )
+        verdicts.append((name, comparison.verdict))
+        print(
+            f"{name:<{width}} {_format_time(comparison.baseline_median):>10} "
+            f"{_format_time(comparison.current_median):>10} "
+            f"{comparison.change_percent:>+8.1%}  {comparison.verdict}"
+        )
+    return verdicts
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-b", "--bench", help="Regex selecting benchmark names")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timings per benchmark and process (default 5)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=3,
+        help="Fresh processes timing every benchmark, 0 to time in this "
+        "process (default 3)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Time one call per benchmark"
+    )
+    parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=DEFAULT_RESULTS_DIR,
+        help="Directory of the per-commit results files",
+    )
+    parser.add_argument(
+        "--compare", metavar="COMMIT", help="Compare with the results of COMMIT"
+    )
+    parser.add_argument(
+        "--no-record", action="store_true", help="Do not write the results"
+    )
+    parser.add_argument(
+        "--no-pin", action="store_true", help="Do not pin the process to one CPU"
+    )
+    args = parser.parse_args(argv)
+
+    benchmarks = discover(args.bench)
+    if not benchmarks:
+        print("No benchmarks selected")
+        return 1
+
+    if args.quick:
+        args.processes = min(args.processes, 1)
+
+    if args.processes == 0:
+        if not args.no_pin:
+            cpus = default_cpus()
+            if cpus and pin_to_cpus(cpus):
+                print(f"Pinned to CPU {cpus[0]}")
+        measurements = [measure_benchmarks(args.bench, args.repeat, args.quick)]
+    else:
+        runner = RepeatedRunner(
+            repetitions=args.processes, warmup=0, pin_cpu=not args.no_pin
+        )
+        print(f"Timing {len(benchmarks)} benchmarks in {args.processes} processes")
+        measurements = runner.run(
+            measure_benchmarks, args.bench, args.repeat, args.quick
+        )
+    results = merge_measurements(measurements)
+
+    width = max(len(name) for name in results)
+    print()
+    for name, result in results.items():
+        print(f"{name:<{width}} {_format_time(result['median']):>10}")
+
+    if not args.no_record:
+        commit = current_commit()
+        path = record_results(results, args.results_dir, commit)
+        print(f"\nRecorded {len(results)} results for {commit} in {path}")
+
+    if args.compare:
+        verdicts = compare_results(
+            load_results(args.results_dir, args.compare), results
+        )
+        if any(verdict == "regression" for _, verdict in verdicts):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
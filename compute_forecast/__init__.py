@@ -11,19 +11,38 @@ This package provides tools for:
 __version__ = "0.1.0"
 __author__ = "Compute Forecast Team"
 
-# Core modules
-from . import pipeline
-from . import core
-from . import monitoring
-from . import orchestration
-from . import quality
-from . import testing
-
-# Module aliases for backward compatibility and test imports
-from .pipeline.pdf_acquisition import discovery as pdf_discovery
-from .pipeline import metadata_collection
-from .pipeline import content_extraction as extraction
-from .pipeline.metadata_collection import processors as data
+import importlib
+from typing import Any
+
+# Submodules and aliases are imported on first access, so entry points such as
+# the CLI only pay for the parts of the package they use.
+_LAZY_MODULES = {
+    # Core modules
+    "pipeline": ".pipeline",
+    "core": ".core",
+    "monitoring": ".monitoring",
+    "orchestration": ".orchestration",
+    "quality": ".quality",
+    "testing": ".testing",
+    # Module aliases for backward compatibility and test imports
+    "pdf_discovery": ".pipeline.pdf_acquisition.discovery",
+    "metadata_collection": ".pipeline.metadata_collection",
+    "extraction": ".pipeline.content_extraction",
+    "data": ".pipeline.metadata_collection.processors",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_MODULES))
+
 
 __all__ = [
     "__version__",
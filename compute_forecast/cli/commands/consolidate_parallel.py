@@ -28,9 +28,16 @@ from compute_forecast.pipeline.consolidation.checkpoint_manager import (
 from compute_forecast.pipeline.consolidation.models_extended import (
     ConsolidationPhaseState,
 )
+from compute_forecast.pipeline.consolidation.identity import (
+    DEFAULT_IDENTITY_HASH_ALGORITHM,
+    IDENTITY_HASH_ALGORITHMS,
+)
 from compute_forecast.utils.profiling import PerformanceProfiler, set_profiler
 from compute_forecast.cli.utils.logging_handler import RichConsoleHandler
-from compute_forecast.cli.utils.consolidation_io import load_papers, save_papers
+from compute_forecast.cli.utils.consolidation_io import (
+    load_papers,
+    save_paper_records,
+)
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -117,6 +124,17 @@ def main(
     checkpoint_interval: float = typer.Option(
         5.0, "--checkpoint-interval", help="Minutes between checkpoints (0 to disable)"
     ),
+    merge_shards: int = typer.Option(
+        1,
+        "--merge-shards",
+        min=1,
+        help="Number of merge workers, each owning a partition of the papers",
+    ),
+    identity_hash: str = typer.Option(
+        DEFAULT_IDENTITY_HASH_ALGORITHM,
+        "--identity-hash",
+        help=f"Paper identity hash algorithm ({', '.join(IDENTITY_HASH_ALGORITHMS)}); resumed sessions keep their own",
+    ),
     phase1_batch_size: int = typer.Option(
         1, "--phase1-batch-size", help="Batch size for Phase 1 (OpenAlex ID harvesting)"
     ),
@@ -344,6 +362,8 @@ def main(
         console.print("\n[yellow]DRY RUN - Parallel consolidation:[/yellow]")
         console.print(f"  Papers: {len(papers)}")
         console.print(f"  Checkpoint interval: {checkpoint_interval} minutes")
+        console.print(f"  Merge shards: {merge_shards}")
+        console.print(f"  Identity hash: {identity_hash}")
         return
 
     # Create consolidator
@@ -354,12 +374,14 @@ def main(
         ss_batch_size=1,  # Always 1 for title search
         checkpoint_manager=checkpoint_manager,
         checkpoint_interval=checkpoint_interval * 60,  # Convert to seconds
+        merge_shards=merge_shards,
+        identity_hash_algorithm=identity_hash,
     )
 
-    # Load checkpoint state if resuming
-    existing_papers = []
+    # Load checkpoint state if resuming. Papers both sources already
+    # processed are part of the output without being merged again.
     if resume and phase_state:
-        existing_papers = consolidator.load_checkpoint(phase_state)
+        consolidator.load_checkpoint(phase_state)
 
     # Create custom progress column
     progress_column = ParallelProgressColumn()
@@ -395,7 +417,8 @@ def main(
             "[green]Semantic Scholar[/green]", total=len(papers)
         )
 
-        # If resuming, set initial progress
+        # If resuming, show the starting statistics. The consolidator reports
+        # the already processed papers as initial progress.
         if resume and (
             actual_stats or (checkpoint_data and hasattr(checkpoint_data, "sources"))
         ):
@@ -408,26 +431,9 @@ def main(
             oa_stats = stats_to_use.get("openalex", {})
             ss_stats = stats_to_use.get("semantic_scholar", {})
 
-            # Set initial progress
             oa_processed = oa_stats.get("papers_processed", 0)
             ss_processed = ss_stats.get("papers_processed", 0)
 
-            if oa_processed > 0:
-                progress.update(openalex_task, completed=oa_processed)
-                progress_column.update_stats(
-                    openalex_task,
-                    oa_stats.get("citations_found", 0),
-                    oa_stats.get("abstracts_found", 0),
-                )
-
-            if ss_processed > 0:
-                progress.update(ss_task, completed=ss_processed)
-                progress_column.update_stats(
-                    ss_task,
-                    ss_stats.get("citations_found", 0),
-                    ss_stats.get("abstracts_found", 0),
-                )
-
             # Log the actual statistics being used
             console.print("\n[cyan]Starting with statistics:[/cyan]")
             console.print(
@@ -462,7 +468,7 @@ def main(
             else:
                 checkpoint_stats = checkpoint_data.sources
 
-        enriched_papers = consolidator.process_papers(
+        consolidator.consolidate(
             papers,
             update_progress,
             input_file=str(input),
@@ -470,31 +476,23 @@ def main(
             checkpoint_stats=checkpoint_stats,
         )
 
-        # Merge with any existing papers from checkpoint
-        if existing_papers:
-            # Create a dict for fast lookup
-            enriched_dict = {p.paper_id: p for p in enriched_papers}
-
-            # Add any papers from checkpoint that aren't in the new results
-            for existing_paper in existing_papers:
-                if existing_paper.paper_id not in enriched_dict:
-                    enriched_papers.append(existing_paper)
-
         duration = (datetime.now() - start_time).total_seconds()
 
         # Ensure progress shows 100%
         progress.update(openalex_task, completed=len(papers))
         progress.update(ss_task, completed=len(papers))
 
-    # Calculate enrichment statistics
-    citation_count = sum(1 for p in enriched_papers if p.citations)
-    abstract_count = sum(1 for p in enriched_papers if p.abstracts)
-    doi_count = sum(1 for p in enriched_papers if p.doi)
-    arxiv_count = sum(1 for p in enriched_papers if p.arxiv_id)
+    # Enrichment statistics, counted by the merge shards
+    output_counts = consolidator.output_counts()
+    total_papers = output_counts["total_papers"]
+    citation_count = output_counts["papers_with_citations"]
+    abstract_count = output_counts["papers_with_abstracts"]
+    doi_count = output_counts["papers_with_dois"]
+    arxiv_count = output_counts["papers_with_arxiv"]
 
     # Collect statistics for save_papers
     stats = {
-        "total_papers": len(enriched_papers),
+        "total_papers": total_papers,
         "duration_seconds": duration,
         "papers_per_second": len(papers) / duration,
         "papers_with_citations": citation_count,
@@ -504,31 +502,31 @@ def main(
         "method": "parallel",
     }
 
-    # Save results
+    # Save results, streamed from the merge shards
     console.print(
-        f"\n[cyan]Saving {len(enriched_papers)} enriched papers to {output}...[/cyan]"
+        f"\n[cyan]Saving {total_papers} enriched papers to {output}...[/cyan]"
     )
-    save_papers(enriched_papers, output, stats)
+    save_paper_records(consolidator.iter_output_records(), output, stats)
 
     # Report summary
     console.print("\n[green]Consolidation Complete:[/green]")
-    console.print(f"  Total papers: {len(enriched_papers)}")
+    console.print(f"  Total papers: {total_papers}")
     console.print(f"  Duration: {duration:.1f}s")
     console.print(f"  Papers/second: {len(papers) / duration:.1f}")
 
     # Report enrichment statistics
     console.print("\n[green]Enrichment Statistics:[/green]")
     console.print(
-        f"  Papers with citations: {citation_count} ({citation_count / len(enriched_papers) * 100:.1f}%)"
+        f"  Papers with citations: {citation_count} ({citation_count / total_papers * 100:.1f}%)"
     )
     console.print(
-        f"  Papers with abstracts: {abstract_count} ({abstract_count / len(enriched_papers) * 100:.1f}%)"
+        f"  Papers with abstracts: {abstract_count} ({abstract_count / total_papers * 100:.1f}%)"
     )
     console.print(
-        f"  Papers with DOIs: {doi_count} ({doi_count / len(enriched_papers) * 100:.1f}%)"
+        f"  Papers with DOIs: {doi_count} ({doi_count / total_papers * 100:.1f}%)"
     )
     console.print(
-        f"  Papers with ArXiv IDs: {arxiv_count} ({arxiv_count / len(enriched_papers) * 100:.1f}%)"
+        f"  Papers with ArXiv IDs: {arxiv_count} ({arxiv_count / total_papers * 100:.1f}%)"
     )
 
     if profile and profiler:
@@ -11,9 +11,14 @@ from datetime import datetime
 from compute_forecast.pipeline.consolidation.checkpoint_manager import (
     ConsolidationCheckpointManager,
 )
+from compute_forecast.pipeline.consolidation.session_catalog import (
+    count_enriched_papers,
+)
 
 console = Console()
 
+app = typer.Typer(help="Manage consolidation sessions")
+
 
 def list_sessions(
     checkpoint_dir: Path = typer.Option(
@@ -91,79 +96,35 @@ def list_sessions(
                 enriched = ss.get("papers_enriched", 0)
                 ss_stats = f"{papers}p/{enriched}e"
 
-        # Try to get actual statistics from enriched papers file
-        session_dir = checkpoint_dir / session["session_id"]
-        enriched_file = session_dir / "papers_enriched.json"
-
-        if enriched_file.exists():
-            try:
-                import json
-
-                with open(enriched_file) as f:
-                    data = json.load(f)
-
-                papers_data = data.get("papers", [])
-
-                # Count actual enriched papers from each source
-                oa_enriched_count = 0
-                ss_enriched_count = 0
-
-                for paper in papers_data:
-                    # Check OpenAlex
-                    has_oa_data = False
-                    if paper.get("openalex_id"):
-                        has_oa_data = True
-                    elif paper.get("citations"):
-                        for citation in paper["citations"]:
-                            if citation.get("source") == "openalex":
-                                has_oa_data = True
-                                break
-                    elif paper.get("abstracts"):
-                        for abstract in paper["abstracts"]:
-                            if abstract.get("source") == "openalex":
-                                has_oa_data = True
-                                break
-
-                    if has_oa_data:
-                        oa_enriched_count += 1
-
-                    # Check Semantic Scholar
-                    has_ss_data = False
-                    if hasattr(paper, "external_ids") and paper.get(
-                        "external_ids", {}
-                    ).get("semantic_scholar"):
-                        has_ss_data = True
-                    elif paper.get("citations"):
-                        for citation in paper["citations"]:
-                            if citation.get("source") == "semanticscholar":
-                                has_ss_data = True
-                                break
-                    elif paper.get("abstracts"):
-                        for abstract in paper["abstracts"]:
-                            if abstract.get("source") == "semanticscholar":
-                                has_ss_data = True
-                                break
-
-                    if has_ss_data:
-                        ss_enriched_count += 1
-
-                # Update stats with actual counts
-                if "source_stats" in session:
-                    if "openalex" in session["source_stats"]:
-                        papers = session["source_stats"]["openalex"].get(
-                            "papers_processed", 0
-                        )
-                        oa_stats = f"{papers}p/{oa_enriched_count}e"
-
-                    if "semantic_scholar" in session["source_stats"]:
-                        papers = session["source_stats"]["semantic_scholar"].get(
-                            "papers_processed", 0
-                        )
-                        ss_stats = f"{papers}p/{ss_enriched_count}e"
-
-            except Exception:
-                # If we can't read the file, fall back to checkpoint stats
-                pass
+        # Actual enriched counts, from the catalog or the enriched papers file
+        enriched_counts = session.get("enriched_counts")
+        if enriched_counts is None:
+            session_dir = checkpoint_dir / session["session_id"]
+            enriched_file = session_dir / "papers_enriched.json"
+
+            if enriched_file.exists():
+                try:
+                    import json
+
+                    with open(enriched_file) as f:
+                        data = json.load(f)
+
+                    enriched_counts = count_enriched_papers(data.get("papers", []))
+                except Exception:
+                    # If we can't read the file, fall back to checkpoint stats
+                    pass
+
+        # Update stats with actual counts
+        if enriched_counts is not None and "source_stats" in session:
+            if "openalex" in session["source_stats"]:
+                papers = session["source_stats"]["openalex"].get("papers_processed", 0)
+                oa_stats = f"{papers}p/{enriched_counts['openalex']}e"
+
+            if "semantic_scholar" in session["source_stats"]:
+                papers = session["source_stats"]["semantic_scholar"].get(
+                    "papers_processed", 0
+                )
+                ss_stats = f"{papers}p/{enriched_counts['semantic_scholar']}e"
 
         # Add row
         table.add_row(
@@ -251,3 +212,31 @@ def clean_sessions(
             console.print(f"[red]Failed to clean {session['session_id']}: {e}[/red]")
 
     console.print(f"\n[green]Cleaned {cleaned} session(s).[/green]")
+
+
+def reindex_sessions(
+    checkpoint_dir: Path = typer.Option(
+        Path(".cf_state/consolidate"), "--checkpoint-dir", help="Checkpoint directory"
+    ),
+    skip_enriched_counts: bool = typer.Option(
+        False,
+        "--skip-enriched-counts",
+        help="Do not load the papers files to count enriched papers",
+    ),
+):
+    """
+    Rebuild the session catalog, e.g. after upgrading from a version without it.
+    """
+    if not checkpoint_dir.exists():
+        console.print("[yellow]No consolidation sessions found.[/yellow]")
+        return
+
+    indexed = ConsolidationCheckpointManager.reindex_sessions(
+        checkpoint_dir, count_enriched=not skip_enriched_counts
+    )
+    console.print(f"[green]Indexed {indexed} session(s).[/green]")
+
+
+app.command(name="list")(list_sessions)
+app.command(name="clean")(clean_sessions)
+app.command(name="reindex")(reindex_sessions)
@@ -62,6 +62,13 @@ def main(
     min_overall: Optional[float] = typer.Option(
         None, "--min-overall", help="Minimum overall quality score (0.0-1.0)"
     ),
+    near_duplicate_threshold: Optional[float] = typer.Option(
+        None,
+        "--near-duplicate-threshold",
+        min=0.0,
+        max=1.0,
+        help="Minimum title similarity of near-duplicate papers (0.0-1.0, 0 disables)",
+    ),
     fail_on_critical: bool = typer.Option(
         True,
         "--fail-on-critical/--no-fail-on-critical",
@@ -123,6 +130,8 @@ def main(
         thresholds["consistency"] = min_consistency
     if min_overall is not None:
         thresholds["overall"] = min_overall
+    if near_duplicate_threshold is not None:
+        thresholds["near_duplicate_similarity"] = near_duplicate_threshold
 
     # Prepare configuration
     config = QualityConfig(
@@ -0,0 +1,63 @@
+"""Typer group that imports command modules only when a command runs."""
+
+import importlib
+from typing import Dict, List, Tuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """Command group whose commands are loaded from "module:attribute" paths.
+
+    The attribute is either a command function or a Typer app for a nested
+    group. Help listings use the registered help text, so ``cf --help`` and
+    ``cf --version`` import none of the command modules.
+    """
+
+    lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listing_help = False
+
+    # Contexts and commands are left unannotated, as recent typer releases
+    # vendor their own click types
+
+    def list_commands(self, ctx) -> List[str]:
+        names = list(super().list_commands(ctx))
+        return names + [name for name in self.lazy_commands if name not in names]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name not in self.lazy_commands or cmd_name in self.commands:
+            return super().get_command(ctx, cmd_name)
+
+        import_path, help_text = self.lazy_commands[cmd_name]
+        if self._listing_help:
+            return TyperCommand(cmd_name, help=help_text)
+
+        command = self._load_command(cmd_name, import_path)
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx, formatter):
+        self._listing_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+    @staticmethod
+    def _load_command(cmd_name: str, import_path: str):
+        module_name, attribute = import_path.split(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_command(target)
+        else:
+            app = typer.Typer()
+            app.command(name=cmd_name)(target)
+            command = typer.main.get_command(app)
+
+        command.name = cmd_name
+        return command
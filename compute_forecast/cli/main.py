@@ -3,11 +3,35 @@
 import typer
 from typing import Optional
 from .. import __version__
-from .commands.collect import main as collect_command
-from .commands.consolidate_sessions import list_sessions, clean_sessions
-from .commands.consolidate_parallel import main as consolidate_parallel_command
-from .commands.quality import main as quality_command
-from .commands.download import main as download_command
+from .lazy_group import LazyTyperGroup
+
+
+class CommandGroup(LazyTyperGroup):
+    """Top-level commands, imported only when invoked"""
+
+    lazy_commands = {
+        "collect": (
+            "compute_forecast.cli.commands.collect:main",
+            "Collect research papers from various venues and years.",
+        ),
+        "consolidate": (  # Use parallel version
+            "compute_forecast.cli.commands.consolidate_parallel:main",
+            "Parallel consolidation and enrichment of paper metadata.",
+        ),
+        "download": (
+            "compute_forecast.cli.commands.download:main",
+            "Download PDFs using URLs discovered by consolidate command.",
+        ),
+        "quality": (
+            "compute_forecast.cli.commands.quality:main",
+            "Run quality checks on compute-forecast data.",
+        ),
+        # Subcommand group for consolidation sessions
+        "consolidate-sessions": (
+            "compute_forecast.cli.commands.consolidate_sessions:app",
+            "Manage consolidation sessions",
+        ),
+    }
 
 
 app = typer.Typer(
@@ -16,22 +40,9 @@ app = typer.Typer(
     "A tool for collecting and analyzing computational requirements from ML research papers "
     "to project future infrastructure needs.",
     add_completion=False,
+    cls=CommandGroup,
 )
 
-# Register the collect command
-app.command(name="collect")(collect_command)
-app.command(name="consolidate")(consolidate_parallel_command)  # Use parallel version
-app.command(name="download")(download_command)
-
-# Create a subcommand group for consolidation sessions
-consolidate_sessions_app = typer.Typer(help="Manage consolidation sessions")
-consolidate_sessions_app.command(name="list")(list_sessions)
-consolidate_sessions_app.command(name="clean")(clean_sessions)
-app.add_typer(consolidate_sessions_app, name="consolidate-sessions")
-
-# Register the quality command
-app.command(name="quality")(quality_command)
-
 
 def version_callback(value: bool):
     """Show version and exit."""
@@ -1,9 +1,10 @@
 """Shared utilities for consolidation commands - I/O operations."""
 
 import json
+import textwrap
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, Iterable, List
 
 from compute_forecast.pipeline.metadata_collection.models import Paper
 
@@ -28,28 +29,40 @@ def load_papers(input_path: Path) -> List[Paper]:
     return papers
 
 
-def save_papers(papers: List[Paper], output_path: Path, stats: dict):
+def save_papers(papers: Iterable[Paper], output_path: Path, stats: dict):
     """Save enriched papers to JSON file"""
-    # Convert papers to dict format with proper serialization
-    papers_data = []
-    for p in papers:
-        # to_dict() now handles all serialization including provenance records
-        paper_dict = p.to_dict()
-        papers_data.append(paper_dict)
-
-    output_data = {
-        "consolidation_metadata": {
-            "timestamp": datetime.now().isoformat(),
-            "stats": stats,
-            "method": "two-phase",
-            "phases": [
-                "openalex_id_harvesting",
-                "semantic_scholar_batch_enrichment",
-                "openalex_full_enrichment",
-            ],
-        },
-        "papers": papers_data,
+    save_paper_records((p.to_dict() for p in papers), output_path, stats)
+
+
+def save_paper_records(
+    records: Iterable[Dict[str, Any]], output_path: Path, stats: dict
+):
+    """Save serialized enriched papers to JSON file
+
+    Papers are written one at a time, so sharded results can be streamed into
+    the output without building the whole document in memory. The output is
+    identical to ``json.dump(..., indent=2)`` of the document.
+    """
+    metadata = {
+        "timestamp": datetime.now().isoformat(),
+        "stats": stats,
+        "method": "two-phase",
+        "phases": [
+            "openalex_id_harvesting",
+            "semantic_scholar_batch_enrichment",
+            "openalex_full_enrichment",
+        ],
     }
 
     with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+        f.write('{\n  "consolidation_metadata": ')
+        f.write(textwrap.indent(json.dumps(metadata, indent=2), "  ").lstrip())
+        f.write(',\n  "papers": [')
+
+        first = True
+        for record in records:
+            f.write("\n" if first else ",\n")
+            f.write(textwrap.indent(json.dumps(record, indent=2), "    "))
+            first = False
+
+        f.write("]\n}" if first else "\n  ]\n}")
@@ -1,13 +1,17 @@
 """
 MetricsCollector - Collects system metrics from all components.
 Provides real-time metrics gathering with <2 second collection time requirement.
+
+Each metric source is sampled independently on its own cadence by a dedicated
+sampler thread; snapshots are assembled from the latest cached samples so a
+slow source never delays the whole snapshot.
 """
 
 import time
 import threading
 import psutil
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import logging
 
 from ..server.dashboard_metrics import (
@@ -24,6 +28,23 @@ from ..server.dashboard_metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Metric source names, one sampler thread per source
+SOURCE_COLLECTION_PROGRESS = "collection_progress"
+SOURCE_API = "api"
+SOURCE_PROCESSING = "processing"
+SOURCE_SYSTEM = "system"
+SOURCE_STATE = "state"
+SOURCE_VENUE_PROGRESS = "venue_progress"
+
+METRIC_SOURCES = (
+    SOURCE_COLLECTION_PROGRESS,
+    SOURCE_API,
+    SOURCE_PROCESSING,
+    SOURCE_SYSTEM,
+    SOURCE_STATE,
+    SOURCE_VENUE_PROGRESS,
+)
+
 
 class MetricsCollector:
     """
@@ -31,6 +52,12 @@ class MetricsCollector:
 
     Performance requirement: Complete metrics collection within 2 seconds.
     Thread-safe design for concurrent access.
+
+    While collection is running, every source is sampled by its own thread:
+    periodic sources use the interval from ``source_intervals`` and
+    event-driven sources (interval ``None``) are resampled when notified via
+    ``notify_venue_progress_changed`` / ``notify_checkpoint_written``, or
+    after ``event_source_max_age_seconds`` without an event.
     """
 
     def __init__(self, collection_interval_seconds: int = 5):
@@ -40,6 +67,35 @@ class MetricsCollector:
         self.metrics_buffer = MetricsBuffer(max_size=1000)
         self._current_metrics: Optional[SystemMetrics] = None
 
+        # Per-source sampling cadence in seconds (None = event driven)
+        self.source_intervals: Dict[str, Optional[float]] = {
+            SOURCE_COLLECTION_PROGRESS: collection_interval_seconds,
+            SOURCE_API: collection_interval_seconds,
+            SOURCE_PROCESSING: collection_interval_seconds,
+            SOURCE_SYSTEM: 1.0,
+            SOURCE_STATE: None,
+            SOURCE_VENUE_PROGRESS: None,
+        }
+        self.event_source_max_age_seconds = 60.0
+
+        # Latest sample per source
+        self._samplers: Dict[str, Callable[[], Any]] = {
+            SOURCE_COLLECTION_PROGRESS: self._collect_collection_progress,
+            SOURCE_API: self._collect_api_metrics,
+            SOURCE_PROCESSING: self._collect_processing_metrics,
+            SOURCE_SYSTEM: self._collect_system_metrics,
+            SOURCE_STATE: self._collect_state_metrics,
+            SOURCE_VENUE_PROGRESS: self._collect_venue_progress,
+        }
+        self._source_cache: Dict[str, Any] = {}
+        self._source_sampled_at: Dict[str, float] = {}
+        self._source_sample_times: Dict[str, float] = {}
+        self._source_events: Dict[str, threading.Event] = {
+            source: threading.Event() for source in METRIC_SOURCES
+        }
+        self._sampler_threads: Dict[str, threading.Thread] = {}
+        self._stop_event = threading.Event()
+
         # Component references
         self.venue_engine = None
         self.state_manager = None
@@ -126,8 +182,21 @@ class MetricsCollector:
             self._session_id = str(uuid.uuid4())
             self.session_start_time = datetime.now()
 
-            # Start collection thread
+            # Start one sampler thread per source, then the snapshot thread
             self._running = True
+            self._stop_event.clear()
+            self._source_cache.clear()
+            self._source_sampled_at.clear()
+            for source in METRIC_SOURCES:
+                thread = threading.Thread(
+                    target=self._sampler_loop,
+                    args=(source,),
+                    name=f"MetricsSampler-{source}",
+                    daemon=True,
+                )
+                self._sampler_threads[source] = thread
+                thread.start()
+
             self._collection_thread = threading.Thread(
                 target=self._collection_loop, name="MetricsCollector", daemon=True
             )
@@ -142,10 +211,17 @@ class MetricsCollector:
                 return
 
             self._running = False
+            self._stop_event.set()
+            for event in self._source_events.values():
+                event.set()
 
-        # Wait for collection thread to finish
+        # Wait for collection and sampler threads to finish
         if self._collection_thread and self._collection_thread.is_alive():
             self._collection_thread.join(timeout=10)
+        for thread in self._sampler_threads.values():
+            if thread.is_alive():
+                thread.join(timeout=10)
+        self._sampler_threads.clear()
 
         logger.info("Metrics collection stopped")
 
@@ -156,7 +232,21 @@ class MetricsCollector:
 
     def collect_current_metrics(self) -> SystemMetrics:
         """Collect fresh metrics from all system components"""
-        return self.collect_metrics()
+        return self.collect_metrics(refresh=True)
+
+    def notify_venue_progress_changed(self) -> None:
+        """Signal that venue progress changed so it is resampled promptly"""
+        self.request_refresh(SOURCE_VENUE_PROGRESS)
+
+    def notify_checkpoint_written(self) -> None:
+        """Signal that a checkpoint was written so state metrics are resampled"""
+        self.request_refresh(SOURCE_STATE)
+
+    def request_refresh(self, source: str) -> None:
+        """Wake the sampler of ``source`` so it samples immediately"""
+        if source not in self._source_events:
+            raise ValueError(f"Unknown metric source: {source}")
+        self._source_events[source].set()
 
     def get_metrics_summary(self, time_window_minutes: int = 60) -> MetricsSummary:
         """Get aggregated metrics summary over time window"""
@@ -251,32 +341,40 @@ class MetricsCollector:
             processing_throughput=avg_collection_rate,
         )
 
-    def collect_metrics(self) -> SystemMetrics:
+    def collect_metrics(self, refresh: Optional[bool] = None) -> SystemMetrics:
         """
         Collect metrics from all system components
 
         Performance requirement: Complete within 2 seconds
+
+        Args:
+            refresh: Sample every source synchronously instead of using the
+                samplers' cached values. Defaults to True when background
+                collection is not running.
         """
         start_time = time.time()
+        if refresh is None:
+            refresh = not self._running
 
         try:
-            # Collect from each component
-            collection_progress = self._collect_collection_progress()
-            api_metrics = self._collect_api_metrics()
-            processing_metrics = self._collect_processing_metrics()
-            system_metrics = self._collect_system_metrics()
-            state_metrics = self._collect_state_metrics()
-            venue_progress = self._collect_venue_progress()
+            samples = {
+                source: (
+                    self._sample_source(source)
+                    if refresh
+                    else self._get_cached_sample(source)
+                )
+                for source in METRIC_SOURCES
+            }
 
             # Create metrics snapshot
             metrics = SystemMetrics(
                 timestamp=datetime.now(),
-                collection_progress=collection_progress,
-                api_metrics=api_metrics,
-                processing_metrics=processing_metrics,
-                system_metrics=system_metrics,
-                state_metrics=state_metrics,
-                venue_progress=venue_progress,
+                collection_progress=samples[SOURCE_COLLECTION_PROGRESS],
+                api_metrics=samples[SOURCE_API],
+                processing_metrics=samples[SOURCE_PROCESSING],
+                system_metrics=samples[SOURCE_SYSTEM],
+                state_metrics=samples[SOURCE_STATE],
+                venue_progress=samples[SOURCE_VENUE_PROGRESS],
             )
 
             # Track collection time
@@ -304,23 +402,58 @@ class MetricsCollector:
             raise
 
     def _collection_loop(self) -> None:
-        """Background thread for periodic metrics collection"""
+        """Background thread assembling snapshots from cached samples"""
         logger.info("Starting metrics collection loop")
 
         while self._running:
             try:
-                # Collect metrics
-                self.collect_metrics()
-
-                # Sleep for interval
-                time.sleep(self.collection_interval)
-
+                self.collect_metrics(refresh=False)
             except Exception as e:
                 logger.error(f"Error in collection loop: {e}")
-                time.sleep(self.collection_interval)
+
+            self._stop_event.wait(self.collection_interval)
 
         logger.info("Metrics collection loop stopped")
 
+    def _sampler_loop(self, source: str) -> None:
+        """Background thread sampling a single source on its own cadence"""
+        event = self._source_events[source]
+
+        while not self._stop_event.is_set():
+            event.clear()
+            try:
+                self._sample_source(source)
+            except Exception as e:
+                logger.error(f"Error sampling {source} metrics: {e}")
+
+            interval = self.source_intervals.get(source)
+            event.wait(
+                interval if interval is not None else self.event_source_max_age_seconds
+            )
+
+    def _sample_source(self, source: str) -> Any:
+        """Sample a source and store the result in the cache"""
+        start_time = time.time()
+        sample = self._samplers[source]()
+        sample_time = time.time() - start_time
+
+        if sample_time > 2.0:
+            logger.warning(f"Sampling {source} metrics took {sample_time:.2f}s")
+
+        with self._lock:
+            self._source_cache[source] = sample
+            self._source_sampled_at[source] = time.time()
+            self._source_sample_times[source] = sample_time
+
+        return sample
+
+    def _get_cached_sample(self, source: str) -> Any:
+        """Return the latest sample of a source, sampling it if never sampled"""
+        with self._lock:
+            if source in self._source_cache:
+                return self._source_cache[source]
+        return self._sample_source(source)
+
     def _collect_collection_progress(self) -> CollectionProgressMetrics:
         """Collect overall collection progress metrics"""
         if not self.venue_engine:
@@ -607,6 +740,11 @@ class MetricsCollector:
                 "is_collecting": self._running,
                 "session_start_time": self.session_start_time,
                 "collection_interval_seconds": self.collection_interval,
+                "source_sample_times_seconds": dict(self._source_sample_times),
+                "source_ages_seconds": {
+                    source: time.time() - sampled_at
+                    for source, sampled_at in self._source_sampled_at.items()
+                },
             }
 
     # Empty metric factory methods for error cases
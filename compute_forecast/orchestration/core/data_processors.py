@@ -6,9 +6,9 @@ Includes deduplication and citation analysis.
 import logging
 from typing import List, Dict
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
 
 from ...pipeline.metadata_collection.models import Paper
+from ...pipeline.metadata_collection.processors.entity_resolver import EntityResolver
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,7 @@ class DeduplicationResult:
     duplicate_groups: List[List[Paper]]
     deduplicated_count: int
     original_count: int
+    # Scores of the matches that merged papers, keyed by "{i}_{j}" positions
     similarity_scores: Dict[str, float] = field(default_factory=dict)
 
 
@@ -39,7 +40,7 @@ class SimpleDeduplicator:
         self.similarity_threshold = similarity_threshold
 
     def deduplicate_papers(self, papers: List[Paper]) -> DeduplicationResult:
-        """Deduplicate papers based on title and author similarity"""
+        """Deduplicate papers based on identifiers and title and author similarity"""
         if not papers:
             return DeduplicationResult(
                 unique_papers=[],
@@ -50,87 +51,38 @@ class SimpleDeduplicator:
 
         logger.info(f"Deduplicating {len(papers)} papers...")
 
-        unique_papers = []
-        duplicate_groups = []
-        processed_indices = set()
-        similarity_scores = {}
-
-        for i, paper1 in enumerate(papers):
-            if i in processed_indices:
-                continue
-
-            # Find similar papers
-            duplicates = [paper1]
-            processed_indices.add(i)
-
-            for j, paper2 in enumerate(papers[i + 1 :], i + 1):
-                if j in processed_indices:
-                    continue
+        resolver = EntityResolver(self.similarity_threshold)
+        resolver.add_papers(papers)
+        result = self.build_result(resolver)
 
-                similarity = self._calculate_similarity(paper1, paper2)
-                similarity_scores[f"{i}_{j}"] = similarity
-
-                if similarity >= self.similarity_threshold:
-                    duplicates.append(paper2)
-                    processed_indices.add(j)
+        logger.info(
+            f"Deduplication complete: {len(papers)} -> {result.deduplicated_count} papers"
+        )
+        return result
 
+    def build_result(self, resolver: EntityResolver) -> DeduplicationResult:
+        """Summarize the clusters of a resolver, e.g. after incremental batches"""
+        unique_papers = []
+        duplicate_groups = []
+        for cluster in resolver.clusters():
             # Keep the paper with most citations as the unique one
-            best_paper = max(duplicates, key=lambda p: p.citations)
-            unique_papers.append(best_paper)
-
-            if len(duplicates) > 1:
-                duplicate_groups.append(duplicates)
+            unique_papers.append(resolver.canonical_paper(cluster))
+            if len(cluster) > 1:
+                duplicate_groups.append([resolver.papers[i] for i in cluster])
 
-        result = DeduplicationResult(
+        return DeduplicationResult(
             unique_papers=unique_papers,
             duplicate_groups=duplicate_groups,
             deduplicated_count=len(unique_papers),
-            original_count=len(papers),
-            similarity_scores=similarity_scores,
+            original_count=len(resolver.papers),
+            similarity_scores={
+                f"{i}_{j}": score for (i, j), score in resolver.match_scores.items()
+            },
         )
 
-        logger.info(
-            f"Deduplication complete: {len(papers)} -> {len(unique_papers)} papers"
-        )
-        return result
-
     def _calculate_similarity(self, paper1: Paper, paper2: Paper) -> float:
         """Calculate similarity between two papers"""
-        # Title similarity (most important)
-        title_similarity = SequenceMatcher(
-            None, paper1.title.lower(), paper2.title.lower()
-        ).ratio()
-
-        # Author similarity
-        authors1 = {author.name.lower() for author in paper1.authors}
-        authors2 = {author.name.lower() for author in paper2.authors}
-
-        if authors1 and authors2:
-            author_intersection = len(authors1 & authors2)
-            author_union = len(authors1 | authors2)
-            author_similarity = (
-                author_intersection / author_union if author_union > 0 else 0
-            )
-        else:
-            author_similarity = 0
-
-        # Year similarity (exact match gets bonus)
-        year_similarity = 1.0 if paper1.year == paper2.year else 0.5
-
-        # Venue similarity
-        venue_similarity = SequenceMatcher(
-            None, paper1.venue.lower(), paper2.venue.lower()
-        ).ratio()
-
-        # Weighted combination
-        overall_similarity = (
-            title_similarity * 0.6  # Title is most important
-            + author_similarity * 0.2  # Authors are important
-            + year_similarity * 0.1  # Year should match
-            + venue_similarity * 0.1  # Venue provides context
-        )
-
-        return overall_similarity
+        return EntityResolver(self.similarity_threshold).similarity(paper1, paper2)
 
 
 class SimpleCitationAnalyzer:
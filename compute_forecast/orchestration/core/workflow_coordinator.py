@@ -107,7 +107,9 @@ class WorkflowCoordinator:
                 checksum="",
             )
 
-            state_manager.save_checkpoint(session_id, initial_checkpoint)
+            self._save_checkpoint(
+                state_manager, session_id, initial_checkpoint, metrics_collector
+            )
 
             # Step 2: Process each venue/year combination
             logger.info(
@@ -209,7 +211,9 @@ class WorkflowCoordinator:
                 checksum="",
             )
 
-            state_manager.save_checkpoint(session_id, final_checkpoint)
+            self._save_checkpoint(
+                state_manager, session_id, final_checkpoint, metrics_collector
+            )
 
             # Determine overall success
             workflow_result["success"] = (
@@ -276,7 +280,10 @@ class WorkflowCoordinator:
                 checksum="",
             )
 
-            state_manager.save_checkpoint(session_id, venue_checkpoint)
+            self._save_checkpoint(
+                state_manager, session_id, venue_checkpoint, metrics_collector
+            )
+            self._notify_venue_progress(metrics_collector)
 
             # Step 2: Collect papers (simplified - using mock data)
             papers_collected = self._mock_paper_collection(venue, year)
@@ -335,7 +342,9 @@ class WorkflowCoordinator:
                 checksum="",
             )
 
-            state_manager.save_checkpoint(session_id, completion_checkpoint)
+            self._save_checkpoint(
+                state_manager, session_id, completion_checkpoint, metrics_collector
+            )
 
             result.success = True
 
@@ -344,9 +353,23 @@ class WorkflowCoordinator:
 
         finally:
             result.processing_time_seconds = time.time() - process_start
+            self._notify_venue_progress(metrics_collector)
 
         return result
 
+    def _save_checkpoint(
+        self, state_manager, session_id: str, checkpoint, metrics_collector
+    ) -> None:
+        """Save a checkpoint and tell the metrics collector to resample state"""
+        state_manager.save_checkpoint(session_id, checkpoint)
+        if hasattr(metrics_collector, "notify_checkpoint_written"):
+            metrics_collector.notify_checkpoint_written()
+
+    def _notify_venue_progress(self, metrics_collector) -> None:
+        """Tell the metrics collector to resample venue progress"""
+        if hasattr(metrics_collector, "notify_venue_progress_changed"):
+            metrics_collector.notify_venue_progress_changed()
+
     def _mock_paper_collection(self, venue: str, year: int) -> List[Paper]:
         """Mock paper collection for testing (replace with real API calls)"""
 
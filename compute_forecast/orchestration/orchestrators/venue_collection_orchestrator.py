@@ -661,6 +661,8 @@ class VenueCollectionOrchestrator:
                     session_id,
                     {"result": result.__dict__, "final_status": session.status},
                 )
+                if self.metrics_collector is not None:
+                    self.metrics_collector.notify_checkpoint_written()
 
         return result
 
@@ -695,6 +697,8 @@ class VenueCollectionOrchestrator:
             # Save current state
             if self.state_manager is not None:
                 self.state_manager.checkpoint_session(session_id)
+                if self.metrics_collector is not None:
+                    self.metrics_collector.notify_checkpoint_written()
 
             # Update session status
             session.status = "paused"
@@ -1,10 +1,7 @@
 """Pipeline components for research paper analysis and processing."""
 
-from . import analysis
-from . import content_extraction
-from . import metadata_collection
-from . import paper_filtering
-from . import pdf_acquisition
+import importlib
+from typing import Any
 
 __all__ = [
     "analysis",
@@ -13,3 +10,12 @@ __all__ = [
     "paper_filtering",
     "pdf_acquisition",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Stages are imported on first access rather than with the package
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
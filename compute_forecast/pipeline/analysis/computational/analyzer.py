@@ -2,7 +2,7 @@
 Computational content analysis engine for papers.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import sys
 import os
 
@@ -64,8 +64,12 @@ class ComputationalAnalyzer(BaseAnalyzer):
 
         return float(min(confidence, 1.0))
 
-    def extract_paper_text(self, paper: Paper) -> str:
+    def extract_paper_text(self, paper: Union[Paper, str]) -> str:
         """Extract all available text from paper"""
+        # Extraction protocols pass the raw paper content
+        if isinstance(paper, str):
+            return paper
+
         text_parts = []
 
         if hasattr(paper, "title") and paper.title:
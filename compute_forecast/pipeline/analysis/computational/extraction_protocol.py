@@ -13,6 +13,8 @@ import yaml
 import logging
 import math
 
+from .section_index import SectionIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -290,6 +292,16 @@ class ExtractionProtocol:
             )
         )
         self.decision_tree = ExtractionDecisionTree()
+        self._section_index: Optional[SectionIndex] = None
+
+    @property
+    def section_index(self) -> SectionIndex:
+        """Section index of the paper content, built once and reused by all phases."""
+        if self._section_index is None or (
+            self._section_index.content is not self.paper_content
+        ):
+            self._section_index = SectionIndex(self.paper_content)
+        return self._section_index
 
     def phase1_preparation(self) -> Dict[str, Any]:
         """Phase 1: Paper Preparation (15 minutes)."""
@@ -307,7 +319,7 @@ class ExtractionProtocol:
         computational_indicators = sum(
             1
             for keyword in self.PREPARATION_KEYWORDS
-            if keyword.lower() in self.paper_content.lower()
+            if self.section_index.contains(keyword.lower())
         )
         preparation_results["has_computational_experiments"] = (
             computational_indicators >= 3
@@ -478,8 +490,7 @@ class ExtractionProtocol:
 
     def _find_section_content(self, section_name: str) -> str:
         """Find content in specific paper sections."""
-        # Simple implementation - can be enhanced with more sophisticated parsing
-        content_lower = self.paper_content.lower()
+        index = self.section_index
 
         section_patterns = {
             "abstract": ["abstract", "summary"],
@@ -492,9 +503,10 @@ class ExtractionProtocol:
 
         patterns = section_patterns.get(section_name, [section_name])
         for pattern in patterns:
-            if pattern in content_lower:
-                # Extract content around the pattern (simplified)
-                start_idx = content_lower.find(pattern)
+            # Prefer a matching heading, then the first mention in the text
+            heading = index.find_heading(pattern)
+            start_idx = heading.offset if heading else index.find(pattern)
+            if start_idx >= 0:
                 return self.paper_content[
                     start_idx : start_idx + 1000
                 ]  # Return up to 1000 chars
@@ -504,18 +516,18 @@ class ExtractionProtocol:
     def _extract_hardware_specs(self) -> Dict[str, Any]:
         """Extract hardware specifications from paper content."""
         hardware_info = {}
-        content_lower = self.paper_content.lower()
+        index = self.section_index
 
         # Look for GPU information
-        if "v100" in content_lower:
+        if index.contains("v100"):
             hardware_info["gpu_type"] = "V100"
-        elif "a100" in content_lower:
+        elif index.contains("a100"):
             hardware_info["gpu_type"] = "A100"
-        elif "gpu" in content_lower:
+        elif index.contains("gpu"):
             hardware_info["gpu_type"] = "GPU (type not specified)"
 
         # Look for TPU information
-        if "tpu" in content_lower:
+        if index.contains("tpu"):
             hardware_info["tpu_version"] = "TPU (version not specified)"
 
         # This is a simplified implementation - in practice, would use regex patterns
@@ -526,14 +538,14 @@ class ExtractionProtocol:
     def _extract_training_specs(self) -> Dict[str, Any]:
         """Extract training specifications from paper content."""
         training_info = {}
-        content_lower = self.paper_content.lower()
+        index = self.section_index
 
         # Look for time indicators
-        if "hours" in content_lower:
+        if index.contains("hours"):
             training_info["time_unit_original"] = "hours"
-        elif "days" in content_lower:
+        elif index.contains("days"):
             training_info["time_unit_original"] = "days"
-        elif "weeks" in content_lower:
+        elif index.contains("weeks"):
             training_info["time_unit_original"] = "weeks"
 
         return training_info
@@ -541,18 +553,18 @@ class ExtractionProtocol:
     def _extract_model_specs(self) -> Dict[str, Any]:
         """Extract model specifications from paper content."""
         model_info = {}
-        content_lower = self.paper_content.lower()
+        index = self.section_index
 
         # Look for parameter counts
-        if "parameters" in content_lower or "params" in content_lower:
+        if index.contains("parameters") or index.contains("params"):
             model_info["parameters_unit"] = "millions"  # Default assumption
 
         # Look for architecture information
-        if "transformer" in content_lower:
+        if index.contains("transformer"):
             model_info["architecture"] = "Transformer"
-        elif "bert" in content_lower:
+        elif index.contains("bert"):
             model_info["architecture"] = "BERT"
-        elif "gpt" in content_lower:
+        elif index.contains("gpt"):
             model_info["architecture"] = "GPT"
 
         return model_info
@@ -560,12 +572,12 @@ class ExtractionProtocol:
     def _extract_dataset_specs(self) -> Dict[str, Any]:
         """Extract dataset specifications from paper content."""
         dataset_info = {}
-        content_lower = self.paper_content.lower()
+        index = self.section_index
 
         # Look for common datasets
         dataset_names = ["imagenet", "coco", "wikipedia", "bookcorpus", "glue", "squad"]
         for name in dataset_names:
-            if name in content_lower:
+            if index.contains(name):
                 dataset_info["name"] = name.upper()
                 break
 
@@ -574,13 +586,13 @@ class ExtractionProtocol:
     def _extract_computation_specs(self) -> Dict[str, Any]:
         """Extract computational cost specifications."""
         computation_info = {}
-        content_lower = self.paper_content.lower()
+        index = self.section_index
 
         # Look for GPU-hours or cost information
-        if "gpu-hours" in content_lower or "gpu hours" in content_lower:
+        if index.contains("gpu-hours") or index.contains("gpu hours"):
             computation_info["calculation_method"] = "explicit_gpu_hours"
-        elif "cost" in content_lower and (
-            "$" in self.paper_content or "dollar" in content_lower
+        elif index.contains("cost") and (
+            index.contains("$") or index.contains("dollar")
         ):
             computation_info["calculation_method"] = "cost_estimate"
 
@@ -5,15 +5,17 @@ This module orchestrates the complete extraction process, combining automated
 analysis with manual validation and quality control for optimal results.
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
 from .analyzer import ComputationalAnalyzer
-from ....metadata_collection.models import Paper
+from ...metadata_collection.models import Paper
 from .extraction_protocol import ExtractionProtocol, ExtractionResult
 from .quality_control import QualityController, QualityReport
 from .extraction_forms import FormManager
@@ -104,6 +106,28 @@ class WorkflowResult:
     recommendations: List[str] = field(default_factory=list)
 
 
+# Orchestrator of a batch worker process, created once by the pool initializer
+_worker_orchestrator: Optional["ExtractionWorkflowOrchestrator"] = None
+
+
+def _init_batch_worker(config: WorkflowConfig):
+    """Create the orchestrator used by a batch worker process."""
+    global _worker_orchestrator
+    _worker_orchestrator = ExtractionWorkflowOrchestrator(config)
+
+
+def _run_batch_automated_stages(
+    workflow_result: WorkflowResult, paper_content: str
+) -> Tuple[WorkflowResult, Optional[str]]:
+    """Run the automated stages of a workflow in a batch worker process."""
+    assert _worker_orchestrator is not None
+    try:
+        _worker_orchestrator._run_automated_stages(workflow_result, paper_content, None)
+        return workflow_result, None
+    except Exception as e:
+        return workflow_result, str(e)
+
+
 class ExtractionWorkflowOrchestrator:
     """Orchestrates the complete extraction workflow."""
 
@@ -130,71 +154,206 @@ class ExtractionWorkflowOrchestrator:
         paper_metadata: Optional[Dict[str, Any]] = None,
     ) -> WorkflowResult:
         """Run the complete extraction workflow."""
-        workflow_id = f"{paper_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        workflow_result = self._create_workflow(paper_id, analyst)
+        workflow_id = workflow_result.workflow_id
 
         logger.info(f"Starting extraction workflow {workflow_id} for paper {paper_id}")
 
-        # Initialize workflow result
-        workflow_result = WorkflowResult(
-            workflow_id=workflow_id,
-            paper_id=paper_id,
-            analyst=analyst,
-            config=self.config,
-        )
-
         self.active_workflows[workflow_id] = workflow_result
         start_time = datetime.now()
 
         try:
-            # Stage 1: Initialization
-            self._run_stage_initialization(
-                workflow_result, paper_content, paper_metadata
-            )
-
-            # Stage 2: Automated Analysis
-            self._run_stage_automated_analysis(workflow_result, paper_content)
-
-            # Stage 3: Pattern Matching
-            if self.config.enable_pattern_matching:
-                self._run_stage_pattern_matching(workflow_result, paper_content)
+            self._run_automated_stages(workflow_result, paper_content, paper_metadata)
+            self._run_review_stages(workflow_result, paper_content)
+            self._complete_workflow(workflow_result, start_time)
 
-            # Stage 4: Manual Extraction (conditional)
-            if self._should_run_manual_extraction(workflow_result):
-                self._run_stage_manual_extraction(workflow_result, paper_content)
+        except Exception as e:
+            self._fail_workflow(workflow_result, start_time, str(e))
 
-            # Stage 5: Quality Validation
-            if self.config.require_quality_validation:
-                self._run_stage_quality_validation(workflow_result)
+        return workflow_result
 
-            # Stage 6: Form Generation
-            if self.config.generate_forms:
-                self._run_stage_form_generation(workflow_result)
+    def run_extraction_batch(
+        self,
+        papers: Iterable[Tuple[str, str]],
+        analyst: str,
+        output_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[WorkflowResult]:
+        """Run the extraction workflow over a stream of papers.
+
+        The automated analysis and pattern matching stages run in a process
+        pool. The remaining stages run in this process as results come in,
+        and each completed workflow is saved with ``save_workflow_result``
+        before being yielded. Only in-flight workflows are kept in
+        ``active_workflows``, and at most ``max_in_flight`` papers are read
+        ahead from ``papers``.
+
+        Args:
+            papers: Iterable of (paper_id, paper_content) pairs
+            analyst: Analyst name recorded on every workflow
+            output_path: Directory for saved results (see save_workflow_result)
+            max_workers: Worker processes, 0 to run every stage in this process
+            max_in_flight: Maximum workflows in progress at once
+
+        Yields:
+            Completed workflow results, in completion order
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_in_flight is None:
+            max_in_flight = 2 * max(max_workers, 1)
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
+        if max_workers == 0:
+            for paper_id, paper_content in papers:
+                workflow_result = self._create_workflow(paper_id, analyst)
+                self.active_workflows[workflow_result.workflow_id] = workflow_result
+                start_time = datetime.now()
+                try:
+                    self._run_automated_stages(workflow_result, paper_content, None)
+                    error = None
+                except Exception as e:
+                    error = str(e)
+                yield self._finish_batch_workflow(
+                    workflow_result, paper_content, start_time, error, output_path
+                )
+            return
+
+        paper_iter = iter(papers)
+        in_flight: Dict[Future, Tuple[str, datetime]] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(self.config,),
+        ) as executor:
+
+            def submit_next() -> bool:
+                try:
+                    paper_id, paper_content = next(paper_iter)
+                except StopIteration:
+                    return False
+                workflow_result = self._create_workflow(paper_id, analyst)
+                self.active_workflows[workflow_result.workflow_id] = workflow_result
+                future = executor.submit(
+                    _run_batch_automated_stages, workflow_result, paper_content
+                )
+                in_flight[future] = (paper_content, datetime.now())
+                return True
+
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+
+            while in_flight:
+                done: Set[Future] = wait(in_flight, return_when=FIRST_COMPLETED)[0]
+                for future in done:
+                    paper_content, start_time = in_flight.pop(future)
+                    workflow_result, error = future.result()
+                    # Track the copy returned by the worker process
+                    self.active_workflows[workflow_result.workflow_id] = workflow_result
+                    yield self._finish_batch_workflow(
+                        workflow_result, paper_content, start_time, error, output_path
+                    )
+                    submit_next()
+
+    def _finish_batch_workflow(
+        self,
+        workflow_result: WorkflowResult,
+        paper_content: str,
+        start_time: datetime,
+        error: Optional[str],
+        output_path: Optional[Path],
+    ) -> WorkflowResult:
+        """Run the review stages of a batch workflow, save and release it."""
+        try:
+            if error is not None:
+                raise RuntimeError(error)
+            self._run_review_stages(workflow_result, paper_content)
+            self._complete_workflow(workflow_result, start_time)
+        except Exception as e:
+            self._fail_workflow(workflow_result, start_time, str(e))
 
-            # Stage 7: Review Preparation
-            self._run_stage_review_preparation(workflow_result)
+        try:
+            self.save_workflow_result(
+                workflow_result, output_path or self.config.output_directory
+            )
+        except Exception as e:
+            logger.error(f"Failed to save workflow {workflow_result.workflow_id}: {e}")
+        finally:
+            self.active_workflows.pop(workflow_result.workflow_id, None)
 
-            # Finalize workflow
-            workflow_result.overall_status = WorkflowStatus.COMPLETED
-            workflow_result.total_duration_seconds = (
-                datetime.now() - start_time
-            ).total_seconds()
+        return workflow_result
 
-            logger.info(
-                f"Workflow {workflow_id} completed successfully in {workflow_result.total_duration_seconds:.1f}s"
-            )
+    def _create_workflow(self, paper_id: str, analyst: str) -> WorkflowResult:
+        """Create the result of a new workflow."""
+        workflow_id = f"{paper_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return WorkflowResult(
+            workflow_id=workflow_id,
+            paper_id=paper_id,
+            analyst=analyst,
+            config=self.config,
+        )
 
-        except Exception as e:
-            logger.error(f"Workflow {workflow_id} failed: {str(e)}")
-            workflow_result.overall_status = WorkflowStatus.FAILED
-            workflow_result.total_duration_seconds = (
-                datetime.now() - start_time
-            ).total_seconds()
+    def _run_automated_stages(
+        self,
+        workflow_result: WorkflowResult,
+        paper_content: str,
+        paper_metadata: Optional[Dict[str, Any]],
+    ):
+        """Run the stages that need no analyst input."""
+        # Stage 1: Initialization
+        self._run_stage_initialization(workflow_result, paper_content, paper_metadata)
+
+        # Stage 2: Automated Analysis
+        self._run_stage_automated_analysis(workflow_result, paper_content)
+
+        # Stage 3: Pattern Matching
+        if self.config.enable_pattern_matching:
+            self._run_stage_pattern_matching(workflow_result, paper_content)
+
+    def _run_review_stages(self, workflow_result: WorkflowResult, paper_content: str):
+        """Run manual extraction, validation and review preparation stages."""
+        # Stage 4: Manual Extraction (conditional)
+        if self._should_run_manual_extraction(workflow_result):
+            self._run_stage_manual_extraction(workflow_result, paper_content)
+
+        # Stage 5: Quality Validation
+        if self.config.require_quality_validation:
+            self._run_stage_quality_validation(workflow_result)
+
+        # Stage 6: Form Generation
+        if self.config.generate_forms:
+            self._run_stage_form_generation(workflow_result)
+
+        # Stage 7: Review Preparation
+        self._run_stage_review_preparation(workflow_result)
+
+    def _complete_workflow(self, workflow_result: WorkflowResult, start_time: datetime):
+        """Finalize a successful workflow."""
+        workflow_result.overall_status = WorkflowStatus.COMPLETED
+        workflow_result.total_duration_seconds = (
+            datetime.now() - start_time
+        ).total_seconds()
+
+        logger.info(
+            f"Workflow {workflow_result.workflow_id} completed successfully in {workflow_result.total_duration_seconds:.1f}s"
+        )
 
-            # Add error to final step
-            if workflow_result.steps:
-                workflow_result.steps[-1].errors.append(str(e))
+    def _fail_workflow(
+        self, workflow_result: WorkflowResult, start_time: datetime, error: str
+    ):
+        """Finalize a failed workflow."""
+        logger.error(f"Workflow {workflow_result.workflow_id} failed: {error}")
+        workflow_result.overall_status = WorkflowStatus.FAILED
+        workflow_result.total_duration_seconds = (
+            datetime.now() - start_time
+        ).total_seconds()
 
-        return workflow_result
+        # Add error to final step
+        if workflow_result.steps:
+            workflow_result.steps[-1].errors.append(error)
 
     def _run_stage_initialization(
         self,
@@ -260,13 +419,11 @@ class ExtractionWorkflowOrchestrator:
                 authors=[],
                 venue="",
                 year=0,
-                citations=0,
-                abstract=paper_content[:500]
-                if paper_content
-                else "",  # Use part of content as abstract
                 paper_id=workflow_result.paper_id,
                 collection_timestamp=datetime.now(),
             )
+            # Use part of content as abstract, read by the analyzer
+            setattr(temp_paper, "abstract", paper_content[:500])
 
             # Run automated analysis
             analysis_result = self.analyzer.analyze(temp_paper)
@@ -0,0 +1,201 @@
+"""
+One-time segmentation index of a paper's text for extraction lookups.
+
+The paper is lowercased and scanned once: the same pass over its lines finds
+the section headings and records where every token occurs. Term lookups then
+go through the token table instead of rescanning the full text.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+# Optional section numbering ("3.1", "IV.", "A)") followed by a short
+# capitalized title without sentence punctuation.
+HEADING_PATTERN = re.compile(
+    r"^[ \t]*(?P<number>(?:\d+(?:\.\d+)*|[IVX]+|[A-Z])[.)]?[ \t]+)?"
+    r"(?P<title>[A-Z][^\n.,;:!?]*?)[ \t]*$"
+)
+MAX_HEADING_WORDS = 8
+
+# Section names a heading may use without numbering or a preceding blank line
+SECTION_NAMES = frozenset(
+    {
+        "abstract",
+        "summary",
+        "introduction",
+        "background",
+        "related work",
+        "preliminaries",
+        "method",
+        "methods",
+        "methodology",
+        "approach",
+        "model",
+        "models",
+        "architecture",
+        "experiments",
+        "experiment",
+        "experimental setup",
+        "experimental results",
+        "experimental details",
+        "setup",
+        "implementation",
+        "implementation details",
+        "training",
+        "training details",
+        "datasets",
+        "data",
+        "results",
+        "evaluation",
+        "analysis",
+        "ablation study",
+        "ablations",
+        "discussion",
+        "limitations",
+        "conclusion",
+        "conclusions",
+        "future work",
+        "acknowledgments",
+        "acknowledgements",
+        "references",
+        "appendix",
+        "supplementary material",
+    }
+)
+
+# Words and single punctuation characters, the units of the term table
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass
+class SectionHeading:
+    """A section heading and where it starts in the paper text."""
+
+    offset: int
+    title: str
+    title_lower: str
+
+
+def _is_section_name(title_lower: str) -> bool:
+    """Check a title against the known section names, e.g. "Results and Discussion"."""
+    parts = re.split(r"\s+(?:and|&)\s+", " ".join(title_lower.split()))
+    return all(part in SECTION_NAMES for part in parts)
+
+
+class SectionIndex:
+    """Section headings and token positions of a paper's text."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.content_lower = content.lower()
+        self.headings: List[SectionHeading] = []
+        self._token_offsets: Dict[str, List[int]] = {}
+        self._index()
+        self._heading_offsets = [heading.offset for heading in self.headings]
+        self._positions: Dict[str, int] = {}
+
+    def _index(self) -> None:
+        """Find section headings and token offsets in a single pass over the lines."""
+        token_offsets = self._token_offsets
+        offset = lower_offset = 0
+        after_blank = True
+        # Lowercasing may change the length of some characters, so both
+        # texts keep their own offsets.
+        for line, line_lower in zip(
+            self.content.splitlines(keepends=True),
+            self.content_lower.splitlines(keepends=True),
+        ):
+            for match in TOKEN_PATTERN.finditer(line_lower):
+                token_offsets.setdefault(match.group(), []).append(
+                    lower_offset + match.start()
+                )
+
+            heading = self._match_heading(line, offset, after_blank)
+            if heading is not None:
+                self.headings.append(heading)
+            after_blank = not line.strip()
+            offset += len(line)
+            lower_offset += len(line_lower)
+
+    @staticmethod
+    def _match_heading(
+        line: str, offset: int, after_blank: bool
+    ) -> Optional[SectionHeading]:
+        """Get the heading on a line, if the line is one.
+
+        Wrapped body lines often look like short capitalized titles, so a
+        line only counts when its title is a known section name, or when it
+        is numbered and starts the text or follows a blank line.
+        """
+        match = HEADING_PATTERN.match(line.rstrip("\r\n"))
+        if match is None:
+            return None
+        title = match.group("title")
+        if len(title.split()) > MAX_HEADING_WORDS:
+            return None
+        title_lower = title.lower()
+        if not _is_section_name(title_lower) and not (
+            match.group("number") and after_blank
+        ):
+            return None
+        return SectionHeading(offset + match.start("title"), title, title_lower)
+
+    def find(self, term: str) -> int:
+        """Get the first position of a lowercase term, or -1 if absent."""
+        position = self._positions.get(term)
+        if position is None:
+            position = self._lookup(term)
+            self._positions[term] = position
+        return position
+
+    def _lookup(self, term: str) -> int:
+        """Find a term through the token table, matching like ``str.find``."""
+        first = TOKEN_PATTERN.match(term)
+        if first is None:
+            # Terms starting with whitespace have no token to anchor on
+            return self.content_lower.find(term)
+        lead = first.group()
+        rest = term[len(lead) :]
+
+        # The first token of the term may sit inside a longer text token,
+        # in which case it has to end there if the term goes on.
+        best = -1
+        for token, offsets in self._token_offsets.items():
+            shifts: Set[int] = set()
+            if rest:
+                if token.endswith(lead):
+                    shifts.add(len(token) - len(lead))
+            else:
+                start = token.find(lead)
+                while start >= 0:
+                    shifts.add(start)
+                    start = token.find(lead, start + 1)
+            for shift in sorted(shifts):
+                for offset in offsets:
+                    position = offset + shift
+                    if best >= 0 and position >= best:
+                        break
+                    if not rest or self.content_lower.startswith(
+                        rest, position + len(lead)
+                    ):
+                        best = position
+                        break
+        return best
+
+    def contains(self, term: str) -> bool:
+        """Check whether the text contains a lowercase term."""
+        return self.find(term) >= 0
+
+    def find_heading(self, term: str) -> Optional[SectionHeading]:
+        """Get the first heading whose title contains a lowercase term."""
+        for heading in self.headings:
+            if term in heading.title_lower:
+                return heading
+        return None
+
+    def section_at(self, offset: int) -> Optional[SectionHeading]:
+        """Get the heading of the section containing a text position."""
+        i = bisect.bisect_right(self._heading_offsets, offset)
+        return self.headings[i - 1] if i else None
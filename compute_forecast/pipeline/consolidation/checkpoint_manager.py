@@ -8,11 +8,16 @@ import logging
 import time
 import hashlib
 import os
+import textwrap
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
+from compute_forecast.pipeline.consolidation.session_catalog import (
+    SessionCatalog,
+    count_enriched_papers,
+)
 from compute_forecast.pipeline.metadata_collection.models import Paper
 
 logger = logging.getLogger(__name__)
@@ -41,7 +46,8 @@ class ConsolidationCheckpointManager:
     - Atomic file operations
     - Integrity validation via checksums
     - Incremental paper saving with deduplication
-    - Session discovery and management
+    - Per-shard paper files for sharded merge workers
+    - Session discovery and management through a session catalog
     """
 
     def __init__(
@@ -74,6 +80,7 @@ class ConsolidationCheckpointManager:
         self.checkpoint_meta_file = self.checkpoint_dir / "checkpoint.json.meta"
         self.papers_file = self.checkpoint_dir / "papers_enriched.json"
         self.session_info_file = self.checkpoint_dir / "session.json"
+        self.catalog = SessionCatalog(checkpoint_dir)
 
         # Save session info
         self._save_session_info()
@@ -92,14 +99,14 @@ class ConsolidationCheckpointManager:
 
     def _save_session_info(self):
         """Save session metadata"""
-        session_info = {
+        self.session_info = {
             "session_id": self.session_id,
             "created_at": datetime.now().isoformat(),
             "checkpoint_interval_minutes": self.checkpoint_interval / 60,
             "pid": os.getpid() if hasattr(os, "getpid") else None,
         }
         with open(self.session_info_file, "w") as f:
-            json.dump(session_info, f, indent=2)
+            json.dump(self.session_info, f, indent=2)
 
     def should_checkpoint(self) -> bool:
         """Check if enough time has passed for a checkpoint"""
@@ -112,7 +119,7 @@ class ConsolidationCheckpointManager:
         input_file: str,
         total_papers: int,
         sources_state: Dict[str, Dict[str, Any]],
-        papers: List[Paper],
+        papers: Optional[List[Paper]],
         phase_state: Optional[Dict[str, Any]] = None,
         force: bool = False,
     ) -> bool:
@@ -123,7 +130,8 @@ class ConsolidationCheckpointManager:
             input_file: Path to input file being processed
             total_papers: Total number of papers
             sources_state: State of each source
-            papers: Current list of papers with enrichments
+            papers: Current list of papers with enrichments, or None to keep
+                the existing papers file (papers are saved as shards)
             phase_state: Optional phase state for two-phase consolidation
             force: Force checkpoint regardless of time
 
@@ -148,16 +156,31 @@ class ConsolidationCheckpointManager:
             )
 
             # Save papers first (larger file)
-            self._save_papers_atomic(papers)
+            enriched_counts = None
+            if papers is not None:
+                enriched_counts = self._save_papers_atomic(papers)
+                # Shards written before this snapshot are subsumed by it
+                self._remove_papers_shards(older_than=start_time)
 
             # Save checkpoint state
-            self._save_checkpoint_atomic(checkpoint)
+            checkpoint_data = self._save_checkpoint_atomic(checkpoint)
+
+            try:
+                self.catalog.update(
+                    self.session_id,
+                    self.session_info,
+                    checkpoint_data,
+                    papers_saved=len(papers) if papers is not None else None,
+                    enriched_counts=enriched_counts,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update session catalog: {e}")
 
             self.last_checkpoint_time = time.time()
 
             duration = time.time() - start_time
             logger.info(
-                f"Checkpoint saved in {duration:.2f}s: {len(papers)} papers, sources={list(sources_state.keys())}"
+                f"Checkpoint saved in {duration:.2f}s: {len(papers) if papers is not None else 0} papers, sources={list(sources_state.keys())}"
             )
 
             return True
@@ -254,6 +277,12 @@ class ConsolidationCheckpointManager:
                     # Return checkpoint without papers - user can decide to continue or not
                     return checkpoint, []
 
+            # Papers saved by merge shards are newer than the papers file
+            shard_papers = self._load_papers_shards()
+            if shard_papers:
+                papers = [shard_papers.pop(p.paper_id, p) for p in papers]
+                papers.extend(shard_papers.values())
+
             logger.info(
                 f"Loaded checkpoint: {len(papers)} papers, sources={list(checkpoint.sources.keys())}"
             )
@@ -263,8 +292,10 @@ class ConsolidationCheckpointManager:
             logger.error(f"Failed to load checkpoint: {e}")
             return None
 
-    def _save_checkpoint_atomic(self, checkpoint: ConsolidationCheckpoint):
-        """Save checkpoint with atomic write and checksum"""
+    def _save_checkpoint_atomic(
+        self, checkpoint: ConsolidationCheckpoint
+    ) -> Dict[str, Any]:
+        """Save checkpoint with atomic write and checksum, returns the saved data"""
         # Create backup of existing checkpoint if it exists
         if self.checkpoint_file.exists():
             backup_file = self.checkpoint_file.with_suffix(".json.bak")
@@ -314,37 +345,108 @@ class ConsolidationCheckpointManager:
         # Atomic rename both files
         temp_file.rename(self.checkpoint_file)
         meta_temp.rename(self.checkpoint_meta_file)
+        return data
 
-    def _save_papers_atomic(self, papers: List[Paper]):
-        """Save papers with atomic write and deduplication info"""
-        # Convert papers to dict format
-        papers_data = []
-        paper_ids_seen = set()
+    def _save_papers_atomic(self, papers: List[Paper]) -> Dict[str, int]:
+        """
+        Save papers with atomic write and deduplication info.
 
-        for p in papers:
-            paper_dict = p.to_dict()
-            # Track unique papers for deduplication stats
-            if p.paper_id:
-                paper_ids_seen.add(p.paper_id)
-            papers_data.append(paper_dict)
+        Papers are serialized and written one at a time; the file is identical
+        to ``json.dump(..., indent=2)`` of the whole document.
 
-        # Create wrapper with metadata
-        data = {
-            "metadata": {
-                "total_papers": len(papers),
-                "unique_paper_ids": len(paper_ids_seen),
-                "saved_at": datetime.now().isoformat(),
-            },
-            "papers": papers_data,
+        Returns:
+            Number of saved papers enriched by each source
+        """
+        # Track unique papers for deduplication stats
+        paper_ids_seen = {p.paper_id for p in papers if p.paper_id}
+        metadata = {
+            "total_papers": len(papers),
+            "unique_paper_ids": len(paper_ids_seen),
+            "saved_at": datetime.now().isoformat(),
         }
 
         # Write to temp file
+        enriched_counts = {"openalex": 0, "semantic_scholar": 0}
         temp_file = self.papers_file.with_suffix(".tmp")
         with open(temp_file, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write('{\n  "metadata": ')
+            f.write(textwrap.indent(json.dumps(metadata, indent=2), "  ").lstrip())
+            f.write(',\n  "papers": [')
+            for index, p in enumerate(papers):
+                paper_dict = p.to_dict()
+                f.write(",\n" if index else "\n")
+                f.write(textwrap.indent(json.dumps(paper_dict, indent=2), "    "))
+                for source, count in count_enriched_papers([paper_dict]).items():
+                    enriched_counts[source] += count
+            f.write("\n  ]\n}" if papers else "]\n}")
 
         # Atomic rename
         temp_file.rename(self.papers_file)
+        return enriched_counts
+
+    def _papers_shard_file(self, shard_id: int) -> Path:
+        """Get the papers file of a merge shard"""
+        return self.checkpoint_dir / f"papers_enriched.shard{shard_id:03d}.jsonl"
+
+    def save_papers_shard(self, shard_id: int, papers: Iterable[Paper]):
+        """
+        Save the papers owned by one merge shard with an atomic write.
+
+        Papers are written as JSON lines so each shard file can be streamed
+        back without loading the others.
+        """
+        start_time = time.time()
+        shard_file = self._papers_shard_file(shard_id)
+        temp_file = shard_file.with_suffix(".tmp")
+        saved = 0
+        with open(temp_file, "w") as f:
+            for paper in papers:
+                f.write(json.dumps(paper.to_dict()))
+                f.write("\n")
+                saved += 1
+
+        # Atomic rename
+        temp_file.rename(shard_file)
+
+        logger.debug(
+            f"Saved merge shard {shard_id} in {time.time() - start_time:.2f}s: {saved} papers"
+        )
+
+    def iter_papers_shard(self, shard_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream the serialized papers saved by one merge shard"""
+        shard_file = self._papers_shard_file(shard_id)
+        if not shard_file.exists():
+            return
+        with open(shard_file) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _load_papers_shards(self) -> Dict[Optional[str], Paper]:
+        """Load papers saved by merge shards, keyed by paper ID"""
+        papers: Dict[Optional[str], Paper] = {}
+        for shard_file in sorted(
+            self.checkpoint_dir.glob("papers_enriched.shard*.jsonl")
+        ):
+            try:
+                with open(shard_file) as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        paper = Paper.from_dict(json.loads(line))
+                        papers[paper.paper_id] = paper
+            except Exception as e:
+                logger.warning(f"Failed to load papers shard {shard_file.name}: {e}")
+        return papers
+
+    def _remove_papers_shards(self, older_than: Optional[float] = None):
+        """Remove merge shard files, optionally only those older than a time"""
+        for shard_file in self.checkpoint_dir.glob("papers_enriched.shard*.jsonl"):
+            try:
+                if older_than is None or shard_file.stat().st_mtime < older_than:
+                    shard_file.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove papers shard {shard_file.name}: {e}")
 
     def _validate_checkpoint_integrity(self) -> bool:
         """Validate checkpoint file integrity using checksum"""
@@ -395,6 +497,8 @@ class ConsolidationCheckpointManager:
                 self.checkpoint_meta_file.unlink()
             if self.papers_file.exists():
                 self.papers_file.unlink()
+            self._remove_papers_shards()
+            self.catalog.remove(self.session_id)
 
             # Remove directory if empty
             if not any(self.checkpoint_dir.iterdir()):
@@ -412,148 +516,35 @@ class ConsolidationCheckpointManager:
         """
         Find all resumable consolidation sessions.
 
+        Sessions are read from the session catalog, which only summarizes
+        again the sessions changed since it was last updated.
+
         Returns:
-            List of session info dicts with keys: session_id, created_at, input_file, status
+            List of session info dicts with keys: session_id, created_at,
+            input_file, total_papers, sources, status, phase, last_checkpoint,
+            source_stats, checkpoint_bytes, papers_bytes, papers_saved and,
+            when known, enriched_counts
         """
-        sessions: List[Dict[str, Any]] = []
-
-        if not checkpoint_dir.exists():
-            return sessions
+        return SessionCatalog(checkpoint_dir).sessions()
 
-        for session_dir in checkpoint_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            checkpoint_file = session_dir / "checkpoint.json"
-            session_info_file = session_dir / "session.json"
-
-            if checkpoint_file.exists():
-                try:
-                    # Load session info
-                    session_data = {}
-                    if session_info_file.exists():
-                        with open(session_info_file) as f:
-                            session_data = json.load(f)
-
-                    # Load checkpoint to get status
-                    with open(checkpoint_file) as f:
-                        checkpoint_data = json.load(f)
-
-                    # Determine overall status
-                    sources_status = checkpoint_data.get("sources", {})
-
-                    # Handle edge case where sources might be a string
-                    if isinstance(sources_status, str):
-                        logger.warning(
-                            f"Unexpected string value for sources in {session_dir.name}: {sources_status}"
-                        )
-                        sources_status = {"phase": sources_status}
-
-                    # Handle three different checkpoint formats:
-                    # 1. Old format: sources with status (e.g., {"semantic_scholar": {"status": "completed"}})
-                    # 2. Two-phase format: phase tracking (e.g., {"phase": "id_harvesting"})
-                    # 3. Parallel format: sources with papers_processed counts
-
-                    if "phase" in sources_status:
-                        # New two-phase format
-                        phase = sources_status.get("phase", "unknown")
-                        if phase == "completed":
-                            status = "completed"
-                        elif phase in [
-                            "id_harvesting",
-                            "semantic_scholar_enrichment",
-                            "openalex_enrichment",
-                        ]:
-                            status = "interrupted"
-                        elif phase in [
-                            "id_harvesting_complete",
-                            "semantic_scholar_complete",
-                        ]:
-                            status = "interrupted"  # Between phases
-                        else:
-                            status = "pending"
-                    elif any(
-                        "papers_processed" in s
-                        for s in sources_status.values()
-                        if isinstance(s, dict)
-                    ):
-                        # Parallel consolidation format
-                        # Check if still processing (always consider resumable unless explicitly complete)
-                        status = "interrupted"
-
-                        # Could add logic to determine if complete based on merge counts
-                        # For now, always consider parallel consolidations as resumable
-                    else:
-                        # Old format with source statuses
-                        if all(
-                            isinstance(s, dict) and s.get("status") == "completed"
-                            for s in sources_status.values()
-                        ):
-                            status = "completed"
-                        elif any(
-                            isinstance(s, dict) and s.get("status") == "failed"
-                            for s in sources_status.values()
-                        ):
-                            status = "failed"
-                        elif any(
-                            isinstance(s, dict) and s.get("status") == "in_progress"
-                            for s in sources_status.values()
-                        ):
-                            status = "interrupted"
-                        else:
-                            status = "pending"
-
-                    # Determine sources list based on format
-                    if "phase" in sources_status:
-                        # New format - use phase name as sources
-                        sources_list = [sources_status.get("phase", "unknown")]
-                    else:
-                        # Old format - use actual source names
-                        sources_list = list(sources_status.keys())
-
-                    # Extract source statistics if available
-                    source_stats = {}
-                    if isinstance(sources_status, dict):
-                        for source_name, source_data in sources_status.items():
-                            if (
-                                isinstance(source_data, dict)
-                                and "papers_processed" in source_data
-                            ):
-                                source_stats[source_name] = {
-                                    "papers_processed": source_data.get(
-                                        "papers_processed", 0
-                                    ),
-                                    "papers_enriched": source_data.get(
-                                        "papers_enriched", 0
-                                    ),
-                                    "citations_found": source_data.get(
-                                        "citations_found", 0
-                                    ),
-                                    "abstracts_found": source_data.get(
-                                        "abstracts_found", 0
-                                    ),
-                                    "api_calls": source_data.get("api_calls", 0),
-                                }
-
-                    sessions.append(
-                        {
-                            "session_id": checkpoint_data["session_id"],
-                            "created_at": session_data.get(
-                                "created_at", checkpoint_data["timestamp"]
-                            ),
-                            "input_file": checkpoint_data["input_file"],
-                            "total_papers": checkpoint_data["total_papers"],
-                            "sources": sources_list,
-                            "status": status,
-                            "last_checkpoint": checkpoint_data["timestamp"],
-                            "source_stats": source_stats,
-                        }
-                    )
+    @classmethod
+    def reindex_sessions(
+        cls,
+        checkpoint_dir: Path = Path(".cf_state/consolidate"),
+        count_enriched: bool = True,
+    ) -> int:
+        """
+        Rebuild the session catalog, e.g. for sessions created before it.
 
-                except Exception as e:
-                    logger.warning(f"Failed to load session {session_dir.name}: {e}")
+        Args:
+            checkpoint_dir: Base checkpoint directory
+            count_enriched: Count the papers enriched per source from the
+                papers files, which are otherwise loaded on every listing
 
-        return sorted(sessions, key=lambda x: x["created_at"], reverse=True)
+        Returns:
+            Number of sessions indexed
+        """
+        return SessionCatalog(checkpoint_dir).reindex(count_enriched=count_enriched)
 
     @classmethod
     def get_latest_resumable_session(
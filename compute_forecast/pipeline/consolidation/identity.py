@@ -0,0 +1,81 @@
+"""
+Canonical paper identity keys for consolidation.
+
+A paper's identity key hashes its normalized title, sorted author names, venue
+and year. The key is computed once per paper and cached on it, so every stage
+(enrichment workers, merge shards, checkpoints and resume filtering) reuses the
+same value instead of rehashing.
+"""
+
+import hashlib
+from typing import Iterable
+
+from compute_forecast.pipeline.metadata_collection.models import Paper
+
+# sha256 matches the processed hashes stored by existing checkpoints;
+# blake2b uses a 64-bit digest, which is faster and smaller for large runs
+IDENTITY_HASH_ALGORITHMS = ("sha256", "blake2b")
+DEFAULT_IDENTITY_HASH_ALGORITHM = "sha256"
+
+# Attribute holding the cached (algorithm, key) pair on a Paper
+_CACHE_ATTRIBUTE = "_identity_key"
+
+
+def paper_identity_content(paper: Paper) -> str:
+    """Build the normalized title|authors|venue|year string of a paper."""
+    title = paper.title.lower().strip() if paper.title else ""
+
+    authors = []
+    if hasattr(paper, "authors") and paper.authors:
+        for author in paper.authors:
+            if isinstance(author, dict):
+                name = author.get("name", "").lower().strip()
+            else:
+                name = str(author).lower().strip()
+            if name:
+                authors.append(name)
+    authors.sort()
+    authors_str = ";".join(authors)
+
+    venue = paper.venue.lower().strip() if paper.venue else ""
+    year = str(paper.year) if paper.year else ""
+
+    return f"{title}|{authors_str}|{venue}|{year}"
+
+
+def compute_identity_key(
+    paper: Paper, algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM
+) -> str:
+    """Hash a paper's identity content without using the cache."""
+    content = paper_identity_content(paper).encode()
+
+    if algorithm == "sha256":
+        return hashlib.sha256(content).hexdigest()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+    raise ValueError(
+        f"Unknown identity hash algorithm '{algorithm}', "
+        f"expected one of {IDENTITY_HASH_ALGORITHMS}"
+    )
+
+
+def get_identity_key(
+    paper: Paper, algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM
+) -> str:
+    """Get a paper's identity key, computing and caching it on first use."""
+    cached = paper.__dict__.get(_CACHE_ATTRIBUTE)
+    if cached is not None and cached[0] == algorithm:
+        return str(cached[1])
+
+    key = compute_identity_key(paper, algorithm)
+    setattr(paper, _CACHE_ATTRIBUTE, (algorithm, key))
+    return key
+
+
+def assign_identity_keys(
+    papers: Iterable[Paper], algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM
+) -> None:
+    """Compute and cache identity keys for papers up front."""
+    for paper in papers:
+        get_identity_key(paper, algorithm)
@@ -73,6 +73,8 @@ class ConsolidationPhaseState:
     merged_papers: List[Paper] = field(default_factory=list)
     papers_processed: int = 0
     papers_enriched: int = 0
+    # Algorithm of the processed hashes; sha256 for checkpoints predating it
+    identity_hash_algorithm: str = "sha256"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for checkpointing."""
@@ -105,6 +107,7 @@ class ConsolidationPhaseState:
             # Don't serialize merged_papers - they'll be saved separately
             result["papers_processed"] = self.papers_processed
             result["papers_enriched"] = self.papers_enriched
+            result["identity_hash_algorithm"] = self.identity_hash_algorithm
 
         return result
 
@@ -145,6 +148,9 @@ class ConsolidationPhaseState:
             state.semantic_scholar_processed_hashes = set(
                 data.get("semantic_scholar_processed_hashes", [])
             )
+            state.identity_hash_algorithm = data.get(
+                "identity_hash_algorithm", "sha256"
+            )
             # merged_papers will be loaded separately
 
         return state
@@ -4,14 +4,21 @@ import threading
 import queue
 import logging
 import time
-from typing import List, Dict, Any, Optional, Set, Callable
+from typing import List, Dict, Any, Optional, Set, Callable, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime
 
 from compute_forecast.pipeline.metadata_collection.models import Paper
+from compute_forecast.pipeline.consolidation.identity import (
+    DEFAULT_IDENTITY_HASH_ALGORITHM,
+    get_identity_key,
+)
 
 logger = logging.getLogger(__name__)
 
+# Queue item telling a worker that no more input will arrive
+SHUTDOWN_SENTINEL = object()
+
 
 class ConsolidationWorker(ABC, threading.Thread):
     """Base class for consolidation workers."""
@@ -25,6 +32,9 @@ class ConsolidationWorker(ABC, threading.Thread):
         progress_callback: Optional[Callable[[int], None]] = None,
         batch_size: int = 50,
         processed_hashes: Optional[Set[str]] = None,
+        progress_condition: Optional[threading.Condition] = None,
+        identity_hash_algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM,
+        max_concurrent_papers: int = 1,
     ):
         super().__init__(name=name)
         self.name = name
@@ -34,11 +44,16 @@ class ConsolidationWorker(ABC, threading.Thread):
         self.progress_callback = progress_callback
         self.batch_size = batch_size
         self.processed_hashes = processed_hashes or set()
+        self.progress_condition = progress_condition
+        self.identity_hash_algorithm = identity_hash_algorithm
+        # Queued papers looked up together, so their requests can overlap
+        self.max_concurrent_papers = max(1, max_concurrent_papers)
 
         # Control flags
         self.stop_event = threading.Event()
         self.pause_event = threading.Event()
         self.pause_event.set()  # Start unpaused
+        self.done_event = threading.Event()
 
         # Statistics
         self.papers_processed = 0
@@ -49,8 +64,10 @@ class ConsolidationWorker(ABC, threading.Thread):
         self.abstracts_found = 0
 
     def stop(self):
-        """Signal the worker to stop."""
+        """Signal the worker to stop, waking it if blocked on input."""
         self.stop_event.set()
+        self.pause_event.set()
+        self.input_queue.put(SHUTDOWN_SENTINEL)
 
     def pause(self):
         """Pause the worker."""
@@ -70,31 +87,33 @@ class ConsolidationWorker(ABC, threading.Thread):
                 # Wait if paused
                 self.pause_event.wait()
 
-                try:
-                    # Get paper from queue with timeout
-                    paper = self.input_queue.get(timeout=0.1)
-                    logger.debug(
-                        f"{self.name}: Got paper from queue: {paper.title[:50]}..."
-                    )
+                # Block until a paper or the shutdown sentinel arrives
+                paper = self.input_queue.get()
+                if paper is SHUTDOWN_SENTINEL:
+                    break
 
+                papers, shutdown = self._take_queued_papers(paper)
+
+                pending = []
+                for paper in papers:
                     # Check if already processed
-                    paper_hash = self._get_paper_hash(paper)
-                    if paper_hash in self.processed_hashes:
+                    if self._get_paper_hash(paper) in self.processed_hashes:
                         logger.debug(
                             f"{self.name}: Skipping already processed paper: {paper.title}"
                         )
                         self.papers_processed += 1
-                        # Don't update progress - main thread will handle it
-                        continue
+                        self._notify_progress()
+                    else:
+                        pending.append(paper)
 
-                    # Process single paper immediately
-                    logger.debug(
-                        f"{self.name}: Processing paper: {paper.title[:50]}..."
-                    )
-                    self._process_single_paper(paper)
+                if pending:
+                    logger.debug(f"{self.name}: Processing {len(pending)} papers")
+                    self._process_papers(pending)
+                    for _ in pending:
+                        self._notify_progress()
 
-                except queue.Empty:
-                    continue
+                if shutdown:
+                    break
 
         except Exception as e:
             logger.error(f"{self.name} encountered error: {str(e)}")
@@ -103,6 +122,10 @@ class ConsolidationWorker(ABC, threading.Thread):
             )
 
         finally:
+            self.close()
+            self.done_event.set()
+            # Wake waiting monitors without counting a processed paper
+            self._wake_progress_waiters()
             duration = time.time() - self.start_time
             logger.info(
                 f"{self.name} stopped. Processed: {self.papers_processed}, "
@@ -110,71 +133,91 @@ class ConsolidationWorker(ABC, threading.Thread):
                 f"Duration: {duration:.1f}s"
             )
 
-    def _process_single_paper(self, paper: Paper):
-        """Process a single paper."""
+    def _notify_progress(self):
+        """Report one processed paper to the callback and any waiting monitor."""
+        if self.progress_callback:
+            try:
+                self.progress_callback(1)
+            except Exception as e:
+                logger.error(f"{self.name} progress callback error: {str(e)}")
+
+        self._wake_progress_waiters()
+
+    def _wake_progress_waiters(self):
+        """Wake monitors waiting on the progress condition."""
+        if self.progress_condition is not None:
+            with self.progress_condition:
+                self.progress_condition.notify_all()
+
+    def _take_queued_papers(self, first: Paper) -> Tuple[List[Paper], bool]:
+        """Collect papers already waiting in the queue, up to the concurrency
+
+        Returns the papers and whether the shutdown sentinel was reached.
+        """
+        papers = [first]
+        while len(papers) < self.max_concurrent_papers:
+            try:
+                paper = self.input_queue.get_nowait()
+            except queue.Empty:
+                break
+            if paper is SHUTDOWN_SENTINEL:
+                return papers, True
+            papers.append(paper)
+        return papers, False
+
+    def _process_papers(self, papers: List[Paper]):
+        """Process a batch of papers, sending one result per paper."""
+        source = self.name.lower().replace("worker", "").strip()
+
         try:
             # Get enrichment data from source
-            enrichment_results = self.fetch_enrichment_data([paper])
-
-            # Send result to output queue
-            if enrichment_results:
-                paper, enrichment_data = enrichment_results[0]
-                if enrichment_data:
-                    # Track citation and abstract counts
-                    if enrichment_data.get("citations") is not None:
-                        self.citations_found += 1
-                    if enrichment_data.get("abstract"):
-                        self.abstracts_found += 1
-
-                    self.output_queue.put(
-                        {
-                            "paper": paper,
-                            "enrichment": enrichment_data,
-                            "source": self.name.lower().replace("worker", "").strip(),
-                        }
-                    )
-                    self.papers_enriched += 1
-                else:
-                    # Still send empty result so merge knows this paper was attempted
-                    self.output_queue.put(
-                        {
-                            "paper": paper,
-                            "enrichment": None,
-                            "source": self.name.lower().replace("worker", "").strip(),
-                        }
-                    )
-
-            # Mark as processed
+            enrichment_results = self.fetch_enrichment_data(papers)
+        except Exception as e:
+            logger.error(f"{self.name} processing error: {str(e)}")
+            for paper in papers:
+                self.error_queue.put(
+                    {
+                        "worker": self.name,
+                        "error": f"Processing error: {str(e)}",
+                        "timestamp": datetime.now(),
+                        "paper_title": paper.title,
+                    }
+                )
+            enrichment_results = []
+
+        enrichment_by_paper = {
+            id(paper): enrichment_data for paper, enrichment_data in enrichment_results
+        }
+
+        for paper in papers:
             paper_hash = self._get_paper_hash(paper)
-            self.processed_hashes.add(paper_hash)
-            self.papers_processed += 1
+            enrichment_data = enrichment_by_paper.get(id(paper))
 
-        except Exception as e:
-            logger.error(
-                f"{self.name} processing error for paper '{paper.title}': {str(e)}"
-            )
-            self.error_queue.put(
+            if enrichment_data:
+                # Track citation and abstract counts
+                if enrichment_data.get("citations") is not None:
+                    self.citations_found += 1
+                if enrichment_data.get("abstract"):
+                    self.abstracts_found += 1
+                self.papers_enriched += 1
+
+            # Empty results are still sent so merge knows the paper was attempted
+            self.output_queue.put(
                 {
-                    "worker": self.name,
-                    "error": f"Processing error: {str(e)}",
-                    "timestamp": datetime.now(),
-                    "paper_title": paper.title,
+                    "paper": paper,
+                    "paper_hash": paper_hash,
+                    "enrichment": enrichment_data or None,
+                    "source": source,
                 }
             )
 
-            # Still mark as processed to avoid infinite retries
-            paper_hash = self._get_paper_hash(paper)
+            # Mark as processed, also on errors to avoid infinite retries
             self.processed_hashes.add(paper_hash)
             self.papers_processed += 1
 
-            # Send empty result so merge knows this paper was attempted
-            self.output_queue.put(
-                {
-                    "paper": paper,
-                    "enrichment": None,
-                    "source": self.name.lower().replace("worker", "").strip(),
-                }
-            )
+    def close(self):
+        """Release resources held by the worker once it stops."""
+        pass
 
     @abstractmethod
     def fetch_enrichment_data(
@@ -194,25 +237,5 @@ class ConsolidationWorker(ABC, threading.Thread):
         pass
 
     def _get_paper_hash(self, paper: Paper) -> str:
-        """Generate hash for paper (same as in consolidate.py)."""
-        title = paper.title.lower().strip() if paper.title else ""
-
-        authors = []
-        if hasattr(paper, "authors") and paper.authors:
-            for author in paper.authors:
-                if isinstance(author, dict):
-                    name = author.get("name", "").lower().strip()
-                else:
-                    name = str(author).lower().strip()
-                if name:
-                    authors.append(name)
-        authors.sort()
-        authors_str = ";".join(authors)
-
-        venue = paper.venue.lower().strip() if paper.venue else ""
-        year = str(paper.year) if paper.year else ""
-
-        content = f"{title}|{authors_str}|{venue}|{year}"
-        import hashlib
-
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Get the paper's identity key, cached on the paper after first use."""
+        return get_identity_key(paper, self.identity_hash_algorithm)
@@ -2,8 +2,9 @@
 
 import queue
 import logging
+import threading
 import time
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator, Set, Tuple
 from datetime import datetime
 
 from compute_forecast.pipeline.metadata_collection.models import Paper
@@ -13,19 +14,40 @@ from compute_forecast.pipeline.consolidation.parallel.openalex_worker import (
 from compute_forecast.pipeline.consolidation.parallel.semantic_scholar_worker import (
     SemanticScholarWorker,
 )
-from compute_forecast.pipeline.consolidation.parallel.merge_worker import MergeWorker
+from compute_forecast.pipeline.consolidation.parallel.merge_worker import (
+    OUTPUT_COUNTS,
+    MergeShardRouter,
+    MergeWorker,
+    count_output_papers,
+)
+from compute_forecast.pipeline.consolidation.parallel.base_worker import (
+    SHUTDOWN_SENTINEL,
+)
 from compute_forecast.pipeline.consolidation.checkpoint_manager import (
     ConsolidationCheckpointManager,
 )
 from compute_forecast.pipeline.consolidation.models_extended import (
     ConsolidationPhaseState,
 )
+from compute_forecast.pipeline.consolidation.identity import (
+    DEFAULT_IDENTITY_HASH_ALGORITHM,
+    IDENTITY_HASH_ALGORITHMS,
+    assign_identity_keys,
+    get_identity_key,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ParallelConsolidator:
-    """Orchestrates parallel consolidation with multiple workers."""
+    """Orchestrates parallel consolidation with multiple workers.
+
+    The merge stage can be sharded by paper hash across ``merge_shards``
+    merge workers. Each shard owns a partition of the papers and saves its
+    own checkpoint shard, while the consolidator periodically saves the
+    shared worker state. With a checkpoint manager, the final output is
+    streamed from the shard files by ``iter_output_records``.
+    """
 
     def __init__(
         self,
@@ -35,35 +57,59 @@ class ParallelConsolidator:
         ss_batch_size: int = 500,
         checkpoint_manager: Optional[ConsolidationCheckpointManager] = None,
         checkpoint_interval: float = 300,  # 5 minutes
+        merge_shards: int = 1,
+        identity_hash_algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM,
     ):
+        if merge_shards < 1:
+            raise ValueError(f"merge_shards must be >= 1, got {merge_shards}")
+        if identity_hash_algorithm not in IDENTITY_HASH_ALGORITHMS:
+            raise ValueError(
+                f"Unknown identity hash algorithm '{identity_hash_algorithm}', "
+                f"expected one of {IDENTITY_HASH_ALGORITHMS}"
+            )
+
         self.openalex_email = openalex_email
         self.ss_api_key = ss_api_key
         self.openalex_batch_size = openalex_batch_size
         self.ss_batch_size = ss_batch_size
         self.checkpoint_manager = checkpoint_manager
         self.checkpoint_interval = checkpoint_interval
+        self.merge_shards = merge_shards
+        self.identity_hash_algorithm = identity_hash_algorithm
 
         # Queues - separate input queues for each worker
-        self.openalex_input_queue: queue.Queue[Paper] = queue.Queue()
-        self.ss_input_queue: queue.Queue[Paper] = queue.Queue()
-        self.enrichment_queue: queue.Queue[Any] = queue.Queue()
+        self.openalex_input_queue: queue.Queue[Any] = queue.Queue()
+        self.ss_input_queue: queue.Queue[Any] = queue.Queue()
+        self.enrichment_queue = MergeShardRouter(merge_shards, identity_hash_algorithm)
         self.output_queue: queue.Queue[Any] = queue.Queue()
         self.error_queue: queue.Queue[Any] = queue.Queue()
 
         # Workers
         self.openalex_worker: Optional[OpenAlexWorker] = None
         self.semantic_scholar_worker: Optional[SemanticScholarWorker] = None
-        self.merge_worker: Optional[MergeWorker] = None
+        self.merge_workers: List[MergeWorker] = []
 
         # Progress callbacks
         self.openalex_progress_callback: Optional[Callable[[int], None]] = None
         self.ss_progress_callback: Optional[Callable[[int], None]] = None
 
+        # Signalled by workers whenever they make progress or finish
+        self.progress_condition = threading.Condition()
+
         # State
         self.openalex_processed_hashes: set[str] = set()
         self.ss_processed_hashes: set[str] = set()
         self.start_time: Optional[float] = None
 
+        # Papers both sources processed before resuming, never merged again
+        self.completed_papers: List[Paper] = []
+
+        # Processed hashes are only checkpointed once the paper they were
+        # merged into is saved: those restored on resume, and per shard the
+        # merged hashes as of its last save
+        self.resumed_hashes: Dict[str, Set[str]] = {}
+        self.persisted_hashes: Dict[int, Dict[str, Set[str]]] = {}
+
     def set_progress_callbacks(
         self,
         openalex_callback: Callable[[int], None],
@@ -81,6 +127,17 @@ class ParallelConsolidator:
         if hasattr(phase_state, "semantic_scholar_processed_hashes"):
             self.ss_processed_hashes = phase_state.semantic_scholar_processed_hashes
 
+        # Processed hashes are only comparable with keys of the same algorithm
+        checkpoint_algorithm = getattr(
+            phase_state, "identity_hash_algorithm", DEFAULT_IDENTITY_HASH_ALGORITHM
+        )
+        if checkpoint_algorithm != self.identity_hash_algorithm:
+            logger.warning(
+                f"Using identity hash algorithm '{checkpoint_algorithm}' "
+                f"from checkpoint instead of '{self.identity_hash_algorithm}'"
+            )
+            self.identity_hash_algorithm = checkpoint_algorithm
+
         # Return any merged papers from checkpoint
         return getattr(phase_state, "merged_papers", [])
 
@@ -98,6 +155,45 @@ class ParallelConsolidator:
         Args:
             papers: List of papers to process
             progress_update_callback: Optional callback(source, count) to update progress
+
+        Returns:
+            The papers merged in this run, concatenated across shards
+        """
+        self.consolidate(
+            papers,
+            progress_update_callback,
+            input_file=input_file,
+            checkpoint_papers=checkpoint_papers,
+            checkpoint_stats=checkpoint_stats,
+        )
+        return list(self.iter_merged_papers())
+
+    def consolidate(
+        self,
+        papers: List[Paper],
+        progress_update_callback: Optional[Callable[[str, int, int, int], None]] = None,
+        input_file: str = "",
+        checkpoint_papers: Optional[List[Paper]] = None,
+        checkpoint_stats: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Process papers through parallel consolidation, keeping the results
+        in the merge shards.
+
+        When resuming, papers already processed by a source are never queued
+        for it. They are counted as progress up front and reported through
+        the callback before any new work starts.
+
+        With a checkpoint manager, each shard saves its papers after the final
+        checkpoint, so ``iter_output_records`` can stream the output from the
+        shard files.
+
+        Args:
+            papers: List of papers to process
+            progress_update_callback: Optional callback(source, count) to update progress
+
+        Returns:
+            Number of papers merged in this run
         """
         self.start_time = time.time()
         logger.info(f"Starting parallel consolidation for {len(papers)} papers")
@@ -107,15 +203,30 @@ class ParallelConsolidator:
         self.checkpoint_papers = checkpoint_papers or papers
         self.total_papers = len(papers)
 
+        # Compute identity keys once; every worker reuses the cached key
+        assign_identity_keys(papers, self.identity_hash_algorithm)
+        self.enrichment_queue = MergeShardRouter(
+            self.merge_shards, self.identity_hash_algorithm
+        )
+
+        openalex_pending, ss_pending = self._plan_resume(papers)
+        self.resumed_hashes = {
+            "openalex": set(self.openalex_processed_hashes),
+            "semanticscholar": set(self.ss_processed_hashes),
+        }
+        self.persisted_hashes = {}
+
         # Initialize workers with separate input queues
         self.openalex_worker = OpenAlexWorker(
             input_queue=self.openalex_input_queue,
             output_queue=self.enrichment_queue,
             error_queue=self.error_queue,
             openalex_email=self.openalex_email,
-            progress_callback=None,  # No callback - main thread monitors
+            progress_callback=self.openalex_progress_callback,
             batch_size=1,  # Process one at a time
             processed_hashes=self.openalex_processed_hashes,
+            progress_condition=self.progress_condition,
+            identity_hash_algorithm=self.identity_hash_algorithm,
         )
 
         self.semantic_scholar_worker = SemanticScholarWorker(
@@ -123,9 +234,11 @@ class ParallelConsolidator:
             output_queue=self.enrichment_queue,
             error_queue=self.error_queue,
             ss_api_key=self.ss_api_key,
-            progress_callback=None,  # No callback - main thread monitors
+            progress_callback=self.ss_progress_callback,
             batch_size=1,  # Process one at a time
             processed_hashes=self.ss_processed_hashes,
+            progress_condition=self.progress_condition,
+            identity_hash_algorithm=self.identity_hash_algorithm,
         )
 
         # If we have checkpoint stats, initialize worker counters
@@ -133,15 +246,11 @@ class ParallelConsolidator:
             oa_stats = checkpoint_stats.get("openalex", {})
             ss_stats = checkpoint_stats.get("semantic_scholar", {})
 
-            self.openalex_worker.papers_processed = oa_stats.get("papers_processed", 0)
             self.openalex_worker.papers_enriched = oa_stats.get("papers_enriched", 0)
             self.openalex_worker.citations_found = oa_stats.get("citations_found", 0)
             self.openalex_worker.abstracts_found = oa_stats.get("abstracts_found", 0)
             self.openalex_worker.api_calls = oa_stats.get("api_calls", 0)
 
-            self.semantic_scholar_worker.papers_processed = ss_stats.get(
-                "papers_processed", 0
-            )
             self.semantic_scholar_worker.papers_enriched = ss_stats.get(
                 "papers_enriched", 0
             )
@@ -153,188 +262,302 @@ class ParallelConsolidator:
             )
             self.semantic_scholar_worker.api_calls = ss_stats.get("api_calls", 0)
 
-            # If merge worker stats exist, initialize them
-            if self.merge_worker:
-                merge_stats = checkpoint_stats.get("merge", {})
-                self.merge_worker.papers_merged = merge_stats.get("papers_merged", 0)
+        # Papers skipped by the resume plan count as processed
+        self.openalex_worker.papers_processed = len(papers) - len(openalex_pending)
+        self.semantic_scholar_worker.papers_processed = len(papers) - len(ss_pending)
+
+        self.merge_workers = [
+            MergeWorker(
+                input_queue=shard_queue,
+                output_queue=self.output_queue,
+                error_queue=self.error_queue,
+                checkpoint_callback=self._merge_checkpoint_callback(shard_id),
+                checkpoint_interval=int(self.checkpoint_interval),
+                shard_id=shard_id if self.merge_shards > 1 else None,
+                identity_hash_algorithm=self.identity_hash_algorithm,
+            )
+            for shard_id, shard_queue in enumerate(self.enrichment_queue.queues)
+        ]
 
-        self.merge_worker = MergeWorker(
-            input_queue=self.enrichment_queue,
-            output_queue=self.output_queue,
-            error_queue=self.error_queue,
-            checkpoint_callback=self._checkpoint if self.checkpoint_manager else None,
-            checkpoint_interval=int(self.checkpoint_interval),
-        )
+        # If merge worker stats exist, initialize them
+        if checkpoint_stats:
+            merge_stats = checkpoint_stats.get("merge", {})
+            self.merge_workers[0].papers_merged = merge_stats.get("papers_merged", 0)
 
         # Start workers
         self.openalex_worker.start()
         self.semantic_scholar_worker.start()
-        self.merge_worker.start()
+        for merge_worker in self.merge_workers:
+            merge_worker.start()
 
-        # Feed papers to separate input queues
-        logger.debug(f"Adding {len(papers)} papers to each worker's input queue")
-        for i, paper in enumerate(papers):
-            # Add paper to both queues
-            logger.debug(f"Adding paper {i + 1}/{len(papers)}: {paper.title[:50]}...")
+        # Feed only the remaining work to each worker's input queue
+        for paper in openalex_pending:
             self.openalex_input_queue.put(paper)
+        for paper in ss_pending:
             self.ss_input_queue.put(paper)
+
+        # Sentinels mark the end of input; workers exit once they reach them
+        self.openalex_input_queue.put(SHUTDOWN_SENTINEL)
+        self.ss_input_queue.put(SHUTDOWN_SENTINEL)
         logger.debug(
             f"All papers added. OpenAlex queue size: {self.openalex_input_queue.qsize()}, SS queue size: {self.ss_input_queue.qsize()}"
         )
 
-        # Monitor progress and wait for completion
+        # Monitor progress until both enrichment workers have drained their input
         self._monitor_progress(len(papers), progress_update_callback)  # type: ignore
+        self.openalex_worker.join()
+        self.semantic_scholar_worker.join()
 
-        # Stop workers
-        if self.openalex_worker:
-            self.openalex_worker.stop()
-        if self.semantic_scholar_worker:
-            self.semantic_scholar_worker.stop()
-        if self.merge_worker:
-            self.merge_worker.stop()
-
-        # Wait for workers to finish
-        if self.openalex_worker:
-            self.openalex_worker.join(timeout=5)
-        if self.semantic_scholar_worker:
-            self.semantic_scholar_worker.join(timeout=5)
-        if self.merge_worker:
-            self.merge_worker.join(timeout=5)
-
-        # Get final results
-        merged_papers = (
-            self.merge_worker.get_merged_papers() if self.merge_worker else []
-        )
+        # All enrichment results are queued; let the merge shards drain them
+        self.enrichment_queue.put(SHUTDOWN_SENTINEL)
+        for merge_worker in self.merge_workers:
+            merge_worker.join()
+        self._drain_errors()
 
-        # Final checkpoint
+        # Final checkpoint, then the shard files the output is streamed from
         if self.checkpoint_manager:
             self._checkpoint(force=True)
+            for shard_id in range(len(self.merge_workers)):
+                self._checkpoint_shard(shard_id)
 
         # Report statistics
+        merged_count = self._merged_paper_count()
         duration = time.time() - (self.start_time or time.time())
         logger.info(
             f"Parallel consolidation complete. "
-            f"Papers: {len(merged_papers)}, Duration: {duration:.1f}s"
+            f"Papers: {merged_count}, Duration: {duration:.1f}s"
         )
 
         self._report_statistics()
 
-        return merged_papers
+        return merged_count
+
+    def _plan_resume(self, papers: List[Paper]) -> Tuple[List[Paper], List[Paper]]:
+        """Split off the papers each source still has to process.
+
+        Uses the identity keys cached by ``assign_identity_keys`` against the
+        processed hashes restored from the checkpoint, so a resumed run only
+        queues the remaining work.
+        """
+        openalex_pending = []
+        ss_pending = []
+        completed_hashes = set()
+        self.completed_papers = []
+        for paper in papers:
+            paper_hash = get_identity_key(paper, self.identity_hash_algorithm)
+            openalex_done = paper_hash in self.openalex_processed_hashes
+            ss_done = paper_hash in self.ss_processed_hashes
+            if not openalex_done:
+                openalex_pending.append(paper)
+            if not ss_done:
+                ss_pending.append(paper)
+            # Merge shards keep one paper per hash, and so does the output
+            if openalex_done and ss_done and paper_hash not in completed_hashes:
+                completed_hashes.add(paper_hash)
+                self.completed_papers.append(paper)
+
+        if len(openalex_pending) < len(papers) or len(ss_pending) < len(papers):
+            logger.info(
+                f"Resuming: {len(openalex_pending)} papers left for OpenAlex, "
+                f"{len(ss_pending)} left for Semantic Scholar "
+                f"out of {len(papers)}"
+            )
+
+        return openalex_pending, ss_pending
 
     def _monitor_progress(
         self,
         total_papers: int,
         progress_callback: Optional[Callable[[str, int, int, int], None]],
     ):
-        """Monitor progress by watching enrichment queue."""
-        expected_enrichments = total_papers * 2  # Each paper processed by 2 workers
+        """Push worker progress to the callback until enrichment workers finish.
+
+        Sleeps on the progress condition, which workers signal after every
+        paper and when they exit, so an idle run costs no CPU and completion
+        is detected as soon as the last worker finishes.
+        """
+        workers = {
+            "openalex": self.openalex_worker,
+            "semantic_scholar": self.semantic_scholar_worker,
+        }
 
         # Track progress per source
-        source_progress = {"openalex": 0, "semantic_scholar": 0}
+        source_progress = {source: 0 for source in workers}
 
-        last_progress_update = time.time()
+        while True:
+            for source, worker in workers.items():
+                processed = worker.papers_processed if worker else 0
+                if processed <= source_progress[source]:
+                    continue
 
-        while (
-            self.merge_worker and self.merge_worker.papers_merged < expected_enrichments
-        ):
-            # Check enrichment queue for results
-            try:
-                # Non-blocking check of enrichment queue size
-                # We can't peek, but we can track what merge worker has processed
-
-                # Update progress based on what sources have completed
-                # This is approximate since we can't peek into the queue
-                if (
-                    progress_callback and time.time() - last_progress_update > 0.1
-                ):  # Update every 100ms
-                    # Get actual counts from workers
-                    oa_processed = (
-                        self.openalex_worker.papers_processed
-                        if self.openalex_worker
-                        else 0
-                    )
-                    ss_processed = (
-                        self.semantic_scholar_worker.papers_processed
-                        if self.semantic_scholar_worker
-                        else 0
-                    )
-
-                    # Update progress if changed
-                    if oa_processed > source_progress["openalex"]:
+                if progress_callback and worker:
+                    try:
                         progress_callback(
-                            "openalex",
-                            oa_processed - source_progress["openalex"],
-                            self.openalex_worker.citations_found
-                            if self.openalex_worker
-                            else 0,
-                            self.openalex_worker.abstracts_found
-                            if self.openalex_worker
-                            else 0,
+                            source,
+                            processed - source_progress[source],
+                            worker.citations_found,
+                            worker.abstracts_found,
                         )
-                        source_progress["openalex"] = oa_processed
+                    except Exception as e:
+                        logger.error(f"Progress monitoring error: {e}")
+                source_progress[source] = processed
+
+            self._drain_errors()
+
+            # Sharded merge workers only save their own partition, so the
+            # shared worker state is checkpointed from here
+            if self.merge_shards > 1:
+                self._checkpoint(include_papers=False)
+
+            # Check for completion and sleep under the lock so no signal is lost
+            with self.progress_condition:
+                caught_up = all(
+                    worker is None or worker.papers_processed == source_progress[source]
+                    for source, worker in workers.items()
+                )
+                if not caught_up:
+                    continue
+                if all(
+                    worker is None or worker.done_event.is_set()
+                    for worker in workers.values()
+                ):
+                    break
+                self.progress_condition.wait()
+
+    def _drain_errors(self):
+        """Log any errors reported by workers."""
+        errors = []
+        while True:
+            try:
+                errors.append(self.error_queue.get_nowait())
+            except queue.Empty:
+                break
+        if errors:
+            logger.error(f"Worker errors: {errors}")
+
+    def iter_merged_papers(self) -> Iterator[Paper]:
+        """Iterate over the papers merged in this run, shard by shard."""
+        for merge_worker in self.merge_workers:
+            yield from merge_worker.iter_merged_papers()
+
+    def iter_output_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream the serialized consolidated papers for the final output.
+
+        Papers merged in this run are read back one at a time from the shard
+        files saved at the end of ``consolidate``, or serialized from the
+        shards without a checkpoint manager. Papers completed before resuming
+        follow.
+        """
+        if self.checkpoint_manager:
+            for shard_id in range(len(self.merge_workers)):
+                yield from self.checkpoint_manager.iter_papers_shard(shard_id)
+        else:
+            for paper in self.iter_merged_papers():
+                yield paper.to_dict()
+
+        for paper in self.completed_papers:
+            yield paper.to_dict()
+
+    def output_counts(self) -> Dict[str, int]:
+        """Statistics of the consolidated output, summed from shard counters."""
+        counts = count_output_papers(self.completed_papers)
+        for merge_worker in self.merge_workers:
+            for key in OUTPUT_COUNTS:
+                counts[key] += merge_worker.output_counts[key]
+        return counts
+
+    def _merged_paper_count(self) -> int:
+        """Get the number of unique papers merged across all shards."""
+        return sum(
+            len(merge_worker.merged_papers) for merge_worker in self.merge_workers
+        )
 
-                    if ss_processed > source_progress["semantic_scholar"]:
-                        progress_callback(
-                            "semantic_scholar",
-                            ss_processed - source_progress["semantic_scholar"],
-                            self.semantic_scholar_worker.citations_found
-                            if self.semantic_scholar_worker
-                            else 0,
-                            self.semantic_scholar_worker.abstracts_found
-                            if self.semantic_scholar_worker
-                            else 0,
-                        )
-                        source_progress["semantic_scholar"] = ss_processed
+    def _enriched_counts(self) -> Dict[str, int]:
+        """Get the merged papers with data from each source across all shards."""
+        counts: Dict[str, int] = {}
+        for merge_worker in self.merge_workers:
+            for source, count in merge_worker.enriched_counts.items():
+                counts[source] = counts.get(source, 0) + count
+        return counts
+
+    def _papers_merged(self) -> int:
+        """Get the number of enrichment results merged across all shards."""
+        return sum(merge_worker.papers_merged for merge_worker in self.merge_workers)
+
+    def _merge_state(self) -> Dict[str, Any]:
+        """Get merge state for checkpointing, aggregated across shards."""
+        if len(self.merge_workers) == 1:
+            return self.merge_workers[0].get_state()
+
+        shards = [merge_worker.get_state() for merge_worker in self.merge_workers]
+        return {
+            "papers_merged": sum(shard["papers_merged"] for shard in shards),
+            "merged_paper_count": sum(shard["merged_paper_count"] for shard in shards),
+            "timestamp": datetime.now().isoformat(),
+            "shards": shards,
+        }
 
-                    last_progress_update = time.time()
+    def _merge_checkpoint_callback(self, shard_id: int) -> Optional[Callable[[], None]]:
+        """Get the checkpoint callback run inline by a merge worker."""
+        if not self.checkpoint_manager:
+            return None
+        if self.merge_shards == 1:
+            return self._checkpoint
+        return lambda: self._checkpoint_shard(shard_id)
 
-            except Exception as e:
-                logger.error(f"Progress monitoring error: {e}")
+    def _checkpoint_shard(self, shard_id: int):
+        """Save the papers owned by one merge shard."""
+        if not self.checkpoint_manager:
+            return
 
-            # Check for errors
-            if not self.error_queue.empty():
-                errors = []
-                while not self.error_queue.empty():
-                    errors.append(self.error_queue.get())
-                logger.error(f"Worker errors: {errors}")
+        merge_worker = self.merge_workers[shard_id]
+        merged_hashes = merge_worker.merged_hashes_snapshot()
+        try:
+            self.checkpoint_manager.save_papers_shard(
+                shard_id, merge_worker.iter_merged_papers()
+            )
+        except Exception as e:
+            logger.error(f"Failed to save merge shard {shard_id}: {e}")
+            return
+        self.persisted_hashes[shard_id] = merged_hashes
 
-            # Brief sleep to avoid busy waiting
-            time.sleep(0.05)  # 50ms
+    def _persisted_processed_hashes(self, source: str) -> Set[str]:
+        """Get the hashes a source processed whose merged paper is saved.
 
-    def _checkpoint(self, force: bool = False):
-        """Save checkpoint."""
+        A hash checkpointed before its paper is saved would make a resumed
+        run skip the paper and lose its enrichment.
+        """
+        hashes = set(self.resumed_hashes.get(source, ()))
+        for shard_hashes in list(self.persisted_hashes.values()):
+            hashes |= shard_hashes.get(source, set())
+        return hashes
+
+    def _checkpoint(self, force: bool = False, include_papers: bool = True):
+        """Save checkpoint.
+
+        Args:
+            force: Save regardless of the checkpoint interval
+            include_papers: Also rewrite the full papers file. Sharded runs
+                skip it for periodic checkpoints since each shard saves its
+                own papers.
+        """
         if not self.checkpoint_manager:
             return
 
         if not force and not self.checkpoint_manager.should_checkpoint():
             return
 
-        # Get merged papers to count actual enriched papers
-        merged_papers = (
-            self.merge_worker.get_merged_papers() if self.merge_worker else []
-        )
+        save_papers = include_papers or not self.checkpoint_manager.papers_file.exists()
+        if save_papers:
+            # The papers file holds every shard's papers as merged so far
+            for shard_id, merge_worker in enumerate(self.merge_workers):
+                self.persisted_hashes[shard_id] = merge_worker.merged_hashes_snapshot()
 
-        # Count papers that actually have data from each source
-        openalex_enriched = 0
-        ss_enriched = 0
-
-        for paper in merged_papers:
-            # Check if paper has OpenAlex data
-            if paper.openalex_id or any(
-                r.source == "openalex" for r in getattr(paper, "citations", [])
-            ):
-                openalex_enriched += 1
-
-            # Check if paper has Semantic Scholar data
-            # Check external_ids for semantic_scholar ID
-            if hasattr(paper, "external_ids") and paper.external_ids.get(
-                "semantic_scholar"
-            ):
-                ss_enriched += 1
-            elif any(
-                r.source == "semanticscholar" for r in getattr(paper, "citations", [])
-            ):
-                ss_enriched += 1
+        # Papers that actually have data from each source, counted by the
+        # merge shards as they merge
+        enriched_counts = self._enriched_counts()
+        openalex_enriched = enriched_counts.get("openalex", 0)
+        ss_enriched = enriched_counts.get("semanticscholar", 0)
 
         # Build phase state
         phase_state = ConsolidationPhaseState(
@@ -343,15 +566,11 @@ class ParallelConsolidator:
             phase_start_time=datetime.fromtimestamp(self.start_time)
             if self.start_time
             else datetime.now(),
-            # Source-specific processed hashes
-            openalex_processed_hashes=self.openalex_worker.processed_hashes
-            if self.openalex_worker
-            else set(),
-            semantic_scholar_processed_hashes=self.semantic_scholar_worker.processed_hashes
-            if self.semantic_scholar_worker
-            else set(),
-            # Merged papers
-            merged_papers=merged_papers,
+            # Source-specific processed hashes, of saved papers only
+            openalex_processed_hashes=self._persisted_processed_hashes("openalex"),
+            semantic_scholar_processed_hashes=self._persisted_processed_hashes(
+                "semanticscholar"
+            ),
             # Statistics
             papers_processed=(
                 self.openalex_worker.papers_processed if self.openalex_worker else 0
@@ -361,7 +580,8 @@ class ParallelConsolidator:
                 if self.semantic_scholar_worker
                 else 0
             ),
-            papers_enriched=self.merge_worker.papers_merged if self.merge_worker else 0,
+            papers_enriched=self._papers_merged(),
+            identity_hash_algorithm=self.identity_hash_algorithm,
         )
 
         self.checkpoint_manager.save_checkpoint(
@@ -398,9 +618,9 @@ class ParallelConsolidator:
                     if self.semantic_scholar_worker
                     else 0,
                 },
-                "merge": self.merge_worker.get_state() if self.merge_worker else {},
+                "merge": self._merge_state(),
             },
-            papers=self.checkpoint_papers,
+            papers=self.checkpoint_papers if save_papers else None,
             phase_state=phase_state.to_dict(),
             force=force,
         )
@@ -431,12 +651,9 @@ class ParallelConsolidator:
                 else 0,
             },
             "Merge": {
-                "papers_merged": self.merge_worker.papers_merged
-                if self.merge_worker
-                else 0,
-                "unique_papers": len(self.merge_worker.get_merged_papers())
-                if self.merge_worker
-                else 0,
+                "shards": len(self.merge_workers),
+                "papers_merged": self._papers_merged(),
+                "unique_papers": self._merged_paper_count(),
             },
         }
 
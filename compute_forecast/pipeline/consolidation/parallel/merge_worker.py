@@ -4,10 +4,17 @@ import threading
 import queue
 import logging
 import time
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Callable, Set
 from datetime import datetime
 
 from compute_forecast.pipeline.metadata_collection.models import Paper
+from compute_forecast.pipeline.consolidation.parallel.base_worker import (
+    SHUTDOWN_SENTINEL,
+)
+from compute_forecast.pipeline.consolidation.identity import (
+    DEFAULT_IDENTITY_HASH_ALGORITHM,
+    get_identity_key,
+)
 from compute_forecast.pipeline.consolidation.models import (
     CitationData,
     CitationRecord,
@@ -21,9 +28,85 @@ from compute_forecast.pipeline.consolidation.models import (
 
 logger = logging.getLogger(__name__)
 
+# Enrichment sources, as named in enrichment results and provenance records
+ENRICHMENT_SOURCES = ("openalex", "semanticscholar")
+
+# Statistics of the consolidated output, counted per merge shard
+OUTPUT_COUNTS = (
+    "total_papers",
+    "papers_with_citations",
+    "papers_with_abstracts",
+    "papers_with_dois",
+    "papers_with_arxiv",
+)
+
+
+def has_source_data(paper: Paper, source: str) -> bool:
+    """Check whether a paper carries data from an enrichment source."""
+    if source == "openalex" and paper.openalex_id:
+        return True
+    return any(record.source == source for record in paper.citations) or any(
+        record.source == source for record in paper.abstracts
+    )
+
+
+def count_output_papers(papers: Iterable[Paper]) -> Dict[str, int]:
+    """Count the papers of a consolidated output and the fields they have."""
+    counts = dict.fromkeys(OUTPUT_COUNTS, 0)
+    for paper in papers:
+        counts["total_papers"] += 1
+        counts["papers_with_citations"] += bool(paper.citations)
+        counts["papers_with_abstracts"] += bool(paper.abstracts)
+        counts["papers_with_dois"] += bool(paper.doi)
+        counts["papers_with_arxiv"] += bool(paper.arxiv_id)
+    return counts
+
+
+class MergeShardRouter:
+    """Queue-like front end that routes enrichment results to merge shards.
+
+    Results are partitioned by paper hash, so every enrichment of a paper
+    reaches the shard owning that paper. The shutdown sentinel is broadcast
+    to all shards.
+    """
+
+    def __init__(
+        self,
+        num_shards: int = 1,
+        identity_hash_algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM,
+    ):
+        if num_shards < 1:
+            raise ValueError(f"num_shards must be >= 1, got {num_shards}")
+        self.identity_hash_algorithm = identity_hash_algorithm
+        self.queues: List[queue.Queue[Any]] = [queue.Queue() for _ in range(num_shards)]
+
+    def shard_for(self, paper_hash: str) -> int:
+        """Get the shard index owning a paper hash."""
+        return int(paper_hash[:8], 16) % len(self.queues)
+
+    def put(self, item: Any):
+        """Route an enrichment result to its shard queue."""
+        if item is SHUTDOWN_SENTINEL:
+            for shard_queue in self.queues:
+                shard_queue.put(item)
+            return
+
+        paper_hash = item.get("paper_hash") or get_identity_key(
+            item["paper"], self.identity_hash_algorithm
+        )
+        self.queues[self.shard_for(paper_hash)].put(item)
+
+    def qsize(self) -> int:
+        """Approximate number of results pending across all shards."""
+        return sum(shard_queue.qsize() for shard_queue in self.queues)
+
 
 class MergeWorker(threading.Thread):
-    """Worker that merges enrichment results from multiple sources."""
+    """Worker that merges enrichment results from multiple sources.
+
+    When the merge stage is sharded, each worker owns the partition of papers
+    routed to it by a ``MergeShardRouter`` and checkpoints only that partition.
+    """
 
     def __init__(
         self,
@@ -32,13 +115,19 @@ class MergeWorker(threading.Thread):
         error_queue: queue.Queue,
         checkpoint_callback: Optional[Callable[[], None]] = None,
         checkpoint_interval: int = 300,  # 5 minutes default
+        shard_id: Optional[int] = None,
+        identity_hash_algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM,
     ):
-        super().__init__(name="MergeWorker")
+        super().__init__(
+            name="MergeWorker" if shard_id is None else f"MergeWorker-{shard_id}"
+        )
         self.input_queue = input_queue
         self.output_queue = output_queue
         self.error_queue = error_queue
         self.checkpoint_callback = checkpoint_callback
         self.checkpoint_interval = checkpoint_interval
+        self.shard_id = shard_id
+        self.identity_hash_algorithm = identity_hash_algorithm
 
         # Control flags
         self.stop_event = threading.Event()
@@ -46,52 +135,65 @@ class MergeWorker(threading.Thread):
         # Track merged papers
         self.merged_papers: Dict[str, Paper] = {}  # paper_id -> Paper
         self.papers_by_hash: Dict[str, str] = {}  # paper_hash -> paper_id
+        # Hashes of the papers each source's result was merged into
+        self.merged_hashes: Dict[str, Set[str]] = {
+            source: set() for source in ENRICHMENT_SOURCES
+        }
 
         # Statistics
         self.papers_merged = 0
+        # Merged papers with data from each source, kept up to date while
+        # merging so progress reports never scan the papers
+        self.enriched_counts = dict.fromkeys(ENRICHMENT_SOURCES, 0)
+        # Counted once the shard has merged all its results
+        self.output_counts = dict.fromkeys(OUTPUT_COUNTS, 0)
         self.last_checkpoint = time.time()
         self.start_time = None
 
     def stop(self):
-        """Signal the worker to stop."""
+        """Signal the worker to stop, waking it if blocked on input."""
         self.stop_event.set()
+        self.input_queue.put(SHUTDOWN_SENTINEL)
 
     def run(self):
-        """Main merge loop."""
+        """Main merge loop.
+
+        Runs until the shutdown sentinel is received. Since the sentinel is
+        enqueued after every enrichment result, all pending results are merged
+        before the worker exits.
+        """
         self.start_time = time.time()
-        logger.info("MergeWorker started")
+        logger.info(f"{self.name} started")
 
         try:
             while not self.stop_event.is_set():
-                try:
-                    # Get enrichment result with timeout
-                    result = self.input_queue.get(timeout=0.1)
-
-                    # Process the enrichment
-                    self._merge_enrichment(result)
-
-                    # Checkpoint if needed
-                    if (
-                        self.checkpoint_callback
-                        and time.time() - self.last_checkpoint
-                        > self.checkpoint_interval
-                    ):
-                        self.checkpoint_callback()
-                        self.last_checkpoint = time.time()
-
-                except queue.Empty:
-                    continue
+                # Block until an enrichment result or the shutdown sentinel
+                result = self.input_queue.get()
+                if result is SHUTDOWN_SENTINEL:
+                    break
+
+                # Process the enrichment
+                self._merge_enrichment(result)
+
+                # Checkpoint if needed
+                if (
+                    self.checkpoint_callback
+                    and time.time() - self.last_checkpoint > self.checkpoint_interval
+                ):
+                    self.checkpoint_callback()
+                    self.last_checkpoint = time.time()
 
         except Exception as e:
-            logger.error(f"MergeWorker error: {str(e)}")
+            logger.error(f"{self.name} error: {str(e)}")
             self.error_queue.put(
-                {"worker": "MergeWorker", "error": str(e), "timestamp": datetime.now()}
+                {"worker": self.name, "error": str(e), "timestamp": datetime.now()}
             )
 
         finally:
+            self.output_counts = count_output_papers(self.merged_papers.values())
             duration = time.time() - self.start_time
             logger.info(
-                f"MergeWorker stopped. Papers merged: {self.papers_merged}, "
+                f"{self.name} stopped. Papers merged: {self.papers_merged}, "
                 f"Duration: {duration:.1f}s"
             )
 
@@ -101,7 +203,7 @@ class MergeWorker(threading.Thread):
         enrichment = result["enrichment"]
         source = result["source"]
 
-        paper_hash = self._get_paper_hash(paper)
+        paper_hash = result.get("paper_hash") or self._get_paper_hash(paper)
 
         # Get or create consolidated paper
         if paper_hash in self.papers_by_hash:
@@ -112,12 +214,18 @@ class MergeWorker(threading.Thread):
             consolidated = paper
             self.merged_papers[paper.paper_id] = consolidated
             self.papers_by_hash[paper_hash] = paper.paper_id
+            for enrichment_source in ENRICHMENT_SOURCES:
+                if has_source_data(consolidated, enrichment_source):
+                    self.enriched_counts[enrichment_source] += 1
 
         # Skip if no enrichment data (paper not found in source)
         if not enrichment:
+            self.merged_hashes.setdefault(source, set()).add(paper_hash)
             self.papers_merged += 1
             return
 
+        had_source_data = has_source_data(consolidated, source)
+
         # Apply merge rules
         timestamp = datetime.now()
 
@@ -206,6 +314,15 @@ class MergeWorker(threading.Thread):
                 )
             )
 
+        if (
+            not had_source_data
+            and source in self.enriched_counts
+            and has_source_data(consolidated, source)
+        ):
+            self.enriched_counts[source] += 1
+
+        self.merged_hashes.setdefault(source, set()).add(paper_hash)
+
         # Send to output queue
         self.output_queue.put(consolidated)
         self.papers_merged += 1
@@ -217,37 +334,27 @@ class MergeWorker(threading.Thread):
         )
 
     def _get_paper_hash(self, paper: Paper) -> str:
-        """Generate hash for paper (same as in consolidate.py)."""
-        title = paper.title.lower().strip() if paper.title else ""
-
-        authors = []
-        if hasattr(paper, "authors") and paper.authors:
-            for author in paper.authors:
-                if isinstance(author, dict):
-                    name = author.get("name", "").lower().strip()
-                else:
-                    name = str(author).lower().strip()
-                if name:
-                    authors.append(name)
-        authors.sort()
-        authors_str = ";".join(authors)
-
-        venue = paper.venue.lower().strip() if paper.venue else ""
-        year = str(paper.year) if paper.year else ""
-
-        content = f"{title}|{authors_str}|{venue}|{year}"
-        import hashlib
-
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Get the paper's identity key, cached on the paper after first use."""
+        return get_identity_key(paper, self.identity_hash_algorithm)
 
     def get_merged_papers(self) -> List[Paper]:
         """Get all merged papers."""
         return list(self.merged_papers.values())
 
+    def iter_merged_papers(self) -> Iterator[Paper]:
+        """Iterate over the merged papers without copying them."""
+        return iter(self.merged_papers.values())
+
+    def merged_hashes_snapshot(self) -> Dict[str, Set[str]]:
+        """Copy the merged hashes per source, taken before saving the papers."""
+        return {source: set(hashes) for source, hashes in self.merged_hashes.items()}
+
     def get_state(self) -> Dict[str, Any]:
         """Get current state for checkpointing."""
         return {
+            "shard_id": self.shard_id,
             "papers_merged": self.papers_merged,
             "merged_paper_count": len(self.merged_papers),
+            "enriched_counts": dict(self.enriched_counts),
             "timestamp": datetime.now().isoformat(),
         }
@@ -1,6 +1,8 @@
 """OpenAlex worker for parallel consolidation."""
 
+import asyncio
 import logging
+import threading
 from typing import List, Dict, Any, Optional, Set, Callable, Tuple
 import re
 
@@ -8,6 +10,9 @@ from compute_forecast.pipeline.consolidation.parallel.base_worker import (
     ConsolidationWorker,
 )
 from compute_forecast.pipeline.metadata_collection.models import Paper
+from compute_forecast.pipeline.consolidation.identity import (
+    DEFAULT_IDENTITY_HASH_ALGORITHM,
+)
 from compute_forecast.pipeline.consolidation.sources.openalex import OpenAlexSource
 from compute_forecast.pipeline.consolidation.sources.base import SourceConfig
 
@@ -26,6 +31,8 @@ class OpenAlexWorker(ConsolidationWorker):
         progress_callback: Optional[Callable[[int], None]] = None,
         batch_size: int = 50,
         processed_hashes: Optional[Set[str]] = None,
+        progress_condition: Optional[threading.Condition] = None,
+        identity_hash_algorithm: str = DEFAULT_IDENTITY_HASH_ALGORITHM,
     ):
         super().__init__(
             name="OpenAlexWorker",
@@ -35,6 +42,8 @@ class OpenAlexWorker(ConsolidationWorker):
             progress_callback=progress_callback,
             batch_size=batch_size,
             processed_hashes=processed_hashes,
+            progress_condition=progress_condition,
+            identity_hash_algorithm=identity_hash_algorithm,
         )
 
         # Initialize OpenAlex source
@@ -43,17 +52,23 @@ class OpenAlexWorker(ConsolidationWorker):
             batch_size=batch_size,
         )
         self.source = OpenAlexSource(config)
+        self.max_concurrent_papers = config.max_concurrent_requests
 
     def fetch_enrichment_data(
         self, papers: List[Paper]
     ) -> List[Tuple[Paper, Dict[str, Any]]]:
-        """Fetch enrichment data from OpenAlex."""
+        """Fetch enrichment data from OpenAlex via the async engine."""
+        return asyncio.run(self._async_fetch_enrichment_data(papers))
+
+    async def _async_fetch_enrichment_data(
+        self, papers: List[Paper]
+    ) -> List[Tuple[Paper, Dict[str, Any]]]:
         results = []
+        api_calls = self.source.api_calls
 
         try:
             # Find papers in OpenAlex
-            mapping = self.source.find_papers(papers)
-            self.api_calls += self.source.api_calls
+            mapping = await self.source.async_find_papers(papers)
 
             # Get OpenAlex IDs for papers found
             found_ids = []
@@ -67,8 +82,7 @@ class OpenAlexWorker(ConsolidationWorker):
 
             if found_ids:
                 # Fetch all fields for found papers
-                enrichment_data = self.source.fetch_all_fields(found_ids)
-                self.api_calls += self.source.api_calls
+                enrichment_data = await self.source.async_fetch_all_fields(found_ids)
 
                 # Process results
                 for oa_id, data in enrichment_data.items():
@@ -108,8 +122,13 @@ class OpenAlexWorker(ConsolidationWorker):
             # Return empty results for all papers on error
             results = [(paper, {}) for paper in papers]
 
+        self.api_calls += self.source.api_calls - api_calls
         return results
 
+    def close(self):
+        """Release the pooled connections of the source."""
+        self.source.close()
+
     def _extract_arxiv_id(self, data: Dict[str, Any]) -> Optional[str]:
         """Extract ArXiv ID from various locations in OpenAlex data."""
         # Check identifiers first
@@ -0,0 +1,508 @@
+"""
+Catalog of consolidation sessions.
+
+Listing sessions used to load the session and checkpoint files of every
+session directory, and checkpoints can embed a large phase state. The catalog
+keeps one compact summary per session in a single file, rewritten atomically
+whenever a checkpoint is saved. Sessions whose files changed behind the
+catalog's back, or which predate it, are summarized again by parsing only the
+leading fields of their checkpoint.
+"""
+
+import json
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock, concurrent writers may race
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+
+# Checkpoint fields needed to summarize a session, the large phase state that
+# follows them is never parsed
+CHECKPOINT_FIELDS = ("session_id", "input_file", "total_papers", "sources", "timestamp")
+
+# Phases of the two-phase consolidation that can be resumed
+RESUMABLE_PHASES = [
+    "id_harvesting",
+    "semantic_scholar_enrichment",
+    "openalex_enrichment",
+    "id_harvesting_complete",
+    "semantic_scholar_complete",
+]
+
+
+def read_json_fields(
+    path: Path, fields: Iterable[str], chunk_size: int = 64 * 1024
+) -> Dict[str, Any]:
+    """Read top-level fields of a JSON object without parsing the whole file
+
+    The file is decoded one member at a time and reading stops as soon as all
+    requested fields are found, so large members after them are never read.
+
+    Raises:
+        ValueError: If the file is not a JSON object
+    """
+    wanted = set(fields)
+    found: Dict[str, Any] = {}
+    decoder = json.JSONDecoder()
+
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        position = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, position, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        def skip_whitespace() -> str:
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position < len(buffer):
+                    return buffer[position]
+                if not fill():
+                    raise ValueError(f"Unexpected end of {path}")
+
+        def decode() -> Any:
+            nonlocal position
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if fill():
+                        continue
+                    raise ValueError(f"Invalid JSON in {path}")
+                # A number at the end of the buffer may continue in the file
+                if end < len(buffer) or eof or not fill():
+                    position = end
+                    return value
+
+        if skip_whitespace() != "{":
+            raise ValueError(f"{path} is not a JSON object")
+        position += 1
+
+        if skip_whitespace() == "}":
+            return found
+
+        while wanted - found.keys():
+            key = decode()
+            if skip_whitespace() != ":":
+                raise ValueError(f"Invalid JSON in {path}")
+            position += 1
+            skip_whitespace()
+            value = decode()
+            if key in wanted:
+                found[key] = value
+
+            separator = skip_whitespace()
+            position += 1
+            if separator == "}":
+                break
+            if separator != ",":
+                raise ValueError(f"Invalid JSON in {path}")
+            skip_whitespace()
+
+    return found
+
+
+def session_status(sources_status: Dict[str, Any]) -> str:
+    """Status of a session from the source states of its checkpoint
+
+    Handles three checkpoint formats:
+    1. Old format: sources with status (e.g., {"semantic_scholar": {"status": "completed"}})
+    2. Two-phase format: phase tracking (e.g., {"phase": "id_harvesting"})
+    3. Parallel format: sources with papers_processed counts
+    """
+    if "phase" in sources_status:
+        phase = sources_status.get("phase", "unknown")
+        if phase == "completed":
+            return "completed"
+        if phase in RESUMABLE_PHASES:
+            return "interrupted"
+        return "pending"
+
+    if any(
+        "papers_processed" in s for s in sources_status.values() if isinstance(s, dict)
+    ):
+        # Parallel consolidations are always considered resumable
+        return "interrupted"
+
+    if all(
+        isinstance(s, dict) and s.get("status") == "completed"
+        for s in sources_status.values()
+    ):
+        return "completed"
+    if any(
+        isinstance(s, dict) and s.get("status") == "failed"
+        for s in sources_status.values()
+    ):
+        return "failed"
+    if any(
+        isinstance(s, dict) and s.get("status") == "in_progress"
+        for s in sources_status.values()
+    ):
+        return "interrupted"
+    return "pending"
+
+
+def summarize_session(
+    session_data: Dict[str, Any], checkpoint_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Catalog entry of a session from its session info and checkpoint"""
+    sources_status = checkpoint_data.get("sources", {})
+
+    # Handle edge case where sources might be a string
+    if isinstance(sources_status, str):
+        logger.warning(
+            f"Unexpected string value for sources in {checkpoint_data.get('session_id')}: {sources_status}"
+        )
+        sources_status = {"phase": sources_status}
+
+    if "phase" in sources_status:
+        # New format - use phase name as sources
+        phase = sources_status.get("phase", "unknown")
+        sources_list = [phase]
+    else:
+        # Old format - use actual source names
+        phase = None
+        sources_list = list(sources_status.keys())
+
+    source_stats = {}
+    for source_name, source_data in sources_status.items():
+        if isinstance(source_data, dict) and "papers_processed" in source_data:
+            source_stats[source_name] = {
+                "papers_processed": source_data.get("papers_processed", 0),
+                "papers_enriched": source_data.get("papers_enriched", 0),
+                "citations_found": source_data.get("citations_found", 0),
+                "abstracts_found": source_data.get("abstracts_found", 0),
+                "api_calls": source_data.get("api_calls", 0),
+            }
+
+    return {
+        "session_id": checkpoint_data["session_id"],
+        "created_at": session_data.get("created_at", checkpoint_data["timestamp"]),
+        "input_file": checkpoint_data["input_file"],
+        "total_papers": checkpoint_data["total_papers"],
+        "sources": sources_list,
+        "status": session_status(sources_status),
+        "phase": phase,
+        "last_checkpoint": checkpoint_data["timestamp"],
+        "source_stats": source_stats,
+    }
+
+
+def count_enriched_papers(papers_data: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Papers of a saved papers file with data from OpenAlex and Semantic Scholar"""
+    counts = {"openalex": 0, "semantic_scholar": 0}
+
+    for paper in papers_data:
+        has_oa_data = False
+        if paper.get("openalex_id"):
+            has_oa_data = True
+        elif paper.get("citations"):
+            has_oa_data = any(
+                citation.get("source") == "openalex" for citation in paper["citations"]
+            )
+        elif paper.get("abstracts"):
+            has_oa_data = any(
+                abstract.get("source") == "openalex" for abstract in paper["abstracts"]
+            )
+        if has_oa_data:
+            counts["openalex"] += 1
+
+        has_ss_data = False
+        if paper.get("citations"):
+            has_ss_data = any(
+                citation.get("source") == "semanticscholar"
+                for citation in paper["citations"]
+            )
+        elif paper.get("abstracts"):
+            has_ss_data = any(
+                abstract.get("source") == "semanticscholar"
+                for abstract in paper["abstracts"]
+            )
+        if has_ss_data:
+            counts["semantic_scholar"] += 1
+
+    return counts
+
+
+def _file_stamp(path: str) -> Optional[List[int]]:
+    """Modification time and size identifying a version of a file"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class SessionCatalog:
+    """Summaries of all consolidation sessions under a checkpoint directory
+
+    Entries hold the fields listed by find_resumable_sessions plus the phase,
+    file sizes, the number of saved papers and, when known, the number of
+    papers enriched by each source. Each entry also keeps the modification
+    time and size of the files it was built from, so sessions changed without
+    a catalog update are detected with a few stat calls.
+    """
+
+    CATALOG_FILE = "catalog.json"
+    LOCK_FILE = "catalog.lock"
+
+    def __init__(self, checkpoint_dir: Path = Path(".cf_state/consolidate")):
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.catalog_file = self.checkpoint_dir / self.CATALOG_FILE
+        self.lock_file = self.checkpoint_dir / self.LOCK_FILE
+
+    def sessions(self) -> List[Dict[str, Any]]:
+        """Summaries of all sessions with a checkpoint, newest first
+
+        Entries are checked against the session files and rebuilt when
+        missing or outdated, then the catalog is updated with them.
+        """
+        if not self.checkpoint_dir.exists():
+            return []
+
+        entries = self._load()
+        current: Dict[str, Dict[str, Any]] = {}
+        changed: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        # Plain os calls, pathlib overhead dominates with thousands of sessions
+        with os.scandir(self.checkpoint_dir) as session_dirs:
+            for session_dir in session_dirs:
+                if not session_dir.is_dir():
+                    continue
+                name = session_dir.name
+                stamp = self._stamp(session_dir.path)
+                entry = entries.get(name)
+                if stamp["checkpoint"] is None:
+                    if entry is not None:
+                        changed[name] = None
+                    continue
+                if entry is None or entry.get("stamp") != stamp:
+                    try:
+                        entry = self._summarize(Path(session_dir.path), stamp, entry)
+                    except Exception as e:
+                        logger.warning(f"Failed to load session {name}: {e}")
+                        continue
+                    changed[name] = entry
+                current[name] = entry
+
+        # Sessions whose directory was removed
+        for name in entries.keys() - current.keys() - changed.keys():
+            changed[name] = None
+
+        if changed:
+            self._apply(changed)
+
+        sessions = [self._public(entry) for entry in current.values()]
+        return sorted(sessions, key=lambda x: x["created_at"], reverse=True)
+
+    def update(
+        self,
+        session_id: str,
+        session_data: Dict[str, Any],
+        checkpoint_data: Dict[str, Any],
+        papers_saved: Optional[int] = None,
+        enriched_counts: Optional[Dict[str, int]] = None,
+    ):
+        """Record a session from the data of the checkpoint just saved
+
+        Args:
+            session_id: Name of the session directory
+            session_data: Content of the session file
+            checkpoint_data: Content of the checkpoint file
+            papers_saved: Papers in the papers file, None if it was not
+                rewritten with this checkpoint
+            enriched_counts: Papers of the papers file enriched per source
+        """
+        session_dir = self.checkpoint_dir / session_id
+        entry = summarize_session(session_data, checkpoint_data)
+        previous = self._load().get(session_id)
+        if papers_saved is None and previous is not None:
+            # The papers file is unchanged, keep what is known about it
+            papers_saved = previous.get("papers_saved")
+            enriched_counts = previous.get("enriched_counts")
+        self._apply(
+            {
+                session_id: self._entry(
+                    entry, self._stamp(session_dir), papers_saved, enriched_counts
+                )
+            }
+        )
+
+    def remove(self, session_id: str):
+        self._apply({session_id: None})
+
+    def reindex(self, count_enriched: bool = True) -> int:
+        """Rebuild the catalog from the session directories
+
+        Args:
+            count_enriched: Also load each papers file to count the papers
+                enriched per source, so listing sessions never has to
+
+        Returns:
+            Number of sessions indexed
+        """
+        entries: Dict[str, Optional[Dict[str, Any]]] = {
+            name: None for name in self._load()
+        }
+        if self.checkpoint_dir.exists():
+            for session_dir in self.checkpoint_dir.iterdir():
+                if not session_dir.is_dir():
+                    continue
+                stamp = self._stamp(session_dir)
+                if stamp["checkpoint"] is None:
+                    continue
+                try:
+                    entry = self._summarize(session_dir, stamp, None)
+                    if count_enriched and stamp["papers"] is not None:
+                        entry["enriched_counts"] = self._count_enriched(session_dir)
+                except Exception as e:
+                    logger.warning(f"Failed to index session {session_dir.name}: {e}")
+                    continue
+                entries[session_dir.name] = entry
+
+        self._apply(entries)
+        return sum(1 for entry in entries.values() if entry is not None)
+
+    def _summarize(
+        self,
+        session_dir: Path,
+        stamp: Dict[str, Optional[List[int]]],
+        previous: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Catalog entry of a session built from its files"""
+        session_data = {}
+        session_info_file = session_dir / "session.json"
+        if stamp["session"] is not None:
+            with open(session_info_file) as f:
+                session_data = json.load(f)
+
+        checkpoint_data = read_json_fields(
+            session_dir / "checkpoint.json", CHECKPOINT_FIELDS
+        )
+        entry = summarize_session(session_data, checkpoint_data)
+
+        papers_saved = None
+        enriched_counts = None
+        if (
+            previous is not None
+            and previous.get("stamp", {}).get("papers") == (stamp["papers"])
+        ):
+            papers_saved = previous.get("papers_saved")
+            enriched_counts = previous.get("enriched_counts")
+        elif stamp["papers"] is not None:
+            try:
+                metadata = read_json_fields(
+                    session_dir / "papers_enriched.json", ["metadata"]
+                ).get("metadata", {})
+                papers_saved = metadata.get("total_papers")
+            except ValueError:
+                # Old format with a bare list of papers
+                papers_saved = None
+
+        return self._entry(entry, stamp, papers_saved, enriched_counts)
+
+    @staticmethod
+    def _entry(
+        entry: Dict[str, Any],
+        stamp: Dict[str, Optional[List[int]]],
+        papers_saved: Optional[int],
+        enriched_counts: Optional[Dict[str, int]],
+    ) -> Dict[str, Any]:
+        entry["checkpoint_bytes"] = stamp["checkpoint"][1] if stamp["checkpoint"] else 0
+        entry["papers_bytes"] = stamp["papers"][1] if stamp["papers"] else 0
+        entry["papers_saved"] = papers_saved
+        if enriched_counts is not None:
+            entry["enriched_counts"] = enriched_counts
+        entry["stamp"] = stamp
+        return entry
+
+    @staticmethod
+    def _public(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in entry.items() if key != "stamp"}
+
+    @staticmethod
+    def _stamp(session_dir: Union[str, Path]) -> Dict[str, Optional[List[int]]]:
+        join = os.path.join
+        return {
+            "checkpoint": _file_stamp(join(session_dir, "checkpoint.json")),
+            "papers": _file_stamp(join(session_dir, "papers_enriched.json")),
+            "session": _file_stamp(join(session_dir, "session.json")),
+        }
+
+    @staticmethod
+    def _count_enriched(session_dir: Path) -> Dict[str, int]:
+        with open(session_dir / "papers_enriched.json") as f:
+            data = json.load(f)
+        papers_data = data.get("papers", []) if isinstance(data, dict) else data
+        return count_enriched_papers(papers_data)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Entries of the catalog file, empty if missing or unreadable"""
+        try:
+            with open(self.catalog_file) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session catalog: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+            return {}
+        sessions = data.get("sessions", {})
+        return sessions if isinstance(sessions, dict) else {}
+
+    def _apply(self, changes: Dict[str, Optional[Dict[str, Any]]]):
+        """Update and remove entries with an atomic rewrite of the catalog"""
+        try:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            with self._locked():
+                entries = self._load()
+                for session_id, entry in changes.items():
+                    if entry is None:
+                        entries.pop(session_id, None)
+                    else:
+                        entries[session_id] = entry
+
+                temp_file = self.catalog_file.with_name(
+                    f"{self.CATALOG_FILE}.{os.getpid()}.tmp"
+                )
+                with open(temp_file, "w") as f:
+                    json.dump({"version": CATALOG_VERSION, "sessions": entries}, f)
+                os.replace(temp_file, self.catalog_file)
+        except OSError as e:
+            # The catalog is only an index, sessions are still found without it
+            logger.warning(f"Failed to update session catalog: {e}")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive lock serializing catalog updates across processes"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_file, "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
@@ -0,0 +1,144 @@
+"""
+Asyncio request engine for consolidation sources
+
+Requests go through one pooled HTTP session, so connections are reused, and
+are admitted by the process-wide rate governor instead of sleeping between
+calls. Up to ``max_in_flight`` requests wait on the network at the same time,
+which lets the latency of many small lookups overlap while the provider's
+request rate is still respected.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+
+from ....utils.rate_governor import RateGovernor, get_rate_governor
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRequestEngine:
+    """Rate-limited concurrent HTTP requests over a shared session"""
+
+    def __init__(
+        self,
+        provider: str,
+        rate_limit: float,
+        max_in_flight: int = 8,
+        burst: float = 1.0,
+        timeout: int = 30,
+        max_retries: int = 3,
+        backoff_factor: float = 2.0,
+        initial_delay: float = 1.0,
+        session: Optional[requests.Session] = None,
+        governor: Optional[RateGovernor] = None,
+    ):
+        """
+        Args:
+            provider: Rate governor key shared with other clients of the API
+            rate_limit: Requests per second allowed by the provider
+            max_in_flight: Maximum number of concurrent requests
+            burst: Requests that may start back to back before the rate applies
+            timeout: Per-request timeout in seconds
+            max_retries: Attempts per request on connection errors
+            backoff_factor: Multiplier of the retry delay after each attempt
+            initial_delay: Delay before the first retry in seconds
+            session: Session to send requests with, a pooled one by default
+            governor: Rate governor, the process-wide one by default
+        """
+        self.provider = provider
+        self.governor = governor or get_rate_governor()
+        self.governor.register(provider, rate_limit, burst)
+        self.max_in_flight = max(1, max_in_flight)
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.backoff_factor = backoff_factor
+        self.initial_delay = initial_delay
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        self.api_calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives belong to one event loop, a new loop gets a new one
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._semaphore
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying connection errors with exponential backoff
+
+        Throttled responses are retried once the governor lets requests to the
+        provider through again, the last one is returned as is.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        delay = self.initial_delay
+
+        for attempt in range(self.max_retries):
+            async with self._get_semaphore():
+                await self.governor.acquire_async(self.provider)
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    response = await asyncio.to_thread(
+                        self.session.request, method, url, **kwargs
+                    )
+                    self.api_calls += 1
+                    self.governor.record_response(
+                        self.provider,
+                        response.status_code,
+                        getattr(response, "headers", None),
+                    )
+                    if response.status_code != 429 or attempt == self.max_retries - 1:
+                        return response
+                    logger.warning(
+                        f"{self.provider} throttled request on attempt "
+                        f"{attempt + 1}/{self.max_retries}, retrying"
+                    )
+                    continue
+                except (ConnectionError, ConnectionResetError, Timeout) as e:
+                    if attempt == self.max_retries - 1:
+                        logger.error(
+                            f"Connection error after {self.max_retries} attempts: {str(e)}"
+                        )
+                        raise
+                    logger.warning(
+                        f"Connection error on attempt {attempt + 1}/{self.max_retries}: "
+                        f"{str(e)}. Retrying in {delay} seconds..."
+                    )
+                finally:
+                    self.in_flight -= 1
+
+            # Back off outside the semaphore so other requests can proceed
+            await asyncio.sleep(delay)
+            delay *= self.backoff_factor
+
+        raise RuntimeError("unreachable")
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> requests.Response:
+        return await self.request("GET", url, params=params, **kwargs)
+
+    async def post(
+        self, url: str, json: Any = None, **kwargs: Any
+    ) -> requests.Response:
+        return await self.request("POST", url, json=json, **kwargs)
+
+    def close(self):
+        self.session.close()
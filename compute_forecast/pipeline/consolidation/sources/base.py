@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
+import asyncio
 import time
 from datetime import datetime
 import logging
@@ -18,6 +19,8 @@ from ..models import (
 )
 from ...metadata_collection.models import Paper
 from ....utils.profiling import profile_operation
+from ....utils.rate_governor import get_rate_governor
+from .async_engine import AsyncRequestEngine
 
 
 @dataclass
@@ -32,6 +35,8 @@ class SourceConfig:
     # Allow source-specific batch sizes for optimal performance
     find_batch_size: Optional[int] = None  # For finding papers (ID lookup)
     enrich_batch_size: Optional[int] = None  # For enrichment data fetching
+    # Concurrent requests of the async engine, still bounded by rate_limit
+    max_concurrent_requests: int = 8
 
 
 class BaseConsolidationSource(ABC):
@@ -43,18 +48,53 @@ class BaseConsolidationSource(ABC):
         self.logger = logging.getLogger(f"consolidation.{name}")
         self.api_calls = 0
         self.last_request_time = 0
+        self._engine: Optional[AsyncRequestEngine] = None
+
+        # Requests to the provider are admitted by the process-wide governor,
+        # shared with every other client of the same API
+        self.governor = get_rate_governor()
+        self.governor.register(name, config.rate_limit)
+
+    @property
+    def engine(self) -> AsyncRequestEngine:
+        """Async request engine shared by the async lookups of this source"""
+        if self._engine is None:
+            self._engine = AsyncRequestEngine(
+                provider=self.name,
+                rate_limit=self.config.rate_limit,
+                max_in_flight=self.config.max_concurrent_requests,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                governor=self.governor,
+            )
+        return self._engine
+
+    async def _async_request(self, method: str, url: str, **kwargs: Any):
+        """Send a request through the async engine"""
+        response = await self.engine.request(method, url, **kwargs)
+        self.api_calls += 1
+        return response
+
+    def close(self):
+        """Release the pooled connections of the async engine"""
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
 
     def _rate_limit(self):
         """Enforce rate limiting"""
         with profile_operation("rate_limit", source=self.name) as prof:
-            elapsed = time.time() - self.last_request_time
-            sleep_time = (1.0 / self.config.rate_limit) - elapsed
-            if sleep_time > 0:
-                if prof:
-                    prof.metadata["sleep_time"] = sleep_time
-                time.sleep(sleep_time)
+            sleep_time = self.governor.acquire(self.name)
+            if sleep_time > 0 and prof:
+                prof.metadata["sleep_time"] = sleep_time
             self.last_request_time = time.time()
 
+    def _record_response(self, response):
+        """Let the governor adapt the provider's rate to a response"""
+        self.governor.record_response(
+            self.name, response.status_code, getattr(response, "headers", None)
+        )
+
     def _create_provenance(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create provenance record"""
         return {
@@ -86,6 +126,20 @@ class BaseConsolidationSource(ABC):
         """
         pass
 
+    async def async_find_papers(self, papers: List[Paper]) -> Dict[str, str]:
+        """Async version of find_papers, runs the blocking lookup in a thread
+
+        Sources with an async implementation override this to overlap their
+        requests through the engine.
+        """
+        return await asyncio.to_thread(self.find_papers, papers)
+
+    async def async_fetch_all_fields(
+        self, source_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async version of fetch_all_fields, runs the blocking fetch in a thread"""
+        return await asyncio.to_thread(self.fetch_all_fields, source_ids)
+
     def enrich_papers(
         self, papers: List[Paper], progress_callback=None
     ) -> List[EnrichmentResult]:
@@ -141,55 +195,7 @@ class BaseConsolidationSource(ABC):
                     "create_results", source=self.name, batch_size=len(batch)
                 ):
                     for paper in batch:
-                        result = EnrichmentResult(paper_id=paper.paper_id or "")
-
-                        source_id = id_mapping.get(paper.paper_id or "")
-                        if source_id and source_id in enrichment_data:
-                            data = enrichment_data[source_id]
-
-                            # Add citation if found
-                            if data.get("citations") is not None:
-                                citation_record = CitationRecord(
-                                    source=self.name,
-                                    timestamp=datetime.now(),
-                                    original=False,
-                                    data=CitationData(count=data["citations"]),
-                                )
-                                result.citations.append(citation_record)
-
-                            # Add abstract if found
-                            if data.get("abstract"):
-                                abstract_record = AbstractRecord(
-                                    source=self.name,
-                                    timestamp=datetime.now(),
-                                    original=False,
-                                    data=AbstractData(text=data["abstract"]),
-                                )
-                                result.abstracts.append(abstract_record)
-
-                            # Add URLs if found
-                            for url in data.get("urls", []):
-                                url_record = URLRecord(
-                                    source=self.name,
-                                    timestamp=datetime.now(),
-                                    original=False,
-                                    data=URLData(url=url),
-                                )
-                                result.urls.append(url_record)
-
-                            # Add identifiers if found
-                            for identifier in data.get("identifiers", []):
-                                identifier_record = IdentifierRecord(
-                                    source=self.name,
-                                    timestamp=datetime.now(),
-                                    original=False,
-                                    data=IdentifierData(
-                                        identifier_type=identifier["type"],
-                                        identifier_value=identifier["value"],
-                                    ),
-                                )
-                                result.identifiers.append(identifier_record)
-
+                        result = self._create_result(paper, id_mapping, enrichment_data)
                         results.append(result)
 
                         # Call progress callback if provided
@@ -197,3 +203,94 @@ class BaseConsolidationSource(ABC):
                             progress_callback(result)
 
         return results
+
+    async def async_enrich_papers(
+        self, papers: List[Paper], progress_callback=None
+    ) -> List[EnrichmentResult]:
+        """Async enrichment workflow, same results as enrich_papers
+
+        Lookups within a batch run concurrently through async_find_papers and
+        async_fetch_all_fields.
+        """
+        results = []
+        find_batch_size = self.config.find_batch_size or self.config.batch_size
+
+        for i in range(0, len(papers), find_batch_size):
+            batch = papers[i : i + find_batch_size]
+
+            id_mapping = await self.async_find_papers(batch)
+            source_ids = list(id_mapping.values())
+
+            enrichment_data: Dict[str, Dict[str, Any]] = {}
+            if source_ids:
+                try:
+                    enrichment_data = await self.async_fetch_all_fields(source_ids)
+                except Exception as e:
+                    self.logger.error(f"Error fetching data: {e}")
+
+            for paper in batch:
+                result = self._create_result(paper, id_mapping, enrichment_data)
+                results.append(result)
+                if progress_callback:
+                    progress_callback(result)
+
+        return results
+
+    def _create_result(
+        self,
+        paper: Paper,
+        id_mapping: Dict[str, str],
+        enrichment_data: Dict[str, Dict[str, Any]],
+    ) -> EnrichmentResult:
+        """Create the enrichment result of one paper with provenance"""
+        result = EnrichmentResult(paper_id=paper.paper_id or "")
+
+        source_id = id_mapping.get(paper.paper_id or "")
+        if not source_id or source_id not in enrichment_data:
+            return result
+        data = enrichment_data[source_id]
+
+        # Add citation if found
+        if data.get("citations") is not None:
+            citation_record = CitationRecord(
+                source=self.name,
+                timestamp=datetime.now(),
+                original=False,
+                data=CitationData(count=data["citations"]),
+            )
+            result.citations.append(citation_record)
+
+        # Add abstract if found
+        if data.get("abstract"):
+            abstract_record = AbstractRecord(
+                source=self.name,
+                timestamp=datetime.now(),
+                original=False,
+                data=AbstractData(text=data["abstract"]),
+            )
+            result.abstracts.append(abstract_record)
+
+        # Add URLs if found
+        for url in data.get("urls", []):
+            url_record = URLRecord(
+                source=self.name,
+                timestamp=datetime.now(),
+                original=False,
+                data=URLData(url=url),
+            )
+            result.urls.append(url_record)
+
+        # Add identifiers if found
+        for identifier in data.get("identifiers", []):
+            identifier_record = IdentifierRecord(
+                source=self.name,
+                timestamp=datetime.now(),
+                original=False,
+                data=IdentifierData(
+                    identifier_type=identifier["type"],
+                    identifier_value=identifier["value"],
+                ),
+            )
+            result.identifiers.append(identifier_record)
+
+        return result
@@ -1,3 +1,4 @@
+import asyncio
 import requests
 from typing import List, Dict, Optional, Any
 import time
@@ -82,46 +83,21 @@ class OpenAlexSource(BaseConsolidationSource):
         self._rate_limit()
         response = requests.get(url, params=params, headers=self.headers, timeout=30)
         self.api_calls += 1
+        self._record_response(response)
         return response
 
     def find_papers(self, papers: List[Paper]) -> Dict[str, str]:
         """Find papers using OpenAlex search"""
-        mapping = {}
-
-        # Check for existing OpenAlex IDs
-        for paper in papers:
-            if paper.openalex_id:
-                mapping[paper.paper_id] = paper.openalex_id
-                continue
+        mapping = self._existing_ids(papers)
 
         # Batch search by DOI
-        dois = []
-        doi_to_paper = {}
-
-        for paper in papers:
-            if paper.paper_id not in mapping and paper.doi:
-                dois.append(paper.doi)
-                doi_to_paper[paper.doi] = paper.paper_id
-
-        if dois:
-            # OpenAlex OR filter syntax: doi:value1|value2|value3
-            filter_str = "doi:" + "|".join(dois)
-
+        doi_to_paper = self._doi_lookup(papers, mapping)
+        if doi_to_paper:
             try:
                 response = self._make_request(
-                    f"{self.base_url}/works",
-                    params={
-                        "filter": filter_str,
-                        "per-page": len(dois),
-                        "select": "id,doi",
-                    },
+                    f"{self.base_url}/works", params=self._doi_params(doi_to_paper)
                 )
-
-                if response.status_code == 200:
-                    for work in response.json().get("results", []):
-                        doi = work.get("doi", "").replace("https://doi.org/", "")
-                        if doi in doi_to_paper:
-                            mapping[doi_to_paper[doi]] = work["id"]
+                self._parse_doi_response(response, doi_to_paper, mapping)
             except Exception as e:
                 logger.error(f"Failed to lookup DOIs batch after retries: {str(e)}")
                 # Continue with title search for papers not found
@@ -133,40 +109,11 @@ class OpenAlexSource(BaseConsolidationSource):
 
             try:
                 response = self._make_request(
-                    f"{self.base_url}/works",
-                    params={
-                        "search": paper.title,
-                        "filter": f"publication_year:{paper.year}",
-                        "per-page": 1,
-                        "select": "id,title,publication_year,authorships",
-                    },
+                    f"{self.base_url}/works", params=self._title_params(paper)
                 )
-
-                if response.status_code == 200:
-                    results = response.json().get("results", [])
-                    if results:
-                        work = results[0]
-                        # Extract authors from the work
-                        work_authors = []
-                        for authorship in work.get("authorships", []):
-                            author = authorship.get("author", {})
-                            if author and author.get("display_name"):
-                                work_authors.append(author["display_name"])
-
-                        # Verify match using fuzzy matching with year and author info
-                        work_year = work.get("publication_year")
-                        if (
-                            self._similar_title(
-                                paper.title,
-                                work.get("title", ""),
-                                paper.year,
-                                work_year,
-                                paper.authors,  # Pass paper authors
-                                work_authors,  # Pass work authors
-                            )
-                            and paper.paper_id
-                        ):
-                            mapping[paper.paper_id] = work["id"]
+                work_id = self._match_title_response(paper, response)
+                if work_id and paper.paper_id:
+                    mapping[paper.paper_id] = work_id
             except Exception as e:
                 logger.error(
                     f"Failed to lookup paper '{paper.title}' after retries: {str(e)}"
@@ -175,116 +122,140 @@ class OpenAlexSource(BaseConsolidationSource):
 
         return {k: v for k, v in mapping.items() if k is not None}
 
-    def fetch_all_fields(self, source_ids: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Fetch all available fields in minimal API calls"""
-        results = {}
+    async def async_find_papers(self, papers: List[Paper]) -> Dict[str, str]:
+        """Find papers using OpenAlex search, with concurrent title lookups"""
+        mapping = self._existing_ids(papers)
 
-        # Build OR filter for all IDs using correct syntax
-        # OpenAlex supports OR within a single filter: openalex:id1|id2|id3
+        doi_to_paper = self._doi_lookup(papers, mapping)
+        if doi_to_paper:
+            try:
+                response = await self._async_request(
+                    "GET",
+                    f"{self.base_url}/works",
+                    params=self._doi_params(doi_to_paper),
+                    headers=self.headers,
+                )
+                self._parse_doi_response(response, doi_to_paper, mapping)
+            except Exception as e:
+                logger.error(f"Failed to lookup DOIs batch after retries: {str(e)}")
 
-        # Select all fields we need in one request
-        select_fields = "id,title,abstract_inverted_index,cited_by_count,ids,publication_year,authorships,primary_location,locations,concepts"
+        remaining = [paper for paper in papers if paper.paper_id not in mapping]
+        work_ids = await asyncio.gather(
+            *(self._async_title_lookup(paper) for paper in remaining)
+        )
+        for paper, work_id in zip(remaining, work_ids):
+            if work_id and paper.paper_id:
+                mapping[paper.paper_id] = work_id
+
+        return {k: v for k, v in mapping.items() if k is not None}
+
+    async def _async_title_lookup(self, paper: Paper) -> Optional[str]:
+        try:
+            response = await self._async_request(
+                "GET",
+                f"{self.base_url}/works",
+                params=self._title_params(paper),
+                headers=self.headers,
+            )
+            return self._match_title_response(paper, response)
+        except Exception as e:
+            logger.error(
+                f"Failed to lookup paper '{paper.title}' after retries: {str(e)}"
+            )
+            return None
+
+    def _existing_ids(self, papers: List[Paper]) -> Dict[str, str]:
+        """Papers that already carry an OpenAlex ID"""
+        return {
+            paper.paper_id: paper.openalex_id
+            for paper in papers
+            if paper.openalex_id and paper.paper_id
+        }
+
+    def _doi_lookup(
+        self, papers: List[Paper], mapping: Dict[str, str]
+    ) -> Dict[str, str]:
+        """DOIs of unmapped papers, mapped to their paper IDs"""
+        return {
+            paper.doi: paper.paper_id
+            for paper in papers
+            if paper.paper_id not in mapping and paper.doi and paper.paper_id
+        }
+
+    def _doi_params(self, doi_to_paper: Dict[str, str]) -> Dict[str, Any]:
+        # OpenAlex OR filter syntax: doi:value1|value2|value3
+        return {
+            "filter": "doi:" + "|".join(doi_to_paper),
+            "per-page": len(doi_to_paper),
+            "select": "id,doi",
+        }
+
+    def _parse_doi_response(
+        self,
+        response: requests.Response,
+        doi_to_paper: Dict[str, str],
+        mapping: Dict[str, str],
+    ):
+        if response.status_code != 200:
+            return
+        for work in response.json().get("results", []):
+            doi = work.get("doi", "").replace("https://doi.org/", "")
+            if doi in doi_to_paper:
+                mapping[doi_to_paper[doi]] = work["id"]
+
+    def _title_params(self, paper: Paper) -> Dict[str, Any]:
+        return {
+            "search": paper.title,
+            "filter": f"publication_year:{paper.year}",
+            "per-page": 1,
+            "select": "id,title,publication_year,authorships",
+        }
+
+    def _match_title_response(
+        self, paper: Paper, response: requests.Response
+    ) -> Optional[str]:
+        """OpenAlex ID of the top title search result, if it is the same paper"""
+        if response.status_code != 200:
+            return None
+        results = response.json().get("results", [])
+        if not results:
+            return None
+
+        work = results[0]
+        # Extract authors from the work
+        work_authors = []
+        for authorship in work.get("authorships", []):
+            author = authorship.get("author", {})
+            if author and author.get("display_name"):
+                work_authors.append(author["display_name"])
+
+        # Verify match using fuzzy matching with year and author info
+        if self._similar_title(
+            paper.title,
+            work.get("title", ""),
+            paper.year,
+            work.get("publication_year"),
+            paper.authors,  # Pass paper authors
+            work_authors,  # Pass work authors
+        ):
+            work_id: str = work["id"]
+            return work_id
+        return None
+
+    def fetch_all_fields(self, source_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch all available fields in minimal API calls"""
+        results: Dict[str, Dict[str, Any]] = {}
 
         # Process in batches (OpenAlex has URL length limits)
         batch_size = self.config.enrich_batch_size or 50
         for i in range(0, len(source_ids), batch_size):
             batch = source_ids[i : i + batch_size]
 
-            # Build filter string: openalex:id1|id2|id3
-            filter_str = "openalex:" + "|".join(batch)
-
             try:
                 response = self._make_request(
-                    f"{self.base_url}/works",
-                    params={
-                        "filter": filter_str,
-                        "per-page": len(batch),
-                        "select": select_fields,
-                    },
+                    f"{self.base_url}/works", params=self._fetch_params(batch)
                 )
-
-                if response.status_code == 200:
-                    for work in response.json().get("results", []):
-                        work_id = work.get("id")
-                        if not work_id:
-                            continue
-
-                        # Extract all data from single response
-                        paper_data = {
-                            "citations": work.get("cited_by_count", 0),
-                            "abstract": None,
-                            "urls": [],
-                            "identifiers": [],
-                            "authors": [],
-                            "concepts": work.get("concepts", []),
-                        }
-
-                        # Convert inverted index to text
-                        inverted = work.get("abstract_inverted_index", {})
-                        if inverted:
-                            paper_data["abstract"] = self._inverted_to_text(inverted)
-
-                        # Extract author information
-                        for authorship in work.get("authorships", []):
-                            author_info = {
-                                "name": authorship.get("author", {}).get(
-                                    "display_name"
-                                ),
-                                "institutions": [
-                                    inst.get("display_name")
-                                    for inst in authorship.get("institutions", [])
-                                ],
-                            }
-                            paper_data["authors"].append(author_info)
-
-                        # Extract URLs from locations
-                        if work.get("primary_location") and work[
-                            "primary_location"
-                        ].get("pdf_url"):
-                            paper_data["urls"].append(
-                                work["primary_location"]["pdf_url"]
-                            )
-
-                        # Check other locations for open access URLs
-                        for location in work.get("locations", []):
-                            if (
-                                location.get("pdf_url")
-                                and location["pdf_url"] not in paper_data["urls"]
-                            ):
-                                paper_data["urls"].append(location["pdf_url"])
-
-                        # Extract all identifiers
-                        # Add OpenAlex ID
-                        if work_id:
-                            paper_data["identifiers"].append(
-                                {"type": "openalex", "value": work_id}
-                            )
-
-                        # Extract other identifiers from 'ids' field
-                        ids = work.get("ids", {})
-
-                        # Map OpenAlex identifier types to our types
-                        id_mappings = {
-                            "doi": "doi",
-                            "pmid": "pmid",
-                            "mag": "mag",  # OpenAlex includes MAG IDs
-                        }
-
-                        for oa_type, our_type in id_mappings.items():
-                            if oa_type in ids and ids[oa_type]:
-                                # Handle DOI format (OpenAlex returns full URL)
-                                value = ids[oa_type]
-                                if our_type == "doi" and value.startswith(
-                                    "https://doi.org/"
-                                ):
-                                    value = value.replace("https://doi.org/", "")
-
-                                paper_data["identifiers"].append(
-                                    {"type": our_type, "value": str(value)}
-                                )
-
-                        # Use the work_id as key to match what find_papers returned
-                        results[work_id] = paper_data
+                self._parse_works(response, results)
             except Exception as e:
                 logger.error(
                     f"Failed to fetch enrichment data for batch after retries: {str(e)}"
@@ -293,6 +264,123 @@ class OpenAlexSource(BaseConsolidationSource):
 
         return results
 
+    async def async_fetch_all_fields(
+        self, source_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch all available fields, with the batches requested concurrently"""
+        results: Dict[str, Dict[str, Any]] = {}
+        batch_size = self.config.enrich_batch_size or 50
+
+        async def fetch_batch(batch: List[str]):
+            try:
+                response = await self._async_request(
+                    "GET",
+                    f"{self.base_url}/works",
+                    params=self._fetch_params(batch),
+                    headers=self.headers,
+                )
+                self._parse_works(response, results)
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch enrichment data for batch after retries: {str(e)}"
+                )
+
+        await asyncio.gather(
+            *(
+                fetch_batch(source_ids[i : i + batch_size])
+                for i in range(0, len(source_ids), batch_size)
+            )
+        )
+        return results
+
+    def _fetch_params(self, batch: List[str]) -> Dict[str, Any]:
+        # OpenAlex supports OR within a single filter: openalex:id1|id2|id3
+        # Select all fields we need in one request
+        select_fields = "id,title,abstract_inverted_index,cited_by_count,ids,publication_year,authorships,primary_location,locations,concepts"
+        return {
+            "filter": "openalex:" + "|".join(batch),
+            "per-page": len(batch),
+            "select": select_fields,
+        }
+
+    def _parse_works(
+        self, response: requests.Response, results: Dict[str, Dict[str, Any]]
+    ):
+        """Add the enrichment data of each work in a response to results"""
+        if response.status_code != 200:
+            return
+
+        for work in response.json().get("results", []):
+            work_id = work.get("id")
+            if not work_id:
+                continue
+
+            # Extract all data from single response
+            paper_data: Dict[str, Any] = {
+                "citations": work.get("cited_by_count", 0),
+                "abstract": None,
+                "urls": [],
+                "identifiers": [],
+                "authors": [],
+                "concepts": work.get("concepts", []),
+            }
+
+            # Convert inverted index to text
+            inverted = work.get("abstract_inverted_index", {})
+            if inverted:
+                paper_data["abstract"] = self._inverted_to_text(inverted)
+
+            # Extract author information
+            for authorship in work.get("authorships", []):
+                author_info = {
+                    "name": authorship.get("author", {}).get("display_name"),
+                    "institutions": [
+                        inst.get("display_name")
+                        for inst in authorship.get("institutions", [])
+                    ],
+                }
+                paper_data["authors"].append(author_info)
+
+            # Extract URLs from locations
+            if work.get("primary_location") and work["primary_location"].get("pdf_url"):
+                paper_data["urls"].append(work["primary_location"]["pdf_url"])
+
+            # Check other locations for open access URLs
+            for location in work.get("locations", []):
+                if (
+                    location.get("pdf_url")
+                    and location["pdf_url"] not in paper_data["urls"]
+                ):
+                    paper_data["urls"].append(location["pdf_url"])
+
+            # Extract all identifiers
+            # Add OpenAlex ID
+            paper_data["identifiers"].append({"type": "openalex", "value": work_id})
+
+            # Extract other identifiers from 'ids' field
+            ids = work.get("ids", {})
+
+            # Map OpenAlex identifier types to our types
+            id_mappings = {
+                "doi": "doi",
+                "pmid": "pmid",
+                "mag": "mag",  # OpenAlex includes MAG IDs
+            }
+
+            for oa_type, our_type in id_mappings.items():
+                if oa_type in ids and ids[oa_type]:
+                    # Handle DOI format (OpenAlex returns full URL)
+                    value = ids[oa_type]
+                    if our_type == "doi" and value.startswith("https://doi.org/"):
+                        value = value.replace("https://doi.org/", "")
+
+                    paper_data["identifiers"].append(
+                        {"type": our_type, "value": str(value)}
+                    )
+
+            # Use the work_id as key to match what find_papers returned
+            results[work_id] = paper_data
+
     def _inverted_to_text(self, inverted_index: Dict[str, List[int]]) -> str:
         """Convert OpenAlex inverted index to text"""
         words = []
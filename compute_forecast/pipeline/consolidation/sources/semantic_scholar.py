@@ -1,3 +1,4 @@
+import asyncio
 import requests
 import time
 from typing import List, Dict, Optional, Any
@@ -11,6 +12,9 @@ from .title_matcher import TitleMatcher
 
 logger = logging.getLogger(__name__)
 
+# All fields fetched for enrichment, in one request per batch
+FETCH_FIELDS = "paperId,title,abstract,citationCount,year,authors,externalIds,corpusId,openAccessPdf,fieldsOfStudy,venue"
+
 
 def retry_on_connection_error(max_retries=3, backoff_factor=2, initial_delay=1):
     """Decorator to retry requests on connection errors with exponential backoff."""
@@ -111,36 +115,15 @@ class SemanticScholarSource(BaseConsolidationSource):
 
     def find_papers(self, papers: List[Paper]) -> Dict[str, str]:
         """Find papers using multiple identifiers"""
-        mapping = {}
-
-        # Try to match by existing Semantic Scholar ID
-        for paper in papers:
-            if paper.paper_id and paper.paper_id.startswith("SS:"):
-                mapping[paper.paper_id] = paper.paper_id[3:]
-                continue
+        mapping = self._existing_ids(papers)
 
         # Batch lookup by DOI and ArXiv ID
-        id_batch = []
-        id_to_paper = {}
-
-        for paper in papers:
-            if paper.paper_id in mapping:
-                continue
+        id_to_paper = self._id_lookup(papers, mapping)
 
-            # Collect all available IDs (Semantic Scholar can match any)
-            if paper.doi:
-                id_batch.append(f"DOI:{paper.doi}")
-                id_to_paper[f"DOI:{paper.doi}"] = paper.paper_id
-            if paper.arxiv_id:
-                id_batch.append(f"ARXIV:{paper.arxiv_id}")
-                id_to_paper[f"ARXIV:{paper.arxiv_id}"] = paper.paper_id
-            # Note: OpenAlex IDs are not directly supported by Semantic Scholar
-            # We'd need to map them through DOI or other identifiers
-
-        if id_batch:
+        if id_to_paper:
             # Use paper batch endpoint
             with profile_operation(
-                "id_batch_lookup", source=self.name, count=len(id_batch)
+                "id_batch_lookup", source=self.name, count=len(id_to_paper)
             ) as prof:
                 self._rate_limit()
 
@@ -148,46 +131,27 @@ class SemanticScholarSource(BaseConsolidationSource):
                 api_start = time.time()
                 response = self._make_post_request(
                     f"{self.graph_url}/paper/batch",
-                    json={"ids": id_batch},  # Already formatted with prefixes
+                    json={"ids": list(id_to_paper)},  # Already formatted with prefixes
                     headers=self.headers,
                     params={"fields": "paperId,externalIds"},
                     timeout=30,  # Add timeout
                 )
                 api_time = time.time() - api_start
                 self.api_calls += 1
+                self._record_response(response)
 
                 if prof:
                     prof.metadata["api_response_time"] = api_time
                     prof.metadata["status_code"] = response.status_code
 
-                if response.status_code == 200:
-                    matches_found = 0
-                    with profile_operation("parse_id_response", source=self.name):
-                        for item in response.json():
-                            if item and "paperId" in item:
-                                ext_ids = item.get("externalIds", {})
-
-                                # Check DOI match
-                                doi = ext_ids.get("DOI")
-                                if doi and f"DOI:{doi}" in id_to_paper:
-                                    paper_id = id_to_paper[f"DOI:{doi}"]
-                                    if paper_id:
-                                        mapping[paper_id] = item["paperId"]
-                                        matches_found += 1
-
-                                # Check ArXiv match
-                                arxiv = ext_ids.get("ArXiv")
-                                if arxiv and f"ARXIV:{arxiv}" in id_to_paper:
-                                    paper_id = id_to_paper[f"ARXIV:{arxiv}"]
-                                    if paper_id:
-                                        mapping[paper_id] = item["paperId"]
-                                        matches_found += 1
-
-                    if prof:
-                        prof.metadata["matches_found"] = matches_found
-                        prof.metadata["match_rate"] = (
-                            matches_found / len(id_batch) if id_batch else 0
-                        )
+                with profile_operation("parse_id_response", source=self.name):
+                    matches_found = self._parse_id_response(
+                        response, id_to_paper, mapping
+                    )
+
+                if prof and response.status_code == 200:
+                    prof.metadata["matches_found"] = matches_found
+                    prof.metadata["match_rate"] = matches_found / len(id_to_paper)
 
         # Fallback: Search by title for remaining papers
         unmapped_count = len([p for p in papers if p.paper_id not in mapping])
@@ -203,72 +167,166 @@ class SemanticScholarSource(BaseConsolidationSource):
                         "title_search_single", source=self.name
                     ) as prof:
                         self._rate_limit()
-                        query = f'"{paper.title}"'
 
                         # Track API response time
                         api_start = time.time()
                         response = self._make_get_request(
                             f"{self.graph_url}/paper/search",
-                            params={
-                                "query": query,
-                                "limit": 1,
-                                "fields": "paperId,title,year,authors",
-                            },
+                            params=self._title_params(paper),
                             headers=self.headers,
                             timeout=30,
                         )
                         api_time = time.time() - api_start
                         self.api_calls += 1
+                        self._record_response(response)
 
                         if prof:
                             prof.metadata["api_response_time"] = api_time
                             prof.metadata["status_code"] = response.status_code
                             prof.metadata["title_length"] = len(paper.title)
 
-                        if response.status_code == 200:
-                            data = response.json()
-                            if data.get("data"):
-                                result = data["data"][0]
-                                # Verify it's the same paper using fuzzy matching
-                                # Extract authors from result if available
-                                result_authors = (
-                                    [a.get("name") for a in result.get("authors", [])]
-                                    if "authors" in result
-                                    else None
-                                )
-                                paper_authors = (
-                                    [a.name for a in paper.authors]
-                                    if paper.authors
-                                    else None
-                                )
-
-                                if self._similar_title(
-                                    paper.title,
-                                    result["title"],
-                                    paper.year,
-                                    result.get("year"),
-                                    paper_authors,
-                                    result_authors,
-                                ):
-                                    if paper.paper_id is not None:
-                                        mapping[paper.paper_id] = result["paperId"]
-                                    if prof:
-                                        prof.metadata["match_found"] = True
-                                else:
-                                    if prof:
-                                        prof.metadata["match_found"] = False
-                            else:
-                                if prof:
-                                    prof.metadata["match_found"] = False
+                        match = self._match_title_response(paper, response)
+                        if match and paper.paper_id is not None:
+                            mapping[paper.paper_id] = match
+                        if prof and response.status_code == 200:
+                            prof.metadata["match_found"] = match is not None
+
+        return mapping
+
+    async def async_find_papers(self, papers: List[Paper]) -> Dict[str, str]:
+        """Find papers using multiple identifiers, with concurrent title lookups"""
+        mapping = self._existing_ids(papers)
+
+        id_to_paper = self._id_lookup(papers, mapping)
+        if id_to_paper:
+            try:
+                response = await self._async_request(
+                    "POST",
+                    f"{self.graph_url}/paper/batch",
+                    json={"ids": list(id_to_paper)},
+                    headers=self.headers,
+                    params={"fields": "paperId,externalIds"},
+                )
+                self._parse_id_response(response, id_to_paper, mapping)
+            except Exception as e:
+                logger.error(f"Failed to lookup ID batch after retries: {str(e)}")
+
+        remaining = [paper for paper in papers if paper.paper_id not in mapping]
+        matches = await asyncio.gather(
+            *(self._async_title_lookup(paper) for paper in remaining)
+        )
+        for paper, match in zip(remaining, matches):
+            if match and paper.paper_id is not None:
+                mapping[paper.paper_id] = match
 
         return mapping
 
+    async def _async_title_lookup(self, paper: Paper) -> Optional[str]:
+        try:
+            response = await self._async_request(
+                "GET",
+                f"{self.graph_url}/paper/search",
+                params=self._title_params(paper),
+                headers=self.headers,
+            )
+            return self._match_title_response(paper, response)
+        except Exception as e:
+            logger.error(
+                f"Failed to lookup paper '{paper.title}' after retries: {str(e)}"
+            )
+            return None
+
+    def _existing_ids(self, papers: List[Paper]) -> Dict[str, str]:
+        """Papers that already carry a Semantic Scholar ID"""
+        return {
+            paper.paper_id: paper.paper_id[3:]
+            for paper in papers
+            if paper.paper_id and paper.paper_id.startswith("SS:")
+        }
+
+    def _id_lookup(
+        self, papers: List[Paper], mapping: Dict[str, str]
+    ) -> Dict[str, Optional[str]]:
+        """Prefixed DOI and ArXiv IDs of unmapped papers, mapped to paper IDs"""
+        id_to_paper: Dict[str, Optional[str]] = {}
+        for paper in papers:
+            if paper.paper_id in mapping:
+                continue
+
+            # Collect all available IDs (Semantic Scholar can match any)
+            if paper.doi:
+                id_to_paper[f"DOI:{paper.doi}"] = paper.paper_id
+            if paper.arxiv_id:
+                id_to_paper[f"ARXIV:{paper.arxiv_id}"] = paper.paper_id
+            # Note: OpenAlex IDs are not directly supported by Semantic Scholar
+            # We'd need to map them through DOI or other identifiers
+        return id_to_paper
+
+    def _parse_id_response(
+        self,
+        response: requests.Response,
+        id_to_paper: Dict[str, Optional[str]],
+        mapping: Dict[str, str],
+    ) -> int:
+        """Add ID batch matches to mapping, returns the number of matches"""
+        if response.status_code != 200:
+            return 0
+
+        matches_found = 0
+        for item in response.json():
+            if not item or "paperId" not in item:
+                continue
+            ext_ids = item.get("externalIds", {})
+
+            for key in (f"DOI:{ext_ids.get('DOI')}", f"ARXIV:{ext_ids.get('ArXiv')}"):
+                paper_id = id_to_paper.get(key)
+                if paper_id:
+                    mapping[paper_id] = item["paperId"]
+                    matches_found += 1
+        return matches_found
+
+    def _title_params(self, paper: Paper) -> Dict[str, Any]:
+        return {
+            "query": f'"{paper.title}"',
+            "limit": 1,
+            "fields": "paperId,title,year,authors",
+        }
+
+    def _match_title_response(
+        self, paper: Paper, response: requests.Response
+    ) -> Optional[str]:
+        """Paper ID of the top title search result, if it is the same paper"""
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        if not data.get("data"):
+            return None
+
+        result = data["data"][0]
+        # Verify it's the same paper using fuzzy matching
+        # Extract authors from result if available
+        result_authors = (
+            [a.get("name") for a in result.get("authors", [])]
+            if "authors" in result
+            else None
+        )
+        paper_authors = [a.name for a in paper.authors] if paper.authors else None
+
+        if self._similar_title(
+            paper.title,
+            result["title"],
+            paper.year,
+            result.get("year"),
+            paper_authors,
+            result_authors,
+        ):
+            paper_id: str = result["paperId"]
+            return paper_id
+        return None
+
     def fetch_all_fields(self, source_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """Fetch all available fields in a single API call per batch"""
-        results = {}
-
-        # All fields we want in one request (added corpusId)
-        fields = "paperId,title,abstract,citationCount,year,authors,externalIds,corpusId,openAccessPdf,fieldsOfStudy,venue"
+        results: Dict[str, Dict[str, Any]] = {}
 
         # Process in chunks of 500 (API limit)
         for i in range(0, len(source_ids), 500):
@@ -284,80 +342,103 @@ class SemanticScholarSource(BaseConsolidationSource):
                     f"{self.graph_url}/paper/batch",
                     json={"ids": batch},
                     headers=self.headers,
-                    params={"fields": fields},
+                    params={"fields": FETCH_FIELDS},
                     timeout=30,
                 )
                 api_time = time.time() - api_start
                 self.api_calls += 1
+                self._record_response(response)
 
                 if prof:
                     prof.metadata["api_response_time"] = api_time
                     prof.metadata["status_code"] = response.status_code
 
-                if response.status_code == 200:
-                    with profile_operation(
-                        "parse_enrichment_response", source=self.name
-                    ):
-                        for item in response.json():
-                            if item is None:
-                                continue
-
-                            paper_id = item.get("paperId")
-                            if not paper_id:
-                                continue
-
-                            # Extract all data from single response
-                            paper_data = {
-                                "citations": item.get("citationCount"),
-                                "abstract": item.get("abstract"),
-                                "urls": [],
-                                "identifiers": [],
-                                "authors": item.get("authors", []),
-                                "venue": item.get("venue"),
-                                "fields_of_study": item.get("fieldsOfStudy", []),
-                            }
-
-                            # Add open access PDF URL if available
-                            if item.get("openAccessPdf") and item["openAccessPdf"].get(
-                                "url"
-                            ):
-                                paper_data["urls"].append(item["openAccessPdf"]["url"])
-
-                            # Extract all identifiers
-                            # Add Semantic Scholar IDs
-                            if item.get("paperId"):
-                                paper_data["identifiers"].append(
-                                    {"type": "s2_paper", "value": item["paperId"]}
-                                )
-
-                            if item.get("corpusId"):
-                                paper_data["identifiers"].append(
-                                    {
-                                        "type": "s2_corpus",
-                                        "value": str(item["corpusId"]),
-                                    }
-                                )
-
-                            # Extract external identifiers
-                            ext_ids = item.get("externalIds", {})
-                            id_mappings = {
-                                "DOI": "doi",
-                                "ArXiv": "arxiv",
-                                "PubMed": "pmid",
-                                "ACL": "acl",
-                                "MAG": "mag",
-                            }
-
-                            for ext_type, our_type in id_mappings.items():
-                                if ext_type in ext_ids:
-                                    paper_data["identifiers"].append(
-                                        {"type": our_type, "value": ext_ids[ext_type]}
-                                    )
-
-                            results[paper_id] = paper_data
+                with profile_operation("parse_enrichment_response", source=self.name):
+                    self._parse_batch_response(response, results)
 
         return results
 
+    async def async_fetch_all_fields(
+        self, source_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch all available fields, with the batches requested concurrently"""
+        results: Dict[str, Dict[str, Any]] = {}
+
+        async def fetch_batch(batch: List[str]):
+            response = await self._async_request(
+                "POST",
+                f"{self.graph_url}/paper/batch",
+                json={"ids": batch},
+                headers=self.headers,
+                params={"fields": FETCH_FIELDS},
+            )
+            self._parse_batch_response(response, results)
+
+        await asyncio.gather(
+            *(
+                fetch_batch(source_ids[i : i + 500])
+                for i in range(0, len(source_ids), 500)
+            )
+        )
+        return results
+
+    def _parse_batch_response(
+        self, response: requests.Response, results: Dict[str, Dict[str, Any]]
+    ):
+        """Add the enrichment data of each paper in a batch response to results"""
+        if response.status_code != 200:
+            return
+
+        for item in response.json():
+            if item is None:
+                continue
+
+            paper_id = item.get("paperId")
+            if not paper_id:
+                continue
+
+            # Extract all data from single response
+            paper_data: Dict[str, Any] = {
+                "citations": item.get("citationCount"),
+                "abstract": item.get("abstract"),
+                "urls": [],
+                "identifiers": [],
+                "authors": item.get("authors", []),
+                "venue": item.get("venue"),
+                "fields_of_study": item.get("fieldsOfStudy", []),
+            }
+
+            # Add open access PDF URL if available
+            if item.get("openAccessPdf") and item["openAccessPdf"].get("url"):
+                paper_data["urls"].append(item["openAccessPdf"]["url"])
+
+            # Extract all identifiers
+            # Add Semantic Scholar IDs
+            paper_data["identifiers"].append({"type": "s2_paper", "value": paper_id})
+
+            if item.get("corpusId"):
+                paper_data["identifiers"].append(
+                    {"type": "s2_corpus", "value": str(item["corpusId"])}
+                )
+
+            # Extract external identifiers
+            ext_ids = item.get("externalIds", {})
+            id_mappings = {
+                "DOI": "doi",
+                "ArXiv": "arxiv",
+                "PubMed": "pmid",
+                "ACL": "acl",
+                "MAG": "mag",
+            }
+
+            for ext_type, our_type in id_mappings.items():
+                if ext_type in ext_ids:
+                    paper_data["identifiers"].append(
+                        {"type": our_type, "value": ext_ids[ext_type]}
+                    )
+
+            results[paper_id] = paper_data
+
     def _similar_title(
         self,
         title1: str,
@@ -1,10 +1,12 @@
 """Data models and collection components."""
 
-from . import collectors
-from . import processors
-from . import sources
+import importlib
+from typing import Any
+
 from .models import Paper, Author, CollectionQuery, CollectionResult
 
+_SUBMODULES = ("collectors", "processors", "sources")
+
 __all__ = [
     "collectors",
     "processors",
@@ -14,3 +16,13 @@ __all__ = [
     "CollectionQuery",
     "CollectionResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Collectors, processors and sources pull in API clients and scrapers,
+    # so they are imported on first access rather than with the models
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
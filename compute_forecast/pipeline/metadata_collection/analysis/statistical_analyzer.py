@@ -3,11 +3,12 @@ Statistical Analyzer for Issue #9 - Data Analysis System.
 Provides comprehensive statistical analysis of collected academic papers.
 """
 
+import hashlib
 import logging
 import numpy as np
-from collections import defaultdict, Counter
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple, cast
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,119 @@ class AnalysisSummary:
         }
 
 
+class _Missing:
+    """Marker of a field absent from a paper dictionary"""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+# Fields read by the analysis, in the order of a paper record
+_RECORD_FIELDS = ("citation_count", "author_count", "page_count", "venue", "year")
+
+
+def _extract_records(papers: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    return [tuple(p.get(name, _MISSING) for name in _RECORD_FIELDS) for p in papers]
+
+
+def _fingerprint(records: List[Tuple[Any, ...]]) -> str:
+    """Digest of the analysed content of a paper collection"""
+    return hashlib.blake2b(repr(records).encode(), digest_size=16).hexdigest()
+
+
+def _numbers(values: List[Any]) -> np.ndarray:
+    return np.asarray(values) if values else np.zeros(0, dtype=np.int64)
+
+
+class _PaperColumns:
+    """Columnar view of a paper collection, grouped by venue
+
+    Every field is extracted once into arrays aligned with the papers, with
+    masks for the papers where the field is usable. Indices of the papers of
+    each venue (case-insensitive) are kept in collection order, so per-venue
+    statistics only touch that venue's papers.
+    """
+
+    def __init__(self, records: List[Tuple[Any, ...]]):
+        count = len(records)
+        citation_col, author_col, page_col, venue_col, year_col = (
+            zip(*records) if records else ((),) * len(_RECORD_FIELDS)
+        )
+
+        def present(column: Sequence[Any]) -> np.ndarray:
+            return np.fromiter(
+                (v is not None and v is not _MISSING for v in column), bool, count
+            )
+
+        def numeric(column: Sequence[Any], default: int) -> np.ndarray:
+            return np.fromiter(
+                (int(v) if isinstance(v, (int, float)) else default for v in column),
+                np.int64,
+                count,
+            )
+
+        self.has_citations = present(citation_col)
+        # Where the key is absent the citation count defaults to 0
+        self.has_citation_default = np.fromiter(
+            (v is not None for v in citation_col), bool, count
+        )
+        self.has_authors = present(author_col)
+        self.has_pages = present(page_col)
+        self.citations = _numbers(
+            [v if ok else 0 for v, ok in zip(citation_col, self.has_citations)]
+        )
+        self.authors = _numbers(
+            [v if ok else 0 for v, ok in zip(author_col, self.has_authors)]
+        )
+        self.pages = _numbers(
+            [v if ok else 0 for v, ok in zip(page_col, self.has_pages)]
+        )
+
+        self.year_values = np.fromiter(
+            (v if isinstance(v, int) else 0 for v in year_col), np.int64, count
+        )
+        # Any year given, and years plausible for a publication
+        self.has_year = self.year_values != 0
+        self.valid_year = self.year_values > 1900
+        self.years: List[int] = [v for v, ok in zip(year_col, self.valid_year) if ok]
+        self.venues = [v for v in venue_col if v and v is not _MISSING]
+
+        # Simple quality score based on available metrics
+        self.quality_scores = (
+            np.minimum(numeric(citation_col, 0) / 50.0, 1.0) * 0.6  # Citation component
+            + np.minimum(numeric(author_col, 1) / 10.0, 1.0) * 0.2  # Author component
+            + np.minimum(numeric(page_col, 0) / 20.0, 1.0) * 0.2  # Page component
+        )
+
+        venue_index: Dict[str, int] = {}
+        venue_codes = np.fromiter(
+            (
+                venue_index.setdefault(
+                    v.lower() if isinstance(v, str) else "", len(venue_index)
+                )
+                for v in venue_col
+            ),
+            np.intp,
+            count,
+        )
+        self._venue_index = venue_index
+        order = np.argsort(venue_codes, kind="stable")
+        sizes = np.bincount(venue_codes, minlength=len(venue_index))
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+        self._venue_papers = [
+            order[bounds[code] : bounds[code + 1]] for code in range(len(venue_index))
+        ]
+
+    def venue_papers(self, venue: str) -> np.ndarray:
+        """Indices of the papers of a venue, in collection order"""
+        code = self._venue_index.get(venue.lower())
+        if code is None:
+            return np.zeros(0, dtype=np.intp)
+        return self._venue_papers[code]
+
+
 class StatisticalAnalyzer:
     """
     Comprehensive statistical analyzer for academic paper collections.
@@ -105,12 +219,19 @@ class StatisticalAnalyzer:
     - Citation distribution analysis
     - Author collaboration patterns
     - Quality metrics calculation
+
+    Results are cached by a fingerprint of the analysed paper fields, so a
+    changed collection is never answered from the cache.
     """
 
-    def __init__(self):
-        self.analysis_cache: Dict[str, Any] = {}
-        self.cache_timestamp: Dict[str, datetime] = {}
+    def __init__(self, max_cache_entries: int = 100):
+        # Least recently used first, entries are (cached at, result)
+        self.analysis_cache: OrderedDict[Tuple[str, ...], Tuple[datetime, Any]] = (
+            OrderedDict()
+        )
         self.cache_duration = timedelta(hours=1)
+        self.max_cache_entries = max_cache_entries
+        self._columns: Optional[Tuple[str, _PaperColumns]] = None
 
         logger.info("StatisticalAnalyzer initialized")
 
@@ -127,39 +248,22 @@ class StatisticalAnalyzer:
         if not papers:
             return PaperStatistics()
 
-        # Cache key for this analysis
-        cache_key = f"paper_analysis_{len(papers)}_{hash(str(sorted(p.get('paper_id', '') for p in papers[:10])))}"
-
-        if self._is_cached(cache_key):
-            cached_result = self.analysis_cache[cache_key]
-            if isinstance(cached_result, PaperStatistics):
-                return cached_result
-            return cast(PaperStatistics, cached_result)
+        fingerprint, columns = self._get_columns(papers)
+        cache_key = ("paper_analysis", fingerprint)
+        cached_result = self._get_cached(cache_key)
+        if cached_result is not None:
+            return cached_result  # type: ignore[no-any-return]
 
         stats = PaperStatistics()
         stats.total_papers = len(papers)
 
-        # Extract data for analysis
-        citations = [
-            p.get("citation_count", 0)
-            for p in papers
-            if p.get("citation_count") is not None
-        ]
-        authors = [
-            p.get("author_count", 0)
-            for p in papers
-            if p.get("author_count") is not None
-        ]
-        pages = [
-            p.get("page_count", 0) for p in papers if p.get("page_count") is not None
-        ]
-        venues = [p.get("venue", "Unknown") for p in papers if p.get("venue")]
-        years = [
-            year for p in papers if (year := p.get("year")) is not None and year > 1900
-        ]
+        citations = columns.citations[columns.has_citations]
+        authors = columns.authors[columns.has_authors]
+        pages = columns.pages[columns.has_pages]
+        years = columns.years
 
         # Citation statistics
-        if citations:
+        if citations.size:
             stats.citation_stats = {
                 "mean": float(np.mean(citations)),
                 "median": float(np.median(citations)),
@@ -169,24 +273,24 @@ class StatisticalAnalyzer:
                 "q25": float(np.percentile(citations, 25)),
                 "q75": float(np.percentile(citations, 75)),
                 "skewness": float(self._calculate_skewness(citations)),
-                "total_citations": sum(citations),
+                "total_citations": citations.sum().item(),
             }
             stats.avg_citations_per_paper = stats.citation_stats["mean"]
 
         # Author statistics
-        if authors:
+        if authors.size:
             stats.author_stats = {
                 "mean_authors_per_paper": float(np.mean(authors)),
                 "median_authors_per_paper": float(np.median(authors)),
                 "std_authors_per_paper": float(np.std(authors)),
                 "min_authors": int(np.min(authors)),
                 "max_authors": int(np.max(authors)),
-                "single_author_papers": sum(1 for a in authors if a == 1),
-                "multi_author_papers": sum(1 for a in authors if a > 1),
+                "single_author_papers": int(np.count_nonzero(authors == 1)),
+                "multi_author_papers": int(np.count_nonzero(authors > 1)),
             }
 
         # Page statistics
-        if pages:
+        if pages.size:
             stats.page_stats = {
                 "mean_pages": float(np.mean(pages)),
                 "median_pages": float(np.median(pages)),
@@ -196,15 +300,15 @@ class StatisticalAnalyzer:
             }
 
         # Venue distribution
-        venue_counts = Counter(venues)
+        venue_counts = Counter(columns.venues)
         stats.venue_distribution = dict(venue_counts)
 
         # Calculate venue diversity (Shannon diversity index)
         if venue_counts:
-            total = sum(venue_counts.values())
-            proportions = [count / total for count in venue_counts.values()]
-            stats.venue_diversity_index = -sum(
-                p * np.log(p) for p in proportions if p > 0
+            counts = np.fromiter(venue_counts.values(), dtype=np.float64)
+            proportions = counts / counts.sum()
+            stats.venue_diversity_index = float(
+                -np.sum(proportions * np.log(proportions))
             )
 
         # Year distribution
@@ -216,9 +320,10 @@ class StatisticalAnalyzer:
             stats.temporal_coverage = max(years) - min(years) + 1
 
             # Calculate citation growth rate if we have multi-year data
-            if len(set(years)) > 1:
+            if len(year_counts) > 1:
+                dated = columns.valid_year & columns.has_citation_default
                 stats.citation_growth_rate = self._calculate_citation_growth_rate(
-                    papers
+                    columns.year_values[dated], columns.citations[dated]
                 )
 
         # Cache the result
@@ -239,122 +344,8 @@ class StatisticalAnalyzer:
         Returns:
             VenueStatistics object with venue-specific analysis
         """
-        venue_papers = [
-            p for p in papers if p.get("venue", "").lower() == venue.lower()
-        ]
-
-        if not venue_papers:
-            return VenueStatistics(venue_name=venue)
-
-        stats = VenueStatistics(venue_name=venue)
-        stats.total_papers = len(venue_papers)
-
-        # Years covered
-        years = [
-            year
-            for p in venue_papers
-            if (year := p.get("year")) is not None
-            and isinstance(year, int)
-            and year > 1900
-        ]
-        stats.years_covered = sorted(list(set(years)))
-
-        # Impact metrics
-        citations = [
-            p.get("citation_count", 0)
-            for p in venue_papers
-            if p.get("citation_count") is not None
-        ]
-        if citations:
-            stats.impact_metrics = {
-                "total_citations": sum(citations),
-                "avg_citations_per_paper": np.mean(citations),
-                "h_index": self._calculate_h_index(citations),
-                "citation_variance": np.var(citations),
-                "high_impact_papers": sum(
-                    1 for c in citations if c > np.percentile(citations, 90)
-                ),
-            }
-
-        # Author metrics
-        authors_per_paper = [
-            p.get("author_count", 0) for p in venue_papers if p.get("author_count")
-        ]
-        if authors_per_paper:
-            # Extract unique authors (simplified - would need actual author lists)
-            estimated_unique_authors = sum(authors_per_paper) * 0.7  # Rough estimate
-
-            stats.author_metrics = {
-                "avg_authors_per_paper": np.mean(authors_per_paper),
-                "estimated_unique_authors": int(estimated_unique_authors),
-                "collaboration_index": np.mean(authors_per_paper)
-                / max(authors_per_paper)
-                if authors_per_paper
-                else 0,
-            }
-
-        # Citation metrics by year
-        if years and citations:
-            citation_by_year = defaultdict(list)
-            for paper in venue_papers:
-                year = paper.get("year")
-                cites = paper.get("citation_count", 0)
-                if year and cites is not None:
-                    citation_by_year[year].append(cites)
-
-            stats.citation_metrics = {
-                "citation_growth_trend": self._analyze_yearly_citation_trend(
-                    citation_by_year
-                ),
-                "peak_year": max(
-                    citation_by_year.keys(), key=lambda y: np.mean(citation_by_year[y])
-                )
-                if citation_by_year
-                else None,
-                "most_productive_year": max(years, key=years.count) if years else None,
-            }
-
-        # Quality metrics
-        if venue_papers:
-            quality_scores = []
-            for paper in venue_papers:
-                # Calculate a simple quality score based on available metrics
-                citation_count = (
-                    int(paper.get("citation_count", 0))
-                    if isinstance(paper.get("citation_count", 0), (int, float))
-                    else 0
-                )
-                authors = (
-                    int(paper.get("author_count", 1))
-                    if isinstance(paper.get("author_count", 1), (int, float))
-                    else 1
-                )
-                pages = (
-                    int(paper.get("page_count", 0))
-                    if isinstance(paper.get("page_count", 0), (int, float))
-                    else 0
-                )
-
-                # Simple quality scoring
-                quality_score = (
-                    min(citation_count / 50.0, 1.0) * 0.6  # Citation component
-                    + min(authors / 10.0, 1.0) * 0.2  # Author component
-                    + min(pages / 20.0, 1.0) * 0.2  # Page component
-                )
-                quality_scores.append(quality_score)
-
-            if quality_scores:
-                stats.quality_metrics = {
-                    "avg_quality_score": float(np.mean(quality_scores)),
-                    "quality_variance": float(np.var(quality_scores)),
-                    "high_quality_papers": sum(1 for q in quality_scores if q > 0.7),
-                    "excellent_papers": sum(1 for q in quality_scores if q > 0.8),
-                    "good_papers": sum(1 for q in quality_scores if 0.6 < q <= 0.8),
-                    "fair_papers": sum(1 for q in quality_scores if 0.4 < q <= 0.6),
-                    "poor_papers": sum(1 for q in quality_scores if q <= 0.4),
-                }
-
-        return stats
+        fingerprint, columns = self._get_columns(papers)
+        return self._venue_statistics(fingerprint, columns, venue)
 
     def generate_analysis_summary(
         self, papers: List[Dict[str, Any]]
@@ -411,104 +402,169 @@ class StatisticalAnalyzer:
         Returns:
             Dictionary mapping venue names to their statistics
         """
-        comparison = {}
+        # One pass over the papers serves every venue
+        fingerprint, columns = self._get_columns(papers)
+        return {
+            venue: self._venue_statistics(fingerprint, columns, venue)
+            for venue in venues
+        }
 
-        for venue in venues:
-            venue_stats = self.analyze_venue_specific(papers, venue)
-            comparison[venue] = venue_stats
+    def _venue_statistics(
+        self, fingerprint: str, columns: _PaperColumns, venue: str
+    ) -> VenueStatistics:
+        cache_key = ("venue_analysis", fingerprint, venue)
+        cached_result = self._get_cached(cache_key)
+        if cached_result is not None:
+            return cached_result  # type: ignore[no-any-return]
 
-        return comparison
+        indices = columns.venue_papers(venue)
+        stats = VenueStatistics(venue_name=venue)
+        if not indices.size:
+            return stats
+        stats.total_papers = int(indices.size)
 
-    def _calculate_h_index(self, citations: List[int]) -> int:
-        """Calculate h-index from citation counts."""
-        if not citations:
-            return 0
+        # Years covered
+        dated = indices[columns.valid_year[indices]]
+        years = columns.year_values[dated]
+        stats.years_covered = np.unique(years).tolist()
 
-        # Sort citations in descending order
-        sorted_citations = sorted(citations, reverse=True)
+        # Impact metrics
+        citations = columns.citations[indices[columns.has_citations[indices]]]
+        if citations.size:
+            stats.impact_metrics = {
+                "total_citations": citations.sum().item(),
+                "avg_citations_per_paper": np.mean(citations),
+                "h_index": self._calculate_h_index(citations),
+                "citation_variance": np.var(citations),
+                "high_impact_papers": int(
+                    np.count_nonzero(citations > np.percentile(citations, 90))
+                ),
+            }
 
-        h_index = 0
-        for i, citation_count in enumerate(sorted_citations, 1):
-            if citation_count >= i:
-                h_index = i
-            else:
-                break
+        # Author metrics
+        authors_per_paper = columns.authors[indices[columns.has_authors[indices]]]
+        authors_per_paper = authors_per_paper[authors_per_paper != 0]
+        if authors_per_paper.size:
+            # Extract unique authors (simplified - would need actual author lists)
+            estimated_unique_authors = authors_per_paper.sum() * 0.7  # Rough estimate
 
-        return h_index
+            stats.author_metrics = {
+                "avg_authors_per_paper": np.mean(authors_per_paper),
+                "estimated_unique_authors": int(estimated_unique_authors),
+                "collaboration_index": np.mean(authors_per_paper)
+                / np.max(authors_per_paper),
+            }
+
+        # Citation metrics by year
+        if years.size and citations.size:
+            cited = indices[
+                columns.has_year[indices] & columns.has_citation_default[indices]
+            ]
+            year_list, first_seen, year_codes = np.unique(
+                columns.year_values[cited], return_index=True, return_inverse=True
+            )
+            yearly_averages = np.bincount(
+                year_codes, weights=columns.citations[cited]
+            ) / np.bincount(year_codes)
+
+            # Ties go to the year appearing first, as in the paper order
+            by_appearance = np.argsort(first_seen, kind="stable")
+            productive_years, first_listed, year_counts = np.unique(
+                years, return_index=True, return_counts=True
+            )
+            most_productive = np.lexsort((first_listed, -year_counts))[0]
+
+            stats.citation_metrics = {
+                "citation_growth_trend": self._analyze_yearly_citation_trend(
+                    yearly_averages
+                ),
+                "peak_year": int(
+                    year_list[by_appearance[np.argmax(yearly_averages[by_appearance])]]
+                )
+                if year_list.size
+                else None,
+                "most_productive_year": int(productive_years[most_productive]),
+            }
+
+        # Quality metrics
+        quality_scores = columns.quality_scores[indices]
+        stats.quality_metrics = {
+            "avg_quality_score": float(np.mean(quality_scores)),
+            "quality_variance": float(np.var(quality_scores)),
+            "high_quality_papers": int(np.count_nonzero(quality_scores > 0.7)),
+            "excellent_papers": int(np.count_nonzero(quality_scores > 0.8)),
+            "good_papers": int(
+                np.count_nonzero((quality_scores > 0.6) & (quality_scores <= 0.8))
+            ),
+            "fair_papers": int(
+                np.count_nonzero((quality_scores > 0.4) & (quality_scores <= 0.6))
+            ),
+            "poor_papers": int(np.count_nonzero(quality_scores <= 0.4)),
+        }
+
+        self._cache_result(cache_key, stats)
+        return stats
 
-    def _calculate_skewness(self, data: List[float]) -> float:
+    def _calculate_h_index(self, citations: Union[np.ndarray, Sequence[float]]) -> int:
+        """Calculate h-index from citation counts."""
+        if not len(citations):
+            return 0
+
+        # The i-th most cited paper counts while it has at least i citations
+        sorted_citations = np.sort(np.asarray(citations))[::-1]
+        ranks = np.arange(1, len(sorted_citations) + 1)
+        return int(np.count_nonzero(sorted_citations >= ranks))
+
+    def _calculate_skewness(self, data: Union[np.ndarray, Sequence[float]]) -> float:
         """Calculate skewness of data distribution."""
         if len(data) < 3:
             return 0.0
 
-        mean = np.mean(data)
-        std = np.std(data)
+        values = np.asarray(data, dtype=np.float64)
+        mean = np.mean(values)
+        std = np.std(values)
 
         if std == 0:
             return 0.0
 
-        n = len(data)
-        skewness = (n / ((n - 1) * (n - 2))) * sum(
-            ((x - mean) / std) ** 3 for x in data
-        )
+        n = len(values)
+        skewness = (n / ((n - 1) * (n - 2))) * np.sum(((values - mean) / std) ** 3)
 
         return float(skewness)
 
-    def _calculate_citation_growth_rate(self, papers: List[Dict[str, Any]]) -> float:
+    def _calculate_citation_growth_rate(
+        self, years: np.ndarray, citations: np.ndarray
+    ) -> float:
         """Calculate citation growth rate over time."""
-        # Group papers by year and calculate average citations
-        year_citations = defaultdict(list)
-
-        for paper in papers:
-            year = paper.get("year")
-            citations = paper.get("citation_count", 0)
-            if year and year > 1900 and citations is not None:
-                year_citations[year].append(citations)
-
-        if len(year_citations) < 2:
+        if not years.size:
             return 0.0
 
-        # Calculate average citations per year
-        yearly_averages = {
-            year: np.mean(cites) for year, cites in year_citations.items()
-        }
-
-        # Sort by year
-        sorted_years = sorted(yearly_averages.keys())
-
-        if len(sorted_years) < 2:
+        first_year = years.min()
+        last_year = years.max()
+        years_span = int(last_year - first_year)
+        if years_span == 0:
             return 0.0
 
-        # Calculate simple growth rate
-        first_year_avg = yearly_averages[sorted_years[0]]
-        last_year_avg = yearly_averages[sorted_years[-1]]
-        years_span = sorted_years[-1] - sorted_years[0]
+        # Calculate simple growth rate between the average citations of the
+        # first and last years
+        first_year_avg = np.mean(citations[years == first_year])
+        last_year_avg = np.mean(citations[years == last_year])
 
-        if first_year_avg == 0 or years_span == 0:
+        if first_year_avg == 0:
             return 0.0
 
         growth_rate = ((last_year_avg / first_year_avg) ** (1 / years_span)) - 1
 
         return float(growth_rate)
 
-    def _analyze_yearly_citation_trend(
-        self, citation_by_year: Dict[int, List[int]]
-    ) -> str:
-        """Analyze citation trend across years."""
-        if len(citation_by_year) < 2:
+    def _analyze_yearly_citation_trend(self, yearly_averages: np.ndarray) -> str:
+        """Analyze citation trend across years, from averages sorted by year."""
+        if len(yearly_averages) < 2:
             return "insufficient_data"
 
-        yearly_averages = {
-            year: np.mean(cites) for year, cites in citation_by_year.items()
-        }
-        sorted_years = sorted(yearly_averages.keys())
-
-        # Simple trend analysis
-        averages = [yearly_averages[year] for year in sorted_years]
-
         # Calculate correlation with time
-        years_numeric = list(range(len(sorted_years)))
-        correlation = np.corrcoef(years_numeric, averages)[0, 1]
+        years_numeric = np.arange(len(yearly_averages))
+        correlation = np.corrcoef(years_numeric, yearly_averages)[0, 1]
 
         if correlation > 0.3:
             return "increasing"
@@ -576,28 +632,33 @@ class StatisticalAnalyzer:
 
         return insights
 
-    def _is_cached(self, cache_key: str) -> bool:
-        """Check if analysis result is cached and still valid."""
-        if cache_key not in self.analysis_cache:
-            return False
-
-        if cache_key not in self.cache_timestamp:
-            return False
-
-        return bool(
-            (datetime.now() - self.cache_timestamp[cache_key]) < self.cache_duration
-        )
-
-    def _cache_result(self, cache_key: str, result: Any) -> None:
-        """Cache analysis result with timestamp."""
-        self.analysis_cache[cache_key] = result
-        self.cache_timestamp[cache_key] = datetime.now()
+    def _get_columns(self, papers: List[Dict[str, Any]]) -> Tuple[str, _PaperColumns]:
+        """Fingerprint and columnar view of the papers, reused while unchanged"""
+        records = _extract_records(papers)
+        fingerprint = _fingerprint(records)
+        if self._columns is None or self._columns[0] != fingerprint:
+            self._columns = (fingerprint, _PaperColumns(records))
+        return self._columns
+
+    def _get_cached(self, cache_key: Tuple[str, ...]) -> Any:
+        """Cached analysis result, None if absent or expired."""
+        entry = self.analysis_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_at, result = entry
+        if datetime.now() - cached_at >= self.cache_duration:
+            del self.analysis_cache[cache_key]
+            return None
+
+        self.analysis_cache.move_to_end(cache_key)
+        return result
+
+    def _cache_result(self, cache_key: Tuple[str, ...], result: Any) -> None:
+        """Cache analysis result, evicting the least recently used entry."""
+        self.analysis_cache[cache_key] = (datetime.now(), result)
+        self.analysis_cache.move_to_end(cache_key)
 
         # Limit cache size
-        if len(self.analysis_cache) > 100:
-            # Remove oldest entries
-            oldest_key = min(
-                self.cache_timestamp.keys(), key=lambda k: self.cache_timestamp[k]
-            )
-            del self.analysis_cache[oldest_key]
-            del self.cache_timestamp[oldest_key]
+        while len(self.analysis_cache) > self.max_cache_entries:
+            self.analysis_cache.popitem(last=False)
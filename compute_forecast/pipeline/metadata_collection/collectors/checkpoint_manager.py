@@ -1,8 +1,14 @@
 """
 Checkpoint management for state persistence.
 Handles checkpoint creation, validation, and cleanup.
+
+Checkpoints of a session are stored in its append-only SessionLog, so creating
+one only writes what changed since the previous checkpoint and the latest
+checkpoint is served from the log's in-memory index.
 """
 
+import gzip
+import json
 import logging
 import threading
 from pathlib import Path
@@ -16,6 +22,7 @@ from .state_structures import (
     ValidationResult,
 )
 from .state_persistence import StatePersistence
+from .session_log import SessionLog
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +52,7 @@ class CheckpointManager:
         self.checkpoint_cleanup_interval = checkpoint_cleanup_interval
         self._lock = threading.RLock()
         self._checkpoint_counters: Dict[str, int] = {}
+        self._logs: Dict[str, SessionLog] = {}
 
         logger.info(
             f"CheckpointManager initialized with max_checkpoints={max_checkpoints_per_session}"
@@ -116,33 +124,26 @@ class CheckpointManager:
                     logger.error(f"Checkpoint validation failed for {checkpoint_id}")
                     return None
 
-                # Save checkpoint
-                checkpoint_path = self._get_checkpoint_path(session_id, checkpoint_id)
-                success = self.persistence.save_state_atomic(
-                    checkpoint_path, checkpoint, backup_previous=False
+                # Append the changes since the previous checkpoint to the log
+                self._get_log(session_id).append(checkpoint)
+
+                # Update checkpoint counter
+                self._checkpoint_counters[session_id] = (
+                    self._checkpoint_counters.get(session_id, 0) + 1
                 )
 
-                if success:
-                    # Update checkpoint counter
-                    self._checkpoint_counters[session_id] = (
-                        self._checkpoint_counters.get(session_id, 0) + 1
-                    )
-
-                    # Cleanup old checkpoints if needed
-                    if (
-                        self._checkpoint_counters[session_id]
-                        % self.checkpoint_cleanup_interval
-                        == 0
-                    ):
-                        self._cleanup_old_checkpoints(session_id)
-
-                    logger.debug(
-                        f"Created checkpoint {checkpoint_id} for session {session_id}"
-                    )
-                    return checkpoint_id
-                else:
-                    logger.error(f"Failed to save checkpoint {checkpoint_id}")
-                    return None
+                # Cleanup old checkpoints if needed
+                if (
+                    self._checkpoint_counters[session_id]
+                    % self.checkpoint_cleanup_interval
+                    == 0
+                ):
+                    self._cleanup_old_checkpoints(session_id)
+
+                logger.debug(
+                    f"Created checkpoint {checkpoint_id} for session {session_id}"
+                )
+                return checkpoint_id
 
             except Exception as e:
                 logger.error(f"Error creating checkpoint for session {session_id}: {e}")
@@ -162,12 +163,12 @@ class CheckpointManager:
             CheckpointData if found and valid, None otherwise
         """
         try:
-            checkpoint_path = self._get_checkpoint_path(session_id, checkpoint_id)
-            checkpoint = self.persistence.load_state(
-                checkpoint_path, CheckpointData, validate_integrity=True
-            )
+            checkpoint = self._get_log(session_id).get(checkpoint_id)
+            if checkpoint is None:
+                logger.debug(f"Checkpoint {checkpoint_id} not found")
+                return None
 
-            if checkpoint and checkpoint.validate_integrity():
+            if checkpoint.validate_integrity():
                 return checkpoint
             else:
                 logger.warning(f"Checkpoint {checkpoint_id} failed validation")
@@ -188,13 +189,18 @@ class CheckpointManager:
             Most recent valid CheckpointData, or None if no valid checkpoints
         """
         try:
-            checkpoints = self.list_checkpoints(session_id)
+            # The latest checkpoint comes from the log's in-memory state
+            checkpoint = self._get_log(session_id).latest()
 
-            if not checkpoints:
+            if checkpoint is None:
                 logger.debug(f"No checkpoints found for session {session_id}")
                 return None
 
-            # Sort by timestamp (most recent first)
+            if checkpoint.validate_integrity():
+                return checkpoint
+
+            # Fall back to the most recent valid one
+            checkpoints = self.list_checkpoints(session_id)
             checkpoints.sort(key=lambda x: x.timestamp, reverse=True)
 
             # Try to load the most recent valid checkpoint
@@ -222,28 +228,15 @@ class CheckpointManager:
             List of CheckpointData objects
         """
         try:
-            checkpoints_dir = self._get_checkpoints_dir(session_id)
-            if not checkpoints_dir.exists():
-                return []
-
-            checkpoints = []
-            checkpoint_files = list(checkpoints_dir.glob("checkpoint_*.json"))
-
-            for checkpoint_file in checkpoint_files:
-                checkpoint = self.persistence.load_state(
-                    checkpoint_file,
-                    CheckpointData,
-                    validate_integrity=False,  # We'll validate after loading
-                )
-
-                if checkpoint:
-                    # Validate integrity and update status
-                    if checkpoint.validate_integrity():
-                        checkpoint.validation_status = "valid"
-                    else:
-                        checkpoint.validation_status = "corrupted"
+            # One pass over the log rebuilds every checkpoint
+            checkpoints = self._get_log(session_id).checkpoints()
 
-                    checkpoints.append(checkpoint)
+            for checkpoint in checkpoints:
+                # Validate integrity and update status
+                if checkpoint.validate_integrity():
+                    checkpoint.validation_status = "valid"
+                else:
+                    checkpoint.validation_status = "corrupted"
 
             return checkpoints
 
@@ -276,50 +269,7 @@ class CheckpointManager:
                     can_be_used_for_recovery=False,
                 )
 
-            validation_errors = []
-            integrity_score = 1.0
-
-            # Data integrity check
-            if not checkpoint.validate_integrity():
-                validation_errors.append("Checksum validation failed")
-                integrity_score -= 0.5
-
-            # Data consistency checks
-            total_venues = (
-                len(checkpoint.venues_completed)
-                + len(checkpoint.venues_in_progress)
-                + len(checkpoint.venues_not_started)
-            )
-            if total_venues == 0:
-                validation_errors.append("No venues specified in checkpoint")
-                integrity_score -= 0.3
-
-            # Papers count consistency
-            papers_sum = sum(
-                sum(year_counts.values())
-                for year_counts in checkpoint.papers_by_venue.values()
-            )
-            if abs(papers_sum - checkpoint.papers_collected) > (
-                checkpoint.papers_collected * 0.1
-            ):
-                validation_errors.append("Papers count inconsistency detected")
-                integrity_score -= 0.2
-
-            # Session ID consistency
-            if checkpoint.session_id != session_id:
-                validation_errors.append("Session ID mismatch")
-                integrity_score -= 0.4
-
-            is_valid = len(validation_errors) == 0
-            can_be_used_for_recovery = integrity_score >= 0.5
-
-            return CheckpointValidationResult(
-                checkpoint_id=checkpoint_id,
-                is_valid=is_valid,
-                validation_errors=validation_errors,
-                integrity_score=max(0.0, integrity_score),
-                can_be_used_for_recovery=can_be_used_for_recovery,
-            )
+            return self._validate_loaded_checkpoint(session_id, checkpoint)
 
         except Exception as e:
             logger.error(f"Error validating checkpoint {checkpoint_id}: {e}")
@@ -331,6 +281,55 @@ class CheckpointManager:
                 can_be_used_for_recovery=False,
             )
 
+    def _validate_loaded_checkpoint(
+        self, session_id: str, checkpoint: CheckpointData
+    ) -> CheckpointValidationResult:
+        """Consistency checks of a loaded checkpoint"""
+        validation_errors = []
+        integrity_score = 1.0
+
+        # Data integrity check
+        if not checkpoint.validate_integrity():
+            validation_errors.append("Checksum validation failed")
+            integrity_score -= 0.5
+
+        # Data consistency checks
+        total_venues = (
+            len(checkpoint.venues_completed)
+            + len(checkpoint.venues_in_progress)
+            + len(checkpoint.venues_not_started)
+        )
+        if total_venues == 0:
+            validation_errors.append("No venues specified in checkpoint")
+            integrity_score -= 0.3
+
+        # Papers count consistency
+        papers_sum = sum(
+            sum(year_counts.values())
+            for year_counts in checkpoint.papers_by_venue.values()
+        )
+        if abs(papers_sum - checkpoint.papers_collected) > (
+            checkpoint.papers_collected * 0.1
+        ):
+            validation_errors.append("Papers count inconsistency detected")
+            integrity_score -= 0.2
+
+        # Session ID consistency
+        if checkpoint.session_id != session_id:
+            validation_errors.append("Session ID mismatch")
+            integrity_score -= 0.4
+
+        is_valid = len(validation_errors) == 0
+        can_be_used_for_recovery = integrity_score >= 0.5
+
+        return CheckpointValidationResult(
+            checkpoint_id=checkpoint.checkpoint_id,
+            is_valid=is_valid,
+            validation_errors=validation_errors,
+            integrity_score=max(0.0, integrity_score),
+            can_be_used_for_recovery=can_be_used_for_recovery,
+        )
+
     def cleanup_session_checkpoints(
         self, session_id: str, keep_latest: int = 10
     ) -> int:
@@ -346,38 +345,19 @@ class CheckpointManager:
         """
         with self._lock:
             try:
-                checkpoints = self.list_checkpoints(session_id)
+                log = self._get_log(session_id)
+                entries = log.entries()
 
-                if len(checkpoints) <= keep_latest:
+                if len(entries) <= keep_latest:
                     return 0
 
                 # Sort by timestamp (oldest first)
-                checkpoints.sort(key=lambda x: x.timestamp)
-
-                # Identify checkpoints to remove (all except the most recent)
-                checkpoints_to_remove = checkpoints[:-keep_latest]
-
-                cleaned_count = 0
-                for checkpoint in checkpoints_to_remove:
-                    checkpoint_path = self._get_checkpoint_path(
-                        session_id, checkpoint.checkpoint_id
-                    )
-                    try:
-                        if checkpoint_path.exists():
-                            checkpoint_path.unlink()
-                            cleaned_count += 1
-
-                        # Also remove metadata file if it exists
-                        meta_path = checkpoint_path.with_suffix(
-                            f"{checkpoint_path.suffix}.meta"
-                        )
-                        if meta_path.exists():
-                            meta_path.unlink()
-
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to remove checkpoint {checkpoint.checkpoint_id}: {e}"
-                        )
+                entries.sort(key=lambda x: x.timestamp)
+
+                # Drop all except the most recent from the log's index
+                cleaned_count = log.drop(
+                    [entry.checkpoint_id for entry in entries[:-keep_latest]]
+                )
 
                 logger.info(
                     f"Cleaned up {cleaned_count} old checkpoints for session {session_id}"
@@ -404,9 +384,7 @@ class CheckpointManager:
         checkpoints = self.list_checkpoints(session_id)
 
         for checkpoint in checkpoints:
-            validation_result = self.validate_checkpoint(
-                session_id, checkpoint.checkpoint_id
-            )
+            validation_result = self._validate_loaded_checkpoint(session_id, checkpoint)
 
             # Convert to ValidationResult format
             result = ValidationResult(
@@ -434,9 +412,51 @@ class CheckpointManager:
         """Get checkpoints directory for session"""
         return self.persistence.base_dir / "sessions" / session_id / "checkpoints"
 
-    def _get_checkpoint_path(self, session_id: str, checkpoint_id: str) -> Path:
-        """Get full path for checkpoint file"""
-        return self._get_checkpoints_dir(session_id) / f"{checkpoint_id}.json"
+    def _get_log(self, session_id: str) -> SessionLog:
+        """Checkpoint log of a session, opened on first use"""
+        with self._lock:
+            log = self._logs.get(session_id)
+            if log is None:
+                log = SessionLog(self._get_checkpoints_dir(session_id))
+                if not log.entries():
+                    self._import_checkpoint_files(session_id, log)
+                self._logs[session_id] = log
+            return log
+
+    def _import_checkpoint_files(self, session_id: str, log: SessionLog) -> None:
+        """Move checkpoints saved as one JSON file each into the log"""
+        checkpoints_dir = self._get_checkpoints_dir(session_id)
+        if not checkpoints_dir.exists():
+            return
+
+        checkpoints = []
+        for checkpoint_file in checkpoints_dir.iterdir():
+            try:
+                if checkpoint_file.name.endswith(".json.gz"):
+                    with gzip.open(checkpoint_file, "rt", encoding="utf-8") as f:
+                        checkpoint = CheckpointData.from_dict(json.load(f))
+                elif checkpoint_file.suffix == ".json":
+                    with open(checkpoint_file, "r", encoding="utf-8") as f:
+                        checkpoint = CheckpointData.from_dict(json.load(f))
+                else:
+                    continue
+            except Exception as e:
+                logger.warning(f"Skipping unreadable checkpoint {checkpoint_file}: {e}")
+                continue
+
+            if checkpoint.validate_integrity():
+                checkpoints.append(checkpoint)
+            else:
+                logger.warning(f"Skipping corrupted checkpoint {checkpoint_file}")
+
+        checkpoints.sort(key=lambda x: x.timestamp)
+        for checkpoint in checkpoints:
+            log.append(checkpoint)
+        if checkpoints:
+            logger.info(
+                f"Imported {len(checkpoints)} checkpoint files of session "
+                f"{session_id} into its checkpoint log"
+            )
 
     def _cleanup_old_checkpoints(self, session_id: str) -> None:
         """Automatic cleanup of old checkpoints"""
@@ -461,7 +481,9 @@ class CheckpointManager:
             Dictionary with checkpoint statistics
         """
         try:
-            checkpoints = self.list_checkpoints(session_id)
+            # Appended checkpoints passed validation and their log records
+            # are CRC checked, so the index alone answers this
+            checkpoints = self._get_log(session_id).entries()
 
             if not checkpoints:
                 return {
@@ -473,8 +495,8 @@ class CheckpointManager:
                     "checkpoint_types": {},
                 }
 
-            valid_count = sum(1 for c in checkpoints if c.validation_status == "valid")
-            corrupted_count = len(checkpoints) - valid_count
+            valid_count = len(checkpoints)
+            corrupted_count = 0
 
             # Sort by timestamp
             checkpoints.sort(key=lambda x: x.timestamp)
@@ -0,0 +1,213 @@
+"""
+Concurrent scheduling of domain collection jobs.
+
+Collecting a domain/year means searching several venues on every citation
+source. Each (domain, year, venue, source) search is expanded into an
+independent job. Jobs run on a bounded thread pool, with a concurrency limit
+per source, so sources are searched side by side and the wall time follows
+the slowest source instead of the sum of all searches.
+"""
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ....utils.rate_governor import RateGovernor, get_rate_governor
+
+logger = logging.getLogger(__name__)
+
+# Requests per second of the citation sources, shared with their other clients
+SOURCE_RATE_LIMITS = {
+    "google_scholar": 0.5,
+    "semantic_scholar": 1.0,
+    "openalex": 10.0,
+}
+
+
+@dataclass
+class CollectionJob:
+    """One search of a single source for a domain/year"""
+
+    domain: str
+    year: int
+    method: str
+    source: str
+    search: Callable[[], List[Dict[str, Any]]]
+    venue: Optional[str] = None
+    # Position of the job within its domain/year, results are merged in
+    # this order whatever the order in which jobs complete
+    index: int = 0
+    phase: int = 0
+
+
+@dataclass
+class DomainYearGroup:
+    """Jobs and results of one domain/year"""
+
+    domain: str
+    year: int
+    pending: int = 0
+    results: Dict[Tuple[int, int], List[Dict[str, Any]]] = field(default_factory=dict)
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+    phase: int = 0
+    paper_count: int = 0
+
+    def papers(self) -> List[Dict[str, Any]]:
+        """Papers of all finished jobs, in job order"""
+        papers = []
+        for key in sorted(self.results):
+            papers.extend(self.results[key])
+        return papers
+
+
+class CollectionJobScheduler:
+    """Runs collection jobs with per-source concurrency limits
+
+    Jobs wait in one queue per source and are dispatched round-robin across
+    sources while the source has a free slot, so a slow source never holds
+    pool workers that other sources could use.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        source_concurrency: Optional[Dict[str, int]] = None,
+        default_source_concurrency: int = 1,
+        governor: Optional[RateGovernor] = None,
+        source_rate_limits: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            max_workers: Size of the thread pool
+            source_concurrency: Searches in flight allowed per source. The
+                legacy sources keep their pacing state per instance, hence
+                the default of one search at a time per source.
+            default_source_concurrency: Limit of sources missing from
+                source_concurrency
+            governor: Rate governor pacing the searches of each source,
+                defaults to the process-wide one
+            source_rate_limits: Requests per second registered per source
+        """
+        self.max_workers = max(1, max_workers)
+        self.source_concurrency = dict(source_concurrency or {})
+        self.default_source_concurrency = max(1, default_source_concurrency)
+        self.governor = governor or get_rate_governor()
+        for source, rate in (source_rate_limits or SOURCE_RATE_LIMITS).items():
+            self.governor.register(source, rate)
+
+        self._lock = threading.Lock()
+        self.in_flight: Dict[str, int] = {}
+        self.peak_in_flight: Dict[str, int] = {}
+
+    def limit(self, source: str) -> int:
+        return max(
+            1, self.source_concurrency.get(source, self.default_source_concurrency)
+        )
+
+    def run(
+        self,
+        groups: List[DomainYearGroup],
+        expand: Callable[[DomainYearGroup], List[CollectionJob]],
+        on_complete: Callable[[DomainYearGroup], None],
+    ):
+        """Run the jobs of all groups
+
+        Args:
+            groups: Domain/year groups, completed in this order
+            expand: Returns the next jobs of a group once its previous jobs
+                are finished, an empty list when the group is complete. It
+                is called from this thread.
+            on_complete: Called from this thread with each complete group,
+                in the order of groups
+        """
+        queues: Dict[str, Deque[Tuple[DomainYearGroup, CollectionJob]]] = {}
+        running: Dict[Future, Tuple[DomainYearGroup, CollectionJob]] = {}
+        active: Dict[str, int] = {}
+        complete = [False] * len(groups)
+        positions = {id(group): position for position, group in enumerate(groups)}
+        next_to_flush = 0
+
+        def advance(group: DomainYearGroup):
+            """Queue the next phase of a group, or mark it complete"""
+            while group.pending == 0:
+                jobs = expand(group)
+                if not jobs:
+                    complete[positions[id(group)]] = True
+                    return
+                group.phase += 1
+                group.pending = len(jobs)
+                for job in jobs:
+                    job.phase = group.phase
+                    queues.setdefault(job.source, deque()).append((group, job))
+
+        for group in groups:
+            advance(group)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="collection"
+        ) as pool:
+            while True:
+                # Dispatch round-robin while workers and source slots are free
+                dispatched = True
+                while dispatched and len(running) < self.max_workers:
+                    dispatched = False
+                    for source, queue in queues.items():
+                        if len(running) >= self.max_workers:
+                            break
+                        if queue and active.get(source, 0) < self.limit(source):
+                            group, job = queue.popleft()
+                            active[source] = active.get(source, 0) + 1
+                            running[pool.submit(self._run_job, job)] = (group, job)
+                            dispatched = True
+
+                while next_to_flush < len(groups) and complete[next_to_flush]:
+                    on_complete(groups[next_to_flush])
+                    next_to_flush += 1
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group, job = running.pop(future)
+                    active[job.source] -= 1
+                    group.pending -= 1
+                    try:
+                        papers = future.result()
+                    except Exception as e:
+                        logger.warning(
+                            f"    {job.method} on {job.source} failed for "
+                            f"{job.domain} {job.year}: {e}"
+                        )
+                        group.failures.append(
+                            {
+                                "venue": job.venue,
+                                "year": job.year,
+                                "domain": job.domain,
+                                "method": job.method,
+                                "source": job.source,
+                                "error": str(e),
+                            }
+                        )
+                        papers = []
+                    group.results[(job.phase, job.index)] = papers
+                    group.paper_count += len(papers)
+                    advance(group)
+
+    def _run_job(self, job: CollectionJob) -> List[Dict[str, Any]]:
+        with self._lock:
+            in_flight = self.in_flight.get(job.source, 0) + 1
+            self.in_flight[job.source] = in_flight
+            self.peak_in_flight[job.source] = max(
+                in_flight, self.peak_in_flight.get(job.source, 0)
+            )
+        try:
+            if self.governor.is_registered(job.source):
+                self.governor.acquire(job.source)
+            return job.search()
+        finally:
+            with self._lock:
+                self.in_flight[job.source] -= 1
@@ -5,12 +5,17 @@ Handles collection of papers for specific domains and years.
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, cast
+from functools import partial
+from typing import Dict, List, Any, Optional, cast
 from collections import defaultdict
 
+from .collection_jobs import CollectionJob, CollectionJobScheduler, DomainYearGroup
 
 logger = logging.getLogger(__name__)
 
+# Venues searched with domain keywords for every domain
+MAJOR_VENUES = ["NeurIPS", "ICML", "ICLR", "AAAI", "IJCAI"]
+
 
 class DomainCollector:
     """Handles paper collection for specific domains and years"""
@@ -25,9 +30,17 @@ class DomainCollector:
         }
 
     def execute_domain_collection(
-        self, target_per_domain_year: int = 8
+        self,
+        target_per_domain_year: int = 8,
+        scheduler: Optional[CollectionJobScheduler] = None,
     ) -> Dict[str, Any]:
-        """Execute collection for each domain and year combination"""
+        """Execute collection for each domain and year combination
+
+        Every venue search of every source is a separate job, run
+        concurrently by the scheduler. Results are merged per domain/year in
+        the order of the serial collect_domain_year_papers, so the selected
+        papers do not depend on which search finished first.
+        """
         logger.info(
             f"Starting domain collection with target {target_per_domain_year} papers per domain/year"
         )
@@ -35,56 +48,189 @@ class DomainCollector:
         domains = self.executor.get_domains_from_analysis()
         logger.info(f"Collecting papers for {len(domains)} domains: {domains}")
 
-        for domain_name in domains:
-            logger.info(f"\n=== Collecting papers for {domain_name} ===")
+        scheduler = scheduler or CollectionJobScheduler()
+        groups = [
+            DomainYearGroup(domain_name, year)
+            for domain_name in domains
+            for year in range(2019, 2025)
+        ]
+        venues_by_domain: Dict[str, List[str]] = {}
+
+        def expand(group: DomainYearGroup) -> List[CollectionJob]:
+            if group.phase == 0:
+                if group.domain not in venues_by_domain:
+                    venues_by_domain[group.domain] = self.get_domain_venues(
+                        group.domain
+                    )
+                return self.domain_year_jobs(
+                    group.domain, group.year, venues_by_domain[group.domain]
+                )
+            if group.phase == 1 and group.paper_count < target_per_domain_year:
+                return self.direct_keyword_jobs(group.domain, group.year)
+            return []
 
-            for year in range(2019, 2025):
-                logger.info(f"Processing {domain_name} - {year}")
+        def on_complete(group: DomainYearGroup):
+            self.collection_results["failed_searches"].extend(group.failures)
+            try:
+                year_papers = self.select_top_papers(
+                    group.papers(), target_per_domain_year
+                )
+                self.record_domain_year_papers(group.domain, group.year, year_papers)
+            except Exception as e:
+                self.record_domain_year_failure(group.domain, group.year, e)
 
-                try:
-                    year_papers = self.collect_domain_year_papers(
-                        domain_name, year, target_per_domain_year
-                    )
+        scheduler.run(groups, expand, on_complete)
 
-                    # Enrich papers with computational analysis
-                    enriched_papers = self.enrich_papers_with_analysis(
-                        year_papers, domain_name, year
-                    )
+        logger.info(
+            f"\nCollection complete! Total papers: {len(self.collection_results['raw_papers'])}"
+        )
+        return cast(Dict[str, Any], self.collection_results)
 
-                    self.collection_results["raw_papers"].extend(enriched_papers)
-                    self.collection_results["collection_stats"][domain_name][year] = (
-                        len(enriched_papers)
-                    )
+    def record_domain_year_papers(
+        self, domain_name: str, year: int, year_papers: List[Dict[str, Any]]
+    ):
+        """Enrich the selected papers of a domain/year and add them to the results"""
+        # Enrich papers with computational analysis
+        enriched_papers = self.enrich_papers_with_analysis(
+            year_papers, domain_name, year
+        )
 
-                    # Track source distribution
-                    for paper in enriched_papers:
-                        source = paper.get("source", "unknown")
-                        self.collection_results["source_distribution"][source] += 1
+        self.collection_results["raw_papers"].extend(enriched_papers)
+        self.collection_results["collection_stats"][domain_name][year] = len(
+            enriched_papers
+        )
 
-                    logger.info(
-                        f"  ✓ Collected {len(enriched_papers)} papers for {domain_name} {year}"
-                    )
+        # Track source distribution
+        for paper in enriched_papers:
+            source = paper.get("source", "unknown")
+            self.collection_results["source_distribution"][source] += 1
 
-                except Exception as e:
-                    logger.error(
-                        f"  ✗ Failed to collect papers for {domain_name} {year}: {e}"
+        logger.info(
+            f"  ✓ Collected {len(enriched_papers)} papers for {domain_name} {year}"
+        )
+
+    def record_domain_year_failure(self, domain_name: str, year: int, error: Exception):
+        logger.error(f"  ✗ Failed to collect papers for {domain_name} {year}: {error}")
+        self.collection_results["failed_searches"].append(
+            {
+                "domain": domain_name,
+                "year": year,
+                "error": str(error),
+                "method": "domain_year_collection",
+            }
+        )
+
+    def get_source_names(self) -> List[str]:
+        """Citation sources to search, restricted to the working APIs if known"""
+        working_apis = getattr(self.executor, "working_apis", None)
+        sources = list(getattr(self.executor.paper_collector, "sources", {}))
+        if working_apis:
+            sources = [name for name in sources if name in working_apis]
+        return sources
+
+    def get_domain_venues(self, domain_name: str) -> List[str]:
+        """Top venues of a domain from the collection strategy, if available"""
+        optimizer = getattr(self.executor, "collection_strategy_optimizer", None)
+        if not optimizer:
+            return []
+        try:
+            strategy = optimizer.generate_collection_strategy(domain_name)
+            return [venue.venue_name for venue in strategy.primary_venues[:3]]
+        except Exception as e:
+            logger.warning(
+                f"Failed to generate collection strategy for {domain_name}: {e}"
+            )
+            return []
+
+    def domain_year_jobs(
+        self, domain_name: str, year: int, domain_venues: List[str]
+    ) -> List[CollectionJob]:
+        """Domain venue and major venue keyword searches, one job per source"""
+        collector = self.executor.paper_collector
+        sources = self.get_source_names()
+        jobs = []
+
+        for venue in domain_venues:
+            for source in sources:
+                jobs.append(
+                    CollectionJob(
+                        domain_name,
+                        year,
+                        "venue_search",
+                        source,
+                        partial(self.search_domain_venue, venue, year, source),
+                        venue=venue,
                     )
-                    self.collection_results["failed_searches"].append(
-                        {
-                            "domain": domain_name,
-                            "year": year,
-                            "error": str(e),
-                            "method": "domain_year_collection",
-                        }
+                )
+
+        domain_keywords = self.get_domain_keywords(domain_name)
+        for venue in MAJOR_VENUES:
+            for source in sources:
+                jobs.append(
+                    CollectionJob(
+                        domain_name,
+                        year,
+                        "keyword_search",
+                        source,
+                        partial(
+                            collector.collect_from_venue_year_with_keywords,
+                            venue,
+                            year,
+                            domain_keywords[:5],
+                            domain_name,
+                            working_apis=[source],
+                        ),
+                        venue=venue,
                     )
+                )
 
-                # Rate limiting between domain/year combinations
-                self.executor.rate_limiter.wait("general_search")
+        for index, job in enumerate(jobs):
+            job.index = index
+        return jobs
 
-        logger.info(
-            f"\nCollection complete! Total papers: {len(self.collection_results['raw_papers'])}"
+    def search_domain_venue(
+        self, venue: str, year: int, source: str
+    ) -> List[Dict[str, Any]]:
+        """Papers of a domain venue above the year's citation threshold"""
+        citation_threshold = self.executor.get_citation_threshold(year)
+        return cast(
+            List[Dict[str, Any]],
+            self.executor.paper_collector.collect_from_venue_year(
+                venue, year, citation_threshold, working_apis=[source]
+            ),
         )
-        return cast(Dict[str, Any], self.collection_results)
+
+    def direct_keyword_jobs(self, domain_name: str, year: int) -> List[CollectionJob]:
+        """Backup keyword searches without venue, one job per source"""
+        collector = self.executor.paper_collector
+        domain_keywords = self.get_domain_keywords(domain_name)
+        return [
+            CollectionJob(
+                domain_name,
+                year,
+                "direct_keyword_search",
+                source,
+                partial(
+                    collector.collect_from_keywords,
+                    domain_keywords,
+                    year,
+                    domain_name,
+                    working_apis=[source],
+                ),
+                index=index,
+            )
+            for index, source in enumerate(self.get_source_names())
+        ]
+
+    def select_top_papers(
+        self, papers: List[Dict[str, Any]], target_count: int
+    ) -> List[Dict[str, Any]]:
+        """Unique papers with the most citations"""
+        unique_papers = self.deduplicate_papers(papers)
+        sorted_papers = sorted(
+            unique_papers, key=lambda x: x.get("citations", 0), reverse=True
+        )
+        return sorted_papers[:target_count]
 
     def collect_domain_year_papers(
         self, domain_name: str, year: int, target_count: int
@@ -129,16 +275,8 @@ class DomainCollector:
             except Exception as e:
                 logger.warning(f"    Direct keyword search failed: {e}")
 
-        # Remove duplicates and sort by citations
-        unique_papers = self.deduplicate_papers(collected_papers)
-        sorted_papers = sorted(
-            unique_papers, key=lambda x: x.get("citations", 0), reverse=True
-        )
-
-        # Select top papers for this domain/year
-        selected_papers = sorted_papers[:target_count]
-
-        return selected_papers
+        # Remove duplicates and select the most cited papers
+        return self.select_top_papers(collected_papers, target_count)
 
     def collect_from_domain_venues(
         self, domain_name: str, year: int, target_count: int
@@ -192,10 +330,9 @@ class DomainCollector:
         """Collect papers from major ML venues using domain keywords"""
         papers = []
 
-        major_venues = ["NeurIPS", "ICML", "ICLR", "AAAI", "IJCAI"]
         domain_keywords = self.get_domain_keywords(domain_name)
 
-        for venue in major_venues:
+        for venue in MAJOR_VENUES:
             try:
                 keyword_papers = (
                     self.executor.paper_collector.collect_from_venue_year_with_keywords(
@@ -258,6 +258,7 @@ class EnhancedCollectionOrchestrator:
         wait_time = self.rate_limiter.wait_if_needed(source_name)
         if wait_time > 0:
             logger.debug(f"Rate limit wait for {source_name}: {wait_time:.2f}s")
+            time.sleep(wait_time)
 
         # Get the source client
         source_client = self.sources[source_name]
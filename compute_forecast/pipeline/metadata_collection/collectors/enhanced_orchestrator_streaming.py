@@ -5,7 +5,18 @@ Orchestrates multi-source collection with parallel execution, streaming, and pag
 
 import time
 import logging
-from typing import Dict, List, Optional, Iterator, AsyncIterator, Callable, Any
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Iterator,
+    AsyncIterator,
+    Callable,
+    Any,
+    Tuple,
+    Union,
+)
 from dataclasses import dataclass
 import asyncio
 from collections import deque
@@ -16,6 +27,7 @@ from ..sources.enhanced_openalex import EnhancedOpenAlexClient
 from ..sources.enhanced_crossref import EnhancedCrossrefClient
 from ..sources.google_scholar import GoogleScholarSource
 from .rate_limit_manager import RateLimitManager
+from .streaming_sink import JSONLPaperSink, PaperIdentityStore
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +51,12 @@ class StreamingCollectionResult:
 
 
 class EnhancedCollectionOrchestratorStreaming:
-    """Orchestrate multi-source collection with streaming and memory optimization"""
+    """Orchestrate multi-source collection with streaming and memory optimization
+
+    Sources are paged lazily, with cursors where the client supports them, and
+    their streams are merged through a queue of at most max_memory_papers
+    papers, so fast sources wait for the consumer instead of piling up pages.
+    """
 
     def __init__(
         self,
@@ -196,9 +213,30 @@ class EnhancedCollectionOrchestratorStreaming:
         # Determine which sources to use
         active_sources = sources_to_use or list(self.sources.keys())
 
-        # Create async tasks for each source
-        async def stream_from_source(source_name: str):
-            """Stream papers from a single source"""
+        async for _, paper in self._merge_source_streams(
+            query, active_sources, process_callback
+        ):
+            yield paper
+
+    async def _merge_source_streams(
+        self,
+        query: CollectionQuery,
+        active_sources: List[str],
+        process_callback: Optional[Callable[[Paper], Any]] = None,
+        errors: Optional[List[str]] = None,
+    ) -> AsyncIterator[Tuple[str, Paper]]:
+        """
+        Merge the paper streams of several sources through a bounded queue
+
+        Producers block on the full queue, which holds back fast sources
+        until the consumer catches up.
+
+        Yields:
+            (source name, paper) pairs in arrival order
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_memory_papers)
+
+        async def produce(source_name: str):
             try:
                 async for paper_batch in self._async_stream_from_source(
                     source_name, query
@@ -212,43 +250,27 @@ class EnhancedCollectionOrchestratorStreaming:
                             )
                             if processed_paper is not None:
                                 paper = processed_paper
-                        yield paper
+                        await queue.put((source_name, paper))
             except Exception as e:
                 logger.error(f"Async streaming failed for {source_name}: {e}")
-
-        # Merge streams from all sources
-        tasks = [stream_from_source(source) for source in active_sources]
-
-        # Use asyncio to merge the streams
-        async def merge_streams():
-            queues = [asyncio.Queue() for _ in tasks]
-
-            async def enqueue_papers(task_gen, queue):
-                async for paper in task_gen:
-                    await queue.put(paper)
-                await queue.put(None)  # Sentinel
-
-            # Start all enqueue tasks
-            [
-                asyncio.create_task(enqueue_papers(task, queue))
-                for task, queue in zip(tasks, queues)
-            ]
-
-            # Yield papers as they come in from any source
-            active_queues = set(range(len(queues)))
-            while active_queues:
-                for i in list(active_queues):
-                    try:
-                        paper = queues[i].get_nowait()
-                        if paper is None:
-                            active_queues.remove(i)
-                        else:
-                            yield paper
-                    except asyncio.QueueEmpty:
-                        await asyncio.sleep(0.01)
-
-        async for paper in merge_streams():
-            yield paper
+                if errors is not None:
+                    errors.append(f"{source_name}: {str(e)}")
+            await queue.put((source_name, None))  # Sentinel
+
+        producers = [
+            asyncio.create_task(produce(source_name)) for source_name in active_sources
+        ]
+        remaining = len(producers)
+        try:
+            while remaining:
+                source_name, paper = await queue.get()
+                if paper is None:
+                    remaining -= 1
+                else:
+                    yield source_name, paper
+        finally:
+            for producer in producers:
+                producer.cancel()
 
     def _stream_from_source_paginated(
         self, source_name: str, query: CollectionQuery
@@ -263,22 +285,29 @@ class EnhancedCollectionOrchestratorStreaming:
         Yields:
             Batches of papers
         """
+        source_client = self.sources[source_name]
         offset = 0
         has_more = True
 
+        # Cursors page past the offset limits of the search APIs
+        cursor = (
+            "*"
+            if getattr(source_client, "supports_cursor_pagination", False)
+            and not query.venue
+            else None
+        )
+
         while has_more and offset < query.max_results:
             # Wait for rate limit if needed
             wait_time = self.rate_limiter.wait_if_needed(source_name)
             if wait_time > 0:
                 logger.debug(f"Rate limit wait for {source_name}: {wait_time:.2f}s")
+                time.sleep(wait_time)
 
             # Calculate batch size for this request
             remaining = query.max_results - offset
             current_batch_size = min(self.batch_size, remaining)
 
-            # Get the source client
-            source_client = self.sources[source_name]
-
             # Note: Using current_batch_size directly in API calls below
 
             # Perform collection based on query type
@@ -291,9 +320,20 @@ class EnhancedCollectionOrchestratorStreaming:
                 if query.keywords:
                     search_query += " " + " ".join(query.keywords)
 
-                response = source_client.search_papers(
-                    search_query, query.year, limit=current_batch_size, offset=offset
-                )
+                if cursor is not None:
+                    response = source_client.search_papers(
+                        search_query,
+                        query.year,
+                        limit=current_batch_size,
+                        cursor=cursor,
+                    )
+                else:
+                    response = source_client.search_papers(
+                        search_query,
+                        query.year,
+                        limit=current_batch_size,
+                        offset=offset,
+                    )
 
             # Record the request
             response_time_ms = (
@@ -304,11 +344,16 @@ class EnhancedCollectionOrchestratorStreaming:
             )
 
             if response.success and response.papers:
-                yield response.papers
-                offset += len(response.papers)
-
+                # Cursor pages may be larger than requested
+                papers = response.papers[:remaining]
+                yield papers
+                offset += len(papers)
+
+                if cursor is not None:
+                    cursor = response.metadata.next_cursor
+                    has_more = cursor is not None
                 # Check if we got fewer papers than requested (indicating end of results)
-                if len(response.papers) < current_batch_size:
+                elif len(response.papers) < current_batch_size:
                     has_more = False
             else:
                 # No more results or error occurred
@@ -327,10 +372,96 @@ class EnhancedCollectionOrchestratorStreaming:
         Yields:
             Batches of papers
         """
-        # Convert synchronous pagination to async
-        for batch in self._stream_from_source_paginated(source_name, query):
+        # Fetch one page at a time in a worker thread, so blocking requests and
+        # rate limit waits of one source do not stall the others
+        pages = self._stream_from_source_paginated(source_name, query)
+        while True:
+            batch = await asyncio.to_thread(next, pages, None)
+            if batch is None:
+                break
             yield batch
-            await asyncio.sleep(0)  # Allow other coroutines to run
+
+    def collect_to_jsonl(
+        self,
+        query: CollectionQuery,
+        output_path: Union[str, Path],
+        sources_to_use: Optional[List[str]] = None,
+        identity_db_path: Optional[Union[str, Path]] = None,
+    ) -> StreamingCollectionResult:
+        """Synchronous wrapper of async_collect_to_jsonl"""
+        return asyncio.run(
+            self.async_collect_to_jsonl(
+                query, output_path, sources_to_use, identity_db_path
+            )
+        )
+
+    async def async_collect_to_jsonl(
+        self,
+        query: CollectionQuery,
+        output_path: Union[str, Path],
+        sources_to_use: Optional[List[str]] = None,
+        identity_db_path: Optional[Union[str, Path]] = None,
+    ) -> StreamingCollectionResult:
+        """
+        Collect papers from all sources into a JSONL file in constant memory
+
+        Papers are deduplicated as they arrive against an on-disk identity set
+        and appended to the output file, so memory use does not grow with the
+        number of papers collected.
+
+        Args:
+            query: Collection query
+            output_path: JSONL file papers are appended to
+            sources_to_use: Sources to use (defaults to all)
+            identity_db_path: SQLite file of seen paper identities, defaults to
+                the output path with an .identities.db suffix. Reusing it
+                skips papers collected by earlier runs.
+
+        Returns:
+            StreamingCollectionResult with statistics
+        """
+        start_time = time.time()
+        active_sources = sources_to_use or list(self.sources.keys())
+
+        output_path = Path(output_path)
+        identities = PaperIdentityStore(
+            identity_db_path or output_path.with_suffix(".identities.db")
+        )
+        sink = JSONLPaperSink(output_path)
+
+        source_counts: Dict[str, int] = {}
+        errors: List[str] = []
+        duplicates_removed = 0
+        total_processed = 0
+
+        try:
+            async for source_name, paper in self._merge_source_streams(
+                query, active_sources, errors=errors
+            ):
+                total_processed += 1
+                if not identities.add_if_new(paper):
+                    duplicates_removed += 1
+                    continue
+
+                sink.write(paper)
+                source_counts[source_name] = source_counts.get(source_name, 0) + 1
+
+                if total_processed % 1000 == 0:
+                    logger.info(
+                        f"Processed {total_processed} papers, "
+                        f"{duplicates_removed} duplicates removed"
+                    )
+        finally:
+            sink.close()
+            identities.close()
+
+        return StreamingCollectionResult(
+            source_counts=source_counts,
+            duplicates_removed=duplicates_removed,
+            collection_time=time.time() - start_time,
+            errors=errors,
+            total_papers_processed=total_processed,
+        )
 
     def collect_with_memory_limit(
         self,
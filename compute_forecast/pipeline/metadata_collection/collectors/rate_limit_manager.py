@@ -5,7 +5,7 @@ Real implementation with thread-safe rolling windows and adaptive delays
 
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 from ..models import (
     APIConfig,
     RateLimitStatus,
@@ -14,6 +14,7 @@ from ..models import (
     RateLimitingConfig,
     HealthMonitoringConfig,
 )
+from ....utils.rate_governor import get_rate_governor
 import logging
 
 
@@ -30,6 +31,9 @@ class RateLimitManager:
     - 5-minute rolling windows
     - Adaptive delays based on API health
     - Never wait longer than 60 seconds
+
+    APIs whose client does not register with the rate governor take their
+    governor slot here, clients that do already take one per HTTP request.
     """
 
     def __init__(self, api_configs: Dict[str, APIConfig]):
@@ -52,6 +56,19 @@ class RateLimitManager:
             self.consecutive_failures[api_name] = 0  # Start with no failures
             self._locks[api_name] = threading.RLock()
 
+        # Admit requests through the governor for APIs no client governs
+        self.governor = get_rate_governor()
+        self.governed_apis: Set[str] = set()
+        for api_name, config in api_configs.items():
+            if not self.governor.is_registered(api_name):
+                self.governor.register(
+                    api_name,
+                    config.requests_per_window
+                    / RateLimitingConfig.DEFAULT_WINDOW_SECONDS,
+                    config.burst_allowance,
+                )
+                self.governed_apis.add(api_name)
+
     def can_make_request(self, api_name: str, request_size: int = 1) -> bool:
         """
         Check if API request can be made without violating limits
@@ -133,6 +150,14 @@ class RateLimitManager:
                 )
                 adjusted_wait *= size_multiplier
 
+            # Take the governor slot of the request, or for APIs whose client
+            # takes its own, honour Retry-After pauses other clients received
+            if api_name in self.governed_apis:
+                governor_wait = self.governor.reserve(api_name)
+            else:
+                governor_wait = self.governor.blocked_for(api_name)
+            adjusted_wait = max(adjusted_wait, governor_wait)
+
             # Ensure we never exceed maximum wait time
             final_wait = min(adjusted_wait, RateLimitingConfig.MAX_WAIT_TIME_SECONDS)
 
@@ -0,0 +1,435 @@
+"""
+Append-only checkpoint log of a collection session.
+
+Checkpoints are appended to segment files as CRC-framed records that hold
+only what changed since the previous checkpoint: the venue/year entries whose
+status or paper count moved, and the API state when it differs. The latest
+state per venue/year is kept in memory, so the newest checkpoint is served
+without reading the disk and saving one costs O(delta) instead of rewriting
+the whole session.
+
+Once enough segments accumulate they are compacted into a single segment
+holding the live checkpoints. A torn record at the end of the log, left by a
+crash during a write, is truncated when the log is opened.
+"""
+
+import copy
+import json
+import logging
+import os
+import shutil
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .state_structures import CheckpointData
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length and CRC32 of the payload
+_HEADER = struct.Struct(">II")
+
+VENUE_LISTS = ("venues_completed", "venues_in_progress", "venues_not_started")
+
+# Checkpoint fields written only when they differ from the previous record
+_API_FIELDS = ("api_health_status", "rate_limit_status", "error_context")
+
+VenueKey = Tuple[Any, ...]
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    payload = json.dumps(record, separators=(",", ":"), default=str).encode("utf-8")
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _decode(data: bytes, offset: int) -> Optional[Tuple[Dict[str, Any], int]]:
+    """Record at an offset and the offset after it, None if torn or corrupt"""
+    start = offset + _HEADER.size
+    if start > len(data):
+        return None
+    length, crc = _HEADER.unpack_from(data, offset)
+    payload = data[start : start + length]
+    if len(payload) < length or zlib.crc32(payload) != crc:
+        return None
+    try:
+        return json.loads(payload), start + length
+    except ValueError:
+        return None
+
+
+@dataclass
+class VenueState:
+    """Latest progress of one venue/year"""
+
+    status: Optional[str] = None  # Venue list holding the entry
+    seq: int = 0  # Orders the entries of a venue list
+    papers: Optional[int] = None  # Count in papers_by_venue
+
+
+@dataclass
+class LogEntry:
+    """Index entry of a checkpoint in the log"""
+
+    checkpoint_id: str
+    checkpoint_type: str
+    timestamp: datetime
+    papers_collected: int
+
+
+class _LogState:
+    """Session progress rebuilt by applying checkpoint records in order"""
+
+    def __init__(self) -> None:
+        self.venues: Dict[VenueKey, VenueState] = {}
+        self.api: Dict[str, Any] = {
+            "api_health_status": {},
+            "rate_limit_status": {},
+            "error_context": None,
+        }
+        self.header: Optional[Dict[str, Any]] = None
+        self.next_seq = 0
+
+    def diff(self, checkpoint: CheckpointData) -> Dict[str, Any]:
+        """Record of the changes from this state to a checkpoint"""
+        target: Dict[VenueKey, VenueState] = {}
+        next_seq = self.next_seq
+        for status in VENUE_LISTS:
+            # Entries keep their position while the list order allows it, so
+            # appending to a list only records the appended entries
+            last_seq = -1
+            for item in getattr(checkpoint, status):
+                key = tuple(item)
+                if key in target:
+                    raise ValueError(f"Venue {key} appears more than once")
+                current = self.venues.get(key)
+                if current and current.status == status and current.seq > last_seq:
+                    seq = current.seq
+                else:
+                    seq = next_seq
+                    next_seq += 1
+                target[key] = VenueState(status, seq)
+                last_seq = seq
+
+        for venue, years in checkpoint.papers_by_venue.items():
+            for year, count in years.items():
+                target.setdefault((venue, year), VenueState()).papers = count
+
+        changes = [
+            [list(key), state.status, state.seq, state.papers]
+            for key, state in target.items()
+            if self.venues.get(key) != state
+        ]
+        changes.extend(
+            [list(key), None, 0, None] for key in self.venues if key not in target
+        )
+
+        serialized = checkpoint.to_dict()
+        record: Dict[str, Any] = {
+            "op": "checkpoint",
+            "checkpoint_id": checkpoint.checkpoint_id,
+            "session_id": checkpoint.session_id,
+            "checkpoint_type": checkpoint.checkpoint_type,
+            "timestamp": serialized["timestamp"],
+            "papers_collected": checkpoint.papers_collected,
+            "last_successful_operation": checkpoint.last_successful_operation,
+            "checksum": checkpoint.checksum,
+            "venues": changes,
+        }
+        for field in _API_FIELDS:
+            value = json.loads(json.dumps(serialized[field], default=str))
+            if value != self.api[field]:
+                record[field] = value
+        return record
+
+    def apply(self, record: Dict[str, Any]) -> None:
+        for key, status, seq, papers in record["venues"]:
+            if status is None and papers is None:
+                self.venues.pop(tuple(key), None)
+            else:
+                self.venues[tuple(key)] = VenueState(status, seq, papers)
+                self.next_seq = max(self.next_seq, seq + 1)
+        for field in _API_FIELDS:
+            if field in record:
+                self.api[field] = record[field]
+        self.header = record
+
+    def materialize(self) -> CheckpointData:
+        """Full checkpoint of the current state"""
+        assert self.header is not None
+        lists: Dict[str, List[Tuple[int, VenueKey]]] = {
+            status: [] for status in VENUE_LISTS
+        }
+        papers_by_venue: Dict[str, Dict[Any, int]] = {}
+        for key, state in self.venues.items():
+            if state.status is not None:
+                lists[state.status].append((state.seq, key))
+            if state.papers is not None:
+                venue, year = key
+                papers_by_venue.setdefault(venue, {})[year] = state.papers
+
+        data: Dict[str, Any] = {
+            field: self.header[field]
+            for field in (
+                "checkpoint_id",
+                "session_id",
+                "checkpoint_type",
+                "timestamp",
+                "papers_collected",
+                "last_successful_operation",
+                "checksum",
+            )
+        }
+        for status, entries in lists.items():
+            data[status] = [key for _, key in sorted(entries, key=lambda e: e[0])]
+        data["papers_by_venue"] = papers_by_venue
+        for field in _API_FIELDS:
+            data[field] = copy.deepcopy(self.api[field])
+        return CheckpointData.from_dict(data)
+
+
+class SessionLog:
+    """
+    Segment-based append-only store of a session's checkpoints.
+
+    Keeps an in-memory index of the live checkpoints and of the latest state
+    per venue/year, rebuilt from the segments when the log is opened.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        compact_after_segments: int = 8,
+    ):
+        """
+        Args:
+            log_dir: Directory of the segment files
+            segment_max_bytes: Size at which a new segment is started
+            compact_after_segments: Compact once more segments than this exist
+        """
+        self.log_dir = Path(log_dir)
+        self.segment_max_bytes = segment_max_bytes
+        self.compact_after_segments = compact_after_segments
+        self._lock = threading.RLock()
+        self._state = _LogState()
+        self._entries: Dict[str, LogEntry] = {}
+        self._segments: List[int] = []
+        self._handle: Optional[Any] = None
+        self._load()
+
+    def append(self, checkpoint: CheckpointData) -> None:
+        """Append a checkpoint as the changes since the previous one"""
+        with self._lock:
+            record = self._state.diff(checkpoint)
+            self._write(record)
+            self._apply(record)
+            self._rotate_if_full()
+
+    def drop(self, checkpoint_ids: List[str]) -> int:
+        """Remove checkpoints from the index, returns how many were live
+
+        Their records are discarded by the next compaction.
+        """
+        with self._lock:
+            ids = [cid for cid in checkpoint_ids if cid in self._entries]
+            if ids:
+                record = {"op": "drop", "ids": ids}
+                self._write(record)
+                self._apply(record)
+                self._rotate_if_full()
+            return len(ids)
+
+    def entries(self) -> List[LogEntry]:
+        """Index entries of the live checkpoints, oldest first"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def venue_states(self) -> Dict[VenueKey, VenueState]:
+        """Latest state per venue/year"""
+        with self._lock:
+            return {key: copy.copy(state) for key, state in self._state.venues.items()}
+
+    def latest(self) -> Optional[CheckpointData]:
+        """Most recently appended live checkpoint"""
+        with self._lock:
+            if not self._entries:
+                return None
+            return self.get(next(reversed(self._entries)))
+
+    def get(self, checkpoint_id: str) -> Optional[CheckpointData]:
+        """Checkpoint by ID, replaying the log unless it is the latest one"""
+        with self._lock:
+            if checkpoint_id not in self._entries:
+                return None
+            header = self._state.header
+            if header is not None and header["checkpoint_id"] == checkpoint_id:
+                return self._state.materialize()
+
+            found = None
+            for cid, state in self._replay():
+                if cid == checkpoint_id:
+                    found = state.materialize()
+            return found
+
+    def checkpoints(self) -> List[CheckpointData]:
+        """All live checkpoints, oldest first, from one pass over the log"""
+        with self._lock:
+            found: Dict[str, CheckpointData] = {}
+            for cid, state in self._replay():
+                if cid in self._entries:
+                    found[cid] = state.materialize()
+            return [found[cid] for cid in self._entries if cid in found]
+
+    def compact(self) -> None:
+        """Rewrite the live checkpoints into a single new segment"""
+        with self._lock:
+            checkpoints = self.checkpoints()
+            number = self._segments[-1] + 1 if self._segments else 1
+            path = self._segment_path(number)
+            temp_path = path.with_suffix(".tmp")
+
+            state = _LogState()
+            with open(temp_path, "wb") as f:
+                # Marks a segment that replaces all segments before it
+                f.write(_encode({"op": "compacted"}))
+                for checkpoint in checkpoints:
+                    record = state.diff(checkpoint)
+                    f.write(_encode(record))
+                    state.apply(record)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._close_handle()
+            os.replace(temp_path, path)
+            for old in self._segments:
+                self._segment_path(old).unlink(missing_ok=True)
+            self._segments = [number]
+            self._state = state
+            logger.debug(
+                f"Compacted {self.log_dir} into {path.name} "
+                f"with {len(checkpoints)} checkpoints"
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def _segment_path(self, number: int) -> Path:
+        return self.log_dir / f"segment_{number:08d}.log"
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if record["op"] == "checkpoint":
+            self._state.apply(record)
+            cid = record["checkpoint_id"]
+            self._entries.pop(cid, None)
+            self._entries[cid] = LogEntry(
+                checkpoint_id=cid,
+                checkpoint_type=record["checkpoint_type"],
+                timestamp=datetime.fromisoformat(record["timestamp"]),
+                papers_collected=record["papers_collected"],
+            )
+        elif record["op"] == "drop":
+            for cid in record["ids"]:
+                self._entries.pop(cid, None)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self._handle is None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            if not self._segments:
+                self._segments.append(1)
+            self._handle = open(self._segment_path(self._segments[-1]), "ab")
+        self._handle.write(_encode(record))
+        self._handle.flush()
+
+    def _rotate_if_full(self) -> None:
+        if self._handle is None or self._handle.tell() < self.segment_max_bytes:
+            return
+        self._close_handle()
+        if len(self._segments) >= self.compact_after_segments:
+            self.compact()
+        self._segments.append(self._segments[-1] + 1)
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _is_compacted(self, number: int) -> bool:
+        with open(self._segment_path(number), "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return False
+            length, _ = _HEADER.unpack(header)
+            decoded = _decode(header + f.read(length), 0)
+        return decoded is not None and decoded[0]["op"] == "compacted"
+
+    def _read_segment(self, number: int) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """Records of a segment, the offset after the last good one and
+        whether the segment ends in a torn or corrupt record"""
+        data = self._segment_path(number).read_bytes()
+        records: List[Dict[str, Any]] = []
+        offset = 0
+        while offset < len(data):
+            decoded = _decode(data, offset)
+            if decoded is None:
+                return records, offset, True
+            record, offset = decoded
+            records.append(record)
+        return records, offset, False
+
+    def _replay(self) -> Iterator[Tuple[str, _LogState]]:
+        """State after each checkpoint record, from the start of the log"""
+        state = _LogState()
+        for number in self._segments:
+            if not self._segment_path(number).exists():
+                continue
+            records, _, _ = self._read_segment(number)
+            for record in records:
+                if record["op"] == "checkpoint":
+                    state.apply(record)
+                    yield record["checkpoint_id"], state
+
+    def _load(self) -> None:
+        if not self.log_dir.exists():
+            return
+
+        numbers = sorted(
+            int(path.stem.split("_")[1]) for path in self.log_dir.glob("segment_*.log")
+        )
+        # Segments older than the newest compacted one are leftovers of a
+        # compaction interrupted before it removed them
+        for index in range(len(numbers) - 1, 0, -1):
+            if self._is_compacted(numbers[index]):
+                for old in numbers[:index]:
+                    self._segment_path(old).unlink(missing_ok=True)
+                numbers = numbers[index:]
+                break
+
+        for position, number in enumerate(numbers):
+            records, end, damaged = self._read_segment(number)
+            for record in records:
+                self._apply(record)
+            self._segments.append(number)
+            if not damaged:
+                continue
+
+            path = self._segment_path(number)
+            if position == len(numbers) - 1:
+                logger.warning(f"Truncating torn record at {path}:{end}")
+            else:
+                # Later records are changes on top of the lost ones, so the
+                # rest of the log is set aside and appends continue here
+                logger.error(
+                    f"Corrupt record at {path}:{end}, ignoring the rest of the log"
+                )
+                shutil.copy2(path, path.with_suffix(".corrupt"))
+                for later in numbers[position + 1 :]:
+                    later_path = self._segment_path(later)
+                    later_path.rename(later_path.with_suffix(".corrupt"))
+            with open(path, "r+b") as f:
+                f.truncate(end)
+            break
@@ -5,10 +5,9 @@ Provides basic session and checkpoint management functionality.
 
 import logging
 import time
-import gzip
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 import uuid
 
@@ -22,140 +21,12 @@ from .state_structures import (
     ValidationResult,
     InterruptionCause,
 )
+from .checkpoint_manager import CheckpointManager
 from compute_forecast.core.config import CollectionConfig
 
 logger = logging.getLogger(__name__)
 
 
-class SimpleCheckpointManager:
-    """Simplified checkpoint manager for testing"""
-
-    def __init__(self):
-        self._checkpoints: Dict[
-            str, Dict[str, CheckpointData]
-        ] = {}  # session_id -> checkpoint_id -> checkpoint
-
-    def create_checkpoint(
-        self,
-        session_id: str,
-        checkpoint_type: Literal[
-            "venue_completed",
-            "batch_completed",
-            "api_call_completed",
-            "error_occurred",
-            "session_started",
-        ],
-        venues_completed: List[tuple],
-        venues_in_progress: List[tuple],
-        venues_not_started: List[tuple],
-        papers_collected: int,
-        papers_by_venue: Dict[str, Dict[int, int]],
-        last_successful_operation: str,
-        api_health_status: Optional[Dict] = None,
-        rate_limit_status: Optional[Dict] = None,
-        error_context: Optional[Any] = None,
-    ) -> Optional[str]:
-        """Create a new checkpoint"""
-        checkpoint_id = f"{session_id}_checkpoint_{int(time.time())}"
-
-        checkpoint = CheckpointData(
-            checkpoint_id=checkpoint_id,
-            session_id=session_id,
-            checkpoint_type=checkpoint_type,
-            timestamp=datetime.now(),
-            venues_completed=venues_completed,
-            venues_in_progress=venues_in_progress,
-            venues_not_started=venues_not_started,
-            papers_collected=papers_collected,
-            papers_by_venue=papers_by_venue,
-            last_successful_operation=last_successful_operation,
-            api_health_status=api_health_status or {},
-            rate_limit_status=rate_limit_status or {},
-            error_context=error_context,
-        )
-
-        if session_id not in self._checkpoints:
-            self._checkpoints[session_id] = {}
-
-        self._checkpoints[session_id][checkpoint_id] = checkpoint
-        return checkpoint_id
-
-    def load_checkpoint(
-        self, session_id: str, checkpoint_id: str
-    ) -> Optional[CheckpointData]:
-        """Load a specific checkpoint"""
-        return self._checkpoints.get(session_id, {}).get(checkpoint_id)
-
-    def load_latest_checkpoint(self, session_id: str) -> Optional[CheckpointData]:
-        """Load the latest checkpoint for a session"""
-        session_checkpoints = self._checkpoints.get(session_id, {})
-        if not session_checkpoints:
-            return None
-
-        # Return the most recent checkpoint
-        latest_checkpoint = max(
-            session_checkpoints.values(), key=lambda cp: cp.timestamp
-        )
-        return latest_checkpoint
-
-    def validate_checkpoint(self, session_id: str, checkpoint_id: str):
-        """Validate a checkpoint"""
-        from .state_structures import CheckpointValidationResult
-
-        checkpoint = self.load_checkpoint(session_id, checkpoint_id)
-        if not checkpoint:
-            return CheckpointValidationResult(
-                checkpoint_id=checkpoint_id,
-                is_valid=False,
-                validation_errors=["Checkpoint not found"],
-                integrity_score=0.0,
-                can_be_used_for_recovery=False,
-            )
-
-        is_valid = checkpoint.validate_integrity()
-        return CheckpointValidationResult(
-            checkpoint_id=checkpoint_id,
-            is_valid=is_valid,
-            validation_errors=[] if is_valid else ["Integrity check failed"],
-            integrity_score=1.0 if is_valid else 0.0,
-            can_be_used_for_recovery=is_valid,
-        )
-
-    def get_checkpoint_statistics(self, session_id: str) -> Dict[str, Any]:
-        """Get checkpoint statistics for a session"""
-        session_checkpoints = self._checkpoints.get(session_id, {})
-
-        if not session_checkpoints:
-            return {
-                "total_checkpoints": 0,
-                "valid_checkpoints": 0,
-                "corrupted_checkpoints": 0,
-                "latest_checkpoint": None,
-                "earliest_checkpoint": None,
-                "checkpoint_types": {},
-            }
-
-        checkpoints = list(session_checkpoints.values())
-        valid_count = sum(1 for cp in checkpoints if cp.validate_integrity())
-
-        latest = max(checkpoints, key=lambda cp: cp.timestamp)
-        earliest = min(checkpoints, key=lambda cp: cp.timestamp)
-
-        # Count checkpoint types
-        type_counts: Dict[str, int] = {}
-        for cp in checkpoints:
-            type_counts[cp.checkpoint_type] = type_counts.get(cp.checkpoint_type, 0) + 1
-
-        return {
-            "total_checkpoints": len(checkpoints),
-            "valid_checkpoints": valid_count,
-            "corrupted_checkpoints": len(checkpoints) - valid_count,
-            "latest_checkpoint": latest.checkpoint_id,
-            "earliest_checkpoint": earliest.checkpoint_id,
-            "checkpoint_types": type_counts,
-        }
-
-
 class StateManager:
     """
     StateManager implementation matching Issue #5 exact interface contract.
@@ -186,7 +57,6 @@ class StateManager:
         self.backup_interval_seconds = backup_interval_seconds
         self.max_checkpoints_per_session = max_checkpoints_per_session
         self._active_sessions: Dict[str, CollectionSession] = {}
-        self.checkpoint_manager = SimpleCheckpointManager()
 
         # Ensure base directory structure exists
         self.base_state_dir.mkdir(parents=True, exist_ok=True)
@@ -197,6 +67,11 @@ class StateManager:
 
         self.persistence = StatePersistence(self.base_state_dir)
 
+        # Checkpoints go to an append-only log per session
+        self.checkpoint_manager = CheckpointManager(
+            self.persistence, max_checkpoints_per_session=max_checkpoints_per_session
+        )
+
         logger.info(
             f"StateManager initialized with base_dir: {self.base_state_dir}, "
             f"backup_interval: {backup_interval_seconds}s, "
@@ -362,6 +237,9 @@ class StateManager:
         - Must validate checkpoint data integrity
         - Must auto-cleanup old checkpoints
 
+        Only the changes since the previous checkpoint are appended to the
+        session's checkpoint log, so the cost does not grow with the session.
+
         Args:
             session_id: Session identifier
             checkpoint_data: Checkpoint data to save
@@ -391,48 +269,15 @@ class StateManager:
             rate_limit_status=checkpoint_data.rate_limit_status,
             error_context=checkpoint_data.error_context,
         )
+        if checkpoint_id is None:
+            raise ValueError("Failed to create checkpoint")
 
-        # Update session
+        # Update session, old checkpoints are cleaned up by the checkpoint manager
         session = self._active_sessions[session_id]
-        session.last_checkpoint_id = checkpoint_id
         session.checkpoint_count += 1
         session.last_activity_time = datetime.now()
-        session.venues_completed = checkpoint_data.venues_completed
-        session.venues_in_progress = checkpoint_data.venues_in_progress
-        session.total_papers_collected = checkpoint_data.papers_collected
-        session.papers_by_venue = checkpoint_data.papers_by_venue
-
-        # Auto-cleanup old checkpoints if exceeding maximum
-        if session.checkpoint_count > self.max_checkpoints_per_session:
-            logger.info(f"Cleaning up old checkpoints for session {session_id}")
-            self._cleanup_old_checkpoints(session_id)
-
-        # Save checkpoint to session directory as required by Issue #5
-        session_dir = self.base_state_dir / "sessions" / session_id
-        checkpoint_file = session_dir / "checkpoints" / f"{checkpoint_id}.json"
-
-        # Validate path security
-        if not self._validate_path_security(checkpoint_file):
-            raise ValueError(f"Invalid checkpoint path: {checkpoint_file}")
-
-        # Serialize checkpoint data
-        checkpoint_dict = checkpoint_data.to_dict()
-        checkpoint_json = json.dumps(checkpoint_dict, indent=2, default=str)
-
-        # Compress if checkpoint is larger than 10KB
-        if len(checkpoint_json.encode()) > 10240:
-            checkpoint_file = checkpoint_file.with_suffix(".json.gz")
-            with gzip.open(checkpoint_file, "wt", encoding="utf-8") as f:
-                f.write(checkpoint_json)
-            logger.debug(f"Compressed checkpoint saved: {checkpoint_file.name}")
-        else:
-            with open(checkpoint_file, "w") as f:
-                f.write(checkpoint_json)
-
-        # Update session status file
-        session_status_file = session_dir / "session_status.json"
-        with open(session_status_file, "w") as f:
-            json.dump(session.to_dict(), f, indent=2, default=str)
+        self._restore_progress(session, checkpoint_data)
+        session.last_checkpoint_id = checkpoint_id
 
         # Check 2-second requirement
         duration = (datetime.now() - start_time).total_seconds()
@@ -441,8 +286,6 @@ class StateManager:
         else:
             logger.debug(f"Checkpoint {checkpoint_id} saved in {duration:.3f}s")
 
-        if checkpoint_id is None:
-            raise ValueError("Failed to create checkpoint")
         return checkpoint_id
 
     def load_latest_checkpoint(self, session_id: str) -> Optional[CheckpointData]:
@@ -622,11 +465,7 @@ class StateManager:
 
                 if checkpoint:
                     # Restore session state from checkpoint
-                    session.venues_completed = checkpoint.venues_completed
-                    session.venues_in_progress = checkpoint.venues_in_progress
-                    session.total_papers_collected = checkpoint.papers_collected
-                    session.papers_by_venue = checkpoint.papers_by_venue
-                    session.last_checkpoint_id = checkpoint.checkpoint_id
+                    self._restore_progress(session, checkpoint)
                     session.status = "active"
                     session.last_activity_time = datetime.now()
 
@@ -727,6 +566,16 @@ class StateManager:
 
                 # Reconstruct session from saved data
                 session = CollectionSession(**session_data)
+
+                # Progress since creation is in the checkpoint log
+                latest_checkpoint = self.checkpoint_manager.load_latest_checkpoint(
+                    session_id
+                )
+                if latest_checkpoint is not None:
+                    self._restore_progress(session, latest_checkpoint)
+                    session.last_activity_time = max(
+                        session.last_activity_time, latest_checkpoint.timestamp
+                    )
                 return session
             except (json.JSONDecodeError, TypeError) as e:
                 logger.warning(f"Failed to load session {session_id} from disk: {e}")
@@ -787,51 +636,14 @@ class StateManager:
         )
         return results
 
-    def _cleanup_old_checkpoints(self, session_id: str):
-        """Remove old checkpoints when exceeding max_checkpoints_per_session"""
-        # Get checkpoint statistics
-        stats = self.checkpoint_manager.get_checkpoint_statistics(session_id)
-        total_checkpoints = stats["total_checkpoints"]
-
-        if total_checkpoints <= self.max_checkpoints_per_session:
-            return
-
-        # Get all checkpoints for the session
-        session_dir = self.base_state_dir / "sessions" / session_id
-        checkpoint_dir = session_dir / "checkpoints"
-
-        if not checkpoint_dir.exists():
-            return
-
-        # Get all checkpoint files sorted by modification time
-        checkpoint_files = sorted(
-            checkpoint_dir.glob("*.json"), key=lambda f: f.stat().st_mtime
-        )
-
-        # Calculate how many to delete
-        to_delete = (
-            total_checkpoints - self.max_checkpoints_per_session + 10
-        )  # Keep buffer of 10
-
-        if to_delete > 0 and len(checkpoint_files) > to_delete:
-            for i in range(to_delete):
-                try:
-                    checkpoint_files[i].unlink()
-                    logger.debug(f"Deleted old checkpoint: {checkpoint_files[i].name}")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to delete checkpoint {checkpoint_files[i]}: {e}"
-                    )
-
     @staticmethod
-    def _validate_path_security(path: Path) -> bool:
-        """Validate that a path is safe from directory traversal attacks"""
-        try:
-            # Resolve the path and check it doesn't escape the intended directory
-            path.resolve()
-            return ".." not in str(path)
-        except Exception:
-            return False
+    def _restore_progress(session: CollectionSession, checkpoint: CheckpointData):
+        """Set the collection progress of a session to a checkpoint's"""
+        session.venues_completed = checkpoint.venues_completed
+        session.venues_in_progress = checkpoint.venues_in_progress
+        session.total_papers_collected = checkpoint.papers_collected
+        session.papers_by_venue = checkpoint.papers_by_venue
+        session.last_checkpoint_id = checkpoint.checkpoint_id
 
     def _get_session_dir(self, session_id: str) -> Path:
         """Get the directory path for a session"""
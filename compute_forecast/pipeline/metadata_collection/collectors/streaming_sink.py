@@ -0,0 +1,114 @@
+"""
+On-disk deduplication and output for streaming collection
+Keeps memory constant by storing seen paper identities in SQLite and writing
+papers to JSONL as they arrive
+"""
+
+import json
+import sqlite3
+import logging
+from pathlib import Path
+from typing import List, Union
+
+from ..models import Paper
+from ..processors.entity_resolver import (
+    normalize_identifier,
+    paper_id_key,
+    title_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def paper_identity_keys(paper: Paper) -> List[str]:
+    """Identity keys of a paper: normalized identifiers and title with year"""
+    keys = []
+    for id_type, value in (
+        ("doi", paper.doi),
+        ("arxiv", paper.arxiv_id),
+        ("openalex", paper.openalex_id),
+    ):
+        normalized = normalize_identifier(id_type, str(value)) if value else None
+        if normalized:
+            keys.append(f"{id_type}:{normalized}")
+    id_key = paper_id_key(paper)
+    if id_key:
+        keys.append(f"{id_key[0]}:{id_key[1]}")
+
+    title = " ".join(title_tokens(paper.title or ""))
+    if title:
+        keys.append(f"title:{title}|{paper.year}")
+    return keys
+
+
+class PaperIdentityStore:
+    """Set of seen paper identity keys, stored in SQLite instead of memory"""
+
+    def __init__(self, db_path: Union[str, Path] = ":memory:"):
+        """
+        Args:
+            db_path: SQLite database file. An existing file continues the
+                deduplication of a previous run.
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY)")
+        self._pending = 0
+
+    def add_if_new(self, paper: Paper) -> bool:
+        """Record a paper's identity keys, returns False if any was seen before"""
+        keys = paper_identity_keys(paper)
+        if not keys:
+            return True
+
+        placeholders = ",".join("?" * len(keys))
+        seen = self._conn.execute(
+            f"SELECT 1 FROM seen WHERE key IN ({placeholders}) LIMIT 1", keys
+        ).fetchone()
+        if seen:
+            return False
+
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO seen (key) VALUES (?)", [(key,) for key in keys]
+        )
+        self._pending += 1
+        if self._pending >= 1000:
+            self.commit()
+        return True
+
+    def __len__(self) -> int:
+        count: int = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        return count
+
+    def commit(self):
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self._conn.close()
+
+
+class JSONLPaperSink:
+    """Appends papers to a JSON Lines file as they are collected"""
+
+    def __init__(self, output_path: Union[str, Path], flush_every: int = 100):
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.papers_written = 0
+        self._handle = open(self.output_path, "a", encoding="utf-8")
+
+    def write(self, paper: Paper):
+        self._handle.write(json.dumps(paper.to_dict(), default=str) + "\n")
+        self.papers_written += 1
+        if self.papers_written % self.flush_every == 0:
+            self._handle.flush()
+
+    def close(self):
+        self._handle.close()
+        logger.info(f"Wrote {self.papers_written} papers to {self.output_path}")
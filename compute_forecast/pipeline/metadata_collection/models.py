@@ -1,5 +1,7 @@
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Literal
+from typing import Deque, List, Optional, Dict, Any, Literal
 from datetime import datetime, timedelta
 import threading
 
@@ -117,6 +119,9 @@ class Paper:
         """Convert paper to dictionary for JSON serialization"""
         result: Dict[str, Any] = {}
         for key, value in self.__dict__.items():
+            # Private attributes are runtime caches, not paper data
+            if key.startswith("_"):
+                continue
             if isinstance(value, datetime):
                 result[key] = value.isoformat()
             elif key in [
@@ -360,6 +365,7 @@ class ResponseMetadata:
     response_time_ms: float
     api_name: str
     timestamp: datetime = field(default_factory=datetime.now)
+    next_cursor: Optional[str] = None  # Set by sources with cursor pagination
 
 
 @dataclass
@@ -481,12 +487,16 @@ class RateLimitingConfig:
 
 # Rolling window for request tracking
 class RollingWindow:
-    """Rolling time window for request tracking"""
+    """Rolling time window for request tracking
+
+    Timestamps are kept sorted in a deque, so expired requests are dropped
+    from the left and the oldest request is always the first one.
+    """
 
     def __init__(self, window_seconds: int, max_requests: int) -> None:
         self.window_seconds = window_seconds
         self.max_requests = max_requests
-        self.requests: List[datetime] = []
+        self.requests: Deque[datetime] = deque()
         self._lock = threading.RLock()
 
     def add_request(self, timestamp: Optional[datetime] = None) -> bool:
@@ -500,7 +510,12 @@ class RollingWindow:
 
             # Check if we can add this request
             if len(self.requests) < self.max_requests:
-                self.requests.append(timestamp)
+                if not self.requests or timestamp >= self.requests[-1]:
+                    self.requests.append(timestamp)
+                else:
+                    self.requests.insert(
+                        bisect_right(self.requests, timestamp), timestamp
+                    )
                 return True
 
             return False
@@ -521,7 +536,7 @@ class RollingWindow:
 
             # Find oldest request
             if self.requests:
-                oldest_request = min(self.requests)
+                oldest_request = self.requests[0]
                 time_until_expired = (
                     self.window_seconds
                     - (datetime.now() - oldest_request).total_seconds()
@@ -536,4 +551,5 @@ class RollingWindow:
             current_time = datetime.now()
 
         cutoff_time = current_time - timedelta(seconds=self.window_seconds)
-        self.requests = [req for req in self.requests if req > cutoff_time]
+        while self.requests and self.requests[0] <= cutoff_time:
+            self.requests.popleft()
@@ -16,6 +16,11 @@ from compute_forecast.pipeline.metadata_collection.processors.fuzzy_venue_matche
     FuzzyMatchResult,
 )
 
+# Deduplication imports
+from compute_forecast.pipeline.metadata_collection.processors.entity_resolver import (
+    EntityResolver,
+)
+
 # Citation analysis imports
 from compute_forecast.pipeline.metadata_collection.processors.citation_analyzer import (
     CitationAnalyzer,
@@ -35,6 +40,7 @@ from compute_forecast.pipeline.metadata_collection.processors.citation_statistic
     YearCitationStats,
     CitationFilterResult,
     BreakthroughPaper,
+    BreakthroughScores,
     AdaptiveThreshold,
     FilteringQualityReport,
 )
@@ -49,6 +55,8 @@ __all__ = [
     "VenueConfig",
     "FuzzyVenueMatcher",
     "FuzzyMatchResult",
+    # Deduplication exports
+    "EntityResolver",
     # Citation analysis exports
     "CitationAnalyzer",
     "BreakthroughDetector",
@@ -59,6 +67,7 @@ __all__ = [
     "YearCitationStats",
     "CitationFilterResult",
     "BreakthroughPaper",
+    "BreakthroughScores",
     "AdaptiveThreshold",
     "FilteringQualityReport",
 ]
@@ -1,7 +1,7 @@
 """Adaptive threshold calculation for citation filtering."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import numpy as np
 
 from compute_forecast.pipeline.metadata_collection.models import Paper
@@ -12,6 +12,84 @@ from compute_forecast.pipeline.metadata_collection.processors.citation_config im
     CitationConfig,
 )
 
+VenueYear = Tuple[Optional[str], Optional[int]]
+
+
+class VenueYearCitations:
+    """Citation counts of papers grouped by (venue, year)
+
+    Counts and group keys are extracted once into arrays sorted by group and
+    count, so percentiles of every group come from one vectorized pass
+    instead of a scan of the whole paper list per venue/year. Percentiles use
+    numpy's default linear interpolation and match ``np.percentile`` exactly.
+    """
+
+    def __init__(self, papers: List[Paper]):
+        self._index: Dict[VenueYear, int] = {}
+        codes = np.empty(len(papers), dtype=np.intp)
+        counts = []
+        for i, paper in enumerate(papers):
+            key = (paper.normalized_venue or paper.venue, paper.year)
+            codes[i] = self._index.setdefault(key, len(self._index))
+            counts.append(paper.get_latest_citations_count())
+
+        self.keys: List[VenueYear] = list(self._index)
+        self.codes = codes
+        # Citation counts in paper order
+        self.values = np.asarray(counts, dtype=np.int64)
+
+        order = np.lexsort((self.values, codes))
+        self.sorted_values: np.ndarray = self.values[order]
+        self.sizes: np.ndarray = np.bincount(codes, minlength=len(self.keys))
+        self.starts: np.ndarray = np.cumsum(self.sizes) - self.sizes
+        # Highest citation count of every group
+        self.maxima: np.ndarray = self.sorted_values[self.starts + self.sizes - 1]
+        self._percentiles: Dict[float, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def group(self, venue: Optional[str], year: Optional[int]) -> Optional[int]:
+        """Position of the venue/year group, None if it has no papers"""
+        return self._index.get((venue, year))
+
+    def citations(self, group: int) -> np.ndarray:
+        """Sorted citation counts of a group"""
+        start = int(self.starts[group])
+        end = start + int(self.sizes[group])
+        return self.sorted_values[start:end]
+
+    def percentiles(self, q: float) -> np.ndarray:
+        """The q-th percentile of every group, computed once per q"""
+        result = self._percentiles.get(q)
+        if result is None:
+            result = self._compute_percentiles(q)
+            self._percentiles[q] = result
+        return result
+
+    def percentile(self, group: int, q: float) -> float:
+        return float(self.percentiles(q)[group])
+
+    def _compute_percentiles(self, q: float) -> np.ndarray:
+        if not self.keys:
+            return np.empty(0)
+        # Same operations as np.percentile(..., method="linear") per group
+        virtual = (self.sizes - 1) * np.true_divide(q, 100)
+        previous = np.floor(virtual)
+        last = virtual >= self.sizes - 1
+        previous[last] = (self.sizes - 1)[last]
+        gamma = virtual - previous
+        previous_idx = previous.astype(np.intp)
+        next_idx = np.where(last, previous_idx, previous_idx + 1)
+
+        lower = self.sorted_values[self.starts + previous_idx]
+        upper = self.sorted_values[self.starts + next_idx]
+        diff = upper - lower
+        result: np.ndarray = np.where(
+            gamma >= 0.5, upper - diff * (1 - gamma), lower + diff * gamma
+        )
+        return result
+
 
 class AdaptiveThresholdCalculator:
     """Calculate adaptive citation thresholds based on venue, year, and citation patterns."""
@@ -30,61 +108,66 @@ class AdaptiveThresholdCalculator:
         }
 
     def calculate_venue_threshold(
-        self, venue: str, year: int, papers: List[Paper], venue_tier: str
+        self,
+        venue: str,
+        year: int,
+        papers: List[Paper],
+        venue_tier: str,
+        citations: Optional[VenueYearCitations] = None,
     ) -> int:
-        """Calculate adaptive threshold for specific venue/year."""
-        years_since_publication = self.current_year - year
+        """Calculate adaptive threshold for specific venue/year.
 
-        # Get base threshold from tier and age
-        years_key = min(years_since_publication, 4)
-        base_threshold = self.base_thresholds.get(
-            venue_tier, self.base_thresholds["tier4"]
-        ).get(years_key, self.base_thresholds[venue_tier][4])
+        ``citations`` may hold the grouped counts of ``papers`` so repeated
+        calls do not scan the paper list again.
+        """
+        base_threshold = self._base_threshold(venue_tier, year)
 
-        # Filter papers for this venue/year
-        venue_papers = [
-            p
-            for p in papers
-            if (p.normalized_venue or p.venue) == venue and p.year == year
-        ]
-
-        if not venue_papers:
+        if citations is None:
+            citations = self._venue_year_citations(venue, year, papers)
+        group = citations.group(venue, year)
+        if group is None:
             return base_threshold
 
-        # Calculate statistical threshold (percentile from config)
-        citations = [p.get_latest_citations_count() for p in venue_papers]
-        if citations:
-            statistical_threshold = float(
-                np.percentile(citations, self.config.statistical_percentile)
-            )
-        else:
-            statistical_threshold = float(base_threshold)
-
-        # Adaptive threshold (weighted combination using config weights)
-        adaptive_threshold = int(
-            (statistical_threshold * self.config.statistical_weight)
-            + (base_threshold * self.config.base_weight)
+        return self._combine_threshold(
+            base_threshold,
+            citations.percentile(group, self.config.statistical_percentile),
+            citations.percentile(group, self.config.min_representation_percentile),
+            int(citations.maxima[group]),
         )
 
-        # Ensure minimum representation (keep at least config.min_representation_percent of papers)
-        if citations:
-            min_representation_threshold = np.percentile(
-                citations, self.config.min_representation_percentile
-            )
-            adaptive_threshold = min(
-                adaptive_threshold, int(min_representation_threshold)
-            )
+    def calculate_threshold_table(
+        self,
+        citations: VenueYearCitations,
+        venue_tier_of: Callable[[str], str],
+    ) -> Dict[Tuple[str, int], int]:
+        """Calculate the thresholds of every venue/year group in one pass
 
-            # Special case: if all papers have very low citations, we need to keep some
-            # This ensures we don't filter out everything when all papers are below threshold
-            if (
-                adaptive_threshold >= self.config.min_citation_threshold
-                and max(citations) < self.config.min_citation_threshold
-            ):
-                # Keep papers at the maximum citation level (even if it's 0)
-                adaptive_threshold = max(citations)
+        Groups without a venue or year are skipped. The table keeps the order
+        in which the groups first appear in the papers.
+        """
+        if not len(citations):
+            return {}
 
-        return max(adaptive_threshold, 0)  # Allow 0 citations in edge cases
+        statistical = citations.percentiles(self.config.statistical_percentile)
+        min_representation = citations.percentiles(
+            self.config.min_representation_percentile
+        )
+        maxima = citations.maxima
+
+        table = {}
+        tiers: Dict[str, str] = {}
+        for group, (venue, year) in enumerate(citations.keys):
+            if not venue or not year:
+                continue
+            if venue not in tiers:
+                tiers[venue] = venue_tier_of(venue)
+            table[(venue, year)] = self._combine_threshold(
+                self._base_threshold(tiers[venue], year),
+                float(statistical[group]),
+                float(min_representation[group]),
+                int(maxima[group]),
+            )
+        return table
 
     def calculate_percentile_threshold(
         self, citations: List[int], percentile: float
@@ -97,55 +180,51 @@ class AdaptiveThresholdCalculator:
         return int(threshold)
 
     def calculate_adaptive_threshold(
-        self, venue: str, year: int, papers: List[Paper], venue_tier: str
+        self,
+        venue: str,
+        year: int,
+        papers: List[Paper],
+        venue_tier: str,
+        citations: Optional[VenueYearCitations] = None,
     ) -> AdaptiveThreshold:
         """Calculate comprehensive adaptive threshold with metadata."""
         years_since_publication = self.current_year - year
 
         # Get base threshold
-        years_key = min(years_since_publication, 4)
-        base_threshold = self.base_thresholds.get(
-            venue_tier, self.base_thresholds["tier4"]
-        ).get(years_key, self.base_thresholds[venue_tier][4])
-
-        # Filter papers for this venue/year
-        venue_papers = [
-            p
-            for p in papers
-            if (p.normalized_venue or p.venue) == venue and p.year == year
-        ]
+        base_threshold = self._base_threshold(venue_tier, year)
+
+        if citations is None:
+            citations = self._venue_year_citations(venue, year, papers)
+        group = citations.group(venue, year)
 
         # Calculate adaptive threshold
         adaptive_threshold = self.calculate_venue_threshold(
-            venue, year, papers, venue_tier
+            venue, year, papers, venue_tier, citations
         )
 
+        papers_analyzed = 0
+        papers_above = 0
+        alternative_thresholds = {}
+        if group is not None:
+            venue_citations = citations.citations(group)
+            papers_analyzed = len(venue_citations)
+            # Counts are sorted, so everything from the first match is above
+            papers_above = papers_analyzed - int(
+                np.searchsorted(venue_citations, adaptive_threshold, side="left")
+            )
+            alternative_thresholds = {
+                "50th_percentile": int(citations.percentile(group, 50)),
+                "80th_percentile": int(citations.percentile(group, 80)),
+                "90th_percentile": int(citations.percentile(group, 90)),
+            }
+
         # Calculate confidence based on data availability
         confidence = (
-            min(len(venue_papers) / self.config.min_papers_for_full_confidence, 1.0)
-            if venue_papers
+            min(papers_analyzed / self.config.min_papers_for_full_confidence, 1.0)
+            if papers_analyzed
             else 0.1
         )
 
-        # Calculate how many papers would be above threshold
-        papers_above = len(
-            [
-                p
-                for p in venue_papers
-                if p.get_latest_citations_count() >= adaptive_threshold
-            ]
-        )
-
-        # Calculate alternative thresholds
-        citations = [p.get_latest_citations_count() for p in venue_papers]
-        alternative_thresholds = {}
-        if citations:
-            alternative_thresholds = {
-                "50th_percentile": int(np.percentile(citations, 50)),
-                "80th_percentile": int(np.percentile(citations, 80)),
-                "90th_percentile": int(np.percentile(citations, 90)),
-            }
-
         return AdaptiveThreshold(
             venue=venue,
             year=year,
@@ -157,16 +236,64 @@ class AdaptiveThresholdCalculator:
                 venue_tier, 0.5
             ),
             representation_requirement=max(
-                int(len(venue_papers) * self.config.min_representation_percent), 5
+                int(papers_analyzed * self.config.min_representation_percent), 5
             )
-            if venue_papers
+            if papers_analyzed
             else 5,
-            papers_analyzed=len(venue_papers),
+            papers_analyzed=papers_analyzed,
             papers_above_threshold=papers_above,
             percentile_used=self.config.statistical_percentile,
             alternative_thresholds=alternative_thresholds,
         )
 
+    def _base_threshold(self, venue_tier: str, year: int) -> int:
+        """Base threshold from venue tier and years since publication"""
+        years_key = min(self.current_year - year, 4)
+        return self.base_thresholds.get(venue_tier, self.base_thresholds["tier4"]).get(
+            years_key, self.base_thresholds[venue_tier][4]
+        )
+
+    def _combine_threshold(
+        self,
+        base_threshold: int,
+        statistical_threshold: float,
+        min_representation_threshold: float,
+        max_citations: int,
+    ) -> int:
+        """Combine the base and statistical thresholds of a venue/year"""
+        # Adaptive threshold (weighted combination using config weights)
+        adaptive_threshold = int(
+            (statistical_threshold * self.config.statistical_weight)
+            + (base_threshold * self.config.base_weight)
+        )
+
+        # Ensure minimum representation (keep at least config.min_representation_percent of papers)
+        adaptive_threshold = min(adaptive_threshold, int(min_representation_threshold))
+
+        # Special case: if all papers have very low citations, we need to keep some
+        # This ensures we don't filter out everything when all papers are below threshold
+        if (
+            adaptive_threshold >= self.config.min_citation_threshold
+            and max_citations < self.config.min_citation_threshold
+        ):
+            # Keep papers at the maximum citation level (even if it's 0)
+            adaptive_threshold = max_citations
+
+        return max(adaptive_threshold, 0)  # Allow 0 citations in edge cases
+
+    @staticmethod
+    def _venue_year_citations(
+        venue: str, year: int, papers: List[Paper]
+    ) -> VenueYearCitations:
+        """Grouped counts of the papers of a single venue/year"""
+        return VenueYearCitations(
+            [
+                p
+                for p in papers
+                if (p.normalized_venue or p.venue) == venue and p.year == year
+            ]
+        )
+
     def get_venue_tier_multiplier(self, venue_tier: str) -> float:
         """Get prestige multiplier for venue tier."""
         return self.config.venue_tier_multipliers.get(venue_tier, 0.4)
@@ -1,14 +1,18 @@
 """Breakthrough paper detection for identifying high-impact research."""
 
 import json
+from collections import deque
 from datetime import datetime
-from typing import List, Set, Tuple, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 from pathlib import Path
 import logging
 
+import numpy as np
+
 from compute_forecast.pipeline.metadata_collection.models import Paper, Author
 from compute_forecast.pipeline.metadata_collection.processors.citation_statistics import (
     BreakthroughPaper,
+    BreakthroughScores,
 )
 from compute_forecast.pipeline.metadata_collection.processors.citation_config import (
     CitationConfig,
@@ -17,6 +21,102 @@ from compute_forecast.pipeline.metadata_collection.processors.citation_config im
 logger = logging.getLogger(__name__)
 
 
+class KeywordMatcher:
+    """Find which of a fixed set of keywords occur in texts
+
+    Keywords match as plain substrings, exactly like ``keyword in text``.
+    Large keyword sets are compiled into an Aho-Corasick automaton, so each
+    text is scanned once whatever the number of keywords. For small sets the
+    per-keyword substring search, which runs in C, is faster than stepping
+    an automaton in Python, so those keep the direct scan.
+    """
+
+    # Keyword count from which the automaton beats per-keyword scans
+    AUTOMATON_MIN_KEYWORDS = 128
+    SEPARATOR = "\x00"
+
+    def __init__(
+        self, keywords: Iterable[str], automaton_min_keywords: Optional[int] = None
+    ):
+        # Matches are reported in the iteration order of the keywords
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        self._rank = {keyword: i for i, keyword in enumerate(self.keywords)}
+        threshold = (
+            self.AUTOMATON_MIN_KEYWORDS
+            if automaton_min_keywords is None
+            else automaton_min_keywords
+        )
+        self.uses_automaton = len(self.keywords) >= threshold
+        # The empty keyword is in every text, even an empty one
+        self._matches_empty = "" in self._rank
+        # Texts are searched as one when no keyword can span the separator
+        self._joinable = not any(self.SEPARATOR in keyword for keyword in self.keywords)
+        self._transitions: List[Dict[str, int]] = []
+        self._outputs: List[Tuple[str, ...]] = []
+        if self.uses_automaton:
+            self._build_automaton()
+
+    def find(self, *texts: str) -> List[str]:
+        """Keywords occurring in any of the texts, in keyword order"""
+        if self._joinable and len(texts) > 1:
+            texts = (self.SEPARATOR.join(texts),)
+
+        if not self.uses_automaton:
+            if len(texts) == 1:
+                text = texts[0]
+                return [keyword for keyword in self.keywords if keyword in text]
+            return [
+                keyword
+                for keyword in self.keywords
+                if any(keyword in text for text in texts)
+            ]
+
+        found: Set[str] = {""} if self._matches_empty else set()
+        transitions = self._transitions
+        outputs = self._outputs
+        for text in texts:
+            state = 0
+            for char in text:
+                state = transitions[state].get(char, 0)
+                if outputs[state]:
+                    found.update(outputs[state])
+        return sorted(found, key=self._rank.__getitem__)
+
+    def _build_automaton(self):
+        """Build the trie and resolve failure links into full transitions"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[str]] = [set()]
+        for keyword in self.keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(keyword)
+
+        # Breadth-first, so the failure state of a node is complete before it
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [{}] * (len(goto) - 1)
+        failure = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = failure[state]
+            transitions[state] = {**transitions[fallback], **goto[state]}
+            outputs[state] |= outputs[fallback]
+            for char, next_state in goto[state].items():
+                failure[next_state] = transitions[fallback].get(char, 0)
+                queue.append(next_state)
+
+        self._transitions = transitions
+        self._outputs = [tuple(output) for output in outputs]
+
+
 class BreakthroughDetector:
     """Detect papers with breakthrough potential using multiple indicators."""
 
@@ -26,6 +126,7 @@ class BreakthroughDetector:
         self.current_year = datetime.now().year
         self.breakthrough_keywords = self._load_breakthrough_keywords()
         self.high_impact_authors = self._load_high_impact_authors()
+        self._keyword_matcher = KeywordMatcher(self.breakthrough_keywords)
 
     def _load_breakthrough_keywords(self) -> Set[str]:
         """Load breakthrough keywords from JSON file or use defaults."""
@@ -155,50 +256,147 @@ class BreakthroughDetector:
 
     def calculate_breakthrough_score(self, paper: Paper) -> float:
         """Calculate breakthrough potential score (0.0 to 1.0)."""
+        components = self._score_components(paper, self._get_keyword_matcher(), {})
+        weights = self.config.breakthrough_weights
         score = 0.0
 
         # Factor 1: Citation velocity (weight from config)
+        score += components[0] * weights["citation_velocity"]
+        # Factor 2: Breakthrough keywords (weight from config)
+        score += components[1] * weights["keywords"]
+        # Factor 3: Author reputation (weight from config)
+        score += components[2] * weights["author_reputation"]
+        # Factor 4: Venue prestige (weight from config)
+        score += components[3] * weights["venue_prestige"]
+        # Factor 5: Recency bonus (weight from config)
+        score += components[4] * weights["recency"]
+
+        return min(score, 1.0)
+
+    def score_batch(self, papers: List[Paper]) -> BreakthroughScores:
+        """Calculate the breakthrough score components of many papers at once
+
+        Every paper is scored once, keywords are matched by the compiled
+        matcher and venue prestige is looked up once per venue. Scores are
+        identical to calculate_breakthrough_score.
+        """
+        matcher = self._get_keyword_matcher()
+        venue_scores: Dict[Optional[str], float] = {}
+
+        rows = []
+        velocities = []
+        years = []
+        matched_keywords = []
+        high_impact_authors = []
+        for paper in papers:
+            (
+                velocity_score,
+                keyword_score,
+                author_score,
+                venue_score,
+                recency_score,
+                citation_velocity,
+                years_since_pub,
+                keywords,
+                authors,
+            ) = self._score_components(paper, matcher, venue_scores)
+            rows.append(
+                (
+                    velocity_score,
+                    keyword_score,
+                    author_score,
+                    venue_score,
+                    recency_score,
+                )
+            )
+            velocities.append(citation_velocity)
+            years.append(years_since_pub)
+            matched_keywords.append(keywords)
+            high_impact_authors.append(authors)
+
+        components = np.array(rows, dtype=np.float64).reshape(len(papers), 5)
+        weights = self.config.breakthrough_weights
+        # Same order of additions as calculate_breakthrough_score
+        total = np.zeros(len(papers))
+        total += components[:, 0] * weights["citation_velocity"]
+        total += components[:, 1] * weights["keywords"]
+        total += components[:, 2] * weights["author_reputation"]
+        total += components[:, 3] * weights["venue_prestige"]
+        total += components[:, 4] * weights["recency"]
+
+        return BreakthroughScores(
+            breakthrough_score=np.minimum(total, 1.0),
+            citation_velocity_score=components[:, 0],
+            keyword_score=components[:, 1],
+            author_reputation_score=components[:, 2],
+            venue_prestige_score=components[:, 3],
+            recency_score=components[:, 4],
+            citation_velocity=np.array(velocities, dtype=np.float64),
+            years_since_publication=np.array(years, dtype=np.int64),
+            matched_keywords=matched_keywords,
+            high_impact_authors=high_impact_authors,
+        )
+
+    def _score_components(
+        self,
+        paper: Paper,
+        matcher: KeywordMatcher,
+        venue_scores: Dict[Optional[str], float],
+    ) -> Tuple[float, float, float, float, float, float, int, List[str], List[str]]:
+        """Unweighted score components of a paper and their evidence"""
         years_since_pub = max(1, self.current_year - paper.year) if paper.year else 1
         citation_velocity = 0.0
         citation_count = paper.get_latest_citations_count()
         if citation_count > 0 and years_since_pub > 0:
             citation_velocity = citation_count / years_since_pub
-
-        # Velocity scoring using config
         velocity_score = self.config.get_velocity_score(citation_velocity)
-        score += velocity_score * self.config.breakthrough_weights["citation_velocity"]
 
-        # Factor 2: Breakthrough keywords (weight from config)
-        keyword_score, matched_keywords = self._calculate_keyword_score(paper)
-        score += keyword_score * self.config.breakthrough_weights["keywords"]
-
-        # Factor 3: Author reputation (weight from config)
+        keyword_score, matched_keywords = self._match_keywords(paper, matcher)
         author_score, high_impact_authors = self._calculate_author_reputation_score(
             paper.authors
         )
-        score += author_score * self.config.breakthrough_weights["author_reputation"]
 
-        # Factor 4: Venue prestige (weight from config)
-        venue_score = self._calculate_venue_prestige_score(
-            paper.normalized_venue or paper.venue
-        )
-        score += venue_score * self.config.breakthrough_weights["venue_prestige"]
+        venue = paper.normalized_venue or paper.venue
+        venue_score = venue_scores.get(venue)
+        if venue_score is None:
+            venue_score = self._calculate_venue_prestige_score(venue)
+            venue_scores[venue] = venue_score
 
-        # Factor 5: Recency bonus (weight from config)
         recency_score = self.config.get_recency_score(years_since_pub)
-        score += recency_score * self.config.breakthrough_weights["recency"]
 
-        return min(score, 1.0)
+        return (
+            velocity_score,
+            keyword_score,
+            author_score,
+            venue_score,
+            recency_score,
+            citation_velocity,
+            years_since_pub,
+            matched_keywords,
+            high_impact_authors,
+        )
+
+    def _get_keyword_matcher(self) -> KeywordMatcher:
+        """Matcher of the current keywords, recompiled if they were replaced"""
+        matcher = self._keyword_matcher
+        if len(matcher.keywords) != len(self.breakthrough_keywords) or any(
+            a != b for a, b in zip(matcher.keywords, self.breakthrough_keywords)
+        ):
+            matcher = KeywordMatcher(self.breakthrough_keywords)
+            self._keyword_matcher = matcher
+        return matcher
 
     def _calculate_keyword_score(self, paper: Paper) -> Tuple[float, List[str]]:
         """Calculate keyword-based breakthrough score."""
+        return self._match_keywords(paper, self._get_keyword_matcher())
+
+    def _match_keywords(
+        self, paper: Paper, matcher: KeywordMatcher
+    ) -> Tuple[float, List[str]]:
         title_lower = paper.title.lower() if paper.title else ""
         abstract_lower = paper.get_best_abstract().lower()
 
-        matched_keywords = []
-        for keyword in self.breakthrough_keywords:
-            if keyword in title_lower or keyword in abstract_lower:
-                matched_keywords.append(keyword)
+        matched_keywords = matcher.find(title_lower, abstract_lower)
 
         # Max score at config-specified keywords
         keyword_score = min(
@@ -247,15 +445,38 @@ class BreakthroughDetector:
 
     def identify_breakthrough_indicators(self, paper: Paper) -> List[str]:
         """Identify specific indicators of breakthrough potential."""
+        (
+            _,
+            _,
+            _,
+            venue_score,
+            _,
+            citation_velocity,
+            years_since_pub,
+            matched_keywords,
+            high_impact_authors,
+        ) = self._score_components(paper, self._get_keyword_matcher(), {})
+        return self._breakthrough_indicators(
+            paper,
+            citation_velocity,
+            years_since_pub,
+            matched_keywords,
+            high_impact_authors,
+            venue_score,
+        )
+
+    def _breakthrough_indicators(
+        self,
+        paper: Paper,
+        citation_velocity: float,
+        years_since_pub: int,
+        matched_keywords: List[str],
+        high_impact_authors: List[str],
+        venue_score: float,
+    ) -> List[str]:
         indicators = []
 
         # Check citation velocity
-        years_since_pub = max(1, self.current_year - paper.year) if paper.year else 1
-        citation_velocity = 0.0
-        citation_count = paper.get_latest_citations_count()
-        if citation_count > 0 and years_since_pub > 0:
-            citation_velocity = citation_count / years_since_pub
-
         if citation_velocity >= self.config.velocity_thresholds["high"]:
             indicators.append(
                 f"High citation velocity: {citation_velocity:.1f} citations/year"
@@ -266,21 +487,16 @@ class BreakthroughDetector:
             )
 
         # Check keywords
-        _, matched_keywords = self._calculate_keyword_score(paper)
         if matched_keywords:
             indicators.append(
                 f"Breakthrough keywords: {', '.join(matched_keywords[:5])}"
             )
 
         # Check authors
-        _, high_impact_authors = self._calculate_author_reputation_score(paper.authors)
         if high_impact_authors:
             indicators.append(f"High-impact authors: {', '.join(high_impact_authors)}")
 
         # Check venue
-        venue_score = self._calculate_venue_prestige_score(
-            paper.normalized_venue or paper.venue
-        )
         if venue_score >= 0.8:
             indicators.append(
                 f"Top-tier venue: {paper.normalized_venue or paper.venue}"
@@ -297,71 +513,71 @@ class BreakthroughDetector:
     ) -> List[BreakthroughPaper]:
         """Identify papers with breakthrough potential from a list."""
         breakthrough_papers = []
+        scores = self.score_batch(papers)
+
+        # Only consider papers with score >= 0.5 as breakthrough candidates
+        for index in np.flatnonzero(scores.breakthrough_score >= 0.5):
+            paper = papers[index]
+            score = float(scores.breakthrough_score[index])
+            matched_keywords = scores.matched_keywords[index]
+            high_impact_authors = scores.high_impact_authors[index]
+            venue_score = float(scores.venue_prestige_score[index])
+
+            indicators = self._breakthrough_indicators(
+                paper,
+                float(scores.citation_velocity[index]),
+                int(scores.years_since_publication[index]),
+                matched_keywords,
+                high_impact_authors,
+                venue_score,
+            )
 
-        for paper in papers:
-            score = self.calculate_breakthrough_score(paper)
-
-            # Only consider papers with score >= 0.5 as breakthrough candidates
-            if score >= 0.5:
-                indicators = self.identify_breakthrough_indicators(paper)
-
-                # Calculate individual component scores
-                years_since_pub = max(1, self.current_year - paper.year)
-                citation_count = paper.get_latest_citations_count()
-                citation_velocity = (
-                    citation_count / years_since_pub if citation_count > 0 else 0
-                )
-
-                # Velocity score
-                if citation_velocity >= 50:
-                    velocity_score = 1.0
-                elif citation_velocity >= 20:
-                    velocity_score = 0.8
-                elif citation_velocity >= 10:
-                    velocity_score = 0.6
-                elif citation_velocity >= 5:
-                    velocity_score = 0.4
-                elif citation_velocity >= 2:
-                    velocity_score = 0.2
-                else:
-                    velocity_score = 0.0
-
-                # Other scores
-                keyword_score, matched_keywords = self._calculate_keyword_score(paper)
-                author_score, high_impact_authors = (
-                    self._calculate_author_reputation_score(paper.authors)
-                )
-                venue_score = self._calculate_venue_prestige_score(
-                    paper.normalized_venue or paper.venue
-                )
+            # Calculate individual component scores
+            years_since_pub = max(1, self.current_year - paper.year)
+            citation_count = paper.get_latest_citations_count()
+            citation_velocity = (
+                citation_count / years_since_pub if citation_count > 0 else 0
+            )
 
-                # Recency score
-                if years_since_pub <= 2:
-                    recency_score = 1.0
-                elif years_since_pub <= 3:
-                    recency_score = 0.8
-                elif years_since_pub <= 5:
-                    recency_score = 0.6
-                else:
-                    recency_score = 0.0
-
-                breakthrough_paper = BreakthroughPaper(
-                    paper=paper,
-                    breakthrough_score=score,
-                    breakthrough_indicators=indicators,
-                    citation_velocity_score=velocity_score,
-                    keyword_score=keyword_score,
-                    author_reputation_score=author_score,
-                    venue_prestige_score=venue_score,
-                    recency_bonus=recency_score,
-                    matched_keywords=matched_keywords,
-                    high_impact_authors=high_impact_authors,
-                    citation_velocity=citation_velocity
-                    if citation_velocity > 0
-                    else None,
-                )
+            # Velocity score
+            if citation_velocity >= 50:
+                velocity_score = 1.0
+            elif citation_velocity >= 20:
+                velocity_score = 0.8
+            elif citation_velocity >= 10:
+                velocity_score = 0.6
+            elif citation_velocity >= 5:
+                velocity_score = 0.4
+            elif citation_velocity >= 2:
+                velocity_score = 0.2
+            else:
+                velocity_score = 0.0
+
+            # Recency score
+            if years_since_pub <= 2:
+                recency_score = 1.0
+            elif years_since_pub <= 3:
+                recency_score = 0.8
+            elif years_since_pub <= 5:
+                recency_score = 0.6
+            else:
+                recency_score = 0.0
+
+            breakthrough_paper = BreakthroughPaper(
+                paper=paper,
+                breakthrough_score=score,
+                breakthrough_indicators=indicators,
+                citation_velocity_score=velocity_score,
+                keyword_score=float(scores.keyword_score[index]),
+                author_reputation_score=float(scores.author_reputation_score[index]),
+                venue_prestige_score=venue_score,
+                recency_bonus=recency_score,
+                matched_keywords=matched_keywords,
+                high_impact_authors=high_impact_authors,
+                citation_velocity=citation_velocity if citation_velocity > 0 else None,
+            )
 
-                breakthrough_papers.append(breakthrough_paper)
+            breakthrough_papers.append(breakthrough_paper)
 
         # Sort by breakthrough score (highest first)
         breakthrough_papers.sort(key=lambda bp: bp.breakthrough_score, reverse=True)
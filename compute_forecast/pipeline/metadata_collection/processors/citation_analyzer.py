@@ -15,6 +15,7 @@ from compute_forecast.pipeline.metadata_collection.processors.breakthrough_detec
 )
 from compute_forecast.pipeline.metadata_collection.processors.adaptive_threshold_calculator import (
     AdaptiveThresholdCalculator,
+    VenueYearCitations,
 )
 from compute_forecast.pipeline.metadata_collection.processors.citation_statistics import (
     CitationAnalysisReport,
@@ -77,11 +78,14 @@ class CitationAnalyzer:
             if paper.year:
                 year_papers[paper.year].append(paper)
 
+        # Citation counts grouped by venue/year, shared by all venues
+        citations = VenueYearCitations(valid_papers)
+
         # Analyze each venue
         venue_analysis = {}
         for venue, venue_paper_list in venue_papers.items():
             venue_analysis[venue] = self._analyze_venue_citations(
-                venue, venue_paper_list
+                venue, venue_paper_list, citations
             )
 
         # Analyze each year
@@ -90,7 +94,7 @@ class CitationAnalyzer:
             year_analysis[year] = self._analyze_year_citations(year, year_paper_list)
 
         # Overall distribution analysis
-        all_citations = [p.get_latest_citations_count() for p in valid_papers]
+        all_citations = citations.values.tolist()
         overall_percentiles = self._calculate_percentiles(all_citations)
 
         # Detect breakthrough candidates
@@ -175,21 +179,16 @@ class CitationAnalyzer:
                 bp.paper.paper_id for bp in breakthrough_candidates if bp.paper.paper_id
             }
 
-        # Calculate thresholds for each venue/year combination
-        venue_year_thresholds = {}
-        for paper in valid_papers:
-            venue = paper.normalized_venue or paper.venue
-            year = paper.year
-
-            if venue and year and (venue, year) not in venue_year_thresholds:
-                venue_tier = self._get_venue_tier(venue)
-                threshold = self.threshold_calculator.calculate_venue_threshold(
-                    venue, year, valid_papers, venue_tier
-                )
-                venue_year_thresholds[(venue, year)] = threshold
+        # Calculate thresholds for each venue/year combination in one pass
+        citations = VenueYearCitations(valid_papers)
+        venue_year_thresholds = self.threshold_calculator.calculate_threshold_table(
+            citations, self._get_venue_tier
+        )
+        citation_counts = citations.values.tolist()
+        kept_per_group = np.zeros(len(citations), dtype=np.int64)
 
         # Filter papers
-        for paper in valid_papers:
+        for index, paper in enumerate(valid_papers):
             venue = paper.normalized_venue or paper.venue
             year = paper.year
 
@@ -200,6 +199,7 @@ class CitationAnalyzer:
 
             if is_breakthrough and preserve_breakthroughs:
                 papers_above_threshold.append(paper)
+                kept_per_group[citations.codes[index]] += 1
                 breakthrough_papers_preserved.append(paper)
                 filtering_statistics["breakthrough_preserved"] += 1
                 if venue:
@@ -214,8 +214,9 @@ class CitationAnalyzer:
                     (venue, year), 5
                 )  # Default threshold
 
-                if paper.get_latest_citations_count() >= threshold:
+                if citation_counts[index] >= threshold:
                     papers_above_threshold.append(paper)
+                    kept_per_group[citations.codes[index]] += 1
                     filtering_statistics["above_threshold"] += 1
                     if venue:
                         venue_representation[venue] += 1
@@ -225,28 +226,19 @@ class CitationAnalyzer:
 
         # Calculate threshold compliance
         threshold_compliance = {}
-        for (venue, year), threshold in venue_year_thresholds.items():
-            venue_year_papers = [
-                p
-                for p in valid_papers
-                if (p.normalized_venue or p.venue) == venue and p.year == year
-            ]
-            if venue_year_papers:
-                above_count = len(
-                    [p for p in venue_year_papers if p in papers_above_threshold]
+        for venue, year in venue_year_thresholds:
+            group = citations.group(venue, year)
+            if group is not None:
+                compliance_rate = int(kept_per_group[group]) / int(
+                    citations.sizes[group]
                 )
-                compliance_rate = above_count / len(venue_year_papers)
                 threshold_compliance[(venue, year)] = compliance_rate
 
         # Calculate quality metrics
         filtered_count = len(papers_above_threshold)
 
         # Estimated precision (quality of papers kept)
-        avg_citations_original = (
-            np.mean([p.get_latest_citations_count() for p in valid_papers])
-            if valid_papers
-            else 0
-        )
+        avg_citations_original = np.mean(citation_counts) if valid_papers else 0
         avg_citations_filtered = (
             np.mean([p.get_latest_citations_count() for p in papers_above_threshold])
             if papers_above_threshold
@@ -259,9 +251,7 @@ class CitationAnalyzer:
         )
 
         # Estimated coverage (coverage of important papers)
-        high_impact_original = len(
-            [p for p in valid_papers if p.get_latest_citations_count() > 50]
-        )
+        high_impact_original = sum(1 for count in citation_counts if count > 50)
         high_impact_kept = len(
             [p for p in papers_above_threshold if p.get_latest_citations_count() > 50]
         )
@@ -304,7 +294,11 @@ class CitationAnalyzer:
         return self.breakthrough_detector.detect_breakthrough_papers(papers)
 
     def calculate_adaptive_threshold(
-        self, venue: str, year: int, papers: List[Paper]
+        self,
+        venue: str,
+        year: int,
+        papers: List[Paper],
+        citations: Optional[VenueYearCitations] = None,
     ) -> AdaptiveThreshold:
         """
         Calculate adaptive citation threshold for venue/year.
@@ -313,10 +307,13 @@ class CitationAnalyzer:
         - Must consider venue prestige tier
         - Must account for paper recency (newer = lower threshold)
         - Must ensure minimum representation from each venue
+
+        Pass the grouped ``citations`` of ``papers`` when calculating the
+        thresholds of many venue/years of the same papers.
         """
         venue_tier = self._get_venue_tier(venue)
         return self.threshold_calculator.calculate_adaptive_threshold(
-            venue, year, papers, venue_tier
+            venue, year, papers, venue_tier, citations
         )
 
     def validate_filtering_quality(
@@ -442,9 +439,16 @@ class CitationAnalyzer:
         )
 
     def _analyze_venue_citations(
-        self, venue: str, papers: List[Paper]
+        self,
+        venue: str,
+        papers: List[Paper],
+        venue_year_citations: Optional[VenueYearCitations] = None,
     ) -> VenueCitationStats:
-        """Analyze citation patterns for specific venue."""
+        """Analyze citation patterns for specific venue.
+
+        ``venue_year_citations`` are the grouped counts of a paper list
+        containing all of ``papers``.
+        """
         citations = [p.get_latest_citations_count() for p in papers]
 
         # Calculate basic statistics
@@ -489,7 +493,7 @@ class CitationAnalyzer:
             max(papers_by_year.keys()) if papers_by_year else self.current_year - 1
         )
         recommended_threshold = self.threshold_calculator.calculate_venue_threshold(
-            venue, recent_year, papers, venue_tier
+            venue, recent_year, papers, venue_tier, venue_year_citations
         )
 
         return VenueCitationStats(
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from compute_forecast.pipeline.metadata_collection.models import Paper
 
 
@@ -46,6 +48,27 @@ class BreakthroughPaper:
     citation_velocity: Optional[float]  # Actual citations per year
 
 
+@dataclass
+class BreakthroughScores:
+    """Breakthrough score components of a batch of papers, one entry per paper."""
+
+    breakthrough_score: np.ndarray  # Weighted total, capped at 1.0
+    citation_velocity_score: np.ndarray
+    keyword_score: np.ndarray
+    author_reputation_score: np.ndarray
+    venue_prestige_score: np.ndarray
+    recency_score: np.ndarray
+
+    # Supporting evidence
+    citation_velocity: np.ndarray  # Actual citations per year
+    years_since_publication: np.ndarray
+    matched_keywords: List[List[str]]
+    high_impact_authors: List[List[str]]
+
+    def __len__(self) -> int:
+        return len(self.breakthrough_score)
+
+
 @dataclass
 class VenueCitationStats:
     """Citation statistics for specific venue."""
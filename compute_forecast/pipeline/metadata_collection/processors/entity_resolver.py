@@ -0,0 +1,317 @@
+"""
+Entity resolution for collected paper metadata.
+Groups records of the same paper by shared identifiers and by fuzzy title
+matching within blocks, and supports adding new batches incrementally.
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from rapidfuzz import fuzz
+
+from ..models import Paper
+
+logger = logging.getLogger(__name__)
+
+TITLE_STOPWORDS = {
+    "a",
+    "an",
+    "and",
+    "for",
+    "from",
+    "in",
+    "of",
+    "on",
+    "the",
+    "to",
+    "via",
+    "with",
+}
+
+# Weights of the pairwise similarity score, title being most important
+TITLE_WEIGHT = 0.6
+AUTHOR_WEIGHT = 0.2
+YEAR_WEIGHT = 0.1
+VENUE_WEIGHT = 0.1
+
+# Sources whose paper_id is a Semantic Scholar paper id
+SEMANTIC_SCHOLAR_SOURCES = {"semantic_scholar"}
+
+
+def normalize_identifier(id_type: str, value: str) -> Optional[str]:
+    """Normalize an identifier value so equal identifiers compare equal"""
+    value = value.strip().lower()
+    if not value:
+        return None
+
+    if id_type == "doi":
+        value = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:)", "", value)
+    elif id_type == "arxiv":
+        value = re.sub(r"^(https?://arxiv\.org/(abs|pdf)/|arxiv:)", "", value)
+        value = re.sub(r"(v\d+)?(\.pdf)?$", "", value)
+    elif id_type == "openalex":
+        value = value.replace("https://openalex.org/", "")
+    return value or None
+
+
+def paper_id_key(paper: Paper) -> Optional[Tuple[str, str]]:
+    """Normalized (type, value) identifier of paper.paper_id.
+
+    Only papers collected from Semantic Scholar carry a Semantic Scholar id
+    there; scrapers and other sources store their own ids, which are keyed by
+    their source. Without a known source the id is not an identifier.
+    """
+    source = paper.collection_source or paper.source
+    if not paper.paper_id or not source:
+        return None
+    id_type = "s2_paper" if source in SEMANTIC_SCHOLAR_SOURCES else f"{source}_paper"
+    normalized = normalize_identifier(id_type, str(paper.paper_id))
+    return (id_type, normalized) if normalized else None
+
+
+def title_tokens(title: str) -> List[str]:
+    """Lowercase alphanumeric title tokens without stopwords"""
+    return [
+        token
+        for token in re.findall(r"[a-z0-9]+", title.lower())
+        if token not in TITLE_STOPWORDS
+    ]
+
+
+class UnionFind:
+    """Disjoint sets over consecutive integer ids"""
+
+    def __init__(self) -> None:
+        self.parent: List[int] = []
+        self.size: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        """Add a singleton set and return its id"""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, item: int) -> int:
+        """Find the root of an item's set, halving the path on the way"""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of two items, returns False if already merged"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+
+
+@dataclass
+class _PaperFeatures:
+    """Precomputed comparison features of a paper"""
+
+    title: str
+    authors: Set[str]
+    year: int
+    venue: str
+
+
+class EntityResolver:
+    """Incremental entity resolution for collected papers.
+
+    Papers sharing a DOI, arXiv, OpenAlex or Semantic Scholar identifier are
+    merged directly. Other papers are only compared with papers sharing a
+    blocking key (one of their longest title tokens), and merged when their
+    weighted title, author, year and venue similarity reaches the threshold.
+    Clusters are merged transitively with union-find, and new batches only
+    compare the new papers, so a resolved set can grow without recomparing
+    all papers.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.85,
+        blocking_tokens: int = 2,
+        max_block_size: int = 1000,
+    ):
+        """
+        Args:
+            similarity_threshold: Minimum weighted similarity to merge papers
+            blocking_tokens: Number of longest title tokens used as blocking keys
+            max_block_size: Blocks this large are too common to discriminate
+                and are not used to find candidates any more
+        """
+        self.similarity_threshold = similarity_threshold
+        self.blocking_tokens = blocking_tokens
+        self.max_block_size = max_block_size
+
+        self.papers: List[Paper] = []
+        self.match_scores: Dict[Tuple[int, int], float] = {}
+        self._sets = UnionFind()
+        self._features: List[_PaperFeatures] = []
+        self._identifiers: Dict[Tuple[str, str], int] = {}
+        self._blocks: Dict[str, List[int]] = {}
+
+        # No pair can reach the threshold below this title similarity
+        self._min_title_score = max(
+            0.0, (similarity_threshold - (1 - TITLE_WEIGHT)) / TITLE_WEIGHT
+        )
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    def add_papers(self, papers: List[Paper]) -> int:
+        """Add a batch of papers to the resolved set.
+
+        Returns:
+            Number of cluster merges caused by the batch
+        """
+        merges = 0
+        for paper in papers:
+            merges += self.add_paper(paper)
+
+        logger.info(
+            f"Resolved {len(papers)} papers with {merges} merges, "
+            f"{len(self.papers)} papers in {self.cluster_count()} clusters"
+        )
+        return merges
+
+    def add_paper(self, paper: Paper) -> int:
+        """Add a paper to the resolved set.
+
+        Returns:
+            Number of cluster merges caused by the paper
+        """
+        index = self._sets.add()
+        self.papers.append(paper)
+        features = self._paper_features(paper)
+        self._features.append(features)
+
+        merges = 0
+        for identifier in self._identifier_keys(paper):
+            other = self._identifiers.setdefault(identifier, index)
+            if other != index and self._sets.union(other, index):
+                self.match_scores[(other, index)] = 1.0
+                merges += 1
+
+        compared: Set[int] = set()
+        for block_key in self._blocking_keys(paper.title):
+            block = self._blocks.setdefault(block_key, [])
+            if len(block) >= self.max_block_size:
+                continue
+            for other in block:
+                if other in compared:
+                    continue
+                compared.add(other)
+                if self._sets.find(other) == self._sets.find(index):
+                    continue
+                score = self._score(self._features[other], features)
+                if score >= self.similarity_threshold:
+                    self._sets.union(other, index)
+                    self.match_scores[(other, index)] = score
+                    merges += 1
+            block.append(index)
+
+        return merges
+
+    def clusters(self) -> List[List[int]]:
+        """Paper indexes of each cluster, ordered by first appearance"""
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(self.papers)):
+            groups.setdefault(self._sets.find(index), []).append(index)
+        return list(groups.values())
+
+    def cluster_count(self) -> int:
+        return sum(
+            1 for index in range(len(self.papers)) if self._sets.find(index) == index
+        )
+
+    def same_entity(self, a: int, b: int) -> bool:
+        """Check whether two paper indexes were resolved to the same paper"""
+        return self._sets.find(a) == self._sets.find(b)
+
+    def canonical_paper(self, cluster: List[int]) -> Paper:
+        """The most cited paper of a cluster, the earliest one on ties"""
+        return max(
+            (self.papers[index] for index in cluster),
+            key=lambda paper: paper.get_latest_citations_count(),
+        )
+
+    def similarity(self, paper1: Paper, paper2: Paper) -> float:
+        """Weighted title, author, year and venue similarity of two papers"""
+        return self._score(self._paper_features(paper1), self._paper_features(paper2))
+
+    @staticmethod
+    def _paper_features(paper: Paper) -> _PaperFeatures:
+        return _PaperFeatures(
+            title=paper.title.lower(),
+            authors={author.name.lower() for author in paper.authors},
+            year=paper.year,
+            venue=(paper.venue or "").lower(),
+        )
+
+    def _score(self, first: _PaperFeatures, second: _PaperFeatures) -> float:
+        title_similarity = (
+            fuzz.ratio(
+                first.title, second.title, score_cutoff=self._min_title_score * 100
+            )
+            / 100
+        )
+        if title_similarity == 0 and self._min_title_score > 0:
+            return 0.0
+
+        author_union = len(first.authors | second.authors)
+        author_similarity = (
+            len(first.authors & second.authors) / author_union
+            if first.authors and second.authors
+            else 0
+        )
+        year_similarity = 1.0 if first.year == second.year else 0.5
+        venue_similarity = fuzz.ratio(first.venue, second.venue) / 100
+
+        return (
+            title_similarity * TITLE_WEIGHT
+            + author_similarity * AUTHOR_WEIGHT
+            + year_similarity * YEAR_WEIGHT
+            + venue_similarity * VENUE_WEIGHT
+        )
+
+    def _identifier_keys(self, paper: Paper) -> Set[Tuple[str, str]]:
+        """Normalized (type, value) identifiers of a paper"""
+        raw = [
+            ("doi", paper.doi),
+            ("arxiv", paper.arxiv_id),
+            ("openalex", paper.openalex_id),
+        ]
+        raw.extend(
+            (record.data.identifier_type, record.data.identifier_value)
+            for record in paper.identifiers
+        )
+
+        keys = set()
+        for id_type, value in raw:
+            if value:
+                normalized = normalize_identifier(id_type, str(value))
+                if normalized:
+                    keys.add((id_type, normalized))
+        id_key = paper_id_key(paper)
+        if id_key:
+            keys.add(id_key)
+        return keys
+
+    def _blocking_keys(self, title: str) -> List[str]:
+        """Longest distinct title tokens, so a typo in one still shares another"""
+        tokens = sorted(set(title_tokens(title)), key=lambda t: (-len(t), t))
+        if not tokens:
+            return [title.strip().lower()]
+        return tokens[: self.blocking_tokens]
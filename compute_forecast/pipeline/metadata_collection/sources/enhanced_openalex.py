@@ -16,6 +16,7 @@ from ..models import (
     CitationRecord,
 )
 from ...consolidation.models import AbstractData, CitationData
+from ....utils.rate_governor import get_rate_governor
 from datetime import datetime
 import logging
 import re
@@ -27,11 +28,18 @@ logger = logging.getLogger(__name__)
 class EnhancedOpenAlexClient:
     """Enhanced OpenAlex client with batch support"""
 
+    supports_cursor_pagination = True
+
+    # Requests per second, shared with other clients through the rate governor
+    RATE_LIMIT = 10.0  # polite pool limit
+
     def __init__(self, email: Optional[str] = None):
         self.base_url = "https://api.openalex.org"
         self.email = email
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.governor = get_rate_governor()
+        self.governor.register("openalex", self.RATE_LIMIT)
 
         # Default headers (OpenAlex requests polite usage with email)
         self.headers = {
@@ -41,12 +49,19 @@ class EnhancedOpenAlexClient:
             self.headers["User-Agent"] += f" (mailto:{email})"
 
     def search_papers(
-        self, query: str, year: int, limit: int = 500, offset: int = 0
+        self,
+        query: str,
+        year: int,
+        limit: int = 500,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> APIResponse:
         """
         Search papers with enhanced error handling and retry logic
 
-        OpenAlex uses different query syntax than Semantic Scholar
+        OpenAlex uses different query syntax than Semantic Scholar. Deep result
+        sets are paged with a cursor instead of an offset: pass "*" for the
+        first page, then the metadata's next_cursor until it is None.
         """
         start_time = time.time()
 
@@ -61,13 +76,20 @@ class EnhancedOpenAlexClient:
             "page": (offset // min(limit, 200)) + 1,  # Convert offset to page
             "select": "id,title,authorships,primary_location,publication_year,cited_by_count,abstract_inverted_index,doi",
         }
+        if cursor is not None:
+            del params["page"]
+            params["cursor"] = cursor
 
         # Attempt request with retries
         for attempt in range(self.max_retries):
             try:
+                self.governor.acquire("openalex")
                 response = requests.get(
                     url, params=params, headers=self.headers, timeout=30
                 )
+                self.governor.record_response(
+                    "openalex", response.status_code, response.headers
+                )
                 response_time_ms = (time.time() - start_time) * 1000
 
                 if response.status_code == 200:
@@ -238,6 +260,7 @@ class EnhancedOpenAlexClient:
                 response_time_ms=response_time_ms,
                 api_name="openalex",
                 timestamp=datetime.now(),
+                next_cursor=meta.get("next_cursor"),
             )
 
             return APIResponse(
@@ -19,6 +19,7 @@ from ...consolidation.models import (
     CitationRecord,
     CitationData,
 )
+from ....utils.rate_governor import get_rate_governor
 from datetime import datetime
 import logging
 
@@ -29,11 +30,18 @@ logger = logging.getLogger(__name__)
 class EnhancedSemanticScholarClient:
     """Enhanced Semantic Scholar client with batch support"""
 
+    supports_cursor_pagination = True
+
+    # Requests per second, shared with other clients through the rate governor
+    RATE_LIMIT = 1.0  # introductory API key limit
+
     def __init__(self, api_key: Optional[str] = None):
         self.base_url = "https://api.semanticscholar.org/graph/v1"
         self.api_key = api_key
         self.max_retries = 3
         self.retry_delay = 1.0  # Start with 1 second delay
+        self.governor = get_rate_governor()
+        self.governor.register("semantic_scholar", self.RATE_LIMIT)
 
         # Default headers
         self.headers = {"User-Agent": "research-paper-collector/1.0"}
@@ -41,7 +49,12 @@ class EnhancedSemanticScholarClient:
             self.headers["x-api-key"] = api_key
 
     def search_papers(
-        self, query: str, year: int, limit: int = 500, offset: int = 0
+        self,
+        query: str,
+        year: int,
+        limit: int = 500,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> APIResponse:
         """
         Search papers with enhanced error handling and retry logic
@@ -50,24 +63,39 @@ class EnhancedSemanticScholarClient:
         - 100 requests/5min limit, retry logic (max 3 retries)
         - Support pagination with offset
         - Parse Semantic Scholar API response format
+
+        Offset pagination stops at 1000 results. With a cursor the bulk search
+        endpoint is used instead: pass "*" for the first page, then the
+        metadata's next_cursor until it is None. Bulk pages ignore the limit.
         """
         start_time = time.time()
 
         # Construct API URL and parameters
-        url = f"{self.base_url}/paper/search"
-        params: Dict[str, Any] = {
-            "query": query,
-            "limit": min(limit, 100),  # SS API limit is 100 per request
-            "offset": offset,
-            "fields": "paperId,title,authors,venue,year,citationCount,abstract,url",
-        }
+        fields = "paperId,title,authors,venue,year,citationCount,abstract,url"
+        if cursor is None:
+            url = f"{self.base_url}/paper/search"
+            params: Dict[str, Any] = {
+                "query": query,
+                "limit": min(limit, 100),  # SS API limit is 100 per request
+                "offset": offset,
+                "fields": fields,
+            }
+        else:
+            url = f"{self.base_url}/paper/search/bulk"
+            params = {"query": query, "year": str(year), "fields": fields}
+            if cursor != "*":
+                params["token"] = cursor
 
         # Attempt request with retries
         for attempt in range(self.max_retries):
             try:
+                self.governor.acquire("semantic_scholar")
                 response = requests.get(
                     url, params=params, headers=self.headers, timeout=30
                 )
+                self.governor.record_response(
+                    "semantic_scholar", response.status_code, response.headers
+                )
                 response_time_ms = (time.time() - start_time) * 1000
 
                 # Handle different response codes
@@ -199,6 +227,7 @@ class EnhancedSemanticScholarClient:
                 response_time_ms=response_time_ms,
                 api_name="semantic_scholar",
                 timestamp=datetime.now(),
+                next_cursor=data.get("token"),
             )
 
             return APIResponse(
@@ -20,7 +20,16 @@ from .error_handling import (
     retry_on_error,
     RateLimiter,
 )
-from .conference_scrapers import IJCAIScraper, ACLAnthologyScraper
+
+
+def __getattr__(name: str):
+    # Conference scrapers need their scraping dependencies, import on use
+    if name in ("IJCAIScraper", "ACLAnthologyScraper"):
+        from . import conference_scrapers
+
+        return getattr(conference_scrapers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Base classes
@@ -11,6 +11,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ...models import Paper
+from .error_handling import RateLimiter
 from .models import SimplePaper
 
 
@@ -73,6 +74,12 @@ class BaseScraper(ABC):
         self._session: Optional[requests.Session] = None
         self._cache: Dict[str, Any] = {}
 
+        # Requests share the rate governor budget of the source's provider
+        self.rate_limiter = RateLimiter(
+            requests_per_second=1.0 / self.config.rate_limit_delay,
+            provider=source_name,
+        )
+
     @property
     def session(self) -> requests.Session:
         """Get or create HTTP session with retry configuration"""
@@ -99,11 +106,16 @@ class BaseScraper(ABC):
 
     def _make_request(self, url: str, **kwargs) -> requests.Response:
         """Make HTTP request with rate limiting"""
-        time.sleep(self.config.rate_limit_delay)
+        self.rate_limiter.wait()
 
         kwargs.setdefault("timeout", self.config.timeout)
-        response = self.session.get(url, **kwargs)
-        response.raise_for_status()
+        try:
+            response = self.session.get(url, **kwargs)
+            response.raise_for_status()
+        except requests.RequestException:
+            self.rate_limiter.record_error()
+            raise
+        self.rate_limiter.record_success()
 
         return response
 
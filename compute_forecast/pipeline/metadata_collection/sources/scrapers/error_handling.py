@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import requests
 
+from .....utils.rate_governor import get_rate_governor
+
 
 class ErrorType(Enum):
     """Classification of scraping errors"""
@@ -173,32 +175,38 @@ def retry_on_error(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.
 class RateLimiter:
     """Intelligent rate limiting with adaptive backoff based on errors"""
 
-    def __init__(self, requests_per_second: float = 1.0):
+    def __init__(
+        self, requests_per_second: float = 1.0, provider: Optional[str] = None
+    ):
         self.min_interval = 1.0 / requests_per_second
         self.last_request_time = 0.0
         self.consecutive_errors = 0
         self.max_backoff_multiplier = 32  # Cap exponential backoff
 
+        # With a provider, base pacing is shared through the rate governor
+        self.provider = provider
+        if provider is not None:
+            get_rate_governor().register(provider, requests_per_second)
+
     def wait(self):
         """Wait appropriate amount based on rate limit and recent errors"""
         current_time = time.time()
         time_since_last = current_time - self.last_request_time
 
-        # Base delay from configured rate limit
-        required_delay = self.min_interval
-
-        # Exponential backoff for consecutive errors
-        if self.consecutive_errors > 0:
-            backoff_multiplier = min(
-                2**self.consecutive_errors, self.max_backoff_multiplier
-            )
-            required_delay *= backoff_multiplier
+        # Base delay from configured rate limit, with exponential backoff for
+        # consecutive errors
+        required_delay = self.get_current_delay()
+        if self.provider is not None and self.consecutive_errors == 0:
+            required_delay = 0.0
 
         # Only sleep if we haven't waited long enough
         if time_since_last < required_delay:
             sleep_time = required_delay - time_since_last
             time.sleep(sleep_time)
 
+        if self.provider is not None:
+            get_rate_governor().acquire(self.provider)
+
         self.last_request_time = time.time()
 
     def record_success(self):
@@ -8,7 +8,6 @@ from .base import BaseScraper, ScrapingConfig, ScrapingResult
 from .error_handling import (
     ScrapingMonitor,
     retry_on_error,
-    RateLimiter,
     ErrorType,
     ScrapingError,
 )
@@ -23,9 +22,6 @@ class EnhancedScraper(BaseScraper):
 
         # Initialize error handling components
         self.monitor = ScrapingMonitor()
-        self.rate_limiter = RateLimiter(
-            requests_per_second=1.0 / self.config.rate_limit_delay
-        )
 
         # Set up logging
         self.logger = logging.getLogger(f"scraper.{source_name}")
@@ -47,21 +43,12 @@ class EnhancedScraper(BaseScraper):
     def _make_monitored_request(self, url: str, **kwargs) -> str:
         """Make HTTP request with monitoring and error handling"""
         try:
-            # Apply rate limiting
-            self.rate_limiter.wait()
-
-            # Make the request
+            # Make the request, rate limited by the base scraper's limiter
             response = self._make_request(url, **kwargs)
 
-            # Record success
-            self.rate_limiter.record_success()
-
             return response.text
 
         except Exception as e:
-            # Record error for rate limiting
-            self.rate_limiter.record_error()
-
             # Create detailed error for monitoring
             error = ScrapingError(
                 error_type=ErrorType.NETWORK_ERROR,
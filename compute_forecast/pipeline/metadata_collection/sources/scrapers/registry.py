@@ -1,73 +1,104 @@
 """Scraper registry for managing available scrapers."""
 
+import importlib
 import logging
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, Iterator, List, Optional, Type, Any, Union
 
 from .base import BaseScraper, ScrapingConfig
 
 logger = logging.getLogger(__name__)
 
+# Built-in scrapers as "module:Class" entry points, relative to this package
+BUILTIN_SCRAPERS = {
+    # Package scrapers
+    "IJCAIScraper": ".conference_scrapers.ijcai_scraper:IJCAIScraper",
+    "ACLAnthologyScraper": ".conference_scrapers.acl_anthology_scraper:ACLAnthologyScraper",
+    "CVFScraper": ".conference_scrapers.cvf_scraper:CVFScraper",
+    "PMLRScraper": ".conference_scrapers.pmlr_scraper:PMLRScraper",
+    # Paperoni adapters
+    "NeurIPSScraper": ".paperoni_adapters.neurips:NeurIPSAdapter",
+    "MLRScraper": ".paperoni_adapters.mlr:MLRAdapter",
+    "OpenReviewScraper": ".paperoni_adapters.openreview:OpenReviewAdapter",
+    "OpenReviewScraperV2": ".paperoni_adapters.openreview_v2:OpenReviewAdapterV2",
+    "SemanticScholarScraper": ".paperoni_adapters.semantic_scholar:SemanticScholarAdapter",
+    "NaturePortfolioScraper": ".paperoni_adapters.nature_portfolio:NaturePortfolioAdapter",
+    "AAAIScraper": ".aaai:AAAIScraper",
+}
+
+
+class LazyScraperClasses:
+    """Scraper classes by name, imported from their entry point on first use"""
+
+    def __init__(self):
+        self._entry_points: Dict[str, str] = {}
+        self._classes: Dict[str, Type[BaseScraper]] = {}
+
+    def add(self, name: str, scraper: Union[str, Type[BaseScraper]]):
+        """Register a scraper class or a "module:Class" entry point"""
+        self._classes.pop(name, None)
+        self._entry_points.pop(name, None)
+        if isinstance(scraper, str):
+            self._entry_points[name] = scraper
+        else:
+            self._classes[name] = scraper
+
+    def get(self, name: str) -> Optional[Type[BaseScraper]]:
+        """Get a scraper class, importing it if needed. None if unavailable."""
+        if name not in self._classes:
+            entry_point = self._entry_points.get(name)
+            if entry_point is None:
+                return None
+
+            module_name, class_name = entry_point.split(":")
+            try:
+                module = importlib.import_module(module_name, __package__)
+            except ImportError as e:
+                logger.warning(f"Failed to import scraper {name}: {e}")
+                return None
+            self._classes[name] = getattr(module, class_name)
+            del self._entry_points[name]
+        return self._classes[name]
+
+    def __getitem__(self, name: str) -> Type[BaseScraper]:
+        scraper_class = self.get(name)
+        if scraper_class is None:
+            raise KeyError(name)
+        return scraper_class
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._classes or name in self._entry_points
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._classes) + list(self._entry_points))
+
+    def __len__(self) -> int:
+        return len(self._classes) + len(self._entry_points)
+
+    def keys(self) -> List[str]:
+        return list(self)
+
 
 class ScraperRegistry:
-    """Registry for managing and accessing available scrapers."""
+    """Registry for managing and accessing available scrapers.
+
+    Scrapers are registered by entry point and only imported when a venue
+    first needs them, so creating the registry does not pull in the scraping
+    dependencies of every scraper.
+    """
 
     def __init__(self):
-        self._scrapers: Dict[str, Type[BaseScraper]] = {}
+        self._scrapers = LazyScraperClasses()
         self._venue_mapping: Dict[str, str] = {}
         self._initialize_scrapers()
 
     def _initialize_scrapers(self):
         """Initialize built-in scrapers and venue mappings."""
-        # Register package scrapers
-        self._register_package_scrapers()
-
-        # Register paperoni adapters
-        self._register_paperoni_adapters()
+        for name, entry_point in BUILTIN_SCRAPERS.items():
+            self._scrapers.add(name, entry_point)
 
         # Set up venue to scraper mappings
         self._setup_venue_mappings()
 
-    def _register_package_scrapers(self):
-        """Register scrapers from this package."""
-        try:
-            # Import custom scrapers
-            from .conference_scrapers.ijcai_scraper import IJCAIScraper
-            from .conference_scrapers.acl_anthology_scraper import ACLAnthologyScraper
-            from .conference_scrapers.cvf_scraper import CVFScraper
-            from .conference_scrapers.pmlr_scraper import PMLRScraper
-
-            self.register_scraper("IJCAIScraper", IJCAIScraper)
-            self.register_scraper("ACLAnthologyScraper", ACLAnthologyScraper)
-            self.register_scraper("CVFScraper", CVFScraper)
-            self.register_scraper("PMLRScraper", PMLRScraper)
-
-        except ImportError as e:
-            logger.warning(f"Failed to import package scrapers: {e}")
-
-    def _register_paperoni_adapters(self):
-        """Register paperoni adapter scrapers."""
-        try:
-            from .paperoni_adapters import (
-                NeurIPSAdapter,
-                MLRAdapter,
-                OpenReviewAdapter,
-                OpenReviewAdapterV2,
-                SemanticScholarAdapter,
-                NaturePortfolioAdapter,
-            )
-            from .aaai import AAAIScraper
-
-            self.register_scraper("NeurIPSScraper", NeurIPSAdapter)
-            self.register_scraper("MLRScraper", MLRAdapter)
-            self.register_scraper("OpenReviewScraper", OpenReviewAdapter)
-            self.register_scraper("OpenReviewScraperV2", OpenReviewAdapterV2)
-            self.register_scraper("SemanticScholarScraper", SemanticScholarAdapter)
-            self.register_scraper("NaturePortfolioScraper", NaturePortfolioAdapter)
-            self.register_scraper("AAAIScraper", AAAIScraper)
-
-        except ImportError as e:
-            logger.warning(f"Failed to import paperoni adapters: {e}")
-
     def _setup_venue_mappings(self):
         """Set up venue to scraper mappings."""
         self._venue_mapping = {
@@ -114,9 +145,9 @@ class ScraperRegistry:
             "*": "SemanticScholarScraper",
         }
 
-    def register_scraper(self, name: str, scraper_class: Type[BaseScraper]):
-        """Register a scraper class."""
-        self._scrapers[name] = scraper_class
+    def register_scraper(self, name: str, scraper_class: Union[str, Type[BaseScraper]]):
+        """Register a scraper class or a "module:Class" entry point."""
+        self._scrapers.add(name, scraper_class)
         logger.info(f"Registered scraper: {name}")
 
     def get_scraper_for_venue(
@@ -141,7 +172,7 @@ class ScraperRegistry:
         # Instantiate scraper
         try:
             # All scrapers take config as their parameter
-            scraper = scraper_class(config or ScrapingConfig())  # type: ignore[arg-type]
+            scraper: BaseScraper = scraper_class(config or ScrapingConfig())  # type: ignore[arg-type]
             return scraper
         except Exception as e:
             logger.error(f"Failed to instantiate scraper {scraper_name}: {e}")
@@ -1,11 +1,11 @@
 """ArXiv PDF collector with enhanced discovery and version handling."""
 
+import io
 import re
-import time
 import logging
 import requests
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from urllib.parse import quote_plus
 
@@ -17,32 +17,13 @@ from compute_forecast.pipeline.pdf_acquisition.discovery.core.collectors import
 from compute_forecast.pipeline.pdf_acquisition.discovery.utils.exceptions import (
     SourceNotApplicableError,
 )
+from compute_forecast.pipeline.pdf_acquisition.discovery.utils.rate_limiter import (
+    RateLimiter,
+)
 
 logger = logging.getLogger(__name__)
 
-
-class RateLimiter:
-    """Simple rate limiter for API requests."""
-
-    def __init__(self, requests_per_second: float):
-        """Initialize rate limiter.
-
-        Args:
-            requests_per_second: Maximum requests per second allowed
-        """
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0.0
-
-    def wait(self):
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
-            time.sleep(sleep_time)
-
-        self.last_request_time = time.time()
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
 
 
 class ArXivPDFCollector(BasePDFCollector):
@@ -51,9 +32,17 @@ class ArXivPDFCollector(BasePDFCollector):
     def __init__(self):
         """Initialize the arXiv PDF collector."""
         super().__init__("arxiv")
+        self.supports_batch = True
         self.base_url = "https://arxiv.org/pdf/"
         self.api_url = "http://export.arxiv.org/api/query"
-        self.rate_limiter = RateLimiter(3.0)  # 3 requests per second
+        self.rate_limiter = RateLimiter.per_second(
+            3.0, provider="arxiv"
+        )  # 3 requests per second
+
+        # Batch mode: IDs per id_list request and titles per OR-combined search
+        self.id_batch_size = 100
+        self.title_batch_size = 10
+        self.results_per_title = 5
 
         # Compile regex patterns for efficiency
         self.arxiv_id_pattern = re.compile(r"(\d{4}\.\d{4,5})(v\d+)?")
@@ -259,15 +248,8 @@ class ArXivPDFCollector(BasePDFCollector):
             True if titles match, False otherwise
         """
 
-        # Remove common punctuation and extra whitespace
-        def normalize_title(title):
-            # Remove punctuation and normalize whitespace
-            normalized = re.sub(r"[^\w\s]", " ", title)
-            normalized = re.sub(r"\s+", " ", normalized).strip()
-            return normalized
-
-        norm_title1 = normalize_title(title1)
-        norm_title2 = normalize_title(title2)
+        norm_title1 = self._normalize_title(title1)
+        norm_title2 = self._normalize_title(title2)
 
         # Check exact match first
         if norm_title1 == norm_title2:
@@ -279,6 +261,23 @@ class ArXivPDFCollector(BasePDFCollector):
 
         return False
 
+    def _normalize_title(self, title: str) -> str:
+        """Lowercase a title and reduce punctuation and whitespace to spaces."""
+        normalized = re.sub(r"[^\w\s]", " ", title.lower())
+        return re.sub(r"\s+", " ", normalized).strip()
+
+    def _author_surname(self, name: str) -> str:
+        """Get the normalized surname of an author name.
+
+        Handles both "Last, First" and "First Last" forms.
+        """
+        if "," in name:
+            surname = name.split(",")[0]
+        else:
+            parts = name.split()
+            surname = parts[-1] if parts else ""
+        return " ".join(re.sub(r"[^\w\s]", " ", surname.lower()).split())
+
     def handle_versions(self, arxiv_id: str) -> PDFRecord:
         """Handle arXiv version management and create PDFRecord.
 
@@ -331,6 +330,226 @@ class ArXivPDFCollector(BasePDFCollector):
         except requests.RequestException as e:
             raise Exception(f"Failed to validate PDF at {pdf_url}: {e}")
 
+    def discover_pdfs_batch(self, papers: List[Paper]) -> Dict[str, PDFRecord]:
+        """Discover PDFs for many papers with bulk arXiv API requests.
+
+        Known arXiv IDs are resolved through ``id_list`` queries, which also
+        confirm that the papers exist and give their latest version. Papers
+        without an ID, or whose ID lookup failed, are searched by title and
+        first author in OR-combined queries.
+
+        Args:
+            papers: Papers to find PDFs for
+
+        Returns:
+            Dictionary mapping paper_id to PDFRecord for successful discoveries
+        """
+        results: Dict[str, PDFRecord] = {}
+
+        # Strategy 1: Direct arXiv ID lookup, in bulk
+        papers_by_id: Dict[str, List[Tuple[Paper, Optional[str]]]] = {}
+        to_search: List[Paper] = []
+        for paper in papers:
+            arxiv_id = self.extract_arxiv_id(paper)
+            if arxiv_id:
+                version = self._extract_version(paper.arxiv_id or "")
+                papers_by_id.setdefault(arxiv_id, []).append((paper, version))
+            else:
+                to_search.append(paper)
+
+        ids = list(papers_by_id)
+        for start in range(0, len(ids), self.id_batch_size):
+            batch_ids = ids[start : start + self.id_batch_size]
+            try:
+                resolved = self._resolve_id_batch(batch_ids)
+            except Exception as e:
+                logger.warning(f"arXiv id_list lookup failed: {e}")
+                # Fall back to the title search for these papers
+                for arxiv_id in batch_ids:
+                    to_search.extend(paper for paper, _ in papers_by_id[arxiv_id])
+                continue
+
+            for arxiv_id, latest_version in resolved.items():
+                for paper, version in papers_by_id.get(arxiv_id, []):
+                    record = self._create_batch_record(
+                        paper, arxiv_id, version, latest_version
+                    )
+                    results[record.paper_id] = record
+
+        # Strategy 2: Title + first author search, several papers per query
+        to_search = [paper for paper in to_search if paper.title and paper.authors]
+        for start in range(0, len(to_search), self.title_batch_size):
+            batch = to_search[start : start + self.title_batch_size]
+            try:
+                found = self._search_title_batch(batch)
+            except Exception as e:
+                logger.warning(f"arXiv batch title search failed: {e}")
+                continue
+
+            for i, (arxiv_id, latest_version) in found.items():
+                paper = batch[i]
+                record = self._create_batch_record(
+                    paper, arxiv_id, None, latest_version
+                )
+                # Lower confidence for search-based discovery
+                record.confidence_score = min(record.confidence_score, 0.8)
+                results[record.paper_id] = record
+
+        logger.info(f"Resolved {len(results)}/{len(papers)} papers on arXiv in batch")
+        return results
+
+    def _resolve_id_batch(self, arxiv_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Look up many arXiv IDs with a single ``id_list`` request.
+
+        Args:
+            arxiv_ids: Clean arXiv IDs without version
+
+        Returns:
+            Mapping of each existing arXiv ID to its latest version
+        """
+        content = self._query_api(
+            {"id_list": ",".join(arxiv_ids), "max_results": len(arxiv_ids)}
+        )
+
+        resolved: Dict[str, Optional[str]] = {}
+        for entry_id, _, _ in self._iter_atom_entries(content):
+            clean_id = self._extract_id_from_string(entry_id)
+            # Unknown IDs come back as error entries without an arXiv ID
+            if clean_id:
+                resolved[clean_id] = self._extract_version(entry_id)
+        return resolved
+
+    def _search_title_batch(
+        self, papers: List[Paper]
+    ) -> Dict[int, Tuple[str, Optional[str]]]:
+        """Search arXiv for several papers with one OR-combined query.
+
+        Each clause constrains the title and the first author like
+        ``search_by_title_author``. An entry is assigned to a paper only if
+        its normalized title equals the paper's and the first author is
+        among its authors, so short or generic titles can't claim unrelated
+        entries.
+
+        Args:
+            papers: Papers to search for, all with a title and authors
+
+        Returns:
+            Mapping of each matched paper's position to its arXiv ID and
+            latest version
+        """
+        clauses = []
+        wanted: Dict[str, List[Tuple[int, str]]] = {}
+        for i, paper in enumerate(papers):
+            title = self._normalize_title(paper.title)
+            surname = self._author_surname(paper.authors[0].name)
+            if not title or not surname:
+                continue
+            # Keep only words so titles can't break the query syntax
+            clauses.append(f'(ti:"{title}" AND au:"{surname}")')
+            wanted.setdefault(title, []).append((i, surname))
+        if not clauses:
+            return {}
+
+        content = self._query_api(
+            {
+                "search_query": " OR ".join(clauses),
+                "start": 0,
+                "max_results": self.results_per_title * len(clauses),
+            }
+        )
+
+        found: Dict[int, Tuple[str, Optional[str]]] = {}
+        for entry_id, entry_title, entry_authors in self._iter_atom_entries(content):
+            arxiv_id = self._extract_id_from_string(entry_id)
+            if not arxiv_id:
+                continue
+
+            author_names = [
+                f" {self._normalize_title(name)} " for name in entry_authors
+            ]
+            for i, surname in wanted.get(self._normalize_title(entry_title), []):
+                if i not in found and any(
+                    f" {surname} " in name for name in author_names
+                ):
+                    logger.info(f"Found arXiv match via batch search: {arxiv_id}")
+                    found[i] = (arxiv_id, self._extract_version(entry_id))
+        return found
+
+    def _query_api(self, params: Dict[str, Union[str, int]]) -> bytes:
+        """Send a rate limited query to the arXiv API.
+
+        Args:
+            params: Query parameters
+
+        Returns:
+            Raw Atom response
+        """
+        self.rate_limiter.wait()
+        response = requests.get(self.api_url, params=params, timeout=30)
+        response.raise_for_status()
+        return response.content
+
+    def _iter_atom_entries(
+        self, content: bytes
+    ) -> Iterator[Tuple[str, str, List[str]]]:
+        """Stream (id, title, authors) entries from an Atom response.
+
+        Entries are parsed incrementally and cleared once read, so large
+        responses never hold the whole document tree in memory.
+
+        Args:
+            content: Raw Atom response
+
+        Yields:
+            Entry id URL, title and author names
+        """
+        entry_tag = f"{{{ATOM_NAMESPACE}}}entry"
+        id_tag = f"{{{ATOM_NAMESPACE}}}id"
+        title_tag = f"{{{ATOM_NAMESPACE}}}title"
+        author_name_path = f"{{{ATOM_NAMESPACE}}}author/{{{ATOM_NAMESPACE}}}name"
+
+        for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+            if elem.tag != entry_tag:
+                continue
+            entry_id = elem.findtext(id_tag) or ""
+            title = " ".join((elem.findtext(title_tag) or "").split())
+            authors = [name.text or "" for name in elem.findall(author_name_path)]
+            elem.clear()
+            yield entry_id, title, authors
+
+    def _create_batch_record(
+        self,
+        paper: Paper,
+        arxiv_id: str,
+        original_version: Optional[str],
+        latest_version: Optional[str],
+    ) -> PDFRecord:
+        """Create a PDFRecord for an arXiv ID confirmed by the API.
+
+        Args:
+            paper: Paper the ID belongs to
+            arxiv_id: Clean arXiv ID
+            original_version: Version the paper referenced, if any
+            latest_version: Latest version reported by the API
+
+        Returns:
+            PDFRecord with PDF information
+        """
+        return PDFRecord(
+            paper_id=paper.paper_id or f"arxiv_{arxiv_id}",
+            pdf_url=self._build_pdf_url(arxiv_id),
+            source=self.source_name,
+            discovery_timestamp=datetime.now(),
+            confidence_score=0.95 if original_version else 0.8,
+            version_info={
+                "original_version": original_version or "unknown",
+                "fetched_version": "latest",
+                "latest_version": latest_version or "unknown",
+                "arxiv_id": arxiv_id,
+            },
+            validation_status="pending",
+        )
+
     def _discover_single(self, paper: Paper) -> PDFRecord:
         """Discover PDF for a single paper using multiple strategies.
 
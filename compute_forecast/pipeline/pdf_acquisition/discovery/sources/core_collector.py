@@ -39,7 +39,7 @@ class COREPDFCollector(BasePDFCollector):
         super().__init__("core")
         self.api_url = api_url or "https://api.core.ac.uk/v3/search/outputs"
         self.api_key = api_key
-        self.rate_limiter = RateLimiter.per_minute(requests_per_minute)
+        self.rate_limiter = RateLimiter.per_minute(requests_per_minute, provider="core")
 
         # Set up headers
         self.headers = {
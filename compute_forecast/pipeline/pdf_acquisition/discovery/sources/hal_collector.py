@@ -41,7 +41,7 @@ class HALPDFCollector(BasePDFCollector):
         super().__init__("hal")
         self.oai_url = oai_url or "https://api.archives-ouvertes.fr/oai/hal"
         self.search_url = search_url or "https://api.archives-ouvertes.fr/search"
-        self.rate_limiter = RateLimiter.per_second(requests_per_second)
+        self.rate_limiter = RateLimiter.per_second(requests_per_second, provider="hal")
 
         # Compile regex for HAL ID extraction
         self.hal_id_pattern = re.compile(r"(hal-\d+)")
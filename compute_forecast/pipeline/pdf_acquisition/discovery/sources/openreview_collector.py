@@ -2,11 +2,11 @@
 
 import time
 import logging
-from typing import List, Optional, Any
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 import openreview
-from rapidfuzz import fuzz
 
 from compute_forecast.pipeline.metadata_collection.models import Paper
 from compute_forecast.pipeline.pdf_acquisition.discovery.core.models import PDFRecord
@@ -14,17 +14,34 @@ from compute_forecast.pipeline.pdf_acquisition.discovery.core.collectors import
     BasePDFCollector,
 )
 from .venue_mappings import OPENREVIEW_VENUES, get_venue_invitation, is_venue_supported
+from .openreview_index import SubmissionEntry, VenueSubmissionIndex
 
 
 logger = logging.getLogger(__name__)
 
 
 class OpenReviewPDFCollector(BasePDFCollector):
-    """Collector for PDFs from OpenReview platform."""
+    """Collector for PDFs from OpenReview platform.
 
-    def __init__(self):
-        """Initialize OpenReview collector."""
+    Title matching runs against a per-venue submission index that is fetched
+    once per (venue, year) and optionally cached on disk, so all papers of a
+    venue are resolved without refetching the venue's submissions.
+    """
+
+    def __init__(
+        self,
+        index_cache_dir: Optional[str] = None,
+        index_max_age_hours: float = 24 * 7,
+    ):
+        """Initialize OpenReview collector.
+
+        Args:
+            index_cache_dir: Directory for cached venue submission indexes.
+                Indexes are only kept in memory if not set.
+            index_max_age_hours: Refetch cached indexes older than this
+        """
         super().__init__("openreview")
+        self.supports_batch = True
 
         # Initialize OpenReview client
         self.client = openreview.api.OpenReviewClient(
@@ -44,6 +61,76 @@ class OpenReviewPDFCollector(BasePDFCollector):
         self.max_retries = 3
         self.retry_delay = 1.0  # Initial retry delay in seconds
 
+        # Venue submission indexes, keyed by (venue, year)
+        self.index_cache_dir = Path(index_cache_dir) if index_cache_dir else None
+        self.index_max_age_seconds = index_max_age_hours * 3600
+        self._venue_indexes: Dict[Tuple[str, int], VenueSubmissionIndex] = {}
+
+    def discover_pdfs_batch(self, papers: List[Paper]) -> Dict[str, PDFRecord]:
+        """Discover PDFs for many papers, resolving each venue in one pass.
+
+        Args:
+            papers: Papers to find PDFs for
+
+        Returns:
+            Dictionary mapping paper_id to PDFRecord for successful discoveries
+        """
+        by_venue: Dict[Tuple[str, int], List[Paper]] = {}
+        for paper in papers:
+            if not is_venue_supported(paper.venue, paper.year):
+                logger.info(
+                    f"{paper.venue} {paper.year} is not available on OpenReview"
+                )
+                continue
+            by_venue.setdefault((paper.venue, paper.year), []).append(paper)
+
+        results: Dict[str, PDFRecord] = {}
+        for (venue, year), venue_papers in by_venue.items():
+            try:
+                index = self._get_venue_index(venue, year)
+            except Exception as e:
+                logger.error(f"Failed to index {venue} {year} submissions: {e}")
+                continue
+
+            # Exact title lookups first, then one fuzzy pass for the rest
+            unmatched = []
+            for paper in venue_papers:
+                entry = index.find_exact(
+                    paper.title, [author.name for author in paper.authors]
+                )
+                if entry:
+                    record = self._create_pdf_record(paper, entry, confidence=0.95)
+                    results[record.paper_id] = record
+                else:
+                    unmatched.append(paper)
+
+            fuzzy_matches = index.find_fuzzy(
+                [paper.title for paper in unmatched], self.title_similarity_threshold
+            )
+            for paper, fuzzy_entry in zip(unmatched, fuzzy_matches):
+                if fuzzy_entry:
+                    record = self._create_pdf_record(
+                        paper, fuzzy_entry, confidence=0.95
+                    )
+                    results[record.paper_id] = record
+                    continue
+
+                try:
+                    submission = self._search_by_authors(paper)
+                    if submission:
+                        record = self._create_pdf_record(
+                            paper, submission, confidence=0.75
+                        )
+                        results[record.paper_id] = record
+                except Exception as e:
+                    logger.warning(f"Author search failed: {e}")
+
+        logger.info(
+            f"Resolved {len(results)}/{len(papers)} papers against "
+            f"{len(by_venue)} OpenReview venue indexes"
+        )
+        return results
+
     def _discover_single(self, paper: Paper) -> PDFRecord:
         """Discover PDF for a single paper.
 
@@ -93,46 +180,78 @@ class OpenReviewPDFCollector(BasePDFCollector):
         Returns:
             OpenReview submission object if found, None otherwise
         """
-        invitation = get_venue_invitation(paper.venue, paper.year)
+        index = self._get_venue_index(paper.venue, paper.year)
 
-        # Search for papers in the venue
-        submissions = self._make_api_request(
-            lambda: self.client.get_all_notes(invitation=invitation, details="original")
+        match = (
+            index.find_exact(paper.title, [author.name for author in paper.authors])
+            or index.find_fuzzy([paper.title], self.title_similarity_threshold)[0]
         )
 
-        # Apply manual limit to avoid memory issues
-        if len(submissions) > 1000:
-            submissions = submissions[:1000]
+        if match:
+            logger.info(f"Found title match: '{match.title}'")
+        return match
 
-        # Find best title match
-        best_match = None
-        best_score = 0.0
+    def _get_venue_index(self, venue: str, year: int) -> VenueSubmissionIndex:
+        """Get the submission index of a venue, fetching it at most once.
 
-        for submission in submissions:
-            # Get title from submission
-            submission_title = self._extract_title(submission)
-            if not submission_title:
-                continue
-
-            # Calculate similarity
-            score = fuzz.ratio(paper.title.lower(), submission_title.lower())
+        Args:
+            venue: Conference name
+            year: Conference year
 
-            if score > best_score and score >= self.title_similarity_threshold:
-                best_score = float(score)
-                best_match = submission
+        Returns:
+            Index of all submissions of the venue and year
+        """
+        key = (venue, year)
+        if key in self._venue_indexes:
+            return self._venue_indexes[key]
+
+        cache_file = self._index_cache_file(venue, year)
+        index = (
+            VenueSubmissionIndex.load(cache_file, self.index_max_age_seconds)
+            if cache_file
+            else None
+        )
 
-                # Perfect match, no need to continue
-                if score == 100:
-                    break
+        if index is None:
+            invitation = get_venue_invitation(venue, year)
+            submissions = self._make_api_request(
+                lambda: self.client.get_all_notes(
+                    invitation=invitation, details="original"
+                )
+            )
 
-        if best_match:
+            entries = []
+            for submission in submissions:
+                title = self._extract_title(submission)
+                if title:
+                    entries.append(
+                        SubmissionEntry(
+                            id=submission.id,
+                            forum=submission.forum,
+                            title=title,
+                            authors=self._extract_authors(submission),
+                        )
+                    )
+            index = VenueSubmissionIndex(venue, year, entries)
             logger.info(
-                f"Found title match with score {best_score}: "
-                f"'{self._extract_title(best_match)}'"
+                f"Indexed {len(index)} OpenReview submissions for {venue} {year}"
             )
-            return best_match
 
-        return None
+            if cache_file:
+                try:
+                    index.save(cache_file)
+                except OSError as e:
+                    logger.warning(f"Failed to cache OpenReview index: {e}")
+
+        self._venue_indexes[key] = index
+        return index
+
+    def _index_cache_file(self, venue: str, year: int) -> Optional[Path]:
+        """Get the on-disk cache file of a venue index, if caching is enabled."""
+        if not self.index_cache_dir:
+            return None
+        safe_venue = "".join(c if c.isalnum() else "_" for c in venue)
+        return self.index_cache_dir / f"openreview_{safe_venue}_{year}.json"
 
     def _search_by_authors(self, paper: Paper) -> Optional[Any]:
         """Search for paper by authors.
@@ -240,6 +359,8 @@ class OpenReviewPDFCollector(BasePDFCollector):
         Returns:
             Title string or None
         """
+        if isinstance(submission, SubmissionEntry):
+            return submission.title
         if hasattr(submission, "content") and isinstance(submission.content, dict):
             title_field = submission.content.get("title", {})
             if isinstance(title_field, dict):
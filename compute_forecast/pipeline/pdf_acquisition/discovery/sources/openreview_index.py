@@ -0,0 +1,141 @@
+"""Per-venue submission index for OpenReview PDF discovery."""
+
+import json
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+
+from rapidfuzz import fuzz, process
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for exact lookup (case, punctuation, whitespace)."""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", title.lower()).split())
+
+
+@dataclass
+class SubmissionEntry:
+    """Minimal view of an OpenReview submission kept in the index."""
+
+    id: str
+    forum: str
+    title: str
+    authors: List[str] = field(default_factory=list)
+
+
+class VenueSubmissionIndex:
+    """All submissions of one venue and year, indexed by title.
+
+    Exact matches on the normalized title are a dictionary lookup. Titles
+    without an exact match are scored against every submission title with
+    ``fuzz.ratio`` in a single batched ``rapidfuzz`` call.
+    """
+
+    def __init__(self, venue: str, year: int, entries: List[SubmissionEntry]):
+        self.venue = venue
+        self.year = year
+        self.entries = entries
+
+        self._titles = [entry.title.lower() for entry in entries]
+        self._by_title: Dict[str, List[int]] = {}
+        for i, entry in enumerate(entries):
+            self._by_title.setdefault(normalize_title(entry.title), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def find_exact(
+        self, title: str, authors: Sequence[str] = ()
+    ) -> Optional[SubmissionEntry]:
+        """Find a submission whose normalized title equals the given title.
+
+        When several submissions share the title, the one with the largest
+        author overlap wins.
+        """
+        candidates = self._by_title.get(normalize_title(title))
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return self.entries[candidates[0]]
+
+        wanted: Set[str] = {a.lower() for a in authors}
+        return max(
+            (self.entries[i] for i in candidates),
+            key=lambda entry: len(wanted & {a.lower() for a in entry.authors}),
+        )
+
+    def find_fuzzy(
+        self, titles: Sequence[str], threshold: float
+    ) -> List[Optional[SubmissionEntry]]:
+        """Find the best fuzzy title match for each title in one pass.
+
+        Args:
+            titles: Titles to resolve
+            threshold: Minimum ``fuzz.ratio`` score for a match
+
+        Returns:
+            The best matching submission for each title, or None
+        """
+        if not titles or not self.entries:
+            return [None] * len(titles)
+
+        scores = process.cdist(
+            [title.lower() for title in titles],
+            self._titles,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            workers=-1,
+        )
+
+        matches: List[Optional[SubmissionEntry]] = []
+        for row in scores:
+            best = int(row.argmax())
+            matches.append(self.entries[best] if row[best] >= threshold else None)
+        return matches
+
+    def save(self, path: Path):
+        """Save the index atomically as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(
+                {
+                    "venue": self.venue,
+                    "year": self.year,
+                    "fetched_at": time.time(),
+                    "entries": [asdict(entry) for entry in self.entries],
+                },
+                f,
+            )
+        temp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls, path: Path, max_age_seconds: Optional[float] = None
+    ) -> Optional["VenueSubmissionIndex"]:
+        """Load a saved index, or None if it is missing, stale or corrupt."""
+        if not path.exists():
+            return None
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable OpenReview index {path}: {e}")
+            return None
+
+        age = time.time() - data.get("fetched_at", 0)
+        if max_age_seconds is not None and age > max_age_seconds:
+            logger.info(f"OpenReview index {path} is stale ({age / 3600:.1f}h old)")
+            return None
+
+        return cls(
+            data["venue"],
+            data["year"],
+            [SubmissionEntry(**entry) for entry in data["entries"]],
+        )
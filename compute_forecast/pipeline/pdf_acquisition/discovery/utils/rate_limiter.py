@@ -2,50 +2,74 @@
 
 import time
 import threading
-from typing import Union
+from typing import Optional, Union
+
+from .....utils.rate_governor import get_rate_governor
 
 
 class RateLimiter:
-    """Thread-safe rate limiter for API requests."""
+    """Thread-safe rate limiter for API requests.
+
+    A limiter created for a provider paces requests through the process-wide
+    rate governor, so all clients of that provider share one budget.
+    """
 
-    def __init__(self, min_interval: float):
+    def __init__(self, min_interval: float, provider: Optional[str] = None):
         """Initialize rate limiter with minimum interval between requests.
 
         Args:
             min_interval: Minimum time (in seconds) between requests
+            provider: Rate governor key shared with other clients of the API
         """
         self.min_interval = min_interval
         self.last_request_time = 0.0
         self._lock = threading.Lock()
+        self.provider = provider
+        if provider is not None and min_interval > 0:
+            get_rate_governor().register(provider, 1.0 / min_interval)
 
     @classmethod
-    def per_minute(cls, requests_per_minute: int) -> "RateLimiter":
+    def per_minute(
+        cls, requests_per_minute: int, provider: Optional[str] = None
+    ) -> "RateLimiter":
         """Create rate limiter with requests per minute limit.
 
         Args:
             requests_per_minute: Maximum number of requests per minute
+            provider: Rate governor key shared with other clients of the API
 
         Returns:
             RateLimiter instance
         """
         min_interval = 60.0 / requests_per_minute
-        return cls(min_interval)
+        return cls(min_interval, provider)
 
     @classmethod
-    def per_second(cls, requests_per_second: Union[int, float]) -> "RateLimiter":
+    def per_second(
+        cls, requests_per_second: Union[int, float], provider: Optional[str] = None
+    ) -> "RateLimiter":
         """Create rate limiter with requests per second limit.
 
         Args:
             requests_per_second: Maximum number of requests per second
+            provider: Rate governor key shared with other clients of the API
 
         Returns:
             RateLimiter instance
         """
         min_interval = 1.0 / requests_per_second
-        return cls(min_interval)
+        return cls(min_interval, provider)
 
     def wait(self):
         """Wait if necessary to respect rate limit."""
+        if self.min_interval <= 0:
+            return
+
+        if self.provider is not None:
+            get_rate_governor().acquire(self.provider)
+            self.last_request_time = time.time()
+            return
+
         with self._lock:
             current_time = time.time()
             time_since_last = current_time - self.last_request_time
@@ -0,0 +1,101 @@
+"""In-memory LRU index of the local PDF cache."""
+
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class PDFCacheIndex:
+    """Tracks cached PDFs in least recently used order with their sizes.
+
+    All operations are O(1), apart from skipping over pinned entries when
+    looking for an eviction candidate. Pinned entries are never evicted.
+    The index is not thread safe; callers serialize access with their own
+    lock.
+    """
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._pins: Dict[str, int] = {}
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self._entries
+
+    def touch(self, paper_id: str, size_bytes: Optional[int] = None):
+        """Mark a PDF as most recently used, adding or resizing it if needed.
+
+        Args:
+            paper_id: Paper identifier
+            size_bytes: File size, required when the PDF is not tracked yet
+        """
+        if paper_id in self._entries:
+            self._entries.move_to_end(paper_id)
+            if size_bytes is None:
+                return
+            self.total_bytes -= self._entries[paper_id]
+        elif size_bytes is None:
+            raise KeyError(f"Size required to track new cache entry {paper_id}")
+
+        self._entries[paper_id] = size_bytes
+        self.total_bytes += size_bytes
+
+    def discard(self, paper_id: str) -> int:
+        """Stop tracking a PDF.
+
+        Returns:
+            Size of the removed entry, 0 if it was not tracked
+        """
+        size_bytes = self._entries.pop(paper_id, 0)
+        self.total_bytes -= size_bytes
+        return size_bytes
+
+    def clear(self):
+        """Stop tracking all PDFs. Pins are kept."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def pin(self, paper_id: str):
+        """Protect a PDF from eviction. Pins are counted and nest."""
+        self._pins[paper_id] = self._pins.get(paper_id, 0) + 1
+
+    def unpin(self, paper_id: str):
+        """Release one pin on a PDF."""
+        count = self._pins.get(paper_id, 0)
+        if count <= 1:
+            self._pins.pop(paper_id, None)
+        else:
+            self._pins[paper_id] = count - 1
+
+    def is_pinned(self, paper_id: str) -> bool:
+        return paper_id in self._pins
+
+    @property
+    def pinned_count(self) -> int:
+        return len(self._pins)
+
+    def pop_eviction_candidate(self, target_bytes: int) -> Optional[str]:
+        """Remove and return the least recently used unpinned PDF.
+
+        Pinned PDFs found at the old end are in use, so they are moved to the
+        recent end instead of being returned.
+
+        Args:
+            target_bytes: Size the cache is being shrunk to
+
+        Returns:
+            Paper ID to evict, or None if the cache is within the target or
+            only pinned PDFs are left
+        """
+        skipped = 0
+        while self.total_bytes > target_bytes and skipped < len(self._entries):
+            paper_id = next(iter(self._entries))
+            if paper_id in self._pins:
+                self._entries.move_to_end(paper_id)
+                skipped += 1
+                continue
+            self.discard(paper_id)
+            return paper_id
+        return None
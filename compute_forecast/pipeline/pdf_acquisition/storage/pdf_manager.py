@@ -2,11 +2,15 @@
 
 import logging
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, Optional, Any
 from datetime import datetime, timedelta
 import shutil
 
+from .cache_index import PDFCacheIndex
 from .google_drive_store import GoogleDriveStore
 from compute_forecast.pipeline.pdf_acquisition.download.cache_manager import (
     PDFCacheManager,
@@ -16,7 +20,12 @@ logger = logging.getLogger(__name__)
 
 
 class PDFManager:
-    """Manages PDFs with local caching and Google Drive storage."""
+    """Manages PDFs with local caching and Google Drive storage.
+
+    The local cache is tracked by an in-memory LRU index with a running byte
+    count, so enforcing the size limit never rescans the cache directory.
+    PDFs leased for analysis are pinned and never evicted while in use.
+    """
 
     def __init__(
         self,
@@ -25,6 +34,9 @@ class PDFManager:
         max_cache_size_gb: float = 10.0,
         cache_ttl_days: int = 7,
         cache_ttl_hours: Optional[int] = None,
+        cache_high_watermark: float = 1.0,
+        cache_low_watermark: Optional[float] = None,
+        background_eviction: bool = False,
     ):
         """Initialize PDF Manager.
 
@@ -34,7 +46,21 @@ class PDFManager:
             max_cache_size_gb: Maximum cache size in GB
             cache_ttl_days: Cache time-to-live in days
             cache_ttl_hours: Cache time-to-live in hours (overrides cache_ttl_days)
+            cache_high_watermark: Fraction of the maximum cache size above
+                which eviction starts
+            cache_low_watermark: Fraction of the maximum cache size eviction
+                shrinks the cache to (defaults to the high watermark)
+            background_eviction: Evict on a background thread instead of in
+                the calling thread
         """
+        if cache_low_watermark is None:
+            cache_low_watermark = cache_high_watermark
+        if not 0 < cache_low_watermark <= cache_high_watermark:
+            raise ValueError(
+                "Cache watermarks must satisfy 0 < low <= high, "
+                f"got low={cache_low_watermark}, high={cache_high_watermark}"
+            )
+
         self.drive_store = drive_store
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
@@ -48,11 +74,83 @@ class PDFManager:
             self.cache_ttl = timedelta(hours=cache_ttl_hours)
         else:
             self.cache_ttl = timedelta(days=cache_ttl_days)
+        self.cache_high_watermark_bytes = int(
+            self.max_cache_size_bytes * cache_high_watermark
+        )
+        self.cache_low_watermark_bytes = int(
+            self.max_cache_size_bytes * cache_low_watermark
+        )
 
         # Metadata tracking
         self.metadata_file = self.cache_dir / "pdf_metadata.json"
         self.metadata = self._load_metadata()
 
+        # LRU index of the local cache, built with a single directory scan
+        self._cache_lock = threading.RLock()
+        self.cache_index = self._build_cache_index()
+
+        # Background eviction
+        self._eviction_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._eviction_thread: Optional[threading.Thread] = None
+        if background_eviction:
+            self._eviction_thread = threading.Thread(
+                target=self._eviction_loop, name="PDFCacheEvictor", daemon=True
+            )
+            self._eviction_thread.start()
+
+    def _build_cache_index(self) -> PDFCacheIndex:
+        """Index the cached PDFs, least recently accessed first."""
+        cached = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".pdf") or not entry.is_file():
+                    continue
+                paper_id = entry.name[: -len(".pdf")]
+                stat = entry.stat()
+                last_accessed = self.metadata.get(paper_id, {}).get("last_accessed", "")
+                cached.append((last_accessed, stat.st_mtime, paper_id, stat.st_size))
+
+        index = PDFCacheIndex()
+        for _, _, paper_id, size_bytes in sorted(cached):
+            index.touch(paper_id, size_bytes)
+        return index
+
+    def _track_cached_file(self, paper_id: str, path: Path):
+        """Record a PDF written to the cache and evict if over the limit."""
+        with self._cache_lock:
+            self.cache_index.touch(paper_id, path.stat().st_size)
+        self._request_eviction()
+
+    def _request_eviction(self):
+        """Evict now, or wake the eviction thread, if above the high watermark."""
+        if self.cache_index.total_bytes <= self.cache_high_watermark_bytes:
+            return
+        if self._eviction_thread:
+            self._eviction_event.set()
+        else:
+            self._enforce_cache_size_limit()
+
+    def _eviction_loop(self):
+        """Evict from the cache whenever woken, until closed."""
+        while not self._stop_event.is_set():
+            self._eviction_event.wait()
+            self._eviction_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self._enforce_cache_size_limit()
+            except Exception as e:
+                logger.error(f"Cache eviction failed: {e}")
+
+    def close(self):
+        """Stop the background eviction thread, if any."""
+        self._stop_event.set()
+        self._eviction_event.set()
+        if self._eviction_thread:
+            self._eviction_thread.join()
+            self._eviction_thread = None
+
     def _load_metadata(self) -> Dict[str, Any]:
         """Load PDF metadata from disk."""
         if self.metadata_file.exists():
@@ -84,6 +182,11 @@ class PDFManager:
         cached_file = self.cache_manager.get_cached_file(paper_id)
         if cached_file:
             logger.info(f"Using cached PDF for {paper_id}")
+            with self._cache_lock:
+                if paper_id in self.cache_index:
+                    self.cache_index.touch(paper_id)
+                else:
+                    self.cache_index.touch(paper_id, cached_file.stat().st_size)
             return cached_file
 
         # Check if we have Drive file ID in metadata
@@ -105,12 +208,41 @@ class PDFManager:
             self.metadata[paper_id]["last_accessed"] = datetime.utcnow().isoformat()
             self._save_metadata()
 
+            self._track_cached_file(paper_id, destination)
             return destination
 
         except Exception as e:
             logger.error(f"Failed to download {paper_id} from Drive: {e}")
             return None
 
+    def pin_pdf(self, paper_id: str):
+        """Protect a cached PDF from eviction until ``unpin_pdf`` is called."""
+        with self._cache_lock:
+            self.cache_index.pin(paper_id)
+
+    def unpin_pdf(self, paper_id: str):
+        """Release a pin taken with ``pin_pdf``."""
+        with self._cache_lock:
+            self.cache_index.unpin(paper_id)
+        self._request_eviction()
+
+    @contextmanager
+    def lease_pdf(self, paper_id: str) -> Iterator[Optional[Path]]:
+        """Get a PDF for analysis, keeping it in the cache while leased.
+
+        Args:
+            paper_id: Paper identifier
+
+        Yields:
+            Path to PDF file or None if not found
+        """
+        # Pin before fetching so the file can't be evicted in between
+        self.pin_pdf(paper_id)
+        try:
+            yield self.get_pdf_for_analysis(paper_id)
+        finally:
+            self.unpin_pdf(paper_id)
+
     def store_pdf(
         self, paper_id: str, pdf_path: Path, metadata: Optional[Dict] = None
     ) -> bool:
@@ -143,8 +275,10 @@ class PDFManager:
             self._save_metadata()
 
             # Cache the file locally
-            if pdf_path != self.cache_manager.get_cache_path(paper_id):
-                shutil.copy2(pdf_path, self.cache_manager.get_cache_path(paper_id))
+            cache_path = self.cache_manager.get_cache_path(paper_id)
+            if pdf_path != cache_path:
+                shutil.copy2(pdf_path, cache_path)
+            self._track_cached_file(paper_id, cache_path)
 
             logger.info(f"Successfully stored {paper_id} in Drive")
             return True
@@ -160,7 +294,9 @@ class PDFManager:
             force: Force cleanup regardless of TTL
         """
         if force:
-            count = self.cache_manager.clear_cache()
+            with self._cache_lock:
+                count = self.cache_manager.clear_cache()
+                self.cache_index.clear()
             logger.info(f"Force cleared {count} files from cache")
             return
 
@@ -181,9 +317,14 @@ class PDFManager:
                 continue
 
             if now - last_accessed > self.cache_ttl:
-                if self.cache_manager.remove_from_cache(paper_id):
-                    removed_count += 1
-                    del self.metadata[paper_id]
+                with self._cache_lock:
+                    # Leased PDFs are still in use
+                    if self.cache_index.is_pinned(paper_id):
+                        continue
+                    self.cache_index.discard(paper_id)
+                    if self.cache_manager.remove_from_cache(paper_id):
+                        removed_count += 1
+                        del self.metadata[paper_id]
 
         logger.info(f"Removed {removed_count} expired files from cache")
 
@@ -192,31 +333,31 @@ class PDFManager:
 
         return removed_count
 
-    def _enforce_cache_size_limit(self):
-        """Ensure cache doesn't exceed size limit."""
-        cache_stats = self.cache_manager.get_cache_stats()
-        current_size = cache_stats["total_size_bytes"]
-
-        if current_size <= self.max_cache_size_bytes:
-            return
+    def _enforce_cache_size_limit(self) -> int:
+        """Evict least recently used PDFs once above the high watermark.
 
-        # Sort by last accessed time
-        sorted_papers = sorted(
-            self.metadata.items(),
-            key=lambda x: x[1].get("last_accessed", ""),
-            reverse=False,  # Oldest first
-        )
+        Shrinks the cache down to the low watermark, skipping pinned PDFs.
 
-        # Remove files until under limit
-        for paper_id, _ in sorted_papers:
-            if current_size <= self.max_cache_size_bytes:
-                break
-
-            cache_path = self.cache_manager.get_cache_path(paper_id)
-            if cache_path.exists():
-                file_size = cache_path.stat().st_size
+        Returns:
+            Number of PDFs evicted
+        """
+        evicted = 0
+        with self._cache_lock:
+            if self.cache_index.total_bytes <= self.cache_high_watermark_bytes:
+                return 0
+
+            while True:
+                paper_id = self.cache_index.pop_eviction_candidate(
+                    self.cache_low_watermark_bytes
+                )
+                if paper_id is None:
+                    break
                 self.cache_manager.remove_from_cache(paper_id)
-                current_size -= file_size
+                evicted += 1
+
+        if evicted:
+            logger.info(f"Evicted {evicted} PDFs to enforce cache size limit")
+        return evicted
 
     def sync_with_drive(self) -> Dict[str, Any]:
         """Sync metadata with Google Drive.
@@ -267,9 +408,17 @@ class PDFManager:
         """
         cache_stats = self.cache_manager.get_cache_stats()
 
+        with self._cache_lock:
+            lru_stats = {
+                "tracked_files": len(self.cache_index),
+                "total_size_bytes": self.cache_index.total_bytes,
+                "pinned_files": self.cache_index.pinned_count,
+            }
+
         return {
             "total_papers": len(self.metadata),
             "cache_stats": cache_stats,
+            "lru_cache": lru_stats,
             "cache_ttl_days": self.cache_ttl.days,
             "max_cache_size_gb": self.max_cache_size_bytes / (1024**3),
             "drive_connected": self.drive_store.test_connection(),
@@ -1,8 +1,7 @@
 """Collection quality checker implementation."""
 
-import json
 from pathlib import Path
-from typing import Dict, List, Any, Callable
+from typing import Dict, Iterator, List, Any, Callable, Optional
 from datetime import datetime
 
 from compute_forecast.quality.stages.base import StageQualityChecker
@@ -16,7 +15,9 @@ from .validators import (
     ConsistencyValidator,
     AccuracyValidator,
     CoverageValidator,
+    BaseValidator,
 )
+from .loader import CollectionDataLoader, parse_papers_file
 from .models import CollectionQualityMetrics
 
 
@@ -28,6 +29,12 @@ class CollectionQualityChecker(StageQualityChecker):
         self.consistency_validator = ConsistencyValidator()
         self.accuracy_validator = AccuracyValidator()
         self.coverage_validator = CoverageValidator()
+        self._validators: Dict[str, BaseValidator] = {
+            "completeness": self.completeness_validator,
+            "consistency": self.consistency_validator,
+            "accuracy": self.accuracy_validator,
+            "coverage": self.coverage_validator,
+        }
         super().__init__()
 
     def get_stage_name(self) -> str:
@@ -44,62 +51,54 @@ class CollectionQualityChecker(StageQualityChecker):
 
     def _load_from_file(self, file_path: Path) -> Dict[str, Any]:
         """Load data from a single file."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Handle different data formats
-            if isinstance(data, list):
-                papers = data
-            elif isinstance(data, dict):
-                if "papers" in data:
-                    papers = data["papers"]
-                elif "data" in data:
-                    papers = data["data"]
-                else:
-                    # Assume the dict values are papers
-                    papers = list(data.values()) if data else []
-            else:
-                raise ValueError(f"Unexpected data format in {file_path}")
-
-            return {
-                "papers": papers,
-                "source_file": str(file_path),
-                "load_timestamp": datetime.now(),
-            }
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {file_path}: {e}")
-        except Exception as e:
-            raise ValueError(f"Error loading {file_path}: {e}")
+        return {
+            "papers": parse_papers_file(file_path),
+            "source_file": str(file_path),
+            "load_timestamp": datetime.now(),
+        }
 
     def _load_from_directory(self, dir_path: Path) -> Dict[str, Any]:
         """Load data from multiple files in a directory."""
+        loader = CollectionDataLoader()
         papers = []
-        source_files = []
-
-        # Look for JSON files
-        json_files = list(dir_path.glob("*.json"))
-        if not json_files:
-            raise ValueError(f"No JSON files found in {dir_path}")
-
-        for file_path in json_files:
-            try:
-                file_data = self._load_from_file(file_path)
-                papers.extend(file_data["papers"])
-                source_files.append(str(file_path))
-            except Exception as e:
-                # Log warning but continue with other files
-                print(f"Warning: Could not load {file_path}: {e}")
+        for batch in loader.iter_batches(self._list_data_files(dir_path)):
+            papers.extend(batch)
 
         if not papers:
             raise ValueError(f"No valid papers found in {dir_path}")
 
         return {
             "papers": papers,
-            "source_files": source_files,
+            "source_files": loader.source_files,
             "load_timestamp": datetime.now(),
         }
 
+    def _list_data_files(self, dir_path: Path) -> List[Path]:
+        """JSON files of a collection directory."""
+        # Look for JSON files
+        json_files = list(dir_path.glob("*.json"))
+        if not json_files:
+            raise ValueError(f"No JSON files found in {dir_path}")
+        return json_files
+
+    def iter_paper_batches(
+        self, data_path: Path, loader: Optional[CollectionDataLoader] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the papers of a file or directory in batches.
+
+        Directory files are parsed concurrently by the loader and files that
+        cannot be loaded are skipped with a warning, as in load_data.
+        """
+        loader = loader or CollectionDataLoader()
+        if data_path.is_file():
+            yield from loader.iter_batches([data_path], skip_failed=False)
+        elif data_path.is_dir():
+            yield from loader.iter_batches(self._list_data_files(data_path))
+            if not loader.paper_count:
+                raise ValueError(f"No valid papers found in {data_path}")
+        else:
+            raise ValueError(f"Data path does not exist: {data_path}")
+
     def _register_checks(self) -> Dict[str, Callable]:
         """Register all collection quality checks."""
         return {
@@ -146,7 +145,65 @@ class CollectionQualityChecker(StageQualityChecker):
         return result
 
     def check(self, data_path: Path, config: QualityConfig) -> QualityReport:
-        """Run all quality checks for this stage and attach metrics."""
+        """Run all quality checks for this stage and attach metrics.
+
+        Papers are streamed in batches through the validators and the
+        metrics accumulator, so the collection is never held in memory as a
+        whole. The loader is configured from ``config.custom_params``
+        (``max_workers``, ``max_in_flight``, ``batch_size`` and
+        ``large_file_bytes``).
+        """
+        check_names = [name for name in self._checks if name not in config.skip_checks]
+        if any(name not in self._validators for name in check_names):
+            # Checks registered without a validator need the loaded data
+            return self._check_loaded(data_path, config)
+
+        accumulators = [
+            self._validators[name].create_accumulator(config) for name in check_names
+        ]
+        metrics_accumulator = CollectionMetricsAccumulator()
+        loader = CollectionDataLoader(
+            **{
+                key: config.custom_params[key]
+                for key in (
+                    "max_workers",
+                    "max_in_flight",
+                    "batch_size",
+                    "large_file_bytes",
+                )
+                if key in config.custom_params
+            }
+        )
+
+        for papers in self.iter_paper_batches(data_path, loader):
+            for accumulator in accumulators:
+                accumulator.add(papers)
+            metrics_accumulator.add(papers)
+
+        results = [accumulator.result() for accumulator in accumulators]
+
+        # Calculate overall score
+        overall_score = sum(r.score for r in results) / len(results) if results else 0.0
+
+        report = QualityReport(
+            stage=self.get_stage_name(),
+            timestamp=datetime.now(),
+            data_path=data_path,
+            overall_score=overall_score,
+            check_results=results,
+        )
+
+        # Attach metrics to report - store in a way the formatter can find it
+        # We'll add it to the first check result for now
+        if report.check_results:
+            report.check_results[0].metrics["collection_metrics"] = (
+                metrics_accumulator.result(report.check_results)
+            )
+
+        return report
+
+    def _check_loaded(self, data_path: Path, config: QualityConfig) -> QualityReport:
+        """Run the registered checks on the fully loaded data."""
         # Get the base report
         report = super().check(data_path, config)
 
@@ -167,98 +224,158 @@ class CollectionQualityChecker(StageQualityChecker):
         self, data: Dict[str, Any], check_results: List[QualityCheckResult]
     ) -> CollectionQualityMetrics:
         """Generate collection quality metrics."""
-        papers = data.get("papers", [])
+        accumulator = CollectionMetricsAccumulator()
+        accumulator.add(data.get("papers", []))
+        return accumulator.result(check_results)
+
+
+class CollectionMetricsAccumulator:
+    """Counts behind the collection quality metrics, accumulated by batch."""
+
+    REQUIRED_FIELDS = ["title", "authors", "venue", "year"]
+    COMPLETENESS_FIELDS = ["title", "authors", "venue", "year", "abstract", "doi"]
+
+    def __init__(self):
+        self.total_papers = 0
+
+        # Completeness counts
+        self.papers_with_all_required = 0
+        self.papers_with_abstracts = 0
+        self.papers_with_pdfs = 0
+        self.papers_with_dois = 0
+        self.field_counts: Dict[str, int] = {
+            field: 0 for field in self.COMPLETENESS_FIELDS + ["pdf_url"]
+        }
+
+        # Accuracy counts
+        self.valid_years = 0
+        self.valid_authors = 0
+        self.valid_urls = 0
+
+        # Coverage counts
+        self.scraper_counts: Dict[str, int] = {}
+        self.venue_counts: Dict[str, int] = {}
+
+    def add(self, papers: List[Dict[str, Any]]):
+        """Count a batch of papers."""
+        self.total_papers += len(papers)
+        for paper in papers:
+            self._count_completeness(paper)
+            self._count_accuracy(paper)
+
+            # Try both possible field names
+            scraper = paper.get("collection_source") or paper.get(
+                "scraper_source", "Unknown"
+            )
+            self.scraper_counts[scraper] = self.scraper_counts.get(scraper, 0) + 1
+            venue = paper.get("venue", "Unknown")
+            self.venue_counts[venue] = self.venue_counts.get(venue, 0) + 1
+
+    def _count_completeness(self, paper: Dict[str, Any]):
+        if all(field in paper and paper[field] for field in self.REQUIRED_FIELDS):
+            self.papers_with_all_required += 1
+        if paper.get("abstract") and str(paper["abstract"]).strip():
+            self.papers_with_abstracts += 1
+        if (paper.get("pdf_urls") and paper["pdf_urls"]) or (
+            paper.get("pdf_url") and str(paper["pdf_url"]).strip()
+        ):
+            self.papers_with_pdfs += 1
+        if paper.get("doi") and str(paper["doi"]).strip():
+            self.papers_with_dois += 1
+
+        for field in self.COMPLETENESS_FIELDS:
+            if paper.get(field):
+                self.field_counts[field] += 1
+        # Check both pdf_url and pdf_urls
+        if (paper.get("pdf_urls") and paper["pdf_urls"]) or (
+            paper.get("pdf_url") and paper["pdf_url"]
+        ):
+            self.field_counts["pdf_url"] += 1
+
+    def _count_accuracy(self, paper: Dict[str, Any]):
+        year = paper.get("year")
+        if year and (
+            isinstance(year, int)
+            and 1900 <= year <= 2100
+            or isinstance(year, str)
+            and year.isdigit()
+            and 1900 <= int(year) <= 2100
+        ):
+            self.valid_years += 1
+
+        authors = paper.get("authors")
+        if (
+            authors
+            and isinstance(authors, list)
+            and len(authors) > 0
+            and all(
+                isinstance(author, dict) and author.get("name", "").strip()
+                for author in authors
+            )
+        ):
+            self.valid_authors += 1
+
+        if (
+            paper.get("pdf_urls")
+            and isinstance(paper["pdf_urls"], list)
+            and any(
+                isinstance(url, str) and url.startswith("http")
+                for url in paper["pdf_urls"]
+            )
+        ) or (
+            paper.get("pdf_url")
+            and isinstance(paper["pdf_url"], str)
+            and paper["pdf_url"].startswith("http")
+        ):
+            self.valid_urls += 1
+
+    def result(
+        self, check_results: List[QualityCheckResult]
+    ) -> CollectionQualityMetrics:
+        """Collection quality metrics of the papers counted so far."""
+        total_papers = self.total_papers
 
         # Basic metrics
         metrics = CollectionQualityMetrics(
-            total_papers_collected=len(papers), quality_check_timestamp=datetime.now()
+            total_papers_collected=total_papers,
+            quality_check_timestamp=datetime.now(),
         )
 
         # Extract metrics from check results
         for result in check_results:
             if result.check_name == "completeness_check":
-                self._extract_completeness_metrics(papers, result, metrics)
+                self._completeness_metrics(metrics)
             elif result.check_name == "consistency_check":
-                self._extract_consistency_metrics(papers, result, metrics)
+                self._consistency_metrics(result, metrics)
             elif result.check_name == "accuracy_check":
-                self._extract_accuracy_metrics(papers, result, metrics)
+                self._accuracy_metrics(metrics)
             elif result.check_name == "coverage_check":
-                self._extract_coverage_metrics(papers, result, metrics)
+                self._coverage_metrics(result, metrics)
 
         return metrics
 
-    def _extract_completeness_metrics(
-        self,
-        papers: List[Dict[str, Any]],
-        result: QualityCheckResult,
-        metrics: CollectionQualityMetrics,
-    ):
+    def _completeness_metrics(self, metrics: CollectionQualityMetrics):
         """Extract completeness metrics from validation results."""
-        total_papers = len(papers)
-
-        # Count papers with required fields
-        papers_with_all_required = sum(
-            1
-            for paper in papers
-            if all(
-                field in paper and paper[field]
-                for field in ["title", "authors", "venue", "year"]
-            )
-        )
-
-        # Count papers with optional fields
-        papers_with_abstracts = sum(
-            1
-            for paper in papers
-            if paper.get("abstract") and str(paper["abstract"]).strip()
-        )
-        papers_with_pdfs = sum(
-            1
-            for paper in papers
-            if (paper.get("pdf_urls") and paper["pdf_urls"])
-            or (paper.get("pdf_url") and str(paper["pdf_url"]).strip())
-        )
-        papers_with_dois = sum(
-            1 for paper in papers if paper.get("doi") and str(paper["doi"]).strip()
-        )
-
-        # Calculate field completeness scores
-        field_completeness = {}
-        for field in [
-            "title",
-            "authors",
-            "venue",
-            "year",
-            "abstract",
-            "pdf_url",
-            "doi",
-        ]:
-            if field == "pdf_url":
-                # Check both pdf_url and pdf_urls
-                present_count = sum(
-                    1
-                    for paper in papers
-                    if (paper.get("pdf_urls") and paper["pdf_urls"])
-                    or (paper.get("pdf_url") and paper["pdf_url"])
-                )
-            else:
-                present_count = sum(1 for paper in papers if paper.get(field))
-            field_completeness[field] = (
-                present_count / total_papers if total_papers > 0 else 0.0
-            )
+        total_papers = self.total_papers
+        metrics.papers_with_all_required_fields = self.papers_with_all_required
+        metrics.papers_with_abstracts = self.papers_with_abstracts
+        metrics.papers_with_pdfs = self.papers_with_pdfs
+        metrics.papers_with_dois = self.papers_with_dois
+        metrics.field_completeness_scores = {
+            field: self.field_counts[field] / total_papers if total_papers > 0 else 0.0
+            for field in [
+                "title",
+                "authors",
+                "venue",
+                "year",
+                "abstract",
+                "pdf_url",
+                "doi",
+            ]
+        }
 
-        # Update metrics
-        metrics.papers_with_all_required_fields = papers_with_all_required
-        metrics.papers_with_abstracts = papers_with_abstracts
-        metrics.papers_with_pdfs = papers_with_pdfs
-        metrics.papers_with_dois = papers_with_dois
-        metrics.field_completeness_scores = field_completeness
-
-    def _extract_consistency_metrics(
-        self,
-        papers: List[Dict[str, Any]],
-        result: QualityCheckResult,
-        metrics: CollectionQualityMetrics,
+    def _consistency_metrics(
+        self, result: QualityCheckResult, metrics: CollectionQualityMetrics
     ):
         """Extract consistency metrics from validation results."""
         # Count duplicates based on issues
@@ -266,7 +383,13 @@ class CollectionQualityChecker(StageQualityChecker):
             issue for issue in result.issues if issue.field == "duplicates"
         ]
         metrics.duplicate_count = len(duplicate_issues)
-        metrics.duplicate_rate = len(duplicate_issues) / len(papers) if papers else 0.0
+        metrics.duplicate_rate = (
+            len(duplicate_issues) / self.total_papers if self.total_papers else 0.0
+        )
+        for issue in result.issues:
+            if issue.field == "near_duplicate_summary":
+                metrics.near_duplicate_count = issue.details["near_duplicates"]
+                metrics.near_duplicate_clusters = issue.details["clusters"]
 
         # Venue and year consistency scores from result
         metrics.venue_consistency_score = min(
@@ -274,105 +397,41 @@ class CollectionQualityChecker(StageQualityChecker):
         )  # Approximate from overall score
         metrics.year_consistency_score = min(1.0, result.score + 0.1)
 
-    def _extract_accuracy_metrics(
-        self,
-        papers: List[Dict[str, Any]],
-        result: QualityCheckResult,
-        metrics: CollectionQualityMetrics,
-    ):
+    def _accuracy_metrics(self, metrics: CollectionQualityMetrics):
         """Extract accuracy metrics from validation results."""
-        # Count valid entries
-        valid_years = sum(
-            1
-            for paper in papers
-            if paper.get("year")
-            and (
-                isinstance(paper["year"], int)
-                and 1900 <= paper["year"] <= 2100
-                or isinstance(paper["year"], str)
-                and paper["year"].isdigit()
-                and 1900 <= int(paper["year"]) <= 2100
-            )
-        )
-
-        valid_authors = sum(
-            1
-            for paper in papers
-            if paper.get("authors")
-            and isinstance(paper["authors"], list)
-            and len(paper["authors"]) > 0
-            and all(
-                isinstance(author, dict) and author.get("name", "").strip()
-                for author in paper["authors"]
-            )
-        )
-
-        valid_urls = sum(
-            1
-            for paper in papers
-            if (
-                paper.get("pdf_urls")
-                and isinstance(paper["pdf_urls"], list)
-                and any(
-                    isinstance(url, str) and url.startswith("http")
-                    for url in paper["pdf_urls"]
-                )
-            )
-            or (
-                paper.get("pdf_url")
-                and isinstance(paper["pdf_url"], str)
-                and paper["pdf_url"].startswith("http")
-            )
-        )
-
-        # Update metrics
-        metrics.valid_years_count = valid_years
-        metrics.valid_authors_count = valid_authors
-        metrics.valid_urls_count = valid_urls
+        metrics.valid_years_count = self.valid_years
+        metrics.valid_authors_count = self.valid_authors
+        metrics.valid_urls_count = self.valid_urls
 
         # Calculate accuracy scores
-        total_papers = len(papers)
+        total_papers = self.total_papers
         if total_papers > 0:
             metrics.accuracy_scores = {
-                "years": valid_years / total_papers,
-                "authors": valid_authors / total_papers,
-                "urls": valid_urls / total_papers,
+                "years": self.valid_years / total_papers,
+                "authors": self.valid_authors / total_papers,
+                "urls": self.valid_urls / total_papers,
             }
 
-    def _extract_coverage_metrics(
-        self,
-        papers: List[Dict[str, Any]],
-        result: QualityCheckResult,
-        metrics: CollectionQualityMetrics,
+    def _coverage_metrics(
+        self, result: QualityCheckResult, metrics: CollectionQualityMetrics
     ):
         """Extract coverage metrics from validation results."""
-        # Count papers by scraper source
-        scraper_counts: Dict[str, int] = {}
-        for paper in papers:
-            # Try both possible field names
-            scraper = paper.get("collection_source") or paper.get(
-                "scraper_source", "Unknown"
-            )
-            scraper_counts[scraper] = scraper_counts.get(scraper, 0) + 1
-
-        # Count papers by venue
-        venue_counts: Dict[str, int] = {}
-        for paper in papers:
-            venue = paper.get("venue", "Unknown")
-            venue_counts[venue] = venue_counts.get(venue, 0) + 1
+        total_papers = self.total_papers
 
         # Calculate success rates (simplified)
         scraper_success_rates = {}
-        for scraper, count in scraper_counts.items():
+        for scraper, count in self.scraper_counts.items():
             # Assume success rate based on relative count
-            scraper_success_rates[scraper] = count / len(papers) if papers else 0.0
+            scraper_success_rates[scraper] = (
+                count / total_papers if total_papers else 0.0
+            )
 
         # Update metrics
-        metrics.papers_by_scraper = scraper_counts
+        metrics.papers_by_scraper = dict(self.scraper_counts)
         metrics.scraper_success_rates = scraper_success_rates
-        metrics.papers_by_venue = venue_counts
+        metrics.papers_by_venue = dict(self.venue_counts)
 
         # Calculate coverage rate (simplified)
-        if len(papers) > 0:
+        if total_papers > 0:
             # Assume coverage rate based on overall score
             metrics.coverage_rate = min(1.0, result.score)
@@ -66,6 +66,8 @@ class CollectionFormatterAdapter(ReportFormatter):
             field_completeness_scores=metrics_data.get("field_completeness_scores", {}),
             duplicate_count=metrics_data.get("duplicate_count", 0),
             duplicate_rate=metrics_data.get("duplicate_rate", 0.0),
+            near_duplicate_count=metrics_data.get("near_duplicate_count", 0),
+            near_duplicate_clusters=metrics_data.get("near_duplicate_clusters", 0),
             venue_consistency_score=metrics_data.get("venue_consistency_score", 1.0),
             year_consistency_score=metrics_data.get("year_consistency_score", 1.0),
             valid_years_count=metrics_data.get("valid_years_count", 0),
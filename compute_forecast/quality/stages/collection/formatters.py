@@ -75,6 +75,9 @@ class TextReportFormatter(CollectionReportFormatter):
         lines.append(
             f"  Duplicate rate: {metrics.duplicate_rate:.1%} ({metrics.duplicate_count} papers)"
         )
+        lines.append(
+            f"  Near duplicates: {metrics.near_duplicate_count} papers in {metrics.near_duplicate_clusters} clusters"
+        )
         lines.append(f"  Venue consistency: {metrics.venue_consistency_score:.2f}")
         lines.append(f"  Year consistency: {metrics.year_consistency_score:.2f}")
         lines.append("")
@@ -296,6 +299,8 @@ class JSONReportFormatter(CollectionReportFormatter):
                 "consistency": {
                     "duplicate_count": metrics.duplicate_count,
                     "duplicate_rate": metrics.duplicate_rate,
+                    "near_duplicate_count": metrics.near_duplicate_count,
+                    "near_duplicate_clusters": metrics.near_duplicate_clusters,
                     "venue_consistency_score": metrics.venue_consistency_score,
                     "year_consistency_score": metrics.year_consistency_score,
                 },
@@ -439,6 +444,9 @@ class MarkdownReportFormatter(CollectionReportFormatter):
         lines.append(
             f"- **Duplicate Rate:** {metrics.duplicate_rate:.1%} ({metrics.duplicate_count} papers)"
         )
+        lines.append(
+            f"- **Near Duplicates:** {metrics.near_duplicate_count} papers in {metrics.near_duplicate_clusters} clusters"
+        )
         lines.append(f"- **Venue Consistency:** {metrics.venue_consistency_score:.2f}")
         lines.append(f"- **Year Consistency:** {metrics.year_consistency_score:.2f}")
         lines.append("")
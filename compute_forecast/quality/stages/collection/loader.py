@@ -0,0 +1,179 @@
+"""Streaming loader for collection data files.
+
+Collection directories hold one JSON file per venue or scraper run and can
+reach several gigabytes in total. Rather than loading every file into one
+list, the loader parses files concurrently and yields their papers in
+batches, in file order, so validators accumulate their state batch by batch
+and only the files in flight are held in memory.
+"""
+
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Files at least this large are parsed in worker processes, smaller files in
+# threads where the cost of sending the papers back would dominate
+LARGE_FILE_BYTES = 32 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 1000
+
+
+def parse_papers_file(file_path: Path) -> List[Dict[str, Any]]:
+    """Load the papers of a collection data file."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # Handle different data formats
+        if isinstance(data, list):
+            papers = data
+        elif isinstance(data, dict):
+            if "papers" in data:
+                papers = data["papers"]
+            elif "data" in data:
+                papers = data["data"]
+            else:
+                # Assume the dict values are papers
+                papers = list(data.values()) if data else []
+        else:
+            raise ValueError(f"Unexpected data format in {file_path}")
+
+        return papers
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {file_path}: {e}")
+    except Exception as e:
+        raise ValueError(f"Error loading {file_path}: {e}")
+
+
+class CollectionDataLoader:
+    """Parses collection data files concurrently and streams their papers."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        large_file_bytes: int = LARGE_FILE_BYTES,
+    ):
+        """
+        Args:
+            max_workers: Parsing workers, defaults to the CPU count, 0 to
+                parse every file in this process
+            max_in_flight: Files parsed ahead of the consumer, defaults to
+                twice max_workers. Bounds the memory held by parsed papers.
+            batch_size: Maximum papers per yielded batch
+            large_file_bytes: Size from which files are parsed in worker
+                processes instead of threads
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_in_flight is None:
+            max_in_flight = 2 * max(max_workers, 1)
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.large_file_bytes = large_file_bytes
+
+        self.source_files: List[str] = []
+        self.failed_files: List[Tuple[str, str]] = []
+        self.paper_count = 0
+
+    def iter_batches(
+        self, files: Sequence[Path], skip_failed: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the papers of files in batches, in file order.
+
+        Args:
+            files: Data files to load
+            skip_failed: Warn and continue when a file cannot be loaded,
+                otherwise raise its ValueError
+
+        Yields:
+            Lists of at most batch_size papers
+        """
+        self.source_files = []
+        self.failed_files = []
+        self.paper_count = 0
+
+        if self.max_workers == 0 or len(files) <= 1:
+            for file_path in files:
+                yield from self._file_batches(
+                    file_path, lambda: parse_papers_file(file_path), skip_failed
+                )
+            return
+
+        sizes = {}
+        for file_path in files:
+            try:
+                sizes[file_path] = file_path.stat().st_size
+            except OSError:
+                sizes[file_path] = 0
+        has_large_files = any(size >= self.large_file_bytes for size in sizes.values())
+
+        thread_pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="quality-loader"
+        )
+        # Spawned workers, since forking while the thread pool runs may
+        # deadlock the children
+        process_pool = (
+            ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if has_large_files
+            else None
+        )
+        pending: Deque[Tuple[Path, Future]] = deque()
+        file_iter = iter(files)
+
+        def submit_next() -> bool:
+            file_path = next(file_iter, None)
+            if file_path is None:
+                return False
+            pool: Executor = thread_pool
+            if process_pool is not None and sizes[file_path] >= self.large_file_bytes:
+                pool = process_pool
+            pending.append((file_path, pool.submit(parse_papers_file, file_path)))
+            return True
+
+        try:
+            while len(pending) < self.max_in_flight and submit_next():
+                pass
+
+            while pending:
+                file_path, future = pending.popleft()
+                submit_next()
+                yield from self._file_batches(file_path, future.result, skip_failed)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            thread_pool.shutdown(wait=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=True)
+
+    def _file_batches(
+        self, file_path: Path, load, skip_failed: bool
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the papers returned by load in batches."""
+        try:
+            papers = load()
+        except Exception as e:
+            if not skip_failed:
+                raise
+            # Log warning but continue with other files
+            print(f"Warning: Could not load {file_path}: {e}")
+            self.failed_files.append((str(file_path), str(e)))
+            return
+
+        self.source_files.append(str(file_path))
+        self.paper_count += len(papers)
+        for start in range(0, len(papers), self.batch_size):
+            yield papers[start : start + self.batch_size]
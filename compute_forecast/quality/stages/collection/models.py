@@ -26,6 +26,8 @@ class CollectionQualityMetrics:
     year_consistency_score: float = 1.0
     duplicate_count: int = 0
     duplicate_rate: float = 0.0
+    near_duplicate_count: int = 0
+    near_duplicate_clusters: int = 0
 
     # Accuracy metrics
     valid_years_count: int = 0
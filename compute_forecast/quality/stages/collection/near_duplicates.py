@@ -0,0 +1,329 @@
+"""Near-duplicate paper detection with MinHash signatures and LSH banding.
+
+Exact title matching misses the duplicates that consolidation later merges:
+titles differing by a typo, punctuation, casing or an "(extended abstract)"
+suffix. Each normalized title is reduced to a MinHash signature of its
+character shingles. Signatures are split into bands, and only papers sharing
+a band, or the same first author and year, are compared, so detection stays
+sub-quadratic in the number of papers.
+
+The Jaccard similarity of two titles is estimated from the share of equal
+signature values. Pairs at or above the similarity threshold are scored for
+confidence from their first author and year, and grouped into clusters.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+SHINGLE_SIZE = 3
+HIGH_CONFIDENCE_SIMILARITY = 0.9
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Suffixes marking versions of the same paper, as in the consolidation
+# TitleMatcher
+_TITLE_SUFFIXES = re.compile(
+    r"\s*\((?:extended abstract|short paper|long paper|poster|demo|"
+    r"vision paper|position paper|supplementary material|appendix)\)"
+    r"|\s*[:\-]\s*supplementary.*"
+    r"|\s*\[[^\]]*\]$"
+    r"|\s*\([^)]*arxiv[^)]*\)"
+)
+_NON_ALPHANUMERIC = re.compile(r"[\W_]+")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase a title, drop version suffixes, accents and punctuation."""
+    if not title:
+        return ""
+    normalized = title.lower()
+    if not normalized.isascii():
+        normalized = unicodedata.normalize("NFKD", normalized)
+        normalized = "".join(c for c in normalized if not unicodedata.combining(c))
+    normalized = _TITLE_SUFFIXES.sub("", normalized)
+    return _NON_ALPHANUMERIC.sub(" ", normalized).strip()
+
+
+def title_shingles(normalized_title: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Distinct byte shingles of a normalized title, packed into integers."""
+    data = np.frombuffer(normalized_title.encode("utf-8"), dtype=np.uint8)
+    if len(data) <= size:
+        return np.unique(data.astype(np.uint64)) if len(data) else data
+    shingles = np.zeros(len(data) - size + 1, dtype=np.uint64)
+    for offset in range(size):
+        shingles = (shingles << np.uint64(8)) | data[
+            offset : len(data) - size + 1 + offset
+        ]
+    return np.unique(shingles)
+
+
+def first_author_key(paper: Dict[str, Any]) -> str:
+    """Lowercase last name of the first author, empty when unknown."""
+    authors = paper.get("authors")
+    if not isinstance(authors, list) or not authors:
+        return ""
+    author = authors[0]
+    name = author.get("name", "") if isinstance(author, dict) else author
+    if not isinstance(name, str):
+        return ""
+    if "," in name:
+        # "Last, First" format
+        name = name.split(",", 1)[0]
+    else:
+        parts = name.split()
+        name = parts[-1] if parts else ""
+    return normalize_title(name)
+
+
+def _paper_year(paper: Dict[str, Any]) -> Optional[int]:
+    try:
+        return int(paper.get("year"))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class NearDuplicatePair:
+    """Two papers with similar titles."""
+
+    first: int
+    second: int
+    similarity: float
+    confidence: str
+
+
+@dataclass
+class NearDuplicateCluster:
+    """Papers linked by near-duplicate pairs."""
+
+    indices: List[int]
+    papers: List[Dict[str, Any]]
+    min_similarity: float
+    max_similarity: float
+    confidence: str
+    pairs: List[NearDuplicatePair] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "size": len(self.indices),
+            "indices": self.indices,
+            "papers": self.papers,
+            "min_similarity": round(self.min_similarity, 3),
+            "max_similarity": round(self.max_similarity, 3),
+            "confidence": self.confidence,
+        }
+
+
+CONFIDENCE_LEVELS = ["low", "medium", "high"]
+
+
+class NearDuplicateDetector:
+    """Incremental MinHash/LSH near-duplicate detector for paper titles.
+
+    Each added paper is compared with the papers added before it. Only the
+    signature, first author, year and the summary passed in are kept per
+    paper.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: Optional[int] = None,
+        max_block_size: int = 50,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            threshold: Minimum estimated title similarity of near duplicates
+            num_perm: Number of MinHash permutations, the estimate has a
+                standard error of about 0.5 / sqrt(num_perm)
+            bands: LSH bands, defaults to the division of num_perm whose
+                collision threshold sits just below threshold
+            max_block_size: Earlier papers of the same first author and year
+                compared with each new paper
+            seed: Seed of the permutations
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands or self._choose_bands(threshold, num_perm)
+        if num_perm % self.bands:
+            raise ValueError(
+                f"num_perm ({num_perm}) must be a multiple of bands ({self.bands})"
+            )
+        self.rows = num_perm // self.bands
+        self.max_block_size = max_block_size
+
+        rng = np.random.RandomState(seed)
+        # Below 2**31 so that a * shingle + b fits in 64 bits
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+        self.indices: List[int] = []
+        self.summaries: List[Dict[str, Any]] = []
+        self.authors: List[str] = []
+        self.years: List[Optional[int]] = []
+        # Signatures of the added papers, grown by doubling
+        self._signatures = np.empty((1024, num_perm), dtype=np.uint32)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._blocks: Dict[Tuple[str, int], List[int]] = {}
+        self.pairs: List[NearDuplicatePair] = []
+        self.comparisons = 0
+
+    @staticmethod
+    def _choose_bands(threshold: float, num_perm: int) -> int:
+        """Bands whose collision threshold (1/b)^(1/r) best fits threshold."""
+        # Aim below the threshold so that pairs near it still collide
+        target = threshold * 0.85
+        best_bands, best_distance = 1, float("inf")
+        for bands in range(1, num_perm + 1):
+            if num_perm % bands:
+                continue
+            rows = num_perm // bands
+            distance = abs((1 / bands) ** (1 / rows) - target)
+            if distance < best_distance:
+                best_bands, best_distance = bands, distance
+        return best_bands
+
+    def signature(self, shingles: np.ndarray) -> np.ndarray:
+        """MinHash signature of packed shingles."""
+        if not len(shingles):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        permuted = (np.outer(self._a, shingles) + self._b[:, None]) % _MERSENNE_PRIME
+        return np.asarray((permuted & _MAX_HASH).min(axis=1), dtype=np.uint32)
+
+    def add(
+        self, index: int, paper: Dict[str, Any], summary: Dict[str, Any]
+    ) -> List[NearDuplicatePair]:
+        """Add a paper and return its near-duplicate pairs with earlier papers.
+
+        Args:
+            index: Position of the paper in the collection
+            paper: The paper
+            summary: Fields of the paper quoted in reports
+        """
+        normalized = normalize_title(paper.get("title", ""))
+        if not normalized:
+            return []
+        signature = self.signature(title_shingles(normalized))
+        author = first_author_key(paper)
+        year = _paper_year(paper)
+        position = len(self.indices)
+
+        candidates: Set[int] = set()
+        for band, buckets in enumerate(self._buckets):
+            key = signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            bucket = buckets.setdefault(key, [])
+            candidates.update(bucket)
+            bucket.append(position)
+        if author and year is not None:
+            block = self._blocks.setdefault((author, year), [])
+            candidates.update(block[-self.max_block_size :])
+            block.append(position)
+
+        self.indices.append(index)
+        self.summaries.append(summary)
+        self.authors.append(author)
+        self.years.append(year)
+        if position == len(self._signatures):
+            self._signatures = np.concatenate(
+                [self._signatures, np.empty_like(self._signatures)]
+            )
+        self._signatures[position] = signature
+
+        if not candidates:
+            return []
+
+        ordered = np.fromiter(candidates, dtype=np.intp, count=len(candidates))
+        ordered.sort()
+        self.comparisons += len(ordered)
+        similarities = (self._signatures[ordered] == signature).mean(axis=1)
+        matches = np.flatnonzero(similarities >= self.threshold)
+
+        pairs = []
+        for match in matches:
+            candidate, similarity = int(ordered[match]), float(similarities[match])
+            pairs.append(
+                NearDuplicatePair(
+                    first=candidate,
+                    second=position,
+                    similarity=similarity,
+                    confidence=self._confidence(candidate, position, similarity),
+                )
+            )
+        self.pairs.extend(pairs)
+        return pairs
+
+    def _confidence(self, first: int, second: int, similarity: float) -> str:
+        """Confidence that two similar titles are the same paper."""
+        evidence = 0
+        if self.authors[first] and self.authors[second]:
+            evidence += 1 if self.authors[first] == self.authors[second] else -1
+        if self.years[first] is not None and self.years[second] is not None:
+            # Preprints and proceedings of a paper are often a year apart
+            gap = abs(self.years[first] - self.years[second])  # type: ignore[operator]
+            evidence += 1 if gap <= 1 else -1
+
+        if evidence < 0:
+            return "low"
+        if evidence > 0 and similarity >= HIGH_CONFIDENCE_SIMILARITY:
+            return "high"
+        return "medium"
+
+    def clusters(self, min_confidence: str = "medium") -> List[NearDuplicateCluster]:
+        """Group the pairs of at least min_confidence into clusters.
+
+        Clusters are ordered by the collection index of their first paper and
+        take the confidence of their weakest pair.
+        """
+        min_level = CONFIDENCE_LEVELS.index(min_confidence)
+        parent = list(range(len(self.indices)))
+
+        def find(position: int) -> int:
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        kept = [
+            pair
+            for pair in self.pairs
+            if CONFIDENCE_LEVELS.index(pair.confidence) >= min_level
+        ]
+        for pair in kept:
+            root_first, root_second = find(pair.first), find(pair.second)
+            if root_first != root_second:
+                parent[max(root_first, root_second)] = min(root_first, root_second)
+
+        cluster_pairs: Dict[int, List[NearDuplicatePair]] = {}
+        for pair in kept:
+            cluster_pairs.setdefault(find(pair.first), []).append(pair)
+
+        clusters = []
+        for root in sorted(cluster_pairs):
+            pairs = cluster_pairs[root]
+            positions = sorted({p for pair in pairs for p in (pair.first, pair.second)})
+            similarities = [pair.similarity for pair in pairs]
+            clusters.append(
+                NearDuplicateCluster(
+                    indices=[self.indices[p] for p in positions],
+                    papers=[self.summaries[p] for p in positions],
+                    min_similarity=min(similarities),
+                    max_similarity=max(similarities),
+                    confidence=min(
+                        (pair.confidence for pair in pairs),
+                        key=CONFIDENCE_LEVELS.index,
+                    ),
+                    pairs=pairs,
+                )
+            )
+        return clusters
@@ -2,7 +2,7 @@
 
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -13,16 +13,31 @@ from compute_forecast.quality.core.interfaces import (
     QualityIssueLevel,
     QualityConfig,
 )
+from .near_duplicates import (
+    CONFIDENCE_LEVELS,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    NearDuplicateDetector,
+)
 
 
 class BaseValidator(ABC):
-    """Base class for all collection validators."""
+    """Base class for all collection validators.
+
+    Validators accumulate their state over batches of papers, so large
+    collections can be checked without holding all papers in memory.
+    """
 
-    @abstractmethod
     def validate(
         self, papers: List[Dict[str, Any]], config: QualityConfig
     ) -> QualityCheckResult:
         """Validate papers and return results."""
+        accumulator = self.create_accumulator(config)
+        accumulator.add(papers)
+        return accumulator.result()
+
+    @abstractmethod
+    def create_accumulator(self, config: QualityConfig) -> "ValidationAccumulator":
+        """Return an empty accumulator validating papers batch by batch."""
         pass
 
     @abstractmethod
@@ -49,79 +64,61 @@ class BaseValidator(ABC):
         )
 
 
-class CompletenessValidator(BaseValidator):
-    """Validates completeness of required fields and data integrity."""
+class ValidationAccumulator(ABC):
+    """Validation state of one check, updated batch by batch.
 
-    REQUIRED_FIELDS = ["title", "authors", "venue", "year"]
-    OPTIONAL_FIELDS = ["abstract", "pdf_url", "doi", "keywords"]
+    Only counters, distributions and the issues found are kept, not the
+    papers themselves. Paper indices in issues are positions in the whole
+    stream of batches.
+    """
 
-    def get_check_type(self) -> QualityCheckType:
-        return QualityCheckType.COMPLETENESS
+    def __init__(self, validator: BaseValidator, config: QualityConfig):
+        self.validator = validator
+        self.config = config
+        self.total_papers = 0
 
-    def validate(
-        self, papers: List[Dict[str, Any]], config: QualityConfig
-    ) -> QualityCheckResult:
-        """Validate completeness of paper data."""
-        issues: List[QualityIssue] = []
+    def add(self, papers: List[Dict[str, Any]]):
+        """Validate the next batch of papers."""
+        self._add(papers, self.total_papers)
+        self.total_papers += len(papers)
 
-        if not papers:
-            issues.append(
-                self._create_issue(
-                    QualityIssueLevel.CRITICAL,
-                    "papers",
-                    "No papers found in collection",
-                    "Verify collection process completed successfully",
-                )
-            )
-            return QualityCheckResult(
-                check_name="completeness_check",
-                check_type=self.get_check_type(),
-                passed=False,
-                score=0.0,
-                issues=issues,
-            )
+    @abstractmethod
+    def _add(self, papers: List[Dict[str, Any]], start: int):
+        """Update the state with papers numbered from ``start``."""
+        pass
 
-        # Check required fields
-        missing_required = self._check_required_fields(papers, issues)
+    @abstractmethod
+    def result(self) -> QualityCheckResult:
+        """Result of the check over all papers added so far."""
+        pass
 
-        # Check optional fields availability
-        optional_coverage = self._check_optional_fields(papers, issues)
 
-        # Calculate score
-        total_papers = len(papers)
-        papers_with_all_required = total_papers - len(missing_required)
+def _error_score(invalid_count: int, total_count: int) -> float:
+    """Share of valid entries, 1.0 when there are none."""
+    if total_count == 0:
+        return 1.0
+    return max(0.0, 1.0 - (invalid_count / total_count))
 
-        # Score based on required field completeness (80%) + optional coverage (20%)
-        required_score = (
-            papers_with_all_required / total_papers if total_papers > 0 else 0.0
-        )
-        optional_score = (
-            sum(optional_coverage.values()) / len(optional_coverage)
-            if optional_coverage
-            else 0.0
-        )
-        overall_score = 0.8 * required_score + 0.2 * optional_score
 
-        passed = (
-            overall_score >= 0.8
-            and len([i for i in issues if i.level == QualityIssueLevel.CRITICAL]) == 0
-        )
+class CompletenessValidator(BaseValidator):
+    """Validates completeness of required fields and data integrity."""
 
-        return QualityCheckResult(
-            check_name="completeness_check",
-            check_type=self.get_check_type(),
-            passed=passed,
-            score=overall_score,
-            issues=issues,
-        )
+    REQUIRED_FIELDS = ["title", "authors", "venue", "year"]
+    OPTIONAL_FIELDS = ["abstract", "pdf_url", "doi", "keywords"]
+
+    def get_check_type(self) -> QualityCheckType:
+        return QualityCheckType.COMPLETENESS
+
+    def create_accumulator(self, config: QualityConfig) -> "CompletenessAccumulator":
+        return CompletenessAccumulator(self, config)
 
     def _check_required_fields(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
+        self, papers: List[Dict[str, Any]], issues: List[QualityIssue], start: int = 0
     ) -> List[int]:
         """Check for missing required fields."""
         missing_required = []
 
-        for i, paper in enumerate(papers):
+        for i, paper in enumerate(papers, start):
             missing_fields = []
             for field in self.REQUIRED_FIELDS:
                 if (
@@ -149,17 +146,14 @@ class CompletenessValidator(BaseValidator):
 
         return missing_required
 
-    def _check_optional_fields(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> Dict[str, float]:
-        """Check coverage of optional fields."""
-        coverage = {}
-        total_papers = len(papers)
+    def _count_optional_fields(self, papers: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count papers with each optional field present."""
+        counts = {}
 
         for field in self.OPTIONAL_FIELDS:
             if field == "pdf_url":
                 # Check both pdf_url and pdf_urls fields
-                present_count = sum(
+                counts[field] = sum(
                     1
                     for paper in papers
                     if (paper.get("pdf_urls") and paper["pdf_urls"])
@@ -173,13 +167,27 @@ class CompletenessValidator(BaseValidator):
                     )
                 )
             else:
-                present_count = sum(
+                counts[field] = sum(
                     1
                     for paper in papers
                     if field in paper
                     and paper[field]
                     and (not isinstance(paper[field], str) or paper[field].strip())
                 )
+
+        return counts
+
+    def _check_optional_fields(
+        self,
+        present_counts: Dict[str, int],
+        total_papers: int,
+        issues: List[QualityIssue],
+    ) -> Dict[str, float]:
+        """Check coverage of optional fields."""
+        coverage = {}
+
+        for field in self.OPTIONAL_FIELDS:
+            present_count = present_counts.get(field, 0)
             coverage[field] = present_count / total_papers if total_papers > 0 else 0.0
 
             if coverage[field] < 0.5:
@@ -200,63 +208,122 @@ class CompletenessValidator(BaseValidator):
         return coverage
 
 
-class ConsistencyValidator(BaseValidator):
-    """Validates consistency of data across papers."""
+class CompletenessAccumulator(ValidationAccumulator):
+    """Required field issues and optional field counts."""
 
-    def get_check_type(self) -> QualityCheckType:
-        return QualityCheckType.CONSISTENCY
+    validator: CompletenessValidator
 
-    def validate(
-        self, papers: List[Dict[str, Any]], config: QualityConfig
-    ) -> QualityCheckResult:
-        """Validate consistency of paper data."""
-        issues: List[QualityIssue] = []
+    def __init__(self, validator: CompletenessValidator, config: QualityConfig):
+        super().__init__(validator, config)
+        self.issues: List[QualityIssue] = []
+        self.missing_required_count = 0
+        self.optional_counts = {field: 0 for field in validator.OPTIONAL_FIELDS}
+
+    def _add(self, papers: List[Dict[str, Any]], start: int):
+        missing = self.validator._check_required_fields(papers, self.issues, start)
+        self.missing_required_count += len(missing)
+        for field, count in self.validator._count_optional_fields(papers).items():
+            self.optional_counts[field] += count
+
+    def result(self) -> QualityCheckResult:
+        """Validate completeness of paper data."""
+        validator = self.validator
+        issues = list(self.issues)
 
-        if not papers:
+        if not self.total_papers:
+            issues.append(
+                validator._create_issue(
+                    QualityIssueLevel.CRITICAL,
+                    "papers",
+                    "No papers found in collection",
+                    "Verify collection process completed successfully",
+                )
+            )
             return QualityCheckResult(
-                check_name="consistency_check",
-                check_type=self.get_check_type(),
-                passed=True,
-                score=1.0,
-                issues=[],
+                check_name="completeness_check",
+                check_type=validator.get_check_type(),
+                passed=False,
+                score=0.0,
+                issues=issues,
             )
 
-        # Check for duplicates
-        duplicate_score = self._check_duplicates(papers, issues)
+        # Check optional fields availability
+        total_papers = self.total_papers
+        optional_coverage = validator._check_optional_fields(
+            self.optional_counts, total_papers, issues
+        )
 
-        # Check venue consistency
-        venue_score = self._check_venue_consistency(papers, issues)
+        # Calculate score
+        papers_with_all_required = total_papers - self.missing_required_count
 
-        # Check year consistency
-        year_score = self._check_year_consistency(papers, issues)
+        # Score based on required field completeness (80%) + optional coverage (20%)
+        required_score = papers_with_all_required / total_papers
+        optional_score = (
+            sum(optional_coverage.values()) / len(optional_coverage)
+            if optional_coverage
+            else 0.0
+        )
+        overall_score = 0.8 * required_score + 0.2 * optional_score
 
-        # Overall score
-        overall_score = (duplicate_score + venue_score + year_score) / 3
-        passed = overall_score >= 0.8
+        passed = (
+            overall_score >= 0.8
+            and len([i for i in issues if i.level == QualityIssueLevel.CRITICAL]) == 0
+        )
 
         return QualityCheckResult(
-            check_name="consistency_check",
-            check_type=self.get_check_type(),
+            check_name="completeness_check",
+            check_type=validator.get_check_type(),
             passed=passed,
             score=overall_score,
             issues=issues,
         )
 
-    def _check_duplicates(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> float:
-        """Check for duplicate papers."""
-        seen_titles: Dict[str, Tuple[int, Dict[str, Any]]] = {}
-        all_duplicates = []
-        duplicate_pairs = []
 
-        # First pass: collect all duplicates
-        for i, paper in enumerate(papers):
+def _paper_summary(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of a paper quoted in duplicate reports."""
+    return {key: paper[key] for key in ("id", "title", "venue", "year") if key in paper}
+
+
+class DuplicateTracker:
+    """Duplicate titles across batches of papers.
+
+    Keeps one small summary per distinct title, the duplicate counts per
+    venue/year pair and the first few duplicate examples, instead of every
+    duplicate pair with its papers. Distinct titles also go through a
+    near-duplicate detector unless near_duplicate_threshold is None.
+    """
+
+    MAX_EXAMPLES = 5
+
+    def __init__(
+        self, near_duplicate_threshold: Optional[float] = DEFAULT_SIMILARITY_THRESHOLD
+    ):
+        self.near_duplicates = (
+            NearDuplicateDetector(threshold=near_duplicate_threshold)
+            if near_duplicate_threshold
+            else None
+        )
+        self.seen_titles: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self.duplicate_count = 0
+        self.cross_venue_count = 0
+        self.cross_venue_pairs: Dict[Tuple[str, ...], int] = {}
+        self.venue_year_counts: Dict[str, int] = {}
+        self.examples: List[Tuple[int, Dict[str, Any], int, Dict[str, Any]]] = []
+
+    def add(self, papers: List[Dict[str, Any]], start: int = 0):
+        for i, paper in enumerate(papers, start):
+            venue_year = (
+                f"{paper.get('venue', 'Unknown')} {paper.get('year', 'Unknown')}"
+            )
+            self.venue_year_counts[venue_year] = (
+                self.venue_year_counts.get(venue_year, 0) + 1
+            )
+
             title = paper.get("title", "").strip()
             title_lower = title.lower()
 
-            if title_lower and title_lower in seen_titles:
-                prev_idx, prev_paper = seen_titles[title_lower]
+            if title_lower and title_lower in self.seen_titles:
+                prev_idx, prev_paper = self.seen_titles[title_lower]
 
                 # Get venues and years for both papers
                 current_venue = paper.get("venue", "Unknown")
@@ -264,39 +331,38 @@ class ConsistencyValidator(BaseValidator):
                 current_year = str(paper.get("year", "Unknown"))
                 previous_year = str(prev_paper.get("year", "Unknown"))
 
-                duplicate_pairs.append(
-                    {
-                        "indices": (i, prev_idx),
-                        "papers": (paper, prev_paper),
-                        "venue_year_1": f"{current_venue} {current_year}",
-                        "venue_year_2": f"{previous_venue} {previous_year}",
-                        "cross_venue": current_venue != previous_venue,
-                    }
-                )
-                all_duplicates.append((i, prev_idx))
+                self.duplicate_count += 1
+                if current_venue != previous_venue:
+                    self.cross_venue_count += 1
+                    key = tuple(
+                        sorted(
+                            [
+                                f"{current_venue} {current_year}",
+                                f"{previous_venue} {previous_year}",
+                            ]
+                        )
+                    )
+                    self.cross_venue_pairs[key] = self.cross_venue_pairs.get(key, 0) + 1
+                if len(self.examples) < self.MAX_EXAMPLES:
+                    self.examples.append(
+                        (i, _paper_summary(paper), prev_idx, prev_paper)
+                    )
             elif title_lower:
-                seen_titles[title_lower] = (i, paper)
-
-        # Calculate cross-venue duplicate statistics
-        venue_year_counts: Dict[str, int] = {}
-        cross_venue_pairs = {}
+                summary = _paper_summary(paper)
+                self.seen_titles[title_lower] = (i, summary)
+                if self.near_duplicates is not None:
+                    self.near_duplicates.add(i, paper, summary)
 
-        for paper in papers:
-            venue_year = (
-                f"{paper.get('venue', 'Unknown')} {paper.get('year', 'Unknown')}"
-            )
-            venue_year_counts[venue_year] = venue_year_counts.get(venue_year, 0) + 1
-
-        for dup in duplicate_pairs:
-            if dup["cross_venue"]:
-                key = tuple(sorted([dup["venue_year_1"], dup["venue_year_2"]]))
-                if key not in cross_venue_pairs:
-                    cross_venue_pairs[key] = 0
-                cross_venue_pairs[key] += 1
-
-        # Create summary statistics
-        total_duplicates = len(duplicate_pairs)
-        cross_venue_duplicates = sum(1 for d in duplicate_pairs if d["cross_venue"])
+    def finish(
+        self,
+        validator: BaseValidator,
+        issues: List[QualityIssue],
+        total_papers: int,
+    ) -> float:
+        """Report the duplicates found and return the duplicate score."""
+        total_duplicates = self.duplicate_count
+        cross_venue_duplicates = self.cross_venue_count
+        venue_year_counts = self.venue_year_counts
 
         # Add summary issue if there are duplicates
         if total_duplicates > 0:
@@ -322,7 +388,7 @@ class ConsistencyValidator(BaseValidator):
 
                 return (venue1, year1, venue2, year2)
 
-            sorted_pairs = sorted(cross_venue_pairs.items(), key=sort_key)
+            sorted_pairs = sorted(self.cross_venue_pairs.items(), key=sort_key)
 
             for (venue_year_1, venue_year_2), count in sorted_pairs:
                 total_1 = venue_year_counts.get(venue_year_1, 1)
@@ -335,7 +401,7 @@ class ConsistencyValidator(BaseValidator):
                 )
 
             issues.append(
-                self._create_issue(
+                validator._create_issue(
                     QualityIssueLevel.WARNING,
                     "duplicate_summary",
                     f"Found {total_duplicates} duplicate titles ({cross_venue_duplicates} cross-venue)",
@@ -351,19 +417,16 @@ class ConsistencyValidator(BaseValidator):
             )
 
         # Add individual duplicate examples (limit to 5)
-        for idx, dup in enumerate(duplicate_pairs[:5]):
-            i, prev_idx = dup["indices"]
-            paper, prev_paper = dup["papers"]
-
+        for idx, (i, paper, prev_idx, prev_paper) in enumerate(self.examples):
             # Get paper IDs if available
             current_id = paper.get("id", f"index_{i}")
             previous_id = prev_paper.get("id", f"index_{prev_idx}")
 
             issues.append(
-                self._create_issue(
+                validator._create_issue(
                     QualityIssueLevel.WARNING,
                     "duplicates",
-                    f"Duplicate example {idx + 1}/{min(5, total_duplicates)}: Papers {current_id} and {previous_id}",
+                    f"Duplicate example {idx + 1}/{min(self.MAX_EXAMPLES, total_duplicates)}: Papers {current_id} and {previous_id}",
                     "Review papers for duplicates - same title may be valid if different venues/years",
                     {
                         "detection_method": "exact_match_lowercase",
@@ -385,34 +448,119 @@ class ConsistencyValidator(BaseValidator):
                 )
             )
 
-        duplicate_rate = len(all_duplicates) / len(papers) if papers else 0.0
+        near_duplicate_count = self._report_near_duplicates(validator, issues)
+
+        duplicate_rate = (
+            (total_duplicates + near_duplicate_count) / total_papers
+            if total_papers
+            else 0.0
+        )
         return max(0.0, 1.0 - duplicate_rate * 2)  # Penalize duplicates heavily
 
-    def _check_venue_consistency(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> float:
-        """Check venue name consistency."""
-        venue_variants: Dict[str, List[str]] = {}
+    def _report_near_duplicates(
+        self, validator: BaseValidator, issues: List[QualityIssue]
+    ) -> int:
+        """Report the near-duplicate clusters, returns the papers to merge."""
+        detector = self.near_duplicates
+        if detector is None:
+            return 0
+
+        clusters = detector.clusters()
+        if not clusters:
+            return 0
+
+        near_duplicate_count = sum(len(cluster.indices) - 1 for cluster in clusters)
+        possible_pairs = sum(1 for pair in detector.pairs if pair.confidence == "low")
+
+        confidence_counts = {
+            level: sum(1 for cluster in clusters if cluster.confidence == level)
+            for level in CONFIDENCE_LEVELS[1:]
+        }
+        issues.append(
+            validator._create_issue(
+                QualityIssueLevel.WARNING,
+                "near_duplicate_summary",
+                f"Found {len(clusters)} near-duplicate title clusters "
+                f"({near_duplicate_count} likely duplicates)",
+                "Review near-duplicate papers - consolidation will have to merge them",
+                {
+                    "similarity_threshold": detector.threshold,
+                    "clusters": len(clusters),
+                    "near_duplicates": near_duplicate_count,
+                    "clusters_by_confidence": confidence_counts,
+                    # Similar titles with conflicting authors or years
+                    "possible_pairs": possible_pairs,
+                },
+            )
+        )
+
+        # Most confident clusters first
+        examples = sorted(
+            clusters, key=lambda c: -CONFIDENCE_LEVELS.index(c.confidence)
+        )[: self.MAX_EXAMPLES]
+        for idx, cluster in enumerate(examples):
+            issues.append(
+                validator._create_issue(
+                    QualityIssueLevel.WARNING
+                    if cluster.confidence == "high"
+                    else QualityIssueLevel.INFO,
+                    "near_duplicates",
+                    f"Near-duplicate example {idx + 1}/{len(examples)}: "
+                    f"{len(cluster.indices)} papers with title similarity "
+                    f"{cluster.min_similarity:.2f}-{cluster.max_similarity:.2f} "
+                    f"({cluster.confidence} confidence)",
+                    "Check whether these papers are versions of the same paper",
+                    {"detection_method": "minhash_lsh", **cluster.to_dict()},
+                )
+            )
+
+        return near_duplicate_count
+
+
+class ConsistencyValidator(BaseValidator):
+    """Validates consistency of data across papers."""
+
+    def get_check_type(self) -> QualityCheckType:
+        return QualityCheckType.CONSISTENCY
+
+    def create_accumulator(self, config: QualityConfig) -> "ConsistencyAccumulator":
+        return ConsistencyAccumulator(self, config)
 
+    def _check_duplicates(
+        self,
+        papers: List[Dict[str, Any]],
+        issues: List[QualityIssue],
+        near_duplicate_threshold: Optional[float] = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> float:
+        """Check for exact and near-duplicate papers."""
+        tracker = DuplicateTracker(near_duplicate_threshold)
+        tracker.add(papers)
+        return tracker.finish(self, issues, len(papers))
+
+    def _collect_venue_variants(
+        self, papers: List[Dict[str, Any]], venue_variants: Dict[str, Set[str]]
+    ):
+        """Record the spellings of each venue name."""
         for paper in papers:
             venue = paper.get("venue", "").strip()
             if venue:
-                venue_lower = venue.lower()
-                if venue_lower not in venue_variants:
-                    venue_variants[venue_lower] = []
-                venue_variants[venue_lower].append(venue)
+                venue_variants.setdefault(venue.lower(), set()).add(venue)
 
+    def _check_venue_consistency(
+        self, venue_variants: Dict[str, Set[str]], issues: List[QualityIssue]
+    ) -> float:
+        """Check venue name consistency."""
         inconsistent_venues = []
         for venue_lower, variants in venue_variants.items():
-            if len(set(variants)) > 1:
+            if len(variants) > 1:
                 inconsistent_venues.append((venue_lower, variants))
                 issues.append(
                     self._create_issue(
                         QualityIssueLevel.WARNING,
                         "venue_consistency",
-                        f"Inconsistent venue naming: {', '.join(set(variants))}",
+                        f"Inconsistent venue naming: {', '.join(variants)}",
                         "Standardize venue names during collection",
-                        {"venue_variants": list(set(variants))},
+                        {"venue_variants": list(variants)},
                     )
                 )
 
@@ -424,13 +572,13 @@ class ConsistencyValidator(BaseValidator):
         return max(0.0, consistency_score)
 
     def _check_year_consistency(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> float:
-        """Check year format consistency."""
+        self, papers: List[Dict[str, Any]], issues: List[QualityIssue], start: int = 0
+    ) -> int:
+        """Check year format consistency, returns the number of invalid years."""
         invalid_years = []
         current_year = datetime.now().year
 
-        for i, paper in enumerate(papers):
+        for i, paper in enumerate(papers, start):
             year = paper.get("year")
             if year is not None:
                 try:
@@ -466,62 +614,89 @@ class ConsistencyValidator(BaseValidator):
                         )
                     )
 
-        year_score = 1.0 - (len(invalid_years) / len(papers)) if papers else 1.0
-        return max(0.0, year_score)
+        return len(invalid_years)
 
 
-class AccuracyValidator(BaseValidator):
-    """Validates accuracy of data fields."""
+class ConsistencyAccumulator(ValidationAccumulator):
+    """Duplicate titles, venue spellings and year issues."""
 
-    def get_check_type(self) -> QualityCheckType:
-        return QualityCheckType.ACCURACY
+    validator: ConsistencyValidator
 
-    def validate(
-        self, papers: List[Dict[str, Any]], config: QualityConfig
-    ) -> QualityCheckResult:
-        """Validate accuracy of paper data."""
+    def __init__(self, validator: ConsistencyValidator, config: QualityConfig):
+        super().__init__(validator, config)
+        # A threshold of 0 disables near-duplicate detection
+        self.duplicates = DuplicateTracker(
+            config.thresholds.get(
+                "near_duplicate_similarity", DEFAULT_SIMILARITY_THRESHOLD
+            )
+        )
+        self.venue_variants: Dict[str, Set[str]] = {}
+        self.year_issues: List[QualityIssue] = []
+        self.invalid_year_count = 0
+
+    def _add(self, papers: List[Dict[str, Any]], start: int):
+        self.duplicates.add(papers, start)
+        self.validator._collect_venue_variants(papers, self.venue_variants)
+        self.invalid_year_count += self.validator._check_year_consistency(
+            papers, self.year_issues, start
+        )
+
+    def result(self) -> QualityCheckResult:
+        """Validate consistency of paper data."""
+        validator = self.validator
         issues: List[QualityIssue] = []
 
-        if not papers:
+        if not self.total_papers:
             return QualityCheckResult(
-                check_name="accuracy_check",
-                check_type=self.get_check_type(),
+                check_name="consistency_check",
+                check_type=validator.get_check_type(),
                 passed=True,
                 score=1.0,
                 issues=[],
             )
 
-        # Validate author names
-        author_score = self._validate_author_names(papers, issues)
+        # Check for duplicates
+        duplicate_score = self.duplicates.finish(validator, issues, self.total_papers)
 
-        # Validate URLs
-        url_score = self._validate_urls(papers, issues)
+        # Check venue consistency
+        venue_score = validator._check_venue_consistency(self.venue_variants, issues)
 
-        # Validate DOIs
-        doi_score = self._validate_dois(papers, issues)
+        # Check year consistency
+        issues.extend(self.year_issues)
+        year_score = _error_score(self.invalid_year_count, self.total_papers)
 
         # Overall score
-        overall_score = (author_score + url_score + doi_score) / 3
+        overall_score = (duplicate_score + venue_score + year_score) / 3
         passed = overall_score >= 0.8
 
         return QualityCheckResult(
-            check_name="accuracy_check",
-            check_type=self.get_check_type(),
+            check_name="consistency_check",
+            check_type=validator.get_check_type(),
             passed=passed,
             score=overall_score,
             issues=issues,
         )
 
+
+class AccuracyValidator(BaseValidator):
+    """Validates accuracy of data fields."""
+
+    def get_check_type(self) -> QualityCheckType:
+        return QualityCheckType.ACCURACY
+
+    def create_accumulator(self, config: QualityConfig) -> "AccuracyAccumulator":
+        return AccuracyAccumulator(self, config)
+
     def _validate_author_names(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> float:
-        """Validate author name patterns."""
+        self, papers: List[Dict[str, Any]], issues: List[QualityIssue], start: int = 0
+    ) -> int:
+        """Validate author name patterns, returns the number of invalid authors."""
         invalid_authors = []
 
         # Pattern for reasonable author names (allows Unicode for international names)
         author_pattern = re.compile(r"^[A-Za-z\u00C0-\u017F\u0400-\u04FF\s\-\.\']+$")
 
-        for i, paper in enumerate(papers):
+        for i, paper in enumerate(papers, start):
             authors = paper.get("authors", [])
             if not isinstance(authors, list):
                 authors = []
@@ -603,20 +778,15 @@ class AccuracyValidator(BaseValidator):
                         )
                     )
 
-        total_authors = sum(len(paper.get("authors", [])) for paper in papers)
-        if total_authors == 0:
-            return 1.0
-
-        accuracy_score = 1.0 - (len(invalid_authors) / total_authors)
-        return max(0.0, accuracy_score)
+        return len(invalid_authors)
 
     def _validate_urls(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> float:
-        """Validate URL formats."""
+        self, papers: List[Dict[str, Any]], issues: List[QualityIssue], start: int = 0
+    ) -> int:
+        """Validate URL formats, returns the number of invalid URLs."""
         invalid_urls = []
 
-        for i, paper in enumerate(papers):
+        for i, paper in enumerate(papers, start):
             for field in ["pdf_url", "url"]:
                 url = paper.get(field)
                 if url and isinstance(url, str):
@@ -645,25 +815,18 @@ class AccuracyValidator(BaseValidator):
                             )
                         )
 
-        total_urls = sum(
-            1 for paper in papers for field in ["pdf_url", "url"] if paper.get(field)
-        )
-        if total_urls == 0:
-            return 1.0
-
-        url_score = 1.0 - (len(invalid_urls) / total_urls)
-        return max(0.0, url_score)
+        return len(invalid_urls)
 
     def _validate_dois(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
-    ) -> float:
-        """Validate DOI formats."""
+        self, papers: List[Dict[str, Any]], issues: List[QualityIssue], start: int = 0
+    ) -> int:
+        """Validate DOI formats, returns the number of invalid DOIs."""
         invalid_dois = []
 
         # Basic DOI pattern
         doi_pattern = re.compile(r"^10\.\d{4,}/[^\s]+$")
 
-        for i, paper in enumerate(papers):
+        for i, paper in enumerate(papers, start):
             doi = paper.get("doi")
             if doi and isinstance(doi, str):
                 doi = doi.strip()
@@ -685,79 +848,88 @@ class AccuracyValidator(BaseValidator):
                         )
                     )
 
-        total_dois = sum(1 for paper in papers if paper.get("doi"))
-        if total_dois == 0:
-            return 1.0
+        return len(invalid_dois)
 
-        doi_score = 1.0 - (len(invalid_dois) / total_dois)
-        return max(0.0, doi_score)
 
+class AccuracyAccumulator(ValidationAccumulator):
+    """Invalid author names, URLs and DOIs."""
 
-class CoverageValidator(BaseValidator):
-    """Validates collection coverage against expectations."""
+    validator: AccuracyValidator
 
-    def get_check_type(self) -> QualityCheckType:
-        return QualityCheckType.COVERAGE
+    def __init__(self, validator: AccuracyValidator, config: QualityConfig):
+        super().__init__(validator, config)
+        self.author_issues: List[QualityIssue] = []
+        self.url_issues: List[QualityIssue] = []
+        self.doi_issues: List[QualityIssue] = []
+        self.invalid_authors = 0
+        self.invalid_urls = 0
+        self.invalid_dois = 0
+        self.total_authors = 0
+        self.total_urls = 0
+        self.total_dois = 0
 
-    def validate(
-        self, papers: List[Dict[str, Any]], config: QualityConfig
-    ) -> QualityCheckResult:
-        """Validate collection coverage."""
-        issues: List[QualityIssue] = []
+    def _add(self, papers: List[Dict[str, Any]], start: int):
+        validator = self.validator
+        self.invalid_authors += validator._validate_author_names(
+            papers, self.author_issues, start
+        )
+        self.invalid_urls += validator._validate_urls(papers, self.url_issues, start)
+        self.invalid_dois += validator._validate_dois(papers, self.doi_issues, start)
 
-        if not papers:
-            issues.append(
-                self._create_issue(
-                    QualityIssueLevel.CRITICAL,
-                    "coverage",
-                    "No papers collected",
-                    "Verify collection process and scraper functionality",
-                )
-            )
+        self.total_authors += sum(len(paper.get("authors", [])) for paper in papers)
+        self.total_urls += sum(
+            1 for paper in papers for field in ["pdf_url", "url"] if paper.get(field)
+        )
+        self.total_dois += sum(1 for paper in papers if paper.get("doi"))
+
+    def result(self) -> QualityCheckResult:
+        """Validate accuracy of paper data."""
+        if not self.total_papers:
             return QualityCheckResult(
-                check_name="coverage_check",
-                check_type=self.get_check_type(),
-                passed=False,
-                score=0.0,
-                issues=issues,
+                check_name="accuracy_check",
+                check_type=self.validator.get_check_type(),
+                passed=True,
+                score=1.0,
+                issues=[],
             )
 
-        # Analyze venue coverage
-        venue_score = self._analyze_venue_coverage(papers, issues)
-
-        # Analyze year coverage
-        year_score = self._analyze_year_coverage(papers, issues)
-
-        # Analyze scraper coverage
-        scraper_score = self._analyze_scraper_coverage(papers, issues)
+        author_score = _error_score(self.invalid_authors, self.total_authors)
+        url_score = _error_score(self.invalid_urls, self.total_urls)
+        doi_score = _error_score(self.invalid_dois, self.total_dois)
 
         # Overall score
-        overall_score = (venue_score + year_score + scraper_score) / 3
-        passed = overall_score >= 0.6  # Lower threshold for coverage
+        overall_score = (author_score + url_score + doi_score) / 3
+        passed = overall_score >= 0.8
 
         return QualityCheckResult(
-            check_name="coverage_check",
-            check_type=self.get_check_type(),
+            check_name="accuracy_check",
+            check_type=self.validator.get_check_type(),
             passed=passed,
             score=overall_score,
-            issues=issues,
+            issues=self.author_issues + self.url_issues + self.doi_issues,
         )
 
+
+class CoverageValidator(BaseValidator):
+    """Validates collection coverage against expectations."""
+
+    def get_check_type(self) -> QualityCheckType:
+        return QualityCheckType.COVERAGE
+
+    def create_accumulator(self, config: QualityConfig) -> "CoverageAccumulator":
+        return CoverageAccumulator(self, config)
+
     def _analyze_venue_coverage(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
+        self,
+        venue_counts: Dict[str, int],
+        total_papers: int,
+        issues: List[QualityIssue],
     ) -> float:
         """Analyze venue coverage distribution."""
-        venue_counts: Dict[str, int] = {}
-
-        for paper in papers:
-            venue = paper.get("venue", "Unknown")
-            venue_counts[venue] = venue_counts.get(venue, 0) + 1
-
         if not venue_counts:
             return 0.0
 
         # Check for very uneven distribution
-        total_papers = len(papers)
         max_venue_count = max(venue_counts.values())
         min_venue_count = min(venue_counts.values())
 
@@ -804,20 +976,9 @@ class CoverageValidator(BaseValidator):
         return max(0.0, score)
 
     def _analyze_year_coverage(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
+        self, year_counts: Dict[int, int], issues: List[QualityIssue]
     ) -> float:
         """Analyze year coverage distribution."""
-        year_counts: Dict[int, int] = {}
-
-        for paper in papers:
-            year = paper.get("year")
-            if year is not None:
-                try:
-                    year_int = int(year)
-                    year_counts[year_int] = year_counts.get(year_int, 0) + 1
-                except (ValueError, TypeError):
-                    pass
-
         if not year_counts:
             issues.append(
                 self._create_issue(
@@ -864,23 +1025,16 @@ class CoverageValidator(BaseValidator):
         return range_score
 
     def _analyze_scraper_coverage(
-        self, papers: List[Dict[str, Any]], issues: List[QualityIssue]
+        self,
+        scraper_counts: Dict[str, int],
+        total_papers: int,
+        issues: List[QualityIssue],
     ) -> float:
         """Analyze scraper coverage distribution."""
-        scraper_counts: Dict[str, int] = {}
-
-        for paper in papers:
-            # Try both possible field names
-            scraper = paper.get("collection_source") or paper.get(
-                "scraper_source", "Unknown"
-            )
-            scraper_counts[scraper] = scraper_counts.get(scraper, 0) + 1
-
         if not scraper_counts:
             return 0.0
 
         # Check for scraper diversity
-        total_papers = len(papers)
         unknown_count = scraper_counts.get("Unknown", 0)
 
         if len(scraper_counts) == 1 and "Unknown" in scraper_counts:
@@ -912,3 +1066,81 @@ class CoverageValidator(BaseValidator):
         scraper_score = min(1.0, known_scrapers / 3)  # Assume 3 scrapers is good
 
         return scraper_score
+
+
+class CoverageAccumulator(ValidationAccumulator):
+    """Paper counts per venue, year and scraper."""
+
+    validator: CoverageValidator
+
+    def __init__(self, validator: CoverageValidator, config: QualityConfig):
+        super().__init__(validator, config)
+        self.venue_counts: Dict[str, int] = {}
+        self.year_counts: Dict[int, int] = {}
+        self.scraper_counts: Dict[str, int] = {}
+
+    def _add(self, papers: List[Dict[str, Any]], start: int):
+        for paper in papers:
+            venue = paper.get("venue", "Unknown")
+            self.venue_counts[venue] = self.venue_counts.get(venue, 0) + 1
+
+            year = paper.get("year")
+            if year is not None:
+                try:
+                    year_int = int(year)
+                    self.year_counts[year_int] = self.year_counts.get(year_int, 0) + 1
+                except (ValueError, TypeError):
+                    pass
+
+            # Try both possible field names
+            scraper = paper.get("collection_source") or paper.get(
+                "scraper_source", "Unknown"
+            )
+            self.scraper_counts[scraper] = self.scraper_counts.get(scraper, 0) + 1
+
+    def result(self) -> QualityCheckResult:
+        """Validate collection coverage."""
+        validator = self.validator
+        issues: List[QualityIssue] = []
+
+        if not self.total_papers:
+            issues.append(
+                validator._create_issue(
+                    QualityIssueLevel.CRITICAL,
+                    "coverage",
+                    "No papers collected",
+                    "Verify collection process and scraper functionality",
+                )
+            )
+            return QualityCheckResult(
+                check_name="coverage_check",
+                check_type=validator.get_check_type(),
+                passed=False,
+                score=0.0,
+                issues=issues,
+            )
+
+        # Analyze venue coverage
+        venue_score = validator._analyze_venue_coverage(
+            self.venue_counts, self.total_papers, issues
+        )
+
+        # Analyze year coverage
+        year_score = validator._analyze_year_coverage(self.year_counts, issues)
+
+        # Analyze scraper coverage
+        scraper_score = validator._analyze_scraper_coverage(
+            self.scraper_counts, self.total_papers, issues
+        )
+
+        # Overall score
+        overall_score = (venue_score + year_score + scraper_score) / 3
+        passed = overall_score >= 0.6  # Lower threshold for coverage
+
+        return QualityCheckResult(
+            check_name="coverage_check",
+            check_type=validator.get_check_type(),
+            passed=passed,
+            score=overall_score,
+            issues=issues,
+        )
@@ -8,7 +8,7 @@ import threading
 import psutil
 import traceback
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Callable
 from enum import Enum
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
@@ -22,6 +22,11 @@ from compute_forecast.pipeline.analysis.computational.analyzer import (
 )
 from compute_forecast.quality.quality_analyzer import QualityAnalyzer
 
+if TYPE_CHECKING:
+    from compute_forecast.testing.integration.performance_monitor import (
+        PerformanceMonitor,
+    )
+
 
 class PipelinePhase(Enum):
     """Pipeline execution phases"""
@@ -94,8 +99,14 @@ class EndToEndTestFramework:
     Coordinates all pipeline phases and tracks metrics.
     """
 
-    def __init__(self, config: PipelineConfig):
+    def __init__(
+        self,
+        config: PipelineConfig,
+        performance_monitor: Optional["PerformanceMonitor"] = None,
+    ):
         self.config = config
+        # Profiles each phase when set, the caller starts and stops monitoring
+        self.performance_monitor = performance_monitor
         self.phase_validators: Dict[PipelinePhase, Callable[[Any], bool]] = {}
         self.phase_metrics: Dict[str, PhaseMetrics] = {}
         self.performance_profiles: Dict[PipelinePhase, PerformanceProfile] = {}
@@ -192,13 +203,24 @@ class EndToEndTestFramework:
             if phase not in self.performance_profiles:
                 self.performance_profiles[phase] = PerformanceProfile(phase=phase)
 
+            if self.performance_monitor:
+                self.performance_monitor.start_phase_monitoring(phase)
+
             # Execute phase with timeout
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._run_phase_logic, phase, data, metrics)
+            try:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(
+                        self._run_phase_logic, phase, data, metrics
+                    )
 
-                phases = self.config.phases_to_test or []
-                timeout = self.config.max_execution_time_seconds / max(len(phases), 1)
-                output_data = future.result(timeout=timeout)
+                    phases = self.config.phases_to_test or []
+                    timeout = self.config.max_execution_time_seconds / max(
+                        len(phases), 1
+                    )
+                    output_data = future.result(timeout=timeout)
+            finally:
+                if self.performance_monitor:
+                    self.performance_monitor.stop_phase_monitoring(phase)
 
             metrics.success = True
             metrics.complete()
@@ -0,0 +1,216 @@
+"""
+Statistical comparison of repeated performance measurements.
+
+Single timings on a shared machine vary by more than the regressions worth
+catching, so baseline and current runs are compared as samples: a
+Mann-Whitney U test decides whether the two distributions differ, and a
+bootstrap confidence interval bounds the relative change of their medians.
+Both are implemented with numpy only.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Below this many samples per side no comparison is attempted
+MIN_SAMPLES = 3
+# Largest sample sizes for which the exact U distribution is computed
+EXACT_MAX_SAMPLES = 50
+
+VERDICTS = ["unchanged", "improvement", "inconclusive", "regression"]
+
+
+def rank_with_ties(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Ranks starting at 1 with ties averaged, and the size of each tie group."""
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    # Average of the ranks spanned by each group of equal values
+    upper = np.cumsum(counts)
+    group_ranks = upper - (counts - 1) / 2.0
+    return group_ranks[inverse], counts
+
+
+def _exact_u_counts(n1: int, n2: int) -> np.ndarray:
+    """Number of orderings of n1 + n2 distinct values giving each U value."""
+    # counts[j] holds the distribution for (i, j), built up one i at a time.
+    # The largest value either comes from the first sample, adding j to U,
+    # or from the second sample.
+    counts = [np.ones(1) for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        row = [np.ones(1)]
+        for j in range(1, n2 + 1):
+            distribution = np.zeros(i * j + 1)
+            first_largest = counts[j]
+            distribution[j : j + len(first_largest)] += first_largest
+            second_largest = row[j - 1]
+            distribution[: len(second_largest)] += second_largest
+            row.append(distribution)
+        counts = row
+    return counts[n2]
+
+
+def mann_whitney_u(
+    first: Sequence[float], second: Sequence[float]
+) -> Tuple[float, float]:
+    """Two-sided Mann-Whitney U test.
+
+    Uses the exact distribution of U for small samples without ties, and the
+    normal approximation with tie and continuity corrections otherwise.
+
+    Returns:
+        U statistic of the first sample and the p-value
+    """
+    x = np.asarray(first, dtype=float)
+    y = np.asarray(second, dtype=float)
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Both samples need at least one value")
+
+    ranks, tie_counts = rank_with_ties(np.concatenate([x, y]))
+    u = float(ranks[:n1].sum() - n1 * (n1 + 1) / 2.0)
+    has_ties = bool((tie_counts > 1).any())
+
+    if not has_ties and max(n1, n2) <= EXACT_MAX_SAMPLES:
+        counts = _exact_u_counts(n1, n2)
+        total = counts.sum()
+        lower = counts[: int(u) + 1].sum() / total
+        upper = counts[int(u) :].sum() / total
+        return u, float(min(1.0, 2 * min(lower, upper)))
+
+    n = n1 + n2
+    mean = n1 * n2 / 2.0
+    tie_term = float((tie_counts**3 - tie_counts).sum()) / (n * (n - 1))
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0:
+        # Every value is equal
+        return u, 1.0
+    z = max(abs(u - mean) - 0.5, 0.0) / math.sqrt(variance)
+    return u, math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_change_interval(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Percentile bootstrap interval of the relative change of the medians.
+
+    Returns:
+        Lower and upper bound of current median / baseline median - 1
+    """
+    baseline_values = np.asarray(baseline, dtype=float)
+    current_values = np.asarray(current, dtype=float)
+    rng = np.random.default_rng(seed)
+
+    baseline_medians = np.median(
+        rng.choice(baseline_values, size=(resamples, len(baseline_values))), axis=1
+    )
+    current_medians = np.median(
+        rng.choice(current_values, size=(resamples, len(current_values))), axis=1
+    )
+    valid = baseline_medians != 0
+    if not valid.any():
+        return 0.0, 0.0
+    changes = current_medians[valid] / baseline_medians[valid] - 1
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(changes, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+@dataclass
+class SampleComparison:
+    """Comparison of one metric between baseline and current samples"""
+
+    metric_name: str
+    baseline_median: float
+    current_median: float
+    change_percent: float  # Relative change of the medians
+    ci_low: float
+    ci_high: float
+    p_value: float
+    verdict: str  # "unchanged", "improvement", "inconclusive", "regression"
+
+
+def compare_samples(
+    metric_name: str,
+    baseline: Sequence[float],
+    current: Sequence[float],
+    lower_is_better: bool = True,
+    alpha: float = 0.05,
+    min_effect: float = 0.05,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> SampleComparison:
+    """Compare the samples of a metric from two sets of runs.
+
+    A change is a regression or improvement only when the U test rejects
+    equal distributions at alpha, the bootstrap interval excludes no change,
+    and the median moved by at least min_effect. Changes that are significant
+    but below min_effect are reported as unchanged.
+
+    Args:
+        metric_name: Name of the metric
+        baseline: Baseline samples
+        current: Current samples
+        lower_is_better: Whether a decrease is an improvement
+        alpha: Significance level of the U test
+        min_effect: Smallest relative change of the medians worth reporting
+        confidence: Confidence level of the bootstrap interval
+        seed: Seed of the bootstrap resampling
+    """
+    baseline_median = float(np.median(baseline)) if len(baseline) else 0.0
+    current_median = float(np.median(current)) if len(current) else 0.0
+
+    if len(baseline) < MIN_SAMPLES or len(current) < MIN_SAMPLES:
+        return SampleComparison(
+            metric_name=metric_name,
+            baseline_median=baseline_median,
+            current_median=current_median,
+            change_percent=_relative_change(baseline_median, current_median),
+            ci_low=float("-inf"),
+            ci_high=float("inf"),
+            p_value=1.0,
+            verdict="inconclusive",
+        )
+
+    _, p_value = mann_whitney_u(current, baseline)
+    ci_low, ci_high = bootstrap_change_interval(
+        baseline, current, confidence=confidence, seed=seed
+    )
+    change = _relative_change(baseline_median, current_median)
+
+    if baseline_median == 0:
+        verdict = "unchanged" if current_median == 0 else "inconclusive"
+    elif p_value >= alpha or ci_low <= 0 <= ci_high or abs(change) < min_effect:
+        verdict = "unchanged"
+    elif (change > 0) == lower_is_better:
+        verdict = "regression"
+    else:
+        verdict = "improvement"
+
+    return SampleComparison(
+        metric_name=metric_name,
+        baseline_median=baseline_median,
+        current_median=current_median,
+        change_percent=change,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        p_value=p_value,
+        verdict=verdict,
+    )
+
+
+def combine_verdicts(verdicts: Sequence[str]) -> Optional[str]:
+    """Verdict of a group of metrics, the most severe of their verdicts."""
+    if not verdicts:
+        return None
+    return max(verdicts, key=VERDICTS.index)
+
+
+def _relative_change(baseline: float, current: float) -> float:
+    if baseline == 0:
+        return 0.0
+    return (current - baseline) / baseline
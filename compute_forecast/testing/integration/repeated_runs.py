@@ -0,0 +1,131 @@
+"""
+Repeated measurement runs for performance comparisons.
+
+Each repetition runs in a fresh spawned process, pinned to one CPU where the
+platform allows it, after warm-up runs that fill import and data caches.
+Fresh processes keep the heap growth and cached state of one repetition
+from leaking into the next.
+"""
+
+import gc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import psutil
+
+Measurement = Dict[str, Any]
+
+
+def default_cpus() -> Optional[List[int]]:
+    """The last CPU this process may run on, usually the least busy one.
+
+    Returns None when CPU affinity is not supported on this platform.
+    """
+    try:
+        allowed = psutil.Process().cpu_affinity()
+    except (AttributeError, psutil.Error, OSError):
+        return None
+    return [max(allowed)] if allowed else None
+
+
+def pin_to_cpus(cpus: Sequence[int]) -> bool:
+    """Restrict this process to cpus, returns whether it succeeded."""
+    try:
+        psutil.Process().cpu_affinity(list(cpus))
+        return True
+    except (AttributeError, psutil.Error, OSError, ValueError):
+        return False
+
+
+def _warm_run(
+    measure: Callable[..., Measurement],
+    args: Sequence[Any],
+    warmup: int,
+    cpus: Optional[Sequence[int]],
+) -> Measurement:
+    """Warm up, then measure once. Runs in the repetition's process."""
+    if cpus:
+        pin_to_cpus(cpus)
+    for _ in range(warmup):
+        measure(*args)
+    gc.collect()
+    return measure(*args)
+
+
+class RepeatedRunner:
+    """Runs a measurement function repeatedly under controlled conditions."""
+
+    def __init__(
+        self,
+        repetitions: int = 5,
+        warmup: int = 1,
+        isolate: bool = True,
+        pin_cpu: bool = True,
+        cpus: Optional[Sequence[int]] = None,
+    ):
+        """
+        Args:
+            repetitions: Measured runs
+            warmup: Unmeasured runs before measuring, per process when
+                isolated, once otherwise
+            isolate: Run each repetition in a fresh spawned process. The
+                measurement function and its arguments must be picklable.
+            pin_cpu: Pin the measuring process to cpus
+            cpus: CPUs to pin to, defaults to the last available CPU
+        """
+        if repetitions < 1:
+            raise ValueError(f"repetitions must be >= 1, got {repetitions}")
+        if warmup < 0:
+            raise ValueError(f"warmup must be >= 0, got {warmup}")
+        self.repetitions = repetitions
+        self.warmup = warmup
+        self.isolate = isolate
+        self.cpus: Optional[List[int]] = None
+        if pin_cpu:
+            self.cpus = list(cpus) if cpus else default_cpus()
+
+    def run(self, measure: Callable[..., Measurement], *args: Any) -> List[Measurement]:
+        """Measure repetitions times and return the measurements in order."""
+        if self.isolate:
+            return self._run_isolated(measure, args)
+        return self._run_in_process(measure, args)
+
+    def _run_isolated(
+        self, measure: Callable[..., Measurement], args: Sequence[Any]
+    ) -> List[Measurement]:
+        # Repetitions run one after another so that they never compete
+        # for the CPU
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            return [
+                pool.submit(_warm_run, measure, args, self.warmup, self.cpus).result()
+                for _ in range(self.repetitions)
+            ]
+
+    def _run_in_process(
+        self, measure: Callable[..., Measurement], args: Sequence[Any]
+    ) -> List[Measurement]:
+        process = psutil.Process()
+        previous_cpus = None
+        if self.cpus:
+            try:
+                previous_cpus = process.cpu_affinity()
+            except (AttributeError, psutil.Error, OSError):
+                previous_cpus = None
+            pin_to_cpus(self.cpus)
+
+        try:
+            for _ in range(self.warmup):
+                measure(*args)
+            measurements = []
+            for _ in range(self.repetitions):
+                gc.collect()
+                measurements.append(measure(*args))
+            return measurements
+        finally:
+            if previous_cpus:
+                pin_to_cpus(previous_cpus)
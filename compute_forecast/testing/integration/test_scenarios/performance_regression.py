@@ -2,15 +2,23 @@
 Performance Regression Test Scenario
 Compares current pipeline performance against established baselines.
 Detects performance degradation and generates optimization recommendations.
+
+The pipeline is measured over warm-up runs and repeated, isolated runs. The
+baseline file stores the samples of every run, overall and per phase, and
+runs are compared with Mann-Whitney U tests and bootstrap confidence
+intervals so that noise alone does not raise regressions.
 """
 
 import time
 import json
 import os
+import statistics
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 
+import psutil
+
 from compute_forecast.testing.integration.pipeline_test_framework import (
     EndToEndTestFramework,
     PipelineConfig,
@@ -19,8 +27,25 @@ from compute_forecast.testing.integration.performance_monitor import (
     PerformanceMonitor,
     BottleneckAnalyzer,
 )
+from compute_forecast.testing.integration.regression_statistics import (
+    MIN_SAMPLES,
+    combine_verdicts,
+    compare_samples,
+)
+from compute_forecast.testing.integration.repeated_runs import RepeatedRunner
 from compute_forecast.testing.mock_data.generators import MockDataGenerator
 
+# Overall metrics: baseline attribute, sample key, whether lower is better
+OVERALL_METRICS = [
+    ("execution_time", "execution_time_seconds", True),
+    ("peak_memory", "peak_memory_mb", True),
+    ("throughput", "throughput_papers_per_second", False),
+    ("cpu_utilization", "cpu_utilization", True),
+    ("memory_efficiency", "memory_efficiency", False),
+]
+# Phase metrics compared between runs, and whether lower is better
+PHASE_METRICS = [("duration", True), ("peak_memory", True)]
+
 
 @dataclass
 class PerformanceBaseline:
@@ -35,6 +60,11 @@ class PerformanceBaseline:
     phase_metrics: Dict[str, Dict[str, float]]
     cpu_utilization: float
     memory_efficiency: float
+    # Values of each run, the fields above hold their medians. Empty in
+    # baselines recorded from a single run.
+    repetitions: int = 1
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    phase_samples: Dict[str, Dict[str, List[float]]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -56,6 +86,20 @@ class RegressionAnalysis:
     change_percent: float
     is_regression: bool
     severity: str  # "low", "medium", "high", "critical"
+    verdict: str = "unchanged"  # "improvement", "inconclusive", "regression"
+    p_value: Optional[float] = None
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+
+    def describe(self) -> str:
+        """Change of the metric, with its confidence interval when known"""
+        text = f"{self.metric_name}: {self.change_percent:+.1%}"
+        if self.ci_low is not None and self.ci_high is not None:
+            text += (
+                f" (95% CI {self.ci_low:+.1%} to {self.ci_high:+.1%}, "
+                f"p={self.p_value:.3f})"
+            )
+        return text
 
 
 @dataclass
@@ -73,6 +117,73 @@ class PerformanceRegressionResult:
     recommendations: List[str]
     execution_time_seconds: float
     errors: List[str]
+    # Verdict per pipeline phase, the most severe of its metric verdicts
+    phase_verdicts: Dict[str, str] = field(default_factory=dict)
+
+
+def measure_pipeline_run(config: PipelineConfig, seed: int = 42) -> Dict[str, Any]:
+    """Run the pipeline once on generated papers and measure it.
+
+    Module level so that it can run in the isolated processes of
+    RepeatedRunner. Generating the papers is not measured.
+    """
+    from compute_forecast.testing.mock_data.configs import (
+        MockDataConfig,
+        DataQuality,
+    )
+
+    test_papers = MockDataGenerator().generate(
+        MockDataConfig(
+            size=config.test_data_size, quality=DataQuality.NORMAL, seed=seed
+        )
+    )
+
+    monitor = PerformanceMonitor()
+    framework = EndToEndTestFramework(config, performance_monitor=monitor)
+    monitor.start_monitoring()
+    start_time = time.perf_counter()
+    try:
+        pipeline_result = framework.run_pipeline(test_papers)
+    finally:
+        execution_time = time.perf_counter() - start_time
+        monitor.stop_monitoring()
+
+    peak_memory = psutil.Process().memory_info().rss / 1024 / 1024
+    cpu_utilization = 0.0
+    phases = {}
+    for phase, profile in monitor.profiles.items():
+        averages = profile.calculate_averages()
+        phase_memory = profile.peak_memory_mb
+        if not profile.snapshots:
+            # Phases shorter than the sampling interval have no snapshots
+            phase_metrics = pipeline_result["phase_metrics"].get(phase.value)
+            phase_memory = phase_metrics.memory_usage_mb if phase_metrics else 0.0
+        peak_memory = max(peak_memory, phase_memory)
+        cpu_utilization = max(cpu_utilization, profile.peak_cpu)
+
+        phases[phase.value] = {
+            "duration": profile.duration_seconds,
+            "peak_cpu": profile.peak_cpu,
+            "peak_memory": phase_memory,
+            "avg_cpu": averages["avg_cpu_percent"],
+            "avg_memory": averages["avg_memory_mb"],
+            "io_rate": profile.get_io_rate_mbps(),
+            "network_rate": profile.get_network_rate_mbps(),
+        }
+
+    papers_processed = len(test_papers)
+    return {
+        "success": pipeline_result["success"],
+        "papers_processed": papers_processed,
+        "execution_time_seconds": execution_time,
+        "peak_memory_mb": peak_memory,
+        "throughput_papers_per_second": papers_processed / execution_time
+        if execution_time > 0
+        else 0,
+        "cpu_utilization": cpu_utilization,
+        "memory_efficiency": papers_processed / peak_memory if peak_memory > 0 else 0,
+        "phases": phases,
+    }
 
 
 class PerformanceRegressionTestScenario:
@@ -85,9 +196,28 @@ class PerformanceRegressionTestScenario:
     - Execution time within 20% of baseline
     - Memory usage within 30% of baseline
     - Throughput within 15% of baseline
+
+    Regressions are only reported for changes that are statistically
+    significant over the repeated runs.
     """
 
-    def __init__(self, baseline_file: Optional[str] = None):
+    def __init__(
+        self,
+        baseline_file: Optional[str] = None,
+        repetitions: int = 5,
+        warmup: int = 1,
+        isolate: bool = True,
+        pin_cpu: bool = True,
+    ):
+        """
+        Args:
+            baseline_file: Baseline JSON file
+            repetitions: Measured pipeline runs, at least 5 are needed for
+                the U test to detect a change at the 5% level
+            warmup: Unmeasured runs before each measured run
+            isolate: Measure each run in a fresh process
+            pin_cpu: Pin the measuring process to one CPU where supported
+        """
         self.config = PipelineConfig(
             test_data_size=1000,  # Standard size for consistent comparison
             max_execution_time_seconds=600,  # 10 minutes
@@ -98,10 +228,10 @@ class PerformanceRegressionTestScenario:
             parallel_workers=4,
         )
 
-        self.framework = EndToEndTestFramework(self.config)
-        self.performance_monitor = PerformanceMonitor()
+        self.runner = RepeatedRunner(
+            repetitions=repetitions, warmup=warmup, isolate=isolate, pin_cpu=pin_cpu
+        )
         self.bottleneck_analyzer = BottleneckAnalyzer()
-        self.mock_generator = MockDataGenerator()
 
         # Baseline management
         self.baseline_file = baseline_file or "performance_baseline.json"
@@ -150,34 +280,19 @@ class PerformanceRegressionTestScenario:
             print("   📊 No baseline found - will establish new baseline")
             save_as_baseline = True
 
-        # Generate test data
-        from compute_forecast.testing.mock_data.configs import (
-            MockDataConfig,
-            DataQuality,
-        )
-
-        mock_config = MockDataConfig(
-            size=self.config.test_data_size, quality=DataQuality.NORMAL
-        )
-        test_papers = self.mock_generator.generate(mock_config)
-        print(f"   ✓ Generated {len(test_papers)} test papers")
-
-        # Start performance monitoring
-        self.performance_monitor.start_monitoring()
-
         try:
             # Execute pipeline
-            print("   🚀 Starting performance measurement...")
-            pipeline_result = self.framework.run_pipeline(test_papers)
-
-            # Stop monitoring
-            self.performance_monitor.stop_monitoring()
+            print(
+                f"   🚀 Measuring {self.runner.repetitions} runs of "
+                f"{self.config.test_data_size} papers "
+                f"({self.runner.warmup} warm-up, "
+                f"{'isolated' if self.runner.isolate else 'in-process'})..."
+            )
+            runs = self.runner.run(measure_pipeline_run, self.config)
 
             # Measure current performance
             execution_time = time.time() - start_time
-            current_performance = self._measure_current_performance(
-                pipeline_result, execution_time, len(test_papers)
-            )
+            current_performance = self._measure_current_performance(runs)
 
             # Save as baseline if requested
             if save_as_baseline:
@@ -200,8 +315,6 @@ class PerformanceRegressionTestScenario:
             return result
 
         except Exception as e:
-            self.performance_monitor.stop_monitoring()
-
             return PerformanceRegressionResult(
                 success=False,
                 baseline_version="unknown",
@@ -217,50 +330,44 @@ class PerformanceRegressionTestScenario:
             )
 
     def _measure_current_performance(
-        self,
-        pipeline_result: Dict[str, Any],
-        execution_time: float,
-        papers_processed: int,
+        self, runs: List[Dict[str, Any]]
     ) -> PerformanceBaseline:
-        """Measure current performance metrics"""
-
-        # Calculate throughput
-        throughput = papers_processed / execution_time if execution_time > 0 else 0
-
-        # Get peak memory and CPU utilization
-        peak_memory = 0.0
-        cpu_utilization = 0.0
-        phase_metrics = {}
-
-        for phase, profile in self.performance_monitor.profiles.items():
-            if profile.snapshots:
-                averages = profile.calculate_averages()
-                peak_memory = max(peak_memory, profile.peak_memory_mb)
-                cpu_utilization = max(cpu_utilization, profile.peak_cpu)
-
-                phase_metrics[phase.value] = {
-                    "duration": profile.duration_seconds,
-                    "peak_cpu": profile.peak_cpu,
-                    "peak_memory": profile.peak_memory_mb,
-                    "avg_cpu": averages["avg_cpu_percent"],
-                    "avg_memory": averages["avg_memory_mb"],
-                    "io_rate": profile.get_io_rate_mbps(),
-                    "network_rate": profile.get_network_rate_mbps(),
-                }
+        """Summarize the measured runs into medians and per-run samples"""
+        samples = {
+            attribute: [float(run[attribute]) for run in runs]
+            for _, attribute, _ in OVERALL_METRICS
+        }
 
-        # Calculate memory efficiency
-        memory_efficiency = papers_processed / peak_memory if peak_memory > 0 else 0
+        # Phases missing from a run, after a failure, are left out of
+        # that phase's samples
+        phase_samples: Dict[str, Dict[str, List[float]]] = {}
+        for run in runs:
+            for phase_name, metrics in run["phases"].items():
+                phase = phase_samples.setdefault(phase_name, {})
+                for metric, value in metrics.items():
+                    phase.setdefault(metric, []).append(float(value))
 
         return PerformanceBaseline(
             version=f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             date=datetime.now().isoformat(),
-            test_data_size=papers_processed,
-            execution_time_seconds=execution_time,
-            peak_memory_mb=peak_memory,
-            throughput_papers_per_second=throughput,
-            phase_metrics=phase_metrics,
-            cpu_utilization=cpu_utilization,
-            memory_efficiency=memory_efficiency,
+            test_data_size=runs[0]["papers_processed"],
+            execution_time_seconds=statistics.median(samples["execution_time_seconds"]),
+            peak_memory_mb=statistics.median(samples["peak_memory_mb"]),
+            throughput_papers_per_second=statistics.median(
+                samples["throughput_papers_per_second"]
+            ),
+            phase_metrics={
+                phase_name: {
+                    metric: statistics.median(values)
+                    for metric, values in metrics.items()
+                }
+                for phase_name, metrics in phase_samples.items()
+            },
+            cpu_utilization=statistics.median(samples["cpu_utilization"]),
+            memory_efficiency=statistics.median(samples["memory_efficiency"]),
+            repetitions=len(runs),
+            samples=samples,
+            phase_samples=phase_samples,
         )
 
     def _analyze_regression(
@@ -274,82 +381,63 @@ class PerformanceRegressionTestScenario:
         critical_issues = []
 
         # Overall metrics analysis
-        analyses = [
-            self._analyze_metric(
-                "execution_time",
-                self.baseline.execution_time_seconds if self.baseline else 0,
-                current.execution_time_seconds,
-                lower_is_better=True,
-            ),
-            self._analyze_metric(
-                "peak_memory",
-                self.baseline.peak_memory_mb if self.baseline else 0,
-                current.peak_memory_mb,
-                lower_is_better=True,
-            ),
-            self._analyze_metric(
-                "throughput",
-                self.baseline.throughput_papers_per_second if self.baseline else 0,
-                current.throughput_papers_per_second,
-                lower_is_better=False,
-            ),
-            self._analyze_metric(
-                "cpu_utilization",
-                self.baseline.cpu_utilization if self.baseline else 0,
-                current.cpu_utilization,
-                lower_is_better=True,
-            ),
-            self._analyze_metric(
-                "memory_efficiency",
-                self.baseline.memory_efficiency if self.baseline else 0,
-                current.memory_efficiency,
-                lower_is_better=False,
-            ),
-        ]
-
-        regression_analyses.extend(analyses)
+        baseline = self.baseline or self._create_empty_baseline()
+        for name, attribute, lower_is_better in OVERALL_METRICS:
+            regression_analyses.append(
+                self._compare_metric(
+                    name,
+                    getattr(baseline, attribute),
+                    getattr(current, attribute),
+                    baseline.samples.get(attribute, []),
+                    current.samples.get(attribute, []),
+                    lower_is_better,
+                )
+            )
 
         # Phase-level analysis
-        baseline_phases = self.baseline.phase_metrics if self.baseline else {}
-        for phase_name in set(baseline_phases.keys()) | set(
-            current.phase_metrics.keys()
+        phase_verdicts = {}
+        for phase_name in sorted(
+            set(baseline.phase_metrics.keys()) | set(current.phase_metrics.keys())
         ):
-            baseline_phase = baseline_phases.get(phase_name, {})
+            baseline_phase = baseline.phase_metrics.get(phase_name, {})
             current_phase = current.phase_metrics.get(phase_name, {})
-
-            if baseline_phase and current_phase:
-                phase_analyses = [
-                    self._analyze_metric(
-                        f"{phase_name}_duration",
-                        baseline_phase.get("duration", 0),
-                        current_phase.get("duration", 0),
-                        lower_is_better=True,
-                    ),
-                    self._analyze_metric(
-                        f"{phase_name}_peak_memory",
-                        baseline_phase.get("peak_memory", 0),
-                        current_phase.get("peak_memory", 0),
-                        lower_is_better=True,
-                    ),
-                ]
-                regression_analyses.extend(phase_analyses)
+            if not baseline_phase:
+                phase_verdicts[phase_name] = "new"
+                continue
+            if not current_phase:
+                phase_verdicts[phase_name] = "missing"
+                continue
+
+            baseline_phase_samples = baseline.phase_samples.get(phase_name, {})
+            current_phase_samples = current.phase_samples.get(phase_name, {})
+            phase_analyses = [
+                self._compare_metric(
+                    f"{phase_name}_{metric}",
+                    baseline_phase.get(metric, 0),
+                    current_phase.get(metric, 0),
+                    baseline_phase_samples.get(metric, []),
+                    current_phase_samples.get(metric, []),
+                    lower_is_better,
+                )
+                for metric, lower_is_better in PHASE_METRICS
+            ]
+            regression_analyses.extend(phase_analyses)
+            phase_verdicts[phase_name] = (
+                combine_verdicts([analysis.verdict for analysis in phase_analyses])
+                or "unchanged"
+            )
 
         # Categorize results
         for analysis in regression_analyses:
             if analysis.is_regression:
                 if analysis.severity == "critical":
                     critical_issues.append(
-                        f"Critical regression in {analysis.metric_name}: "
-                        f"{analysis.change_percent:+.1%}"
+                        f"Critical regression in {analysis.describe()}"
                     )
                 else:
-                    regressions.append(
-                        f"{analysis.metric_name}: {analysis.change_percent:+.1%}"
-                    )
-            elif analysis.change_percent < -0.05:  # 5% improvement
-                improvements.append(
-                    f"{analysis.metric_name}: {analysis.change_percent:+.1%}"
-                )
+                    regressions.append(analysis.describe())
+            elif analysis.verdict == "improvement":
+                improvements.append(analysis.describe())
 
         # Calculate overall regression score
         regression_score = self._calculate_regression_score(regression_analyses)
@@ -374,6 +462,44 @@ class PerformanceRegressionTestScenario:
             recommendations=recommendations,
             execution_time_seconds=execution_time,
             errors=[],
+            phase_verdicts=phase_verdicts,
+        )
+
+    def _compare_metric(
+        self,
+        metric_name: str,
+        baseline_value: float,
+        current_value: float,
+        baseline_samples: List[float],
+        current_samples: List[float],
+        lower_is_better: bool = True,
+    ) -> RegressionAnalysis:
+        """Compare a metric statistically, or by value for single-run baselines"""
+        if len(baseline_samples) < MIN_SAMPLES or len(current_samples) < MIN_SAMPLES:
+            return self._analyze_metric(
+                metric_name, baseline_value, current_value, lower_is_better
+            )
+
+        comparison = compare_samples(
+            metric_name,
+            baseline_samples,
+            current_samples,
+            lower_is_better=lower_is_better,
+        )
+        is_regression = comparison.verdict == "regression"
+        return RegressionAnalysis(
+            metric_name=metric_name,
+            baseline_value=comparison.baseline_median,
+            current_value=comparison.current_median,
+            change_percent=comparison.change_percent,
+            is_regression=is_regression,
+            severity=self._severity(comparison.change_percent)
+            if is_regression
+            else "low",
+            verdict=comparison.verdict,
+            p_value=comparison.p_value,
+            ci_low=comparison.ci_low,
+            ci_high=comparison.ci_high,
         )
 
     def _analyze_metric(
@@ -396,27 +522,33 @@ class PerformanceRegressionTestScenario:
         else:
             is_regression = change_percent < 0
 
-        # Determine severity
         abs_change = abs(change_percent)
-        if abs_change < 0.05:  # 5%
-            severity = "low"
-        elif abs_change < 0.15:  # 15%
-            severity = "medium"
-        elif abs_change < 0.3:  # 30%
-            severity = "high"
+        if abs_change <= 0.05:  # Only count >5% as a change
+            verdict = "unchanged"
         else:
-            severity = "critical"
+            verdict = "regression" if is_regression else "improvement"
 
         return RegressionAnalysis(
             metric_name=metric_name,
             baseline_value=baseline_value,
             current_value=current_value,
             change_percent=change_percent,
-            is_regression=is_regression
-            and abs_change > 0.05,  # Only count >5% as regression
-            severity=severity if is_regression else "low",
+            is_regression=verdict == "regression",
+            severity=self._severity(change_percent) if is_regression else "low",
+            verdict=verdict,
         )
 
+    def _severity(self, change_percent: float) -> str:
+        """Severity of a regression by the size of the change"""
+        abs_change = abs(change_percent)
+        if abs_change < 0.05:  # 5%
+            return "low"
+        elif abs_change < 0.15:  # 15%
+            return "medium"
+        elif abs_change < 0.3:  # 30%
+            return "high"
+        return "critical"
+
     def _calculate_regression_score(self, analyses: List[RegressionAnalysis]) -> float:
         """Calculate overall regression score (0.0 = bad, 1.0 = good)"""
         if not analyses:
@@ -539,6 +671,12 @@ class PerformanceRegressionTestScenario:
         print(f"   Peak Memory: {current.peak_memory_mb:.0f}MB")
         print(f"   CPU Utilization: {current.cpu_utilization:.1f}%")
         print(f"   Memory Efficiency: {current.memory_efficiency:.2f} papers/MB")
+        print(f"   Repetitions: {current.repetitions} (medians shown)")
+
+        if result.phase_verdicts:
+            print("\n🧭 Phase Verdicts:")
+            for phase_name, verdict in result.phase_verdicts.items():
+                print(f"   • {phase_name}: {verdict}")
 
         if result.critical_issues:
             print("\n🚨 Critical Issues:")
@@ -564,10 +702,16 @@ class PerformanceRegressionTestScenario:
 
 
 def run_performance_regression_test(
-    baseline_file: Optional[str] = None, save_as_baseline: bool = False
+    baseline_file: Optional[str] = None,
+    save_as_baseline: bool = False,
+    repetitions: int = 5,
+    warmup: int = 1,
+    isolate: bool = True,
 ) -> PerformanceRegressionResult:
     """Convenience function to run performance regression test"""
-    scenario = PerformanceRegressionTestScenario(baseline_file)
+    scenario = PerformanceRegressionTestScenario(
+        baseline_file, repetitions=repetitions, warmup=warmup, isolate=isolate
+    )
     return scenario.run_test(save_as_baseline)
 
 
@@ -576,14 +720,19 @@ if __name__ == "__main__":
 
     # Check for command line arguments
     save_baseline = "--save-baseline" in sys.argv
+    isolate = "--no-isolation" not in sys.argv
     baseline_file = None
+    repetitions = 5
 
-    # Look for baseline file argument
+    # Look for baseline file and repetition arguments
     for i, arg in enumerate(sys.argv):
         if arg == "--baseline" and i + 1 < len(sys.argv):
             baseline_file = sys.argv[i + 1]
-            break
+        elif arg == "--repetitions" and i + 1 < len(sys.argv):
+            repetitions = int(sys.argv[i + 1])
 
     # Run performance regression test
-    result = run_performance_regression_test(baseline_file, save_baseline)
+    result = run_performance_regression_test(
+        baseline_file, save_baseline, repetitions=repetitions, isolate=isolate
+    )
     exit(0 if result.success else 1)
@@ -0,0 +1,340 @@
+"""
+Process-wide rate-limit governor keyed by API provider
+
+Every client talking to a provider reserves its requests from the same
+bucket, so for example the OpenAlex collector and the OpenAlex consolidation
+source share one budget. Each bucket is kept as a theoretical arrival time
+(GCRA), which behaves like a token bucket but fits in a few numbers, so it can
+also be shared between processes through a locked state file.
+
+The rate adapts with AIMD: a throttled response (HTTP 429) halves it, each
+success adds back a fraction of the configured rate, and Retry-After headers
+pause the provider for the requested time.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock, coordination stays in-process
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Directory of shared state files for the process-wide governor
+STATE_DIR_ENV = "COMPUTE_FORECAST_RATE_STATE_DIR"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, in seconds or HTTP-date form"""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class ProviderMetrics:
+    """Request and throttling counters of one provider"""
+
+    provider: str
+    configured_rate: float
+    current_rate: float
+    requests: int = 0
+    successes: int = 0
+    throttled: int = 0
+    total_wait_seconds: float = 0.0
+    blocked_until: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class _ProviderState:
+    """Bucket state of one provider, guarded by its lock"""
+
+    def __init__(self, provider: str, rate: float, burst: float):
+        self.lock = threading.Lock()
+        self.burst = burst
+        self.tat = 0.0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.metrics = ProviderMetrics(provider, rate, rate)
+
+    @property
+    def rate(self) -> float:
+        return self.metrics.current_rate
+
+    @rate.setter
+    def rate(self, value: float):
+        self.metrics.current_rate = value
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "tat": self.tat,
+            "rate": self.rate,
+            "blocked_until": self.blocked_until,
+            "last_decrease": self.last_decrease,
+        }
+
+    def load(self, data: Dict[str, float]):
+        self.tat = max(self.tat, data.get("tat", 0.0))
+        self.blocked_until = max(self.blocked_until, data.get("blocked_until", 0.0))
+        self.last_decrease = max(self.last_decrease, data.get("last_decrease", 0.0))
+        if "rate" in data:
+            self.rate = min(data["rate"], self.metrics.configured_rate)
+        self.metrics.blocked_until = self.blocked_until
+
+
+class RateGovernor:
+    """Adaptive request admission shared by all clients of a provider"""
+
+    def __init__(
+        self,
+        state_dir: Optional[Union[str, Path]] = None,
+        increase_fraction: float = 0.05,
+        decrease_factor: float = 0.5,
+        min_rate_fraction: float = 0.05,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        Args:
+            state_dir: Directory of per-provider state files shared between
+                processes. Without it the governor only coordinates threads
+                and tasks of this process.
+            increase_fraction: Share of the configured rate added per success
+            decrease_factor: Rate multiplier applied on a throttled response
+            min_rate_fraction: Lowest rate as a share of the configured rate
+            max_retry_after: Cap on the pause requested by Retry-After
+        """
+        self.increase_fraction = increase_fraction
+        self.decrease_factor = decrease_factor
+        self.min_rate_fraction = min_rate_fraction
+        self.max_retry_after = max_retry_after
+        self._providers: Dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+
+        self.state_dir: Optional[Path] = None
+        if state_dir is not None:
+            if fcntl is None:
+                logger.warning(
+                    "File locks are unavailable, rate limits are not shared "
+                    "between processes"
+                )
+            else:
+                self.state_dir = Path(state_dir)
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def register(self, provider: str, rate: float, burst: float = 1.0):
+        """Declare a provider's rate limit in requests per second
+
+        Clients registering the same provider with different limits share the
+        most conservative one.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate limit of '{provider}' must be positive")
+
+        with self._lock:
+            state = self._providers.get(provider)
+            if state is None:
+                self._providers[provider] = _ProviderState(
+                    provider, rate, max(burst, 1.0)
+                )
+                return
+
+        with state.lock:
+            metrics = state.metrics
+            if rate < metrics.configured_rate:
+                metrics.configured_rate = rate
+                state.rate = min(state.rate, rate)
+            state.burst = min(state.burst, max(burst, 1.0))
+
+    def is_registered(self, provider: str) -> bool:
+        return provider in self._providers
+
+    def reserve(self, provider: str) -> float:
+        """Reserve the next request slot, returns the seconds to wait for it
+
+        Raises:
+            ValueError: If the provider is not registered
+        """
+        state = self._get(provider)
+        with state.lock, self._shared(provider, state):
+            now = time.time()
+            interval = 1.0 / state.rate
+            start = max(state.tat, now, state.blocked_until)
+            state.tat = start + interval
+            allowed_at = max(
+                state.tat - state.burst * interval, now, state.blocked_until
+            )
+            wait = allowed_at - now
+
+            state.metrics.requests += 1
+            state.metrics.total_wait_seconds += wait
+        return wait
+
+    def acquire(self, provider: str) -> float:
+        """Block until a request to the provider may start"""
+        wait = self.reserve(provider)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, provider: str) -> float:
+        """Wait without blocking the event loop until a request may start"""
+        wait = self.reserve(provider)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def blocked_for(self, provider: str) -> float:
+        """Seconds until a Retry-After pause of the provider ends"""
+        state = self._providers.get(provider)
+        if state is None:
+            return 0.0
+        with state.lock, self._shared(provider, state):
+            return max(0.0, state.blocked_until - time.time())
+
+    def record_success(self, provider: str):
+        """Additive increase of the rate after a successful request"""
+        state = self._providers.get(provider)
+        if state is None:
+            return
+        with state.lock, self._shared(provider, state):
+            configured = state.metrics.configured_rate
+            state.rate = min(
+                configured, state.rate + self.increase_fraction * configured
+            )
+            state.metrics.successes += 1
+
+    def record_throttle(self, provider: str, retry_after: Optional[float] = None):
+        """Multiplicative decrease of the rate after a throttled request
+
+        Concurrent requests throttled together lower the rate once, as the
+        decrease is applied at most once per request interval.
+        """
+        state = self._providers.get(provider)
+        if state is None:
+            return
+        with state.lock, self._shared(provider, state):
+            now = time.time()
+            state.metrics.throttled += 1
+
+            if now - state.last_decrease >= 1.0 / state.rate:
+                min_rate = state.metrics.configured_rate * self.min_rate_fraction
+                state.rate = max(min_rate, state.rate * self.decrease_factor)
+                state.last_decrease = now
+                logger.warning(
+                    f"{provider} throttled requests, lowering rate to "
+                    f"{state.rate:.3f}/s"
+                )
+
+            if retry_after:
+                pause = min(retry_after, self.max_retry_after)
+                state.blocked_until = max(state.blocked_until, now + pause)
+                state.metrics.blocked_until = state.blocked_until
+
+    def record_response(
+        self,
+        provider: str,
+        status_code: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        """Adapt the provider's rate to the status of a response"""
+        if not isinstance(status_code, int):
+            return
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        if status_code == 429 or (status_code == 503 and retry_after is not None):
+            self.record_throttle(provider, retry_after)
+        elif 200 <= status_code < 300:
+            self.record_success(provider)
+
+    def metrics(self) -> Dict[str, ProviderMetrics]:
+        """Snapshot of the metrics of every registered provider"""
+        with self._lock:
+            states = list(self._providers.values())
+        snapshot = {}
+        for state in states:
+            with state.lock:
+                snapshot[state.metrics.provider] = replace(state.metrics)
+        return snapshot
+
+    def _get(self, provider: str) -> _ProviderState:
+        state = self._providers.get(provider)
+        if state is None:
+            error_msg = f"Rate limit of provider '{provider}' is not registered"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        return state
+
+    @contextmanager
+    def _shared(self, provider: str, state: _ProviderState) -> Iterator[None]:
+        """Load and store the provider state under an exclusive file lock"""
+        if self.state_dir is None:
+            yield
+            return
+
+        path = self.state_dir / f"{provider}.json"
+        with open(path, "a+", encoding="utf-8") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                content = handle.read()
+                if content:
+                    try:
+                        state.load(json.loads(content))
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"Ignoring corrupt rate state {path}: {e}")
+                yield
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state.to_dict()))
+                handle.flush()
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+_governor: Optional[RateGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_rate_governor() -> RateGovernor:
+    """The governor shared by all API clients of this process
+
+    Setting the COMPUTE_FORECAST_RATE_STATE_DIR environment variable also
+    shares the limits with other processes using the same directory.
+    """
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RateGovernor(state_dir=os.environ.get(STATE_DIR_ENV) or None)
+        return _governor
+
+
+def reset_rate_governor():
+    """Drop the process-wide governor, the next use starts a fresh one"""
+    global _governor
+    with _governor_lock:
+        _governor = None
@@ -3,6 +3,16 @@
 import pytest
 from pathlib import Path
 
+from compute_forecast.utils.rate_governor import reset_rate_governor
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_governor():
+    """Keep rate limits and Retry-After pauses from leaking between tests."""
+    reset_rate_governor()
+    yield
+    reset_rate_governor()
+
 
 @pytest.fixture
 def test_data_dir():
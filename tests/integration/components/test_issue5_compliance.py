@@ -121,10 +121,15 @@ class TestIssue5StateManager:
         assert isinstance(checkpoint_id, str)
         assert duration < 2.0, f"Checkpoint save took {duration:.3f}s (>2s requirement)"
 
-        # Verify checkpoint file created
+        # Verify checkpoint persisted in the session's checkpoint log
         session_dir = self.temp_dir / "states" / "sessions" / session_id
-        checkpoint_file = session_dir / "checkpoints" / f"{checkpoint_id}.json"
-        assert checkpoint_file.exists()
+        assert list((session_dir / "checkpoints").glob("segment_*.log"))
+        reopened = StateManager(base_state_dir=self.temp_dir / "states")
+        checkpoint = reopened.checkpoint_manager.load_checkpoint(
+            session_id, checkpoint_id
+        )
+        assert checkpoint is not None
+        assert checkpoint.venues_completed == [("ICML", 2023)]
 
     def test_load_latest_checkpoint_exact_interface(self):
         """Test load_latest_checkpoint with exact Issue #5 requirements"""
@@ -209,6 +209,30 @@ class TestCLIReporting:
 
             assert result.exit_code == 0
 
+    def test_cli_rejects_near_duplicate_threshold_out_of_range(
+        self, sample_collection_data
+    ):
+        """Test that the near-duplicate threshold is bounded to 0.0-1.0."""
+        with TemporaryDirectory() as tmp_dir:
+            data_file = Path(tmp_dir) / "test_data.json"
+            data_file.write_text(json.dumps(sample_collection_data))
+
+            for threshold in ("-0.5", "1.5"):
+                result = self.runner.invoke(
+                    app,
+                    [
+                        "quality",
+                        str(data_file),
+                        "--stage",
+                        "collection",
+                        "--near-duplicate-threshold",
+                        threshold,
+                    ],
+                )
+
+                assert result.exit_code == 2
+                assert not isinstance(result.exception, ValueError)
+
     def test_cli_list_options(self):
         """Test list-stages and list-checks options."""
         # Test list stages
@@ -0,0 +1,79 @@
+"""
+Tests for the microbenchmark runner and its OpenAlex stand-in
+"""
+
+import json
+
+import pytest
+
+from benchmarks.http_standin import OpenAlexStandIn
+from benchmarks.run import (
+    discover,
+    load_results,
+    measure_benchmark,
+    merge_measurements,
+    record_results,
+)
+from compute_forecast.pipeline.consolidation.sources.base import SourceConfig
+from compute_forecast.pipeline.consolidation.sources.openalex import OpenAlexSource
+from compute_forecast.utils.rate_governor import RateGovernor
+
+
+def test_discover_covers_hot_paths():
+    names = [benchmark.name for benchmark in discover()]
+
+    for hot_path in (
+        "TitleMatcherSuite.time_calculate_similarity",
+        "PaperHashSuite.time_get_paper_hash",
+        "CheckpointSuite.time_save_checkpoint",
+        "OpenAlexEnrichmentSuite.time_fetch_all_fields",
+        "VenueNormalizerSuite.time_normalize_venue",
+        "FuzzyDeduplicationSuite.time_find_duplicates_fuzzy",
+        "PDFProcessingSuite.time_process_pdf",
+    ):
+        assert any(hot_path in name for name in names), hot_path
+    assert len(names) == len(set(names))
+    assert discover("TitleMatcher") == [
+        benchmark for benchmark in discover() if "TitleMatcher" in benchmark.name
+    ]
+
+
+def test_measure_and_merge():
+    benchmark = discover("time_normalize_title")[0]
+
+    first = measure_benchmark(benchmark, repeat=3)
+    second = measure_benchmark(benchmark, repeat=3)
+    merged = merge_measurements([{benchmark.name: first}, {benchmark.name: second}])
+
+    assert len(first["samples"]) == 3
+    assert all(sample > 0 for sample in first["samples"])
+    assert merged[benchmark.name]["samples"] == first["samples"] + second["samples"]
+    assert merged[benchmark.name]["processes"] == 2
+
+
+def test_record_and_load_results(tmp_path):
+    record_results({"a": {"samples": [1.0], "median": 1.0}}, tmp_path, "abc123")
+    record_results({"b": {"samples": [2.0], "median": 2.0}}, tmp_path, "abc123")
+    record_results({"a": {"samples": [3.0], "median": 3.0}}, tmp_path, "abc123-dirty")
+
+    with open(tmp_path / "abc123.json") as f:
+        assert set(json.load(f)["results"]) == {"a", "b"}
+    # The clean results are preferred over dirty runs of the same commit
+    assert load_results(tmp_path, "abc")["a"]["median"] == 1.0
+    assert load_results(tmp_path, "abc123-dirty")["a"]["median"] == 3.0
+    with pytest.raises(FileNotFoundError):
+        load_results(tmp_path, "def")
+
+
+def test_openalex_standin_serves_enrichment():
+    with OpenAlexStandIn() as server:
+        source = OpenAlexSource(SourceConfig(rate_limit=1e6))
+        source.base_url = server.url
+        source.governor = RateGovernor()
+        source.governor.register(source.name, 1e6)
+        try:
+            enrichments = source.fetch_all_fields(["W00000001", "W00000002"])
+        finally:
+            source.close()
+
+    assert set(enrichments) == {"W00000001", "W00000002"}
@@ -0,0 +1,108 @@
+"""Performance of near-duplicate detection on mock corpora with injected
+perturbations."""
+
+import random
+import string
+import time
+
+from compute_forecast.quality.stages.collection.near_duplicates import (
+    NearDuplicateDetector,
+)
+from compute_forecast.testing.mock_data.configs import DataQuality, MockDataConfig
+from compute_forecast.testing.mock_data.generators import MockDataGenerator
+
+
+def perturb_title(title: str, rng: random.Random) -> str:
+    """Edits seen between versions of the same paper across sources"""
+    position = rng.randrange(1, len(title) - 2)
+    perturbations = [
+        lambda: title[:position] + title[position + 1 :],  # Dropped character
+        lambda: title[:position]
+        + title[position + 1]
+        + title[position]
+        + title[position + 2 :],  # Swapped characters
+        lambda: title.upper(),
+        lambda: title + " (Extended Abstract)",
+        lambda: title.replace(" ", ": ", 1),
+    ]
+    return rng.choice(perturbations)()
+
+
+def make_corpus(size: int, seed: int = 7):
+    """Mock papers plus perturbed copies of a tenth of them.
+
+    Mock titles come from a few templates, a random three word phrase makes
+    the original titles distinct.
+    """
+    rng = random.Random(seed)
+    papers = [
+        paper.to_dict()
+        for paper in MockDataGenerator().generate(
+            MockDataConfig(quality=DataQuality.NORMAL, size=size, seed=seed)
+        )
+    ]
+    for paper in papers:
+        words = [
+            "".join(
+                rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 9))
+            )
+            for _ in range(3)
+        ]
+        paper["title"] += " with " + " ".join(words)
+
+    injected = []
+    for index in rng.sample(range(size), size // 10):
+        copy = dict(papers[index])
+        copy["title"] = perturb_title(copy["title"], rng)
+        copy["year"] = copy["year"] + rng.choice([0, 0, 1])
+        injected.append((index, len(papers)))
+        papers.append(copy)
+    return papers, injected
+
+
+def run_detector(papers):
+    detector = NearDuplicateDetector()
+    start = time.perf_counter()
+    for index, paper in enumerate(papers):
+        detector.add(index, paper, {"id": paper.get("paper_id")})
+    clusters = detector.clusters()
+    return detector, clusters, time.perf_counter() - start
+
+
+class TestNearDuplicatePerformance:
+    def test_injected_duplicates_are_found(self):
+        papers, injected = make_corpus(2000)
+
+        detector, clusters, elapsed = run_detector(papers)
+
+        cluster_of = {
+            index: position
+            for position, cluster in enumerate(clusters)
+            for index in cluster.indices
+        }
+        found = sum(
+            1
+            for original, copy in injected
+            if original in cluster_of and cluster_of[original] == cluster_of.get(copy)
+        )
+        clustered = sum(len(cluster.indices) for cluster in clusters)
+
+        print(
+            f"\n{len(papers)} papers: {elapsed:.2f}s, "
+            f"{detector.comparisons} comparisons, {found}/{len(injected)} found"
+        )
+        assert found / len(injected) >= 0.95
+        # Few distinct papers end up in clusters
+        assert clustered - 2 * found <= len(injected) * 0.05
+
+    def test_comparisons_grow_sub_quadratically(self):
+        for size in (2000, 8000):
+            papers, _ = make_corpus(size)
+            detector, _, elapsed = run_detector(papers)
+            per_paper = detector.comparisons / len(papers)
+            print(f"\n{len(papers)} papers: {elapsed:.2f}s, {per_paper:.1f}/paper")
+
+            # Bounded by the author/year block size plus the few band
+            # collisions, against len(papers) / 2 for all pairs
+            assert per_paper < detector.max_block_size + 10
+        assert detector.comparisons < len(papers) ** 2 / 2 / 100
@@ -0,0 +1,240 @@
+"""Tests for the async request engine of the consolidation sources."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from compute_forecast.pipeline.consolidation.sources.async_engine import (
+    AsyncRequestEngine,
+)
+from compute_forecast.pipeline.consolidation.sources.base import SourceConfig
+from compute_forecast.pipeline.consolidation.sources.openalex import OpenAlexSource
+from compute_forecast.pipeline.consolidation.sources.semantic_scholar import (
+    SemanticScholarSource,
+)
+from compute_forecast.pipeline.metadata_collection.models import Author, Paper
+from compute_forecast.utils.rate_governor import RateGovernor
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Session answering requests from a handler, with simulated latency"""
+
+    def __init__(self, handler, latency=0.0, failures=0, throttled=0):
+        self.handler = handler
+        self.throttled = throttled
+        self.latency = latency
+        self.failures = failures
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url, kwargs))
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("connection reset")
+            if self.throttled:
+                self.throttled -= 1
+                return FakeResponse({}, 429, {"Retry-After": "0.1"})
+        time.sleep(self.latency)
+        return FakeResponse(self.handler(method, url, kwargs))
+
+    def close(self):
+        pass
+
+
+def make_paper(index: int, **kwargs) -> Paper:
+    return Paper(
+        paper_id=f"p{index}",
+        title=f"A Study of Topic Number {index} in Deep Learning",
+        authors=[Author(name="Jane Doe")],
+        venue="ICML",
+        year=2023,
+        **kwargs,
+    )
+
+
+def openalex_handler(method, url, kwargs):
+    params = kwargs["params"]
+    if "search" in params:
+        index = params["search"].split()[5]
+        if index == "3":
+            return {"results": []}
+        return {
+            "results": [
+                {
+                    "id": f"W{index}",
+                    "title": params["search"],
+                    "publication_year": 2023,
+                    "authorships": [{"author": {"display_name": "Jane Doe"}}],
+                }
+            ]
+        }
+    if params["filter"].startswith("doi:"):
+        return {"results": [{"id": "W0", "doi": "https://doi.org/10.1/zero"}]}
+    ids = params["filter"][len("openalex:") :].split("|")
+    return {
+        "results": [
+            {"id": work_id, "cited_by_count": int(work_id[1:]) * 10} for work_id in ids
+        ]
+    }
+
+
+def openalex_source(session, rate_limit=1000.0):
+    source = OpenAlexSource(
+        SourceConfig(rate_limit=rate_limit, max_concurrent_requests=4)
+    )
+    source._engine = AsyncRequestEngine(
+        "test", rate_limit=rate_limit, max_in_flight=4, burst=4, session=session
+    )
+    source._make_request = lambda url, params: session.request(
+        "GET", url, params=params
+    )
+    return source
+
+
+class TestAsyncRequestEngine:
+    @pytest.mark.asyncio
+    async def test_requests_overlap_up_to_max_in_flight(self):
+        session = FakeSession(lambda *args: {}, latency=0.05)
+        engine = AsyncRequestEngine(
+            "test", rate_limit=1000, max_in_flight=4, burst=4, session=session
+        )
+
+        start = time.monotonic()
+        await asyncio.gather(*(engine.get("https://api") for _ in range(8)))
+        elapsed = time.monotonic() - start
+
+        assert engine.api_calls == 8
+        assert engine.peak_in_flight == 4
+        assert elapsed < 8 * 0.05
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_errors(self):
+        session = FakeSession(lambda *args: {"ok": True}, failures=2)
+        engine = AsyncRequestEngine(
+            "test", rate_limit=1000, initial_delay=0.001, session=session
+        )
+
+        response = await engine.post("https://api", json={"ids": []})
+
+        assert response.json() == {"ok": True}
+        assert len(session.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_after_max_retries(self):
+        session = FakeSession(lambda *args: {}, failures=5)
+        engine = AsyncRequestEngine(
+            "test", rate_limit=1000, max_retries=2, initial_delay=0.001, session=session
+        )
+
+        with pytest.raises(ConnectionError):
+            await engine.get("https://api")
+
+    @pytest.mark.asyncio
+    async def test_throttled_request_waits_for_retry_after(self):
+        session = FakeSession(lambda *args: {"ok": True}, throttled=1)
+        governor = RateGovernor()
+        engine = AsyncRequestEngine(
+            "test", rate_limit=1000, session=session, governor=governor
+        )
+
+        start = time.monotonic()
+        response = await engine.get("https://api")
+
+        assert response.json() == {"ok": True}
+        assert time.monotonic() - start >= 0.09
+        metrics = governor.metrics()["test"]
+        assert metrics.throttled == 1
+        assert metrics.current_rate < 1000
+
+
+class TestAsyncSources:
+    @pytest.mark.asyncio
+    async def test_openalex_async_matches_sync(self):
+        papers = [make_paper(0, doi="10.1/zero")] + [make_paper(i) for i in range(1, 6)]
+        session = FakeSession(openalex_handler)
+        source = openalex_source(session)
+
+        async_mapping = await source.async_find_papers(papers)
+        sync_mapping = source.find_papers(papers)
+
+        assert async_mapping == sync_mapping
+        assert async_mapping == {
+            "p0": "W0",
+            "p1": "W1",
+            "p2": "W2",
+            "p4": "W4",
+            "p5": "W5",
+        }
+
+        fields = await source.async_fetch_all_fields(list(async_mapping.values()))
+        assert fields == source.fetch_all_fields(list(async_mapping.values()))
+        assert fields["W4"]["citations"] == 40
+
+    @pytest.mark.asyncio
+    async def test_title_lookups_overlap(self):
+        papers = [make_paper(i) for i in range(1, 9)]
+        session = FakeSession(openalex_handler, latency=0.05)
+        source = openalex_source(session)
+
+        start = time.monotonic()
+        mapping = await source.async_find_papers(papers)
+        elapsed = time.monotonic() - start
+
+        assert len(mapping) == 7
+        assert source.api_calls == 8
+        assert source.engine.peak_in_flight > 1
+        assert elapsed < 8 * 0.05
+
+    @pytest.mark.asyncio
+    async def test_async_enrich_papers(self):
+        papers = [make_paper(i) for i in range(1, 4)]
+        source = openalex_source(FakeSession(openalex_handler))
+
+        results = await source.async_enrich_papers(papers)
+
+        assert [result.paper_id for result in results] == ["p1", "p2", "p3"]
+        assert [len(result.citations) for result in results] == [1, 1, 0]
+        assert results[1].citations[0].data.count == 20
+
+    @pytest.mark.asyncio
+    async def test_semantic_scholar_async_find_papers(self):
+        def handler(method, url, kwargs):
+            if method == "POST":
+                return [{"paperId": "S0", "externalIds": {"DOI": "10.1/zero"}}]
+            title = kwargs["params"]["query"].strip('"')
+            return {
+                "data": [
+                    {
+                        "paperId": "S" + title.split()[5],
+                        "title": title,
+                        "year": 2023,
+                        "authors": [{"name": "Jane Doe"}],
+                    }
+                ]
+            }
+
+        source = SemanticScholarSource(SourceConfig(api_key="key"))
+        source._engine = AsyncRequestEngine(
+            "test", rate_limit=1000, max_in_flight=4, session=FakeSession(handler)
+        )
+        papers = [make_paper(0, doi="10.1/zero"), make_paper(1), make_paper(2)]
+
+        mapping = await source.async_find_papers(papers)
+
+        assert mapping == {"p0": "S0", "p1": "S1", "p2": "S2"}
+        assert source.api_calls == 3
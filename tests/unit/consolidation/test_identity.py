@@ -0,0 +1,58 @@
+"""Tests for cached paper identity keys."""
+
+import hashlib
+
+import pytest
+
+from compute_forecast.pipeline.consolidation.identity import (
+    assign_identity_keys,
+    compute_identity_key,
+    get_identity_key,
+)
+from compute_forecast.pipeline.metadata_collection.models import Author, Paper
+
+
+def create_paper() -> Paper:
+    return Paper(
+        paper_id="paper_1",
+        title="  Attention Is All You Need ",
+        authors=[Author(name="Noam Shazeer"), Author(name="Ashish Vaswani")],
+        venue="NeurIPS",
+        year=2017,
+    )
+
+
+def test_sha256_key_matches_checkpoint_format():
+    """The default key is the sha256 of title|sorted authors|venue|year"""
+    paper = create_paper()
+    paper.authors = [{"name": "Noam Shazeer"}, {"name": "Ashish Vaswani "}]
+    content = "attention is all you need|ashish vaswani;noam shazeer|neurips|2017"
+
+    assert get_identity_key(paper) == hashlib.sha256(content.encode()).hexdigest()
+
+
+def test_blake2b_key_is_64_bits():
+    paper = create_paper()
+
+    key = get_identity_key(paper, "blake2b")
+
+    assert len(key) == 16
+    assert key != get_identity_key(paper, "sha256")
+
+
+def test_key_is_cached_and_not_serialized():
+    paper = create_paper()
+    assign_identity_keys([paper])
+    key = get_identity_key(paper)
+
+    # Later edits don't invalidate the key computed for this run
+    paper.title = "Another title"
+    assert get_identity_key(paper) == key
+    assert compute_identity_key(paper) != key
+
+    assert not any(k.startswith("_") for k in paper.to_dict())
+
+
+def test_unknown_algorithm_raises():
+    with pytest.raises(ValueError, match="Unknown identity hash algorithm"):
+        compute_identity_key(create_paper(), "md5")
@@ -0,0 +1,364 @@
+"""Tests for the parallel consolidator worker lifecycle."""
+
+import queue
+import threading
+import time
+from unittest.mock import patch
+
+from compute_forecast.pipeline.consolidation.checkpoint_manager import (
+    ConsolidationCheckpointManager,
+)
+from compute_forecast.pipeline.consolidation.identity import get_identity_key
+from compute_forecast.pipeline.consolidation.models_extended import (
+    ConsolidationPhaseState,
+)
+
+from compute_forecast.pipeline.consolidation.parallel.base_worker import (
+    SHUTDOWN_SENTINEL,
+)
+from compute_forecast.pipeline.consolidation.parallel.consolidator import (
+    ParallelConsolidator,
+)
+from compute_forecast.pipeline.consolidation.parallel.openalex_worker import (
+    OpenAlexWorker,
+)
+from compute_forecast.pipeline.consolidation.parallel.semantic_scholar_worker import (
+    SemanticScholarWorker,
+)
+from compute_forecast.pipeline.metadata_collection.models import Author, Paper
+
+
+def create_papers(count: int) -> list:
+    return [
+        Paper(
+            paper_id=f"paper_{i}",
+            title=f"Paper {i}",
+            authors=[Author(name=f"Author {i}")],
+            venue="ICML",
+            year=2023,
+        )
+        for i in range(count)
+    ]
+
+
+def fake_openalex(self, papers):
+    return [(p, {"openalex_id": f"W{p.paper_id}", "citations": 3}) for p in papers]
+
+
+def fake_semantic_scholar(self, papers):
+    return [(p, {"abstract": f"Abstract of {p.title}"}) for p in papers]
+
+
+@patch.object(SemanticScholarWorker, "fetch_enrichment_data", fake_semantic_scholar)
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_process_papers_completes_and_reports_progress():
+    """All papers are merged and progress events sum to the paper count"""
+    papers = create_papers(25)
+    consolidator = ParallelConsolidator()
+
+    progress = {"openalex": 0, "semantic_scholar": 0}
+
+    def on_progress(source, count, citations, abstracts):
+        progress[source] += count
+
+    start = time.time()
+    merged = consolidator.process_papers(papers, on_progress)
+
+    # Completion is signalled, not detected through polling timeouts
+    assert time.time() - start < 5
+    assert len(merged) == 25
+    assert progress == {"openalex": 25, "semantic_scholar": 25}
+    assert all(p.openalex_id and p.abstracts for p in merged)
+    assert not consolidator.openalex_worker.is_alive()
+    assert not consolidator.semantic_scholar_worker.is_alive()
+    assert not any(w.is_alive() for w in consolidator.merge_workers)
+
+
+@patch.object(SemanticScholarWorker, "fetch_enrichment_data", fake_semantic_scholar)
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_process_papers_finishes_when_resuming():
+    """Papers already processed by a source are skipped without stalling"""
+    papers = create_papers(10)
+
+    # Simulate a checkpoint where OpenAlex already processed half the papers
+    hasher = OpenAlexWorker(None, None, None)
+    consolidator = ParallelConsolidator()
+    consolidator.openalex_processed_hashes = {
+        hasher._get_paper_hash(p) for p in papers[:5]
+    }
+
+    progress = {"openalex": 0, "semantic_scholar": 0}
+
+    def on_progress(source, count, citations, abstracts):
+        progress[source] += count
+
+    merged = consolidator.process_papers(papers, on_progress)
+
+    assert len(merged) == 10
+    assert progress == {"openalex": 10, "semantic_scholar": 10}
+    assert consolidator.merge_workers[0].papers_merged == 15
+
+
+@patch.object(SemanticScholarWorker, "fetch_enrichment_data", fake_semantic_scholar)
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_sharded_merge_partitions_papers(tmp_path):
+    """Each merge shard owns a disjoint partition and saves its own shard file"""
+    papers = create_papers(40)
+    checkpoint_manager = ConsolidationCheckpointManager(
+        session_id="sharded", checkpoint_dir=tmp_path
+    )
+    consolidator = ParallelConsolidator(
+        checkpoint_manager=checkpoint_manager, checkpoint_interval=0, merge_shards=4
+    )
+
+    merged = consolidator.process_papers(papers)
+
+    assert len(merged) == 40
+    assert all(p.openalex_id and p.abstracts for p in merged)
+    assert len(consolidator.merge_workers) == 4
+
+    partitions = [set(w.merged_papers) for w in consolidator.merge_workers]
+    assert sum(len(p) for p in partitions) == 40
+    assert set.union(*partitions) == {p.paper_id for p in papers}
+    assert sum(w.papers_merged for w in consolidator.merge_workers) == 80
+
+    # The final checkpoint writes the full papers file, and the shards saved
+    # after it hold the same papers
+    checkpoint, loaded = checkpoint_manager.load_checkpoint()
+    assert checkpoint.sources["merge"]["papers_merged"] == 80
+    assert len(checkpoint.sources["merge"]["shards"]) == 4
+    assert {p.paper_id for p in loaded} == {p.paper_id for p in papers}
+
+
+@patch.object(SemanticScholarWorker, "fetch_enrichment_data", fake_semantic_scholar)
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_output_streamed_from_shard_files(tmp_path):
+    """The output is read back from the shard files with shard-counted stats"""
+    papers = create_papers(30)
+    papers[0].doi = "10.1/zero"
+    checkpoint_manager = ConsolidationCheckpointManager(
+        session_id="streamed", checkpoint_dir=tmp_path
+    )
+    consolidator = ParallelConsolidator(
+        checkpoint_manager=checkpoint_manager, checkpoint_interval=0, merge_shards=3
+    )
+
+    assert consolidator.consolidate(papers) == 30
+
+    shard_records = [
+        record
+        for shard_id in range(3)
+        for record in checkpoint_manager.iter_papers_shard(shard_id)
+    ]
+    records = list(consolidator.iter_output_records())
+    assert records == shard_records
+    assert records == [p.to_dict() for p in consolidator.iter_merged_papers()]
+    assert consolidator.output_counts() == {
+        "total_papers": 30,
+        "papers_with_citations": 30,
+        "papers_with_abstracts": 30,
+        "papers_with_dois": 1,
+        "papers_with_arxiv": 0,
+    }
+
+    # Checkpointed enrichment counts come from the shard counters
+    checkpoint, _ = checkpoint_manager.load_checkpoint()
+    assert checkpoint.sources["openalex"]["papers_enriched"] == 30
+    assert checkpoint.sources["semantic_scholar"]["papers_enriched"] == 30
+
+
+@patch.object(SemanticScholarWorker, "fetch_enrichment_data", fake_semantic_scholar)
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_checkpoint_only_marks_saved_papers_processed(tmp_path):
+    """A processed hash is checkpointed once its shard has saved the paper"""
+    papers = create_papers(11)
+    late = papers.pop()
+    checkpoint_manager = ConsolidationCheckpointManager(
+        session_id="persisted", checkpoint_dir=tmp_path
+    )
+    consolidator = ParallelConsolidator(
+        checkpoint_manager=checkpoint_manager, checkpoint_interval=3600, merge_shards=2
+    )
+    consolidator.consolidate(papers)
+
+    def checkpointed_hashes():
+        checkpoint, _ = checkpoint_manager.load_checkpoint()
+        phase_state = ConsolidationPhaseState.from_dict(checkpoint.phase_state)
+        return phase_state.openalex_processed_hashes
+
+    # Processed and merged, but not yet saved by its shard
+    late_hash = get_identity_key(late)
+    shard_id = consolidator.enrichment_queue.shard_for(late_hash)
+    consolidator.openalex_worker.processed_hashes.add(late_hash)
+    consolidator.merge_workers[shard_id]._merge_enrichment(
+        {
+            "paper": late,
+            "paper_hash": late_hash,
+            "enrichment": None,
+            "source": "openalex",
+        }
+    )
+
+    consolidator._checkpoint(force=True, include_papers=False)
+    assert checkpointed_hashes() == {get_identity_key(p) for p in papers}
+
+    consolidator._checkpoint_shard(shard_id)
+    consolidator._checkpoint(force=True, include_papers=False)
+    assert late_hash in checkpointed_hashes()
+
+
+@patch.object(SemanticScholarWorker, "fetch_enrichment_data", fake_semantic_scholar)
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_resumed_output_includes_completed_papers():
+    """Papers both sources processed before resuming are still written out"""
+    papers = create_papers(10)
+    consolidator = ParallelConsolidator(merge_shards=2)
+    done = {get_identity_key(p) for p in papers[:4]}
+    consolidator.openalex_processed_hashes = set(done)
+    consolidator.ss_processed_hashes = set(done)
+
+    assert consolidator.consolidate(papers) == 6
+
+    records = list(consolidator.iter_output_records())
+    assert sorted(record["paper_id"] for record in records) == sorted(
+        p.paper_id for p in papers
+    )
+    assert consolidator.output_counts()["total_papers"] == 10
+    assert consolidator.output_counts()["papers_with_abstracts"] == 6
+
+
+def test_checkpoint_shards_overlay_papers_file(tmp_path):
+    """Papers saved by merge shards take precedence over the papers file"""
+    checkpoint_manager = ConsolidationCheckpointManager(
+        session_id="shards", checkpoint_dir=tmp_path
+    )
+    papers = create_papers(4)
+    checkpoint_manager.save_checkpoint(
+        input_file="input.json",
+        total_papers=4,
+        sources_state={},
+        papers=papers,
+        force=True,
+    )
+
+    enriched = create_papers(4)[2:]
+    for paper in enriched:
+        paper.openalex_id = f"W{paper.paper_id}"
+    checkpoint_manager.save_papers_shard(0, enriched[:1])
+    checkpoint_manager.save_papers_shard(1, enriched[1:])
+
+    _, loaded = checkpoint_manager.load_checkpoint()
+
+    assert [p.paper_id for p in loaded] == [p.paper_id for p in papers]
+    assert [p.openalex_id for p in loaded] == [None, None, "Wpaper_2", "Wpaper_3"]
+
+
+def test_resume_only_queues_remaining_papers():
+    """Processed papers are never fetched again and progress starts pre-seeded"""
+    papers = create_papers(20)
+    consolidator = ParallelConsolidator()
+    consolidator.openalex_processed_hashes = {get_identity_key(p) for p in papers[:15]}
+    consolidator.ss_processed_hashes = {get_identity_key(p) for p in papers}
+
+    fetched = {"openalex": [], "semantic_scholar": []}
+
+    def record_openalex(self, batch):
+        fetched["openalex"].extend(p.paper_id for p in batch)
+        return fake_openalex(self, batch)
+
+    def record_semantic_scholar(self, batch):
+        fetched["semantic_scholar"].extend(p.paper_id for p in batch)
+        return fake_semantic_scholar(self, batch)
+
+    progress = {"openalex": [], "semantic_scholar": []}
+
+    def on_progress(source, count, citations, abstracts):
+        progress[source].append(count)
+
+    with (
+        patch.object(OpenAlexWorker, "fetch_enrichment_data", record_openalex),
+        patch.object(
+            SemanticScholarWorker, "fetch_enrichment_data", record_semantic_scholar
+        ),
+    ):
+        consolidator.process_papers(
+            papers,
+            on_progress,
+            checkpoint_stats={"openalex": {"papers_processed": 15}},
+        )
+
+    assert fetched == {
+        "openalex": [p.paper_id for p in papers[15:]],
+        "semantic_scholar": [],
+    }
+    # The resumed count is reported first and never double counted
+    assert progress["openalex"][0] >= 15
+    assert sum(progress["openalex"]) == 20
+    assert progress["semantic_scholar"] == [20]
+
+
+@patch.object(OpenAlexWorker, "fetch_enrichment_data", fake_openalex)
+def test_worker_reports_only_processed_papers():
+    """Stopping a worker wakes monitors without reporting an extra paper"""
+    papers = create_papers(3)
+    input_queue, output_queue, error_queue = queue.Queue(), queue.Queue(), queue.Queue()
+    reported = []
+    condition = threading.Condition()
+    worker = OpenAlexWorker(
+        input_queue,
+        output_queue,
+        error_queue,
+        progress_callback=reported.append,
+        progress_condition=condition,
+        processed_hashes={get_identity_key(papers[0])},
+    )
+    worker.start()
+    for paper in papers:
+        input_queue.put(paper)
+
+    with condition:
+        assert condition.wait_for(lambda: sum(reported) == 3, timeout=5)
+    worker.stop()
+    worker.join(timeout=5)
+
+    assert worker.done_event.is_set()
+    assert sum(reported) == 3
+    assert worker.papers_processed == 3
+
+
+def test_worker_looks_up_queued_papers_concurrently():
+    """Queued papers are enriched together through the async source lookups"""
+    papers = create_papers(5)
+    input_queue, output_queue, error_queue = queue.Queue(), queue.Queue(), queue.Queue()
+    for paper in papers:
+        input_queue.put(paper)
+    input_queue.put(SHUTDOWN_SENTINEL)
+
+    worker = SemanticScholarWorker(input_queue, output_queue, error_queue)
+    source = worker.source
+    batches = []
+
+    async def async_find_papers(batch):
+        batches.append([p.paper_id for p in batch])
+        source.api_calls += len(batch)
+        return {p.paper_id: f"S{p.paper_id}" for p in batch}
+
+    async def async_fetch_all_fields(source_ids):
+        source.api_calls += 1
+        return {sid: {"citations": 1, "abstract": "Abstract"} for sid in source_ids}
+
+    with (
+        patch.object(source, "async_find_papers", async_find_papers),
+        patch.object(source, "async_fetch_all_fields", async_fetch_all_fields),
+        patch.object(source, "find_papers", side_effect=AssertionError),
+        patch.object(source, "close") as close,
+    ):
+        worker.start()
+        worker.join(timeout=5)
+
+    assert batches == [[p.paper_id for p in papers]]
+    assert worker.papers_processed == 5
+    assert worker.papers_enriched == 5
+    assert worker.api_calls == 6
+    assert output_queue.qsize() == 5
+    close.assert_called_once()
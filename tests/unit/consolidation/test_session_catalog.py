@@ -0,0 +1,216 @@
+"""Tests for the consolidation session catalog."""
+
+import json
+import os
+
+import pytest
+
+from compute_forecast.pipeline.consolidation.checkpoint_manager import (
+    ConsolidationCheckpointManager,
+)
+from compute_forecast.pipeline.consolidation.session_catalog import (
+    SessionCatalog,
+    read_json_fields,
+)
+from compute_forecast.pipeline.consolidation.models import (
+    CitationData,
+    CitationRecord,
+)
+from compute_forecast.pipeline.metadata_collection.models import Author, Paper
+
+
+def make_paper(index: int, source: str = "openalex") -> Paper:
+    paper = Paper(
+        paper_id=f"p{index}",
+        title=f"Paper {index}",
+        authors=[Author(name="Jane Doe")],
+        venue="ICML",
+        year=2023,
+    )
+    paper.citations.append(
+        CitationRecord(
+            source=source,
+            timestamp=paper.collection_timestamp,
+            original=False,
+            data=CitationData(count=index),
+        )
+    )
+    return paper
+
+
+def write_legacy_session(checkpoint_dir, session_id, sources, phase_state=None):
+    """Session written before the catalog existed"""
+    session_dir = checkpoint_dir / session_id
+    session_dir.mkdir(parents=True)
+    (session_dir / "session.json").write_text(
+        json.dumps({"session_id": session_id, "created_at": "2024-01-02T00:00:00"})
+    )
+    (session_dir / "checkpoint.json").write_text(
+        json.dumps(
+            {
+                "session_id": session_id,
+                "input_file": "papers.json",
+                "total_papers": 10,
+                "sources": sources,
+                "last_checkpoint_time": "2024-01-02T01:00:00",
+                "timestamp": "2024-01-02T01:00:00",
+                "checksum": None,
+                "phase_state": phase_state,
+            },
+            indent=2,
+        )
+    )
+    return session_dir
+
+
+class TestReadJsonFields:
+    def test_reads_leading_fields(self, tmp_path):
+        path = tmp_path / "data.json"
+        data = {"a": 1234567, "b": {"c": [1, 2.5, None]}, "d": "x" * 1000}
+        path.write_text(json.dumps(data, indent=2))
+
+        assert read_json_fields(path, ["a", "b"], chunk_size=3) == {
+            "a": 1234567,
+            "b": {"c": [1, 2.5, None]},
+        }
+        assert read_json_fields(path, ["d", "missing"], chunk_size=7) == {
+            "d": "x" * 1000
+        }
+        assert read_json_fields(path, []) == {}
+
+    def test_stops_before_large_trailing_field(self, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        # Truncated trailing field, as if it were too large to read
+        path.write_text('{"session_id": "s", "phase_state": {"papers": [1, 2')
+
+        assert read_json_fields(path, ["session_id"]) == {"session_id": "s"}
+
+    @pytest.mark.parametrize("content", ["[1, 2]", '{"a" 1}', '{"a": 1'])
+    def test_invalid_json(self, tmp_path, content):
+        path = tmp_path / "data.json"
+        path.write_text(content)
+
+        with pytest.raises(ValueError):
+            read_json_fields(path, ["a", "b"])
+
+
+class TestSessionCatalog:
+    def test_checkpoint_updates_catalog(self, tmp_path):
+        manager = ConsolidationCheckpointManager(
+            session_id="session_a", checkpoint_dir=tmp_path
+        )
+        papers = [make_paper(1), make_paper(2, "semanticscholar"), make_paper(3)]
+        manager.save_checkpoint(
+            "papers.json",
+            3,
+            {"openalex": {"papers_processed": 3, "papers_enriched": 2}},
+            papers,
+            force=True,
+        )
+
+        catalog = json.loads((tmp_path / "catalog.json").read_text())
+        entry = catalog["sessions"]["session_a"]
+        assert entry["status"] == "interrupted"
+        assert entry["papers_saved"] == 3
+        assert entry["enriched_counts"] == {"openalex": 2, "semantic_scholar": 1}
+        assert entry["papers_bytes"] == manager.papers_file.stat().st_size
+
+        # A checkpoint without papers keeps the counts of the papers file
+        manager.save_checkpoint(
+            "papers.json", 3, {"phase": "completed"}, None, force=True
+        )
+        [session] = ConsolidationCheckpointManager.find_resumable_sessions(tmp_path)
+        assert session["status"] == "completed"
+        assert session["phase"] == "completed"
+        assert session["enriched_counts"] == {"openalex": 2, "semantic_scholar": 1}
+        assert "stamp" not in session
+
+        manager.cleanup()
+        assert ConsolidationCheckpointManager.find_resumable_sessions(tmp_path) == []
+        assert json.loads((tmp_path / "catalog.json").read_text())["sessions"] == {}
+
+    def test_legacy_sessions_are_indexed(self, tmp_path):
+        write_legacy_session(
+            tmp_path,
+            "old",
+            {"semantic_scholar": {"status": "failed"}},
+            phase_state={"papers": list(range(1000))},
+        )
+        write_legacy_session(tmp_path, "two_phase", {"phase": "id_harvesting"})
+        (tmp_path / "no_checkpoint").mkdir()
+
+        sessions = {
+            session["session_id"]: session
+            for session in ConsolidationCheckpointManager.find_resumable_sessions(
+                tmp_path
+            )
+        }
+
+        assert sessions.keys() == {"old", "two_phase"}
+        assert sessions["old"]["status"] == "failed"
+        assert sessions["old"]["sources"] == ["semantic_scholar"]
+        assert sessions["two_phase"]["status"] == "interrupted"
+        assert sessions["two_phase"]["sources"] == ["id_harvesting"]
+        assert sessions["two_phase"]["created_at"] == "2024-01-02T00:00:00"
+        assert set(json.loads((tmp_path / "catalog.json").read_text())["sessions"]) == {
+            "old",
+            "two_phase",
+        }
+        assert (
+            ConsolidationCheckpointManager.get_latest_resumable_session(
+                "papers.json", tmp_path
+            )
+            in sessions
+        )
+
+    def test_outdated_entries_are_rebuilt(self, tmp_path):
+        session_dir = write_legacy_session(
+            tmp_path, "session", {"openalex": {"status": "in_progress"}}
+        )
+        catalog = SessionCatalog(tmp_path)
+        assert catalog.sessions()[0]["status"] == "interrupted"
+
+        checkpoint_file = session_dir / "checkpoint.json"
+        data = json.loads(checkpoint_file.read_text())
+        data["sources"] = {"openalex": {"status": "completed"}}
+        checkpoint_file.write_text(json.dumps(data))
+        stat = checkpoint_file.stat()
+        os.utime(checkpoint_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        assert catalog.sessions()[0]["status"] == "completed"
+
+        # Removed sessions leave the catalog
+        for path in session_dir.iterdir():
+            path.unlink()
+        session_dir.rmdir()
+        assert catalog.sessions() == []
+        assert json.loads(catalog.catalog_file.read_text())["sessions"] == {}
+
+    def test_corrupt_catalog_is_rebuilt(self, tmp_path):
+        write_legacy_session(tmp_path, "session", {"phase": "completed"})
+        (tmp_path / "catalog.json").write_text("{not json")
+
+        [session] = SessionCatalog(tmp_path).sessions()
+
+        assert session["status"] == "completed"
+        assert json.loads((tmp_path / "catalog.json").read_text())["version"] == 1
+
+    def test_reindex_counts_enriched_papers(self, tmp_path):
+        session_dir = write_legacy_session(
+            tmp_path, "session", {"openalex": {"papers_processed": 2}}
+        )
+        (session_dir / "papers_enriched.json").write_text(
+            json.dumps(
+                {
+                    "metadata": {"total_papers": 2},
+                    "papers": [make_paper(1).to_dict(), make_paper(2).to_dict()],
+                }
+            )
+        )
+
+        assert SessionCatalog(tmp_path).sessions()[0]["papers_saved"] == 2
+        assert "enriched_counts" not in SessionCatalog(tmp_path).sessions()[0]
+
+        assert ConsolidationCheckpointManager.reindex_sessions(tmp_path) == 1
+        [session] = SessionCatalog(tmp_path).sessions()
+        assert session["enriched_counts"] == {"openalex": 2, "semantic_scholar": 0}
@@ -1,5 +1,8 @@
 """Unit tests for AdaptiveThresholdCalculator."""
 
+import random
+
+import numpy as np
 import pytest
 from datetime import datetime
 from unittest.mock import patch
@@ -13,6 +16,7 @@ from compute_forecast.pipeline.consolidation.models import (
 )
 from compute_forecast.pipeline.metadata_collection.processors.adaptive_threshold_calculator import (
     AdaptiveThresholdCalculator,
+    VenueYearCitations,
 )
 
 
@@ -332,3 +336,72 @@ class TestAdaptiveThresholdCalculator:
 
             # Should use the max base threshold for tier1 (4+ years)
             assert result.base_threshold == 15  # tier1, 4+ years
+
+
+class TestVenueYearCitations:
+    """Test grouped percentiles and the threshold table."""
+
+    @pytest.fixture
+    def papers(self):
+        rng = random.Random(42)
+        counts = [0, 1, 2, 3, 5, 8, 13, 40, 120, 3000]
+        return [
+            create_test_paper(
+                paper_id=str(i),
+                title=f"Paper {i}",
+                venue=rng.choice(["NeurIPS", "AAAI", "UAI", "Workshop"]),
+                year=rng.choice([2019, 2021, 2023]),
+                citation_count=rng.choice(counts) + rng.randint(0, 3),
+                authors=[Author(name="Test")],
+            )
+            for i in range(400)
+        ]
+
+    def test_percentiles_match_numpy(self, papers):
+        citations = VenueYearCitations(papers)
+
+        for q in [0, 10, 12.5, 33.3, 50, 75, 90, 99, 100]:
+            percentiles = citations.percentiles(q)
+            for group, (venue, year) in enumerate(citations.keys):
+                counts = [
+                    p.get_latest_citations_count()
+                    for p in papers
+                    if p.venue == venue and p.year == year
+                ]
+                # Bit-identical to the per-group np.percentile
+                assert percentiles[group] == np.percentile(counts, q)
+
+    def test_threshold_table_matches_per_venue_calculation(self, papers):
+        calculator = AdaptiveThresholdCalculator()
+        tiers = {"NeurIPS": "tier1", "AAAI": "tier2", "UAI": "tier3"}
+
+        table = calculator.calculate_threshold_table(
+            VenueYearCitations(papers), lambda venue: tiers.get(venue, "tier4")
+        )
+
+        assert len(table) == 12
+        for (venue, year), threshold in table.items():
+            assert threshold == calculator.calculate_venue_threshold(
+                venue, year, papers, tiers.get(venue, "tier4")
+            )
+
+    def test_shared_citations_give_same_result(self, papers):
+        calculator = AdaptiveThresholdCalculator()
+        citations = VenueYearCitations(papers)
+
+        for venue, year in [("NeurIPS", 2023), ("UAI", 2019), ("Missing", 2023)]:
+            assert calculator.calculate_adaptive_threshold(
+                venue, year, papers, "tier1", citations
+            ) == calculator.calculate_adaptive_threshold(venue, year, papers, "tier1")
+
+    def test_empty_papers(self):
+        citations = VenueYearCitations([])
+
+        assert len(citations) == 0
+        assert citations.group("NeurIPS", 2023) is None
+        assert (
+            AdaptiveThresholdCalculator().calculate_threshold_table(
+                citations, lambda venue: "tier1"
+            )
+            == {}
+        )
@@ -14,6 +14,7 @@ from compute_forecast.pipeline.consolidation.models import (
 )
 from compute_forecast.pipeline.metadata_collection.processors.breakthrough_detector import (
     BreakthroughDetector,
+    KeywordMatcher,
 )
 
 
@@ -380,3 +381,71 @@ class TestBreakthroughDetector:
             assert len(bp.matched_keywords) > 0
             assert len(bp.high_impact_authors) > 0
             assert bp.citation_velocity == 150.0  # 150 citations in 1 year
+
+    def test_score_batch_matches_single_scores(
+        self, detector, high_impact_paper, medium_impact_paper, low_impact_paper
+    ):
+        """Test batch scoring gives the per-paper scores and evidence."""
+        papers = [high_impact_paper, medium_impact_paper, low_impact_paper]
+
+        scores = detector.score_batch(papers)
+
+        assert len(scores) == 3
+        for index, paper in enumerate(papers):
+            assert scores.breakthrough_score[index] == (
+                detector.calculate_breakthrough_score(paper)
+            )
+            keyword_score, matched = detector._calculate_keyword_score(paper)
+            assert scores.keyword_score[index] == keyword_score
+            assert scores.matched_keywords[index] == matched
+        assert scores.high_impact_authors[0] == ["Geoffrey Hinton", "Yann LeCun"]
+        assert scores.venue_prestige_score[0] == 1.0
+        assert len(detector.score_batch([])) == 0
+
+    def test_replaced_keywords_are_recompiled(self, detector, low_impact_paper):
+        """Test that assigning new keywords updates the matcher."""
+        detector.breakthrough_keywords = {"survey", "recent methods"}
+
+        _, matched = detector._calculate_keyword_score(low_impact_paper)
+
+        assert sorted(matched) == ["recent methods", "survey"]
+
+
+class TestKeywordMatcher:
+    """Test the compiled keyword matcher."""
+
+    KEYWORDS = ["best", "attention", "self-attention", "novel approach", "novel", "a"]
+
+    @pytest.mark.parametrize("automaton_min_keywords", [0, 1000])
+    def test_matches_like_substring_search(self, automaton_min_keywords):
+        """Test both strategies find exactly the substrings, in keyword order."""
+        matcher = KeywordMatcher(self.KEYWORDS, automaton_min_keywords)
+        texts = [
+            "a novel approach with self-attention",
+            "bestow attentional focus",
+            "no match here",
+            "",
+            "selfattention novelty",
+        ]
+
+        assert matcher.uses_automaton == (automaton_min_keywords == 0)
+        for title in texts:
+            for abstract in texts:
+                assert matcher.find(title, abstract) == [
+                    keyword
+                    for keyword in self.KEYWORDS
+                    if keyword in title or keyword in abstract
+                ]
+
+    def test_keywords_do_not_span_texts(self):
+        """Test that a keyword is not found across the title/abstract boundary."""
+        matcher = KeywordMatcher(["novel approach"], automaton_min_keywords=0)
+
+        assert matcher.find("a novel", "approach") == []
+        assert matcher.find("a novel approach", "") == ["novel approach"]
+
+    def test_empty_keyword_matches_everything(self):
+        matcher = KeywordMatcher(["", "gpt"], automaton_min_keywords=0)
+
+        assert matcher.find("", "") == [""]
+        assert matcher.find("chatgpt") == ["", "gpt"]
@@ -0,0 +1,197 @@
+"""Unit tests for EntityResolver and the deduplicator built on it."""
+
+from datetime import datetime
+
+from compute_forecast.orchestration.core.data_processors import SimpleDeduplicator
+from compute_forecast.pipeline.consolidation.models import (
+    CitationData,
+    CitationRecord,
+    IdentifierData,
+    IdentifierRecord,
+)
+from compute_forecast.pipeline.metadata_collection.models import Author, Paper
+from compute_forecast.pipeline.metadata_collection.processors.entity_resolver import (
+    EntityResolver,
+    UnionFind,
+    normalize_identifier,
+)
+
+
+def create_paper(
+    title: str,
+    authors=("Alice Smith", "Bob Jones"),
+    venue: str = "NeurIPS",
+    year: int = 2023,
+    citation_count: int = 0,
+    **identifiers,
+) -> Paper:
+    citations = []
+    if citation_count:
+        citations.append(
+            CitationRecord(
+                source="test",
+                timestamp=datetime.now(),
+                original=True,
+                data=CitationData(count=citation_count),
+            )
+        )
+    return Paper(
+        title=title,
+        authors=[Author(name=name) for name in authors],
+        venue=venue,
+        year=year,
+        citations=citations,
+        **identifiers,
+    )
+
+
+class TestUnionFind:
+    def test_union_is_transitive(self):
+        sets = UnionFind()
+        for _ in range(4):
+            sets.add()
+
+        assert sets.union(0, 1)
+        assert sets.union(1, 2)
+        assert not sets.union(0, 2)
+        assert sets.find(0) == sets.find(2)
+        assert sets.find(3) != sets.find(0)
+
+
+class TestEntityResolver:
+    def test_normalize_identifier(self):
+        assert normalize_identifier("doi", "https://doi.org/10.1/ABC") == "10.1/abc"
+        assert normalize_identifier("arxiv", "arXiv:2301.00001v3") == "2301.00001"
+        assert normalize_identifier("openalex", "https://openalex.org/W123") == "w123"
+        assert normalize_identifier("doi", "  ") is None
+
+    def test_identifier_match_merges_different_titles(self):
+        resolver = EntityResolver()
+        resolver.add_papers(
+            [
+                create_paper("Attention Is All You Need", doi="10.1/attn"),
+                create_paper("Transformers", doi="https://doi.org/10.1/ATTN"),
+                create_paper("Unrelated Work", arxiv_id="2301.00001"),
+                create_paper(
+                    "Another Title",
+                    identifiers=[
+                        IdentifierRecord(
+                            source="test",
+                            timestamp=datetime.now(),
+                            original=True,
+                            data=IdentifierData("arxiv", "2301.00001v2"),
+                        )
+                    ],
+                ),
+            ]
+        )
+
+        assert resolver.clusters() == [[0, 1], [2, 3]]
+
+    def test_paper_ids_are_scoped_to_their_source(self):
+        resolver = EntityResolver()
+        resolver.add_papers(
+            [
+                create_paper(
+                    "Sparse Mixtures", paper_id="42", collection_source="pmlr"
+                ),
+                create_paper(
+                    "Dense Retrieval", paper_id="42", collection_source="ijcai"
+                ),
+                create_paper("Graph Kernels", paper_id="42"),
+                create_paper("Tabular Models", paper_id="42"),
+                create_paper("Speech Codecs", paper_id="42", collection_source="pmlr"),
+            ]
+        )
+
+        # Only the same scraper id from the same scraper is an identity match
+        assert resolver.clusters() == [[0, 4], [1], [2], [3]]
+
+    def test_fuzzy_title_match_within_blocks(self):
+        resolver = EntityResolver()
+        resolver.add_papers(
+            [
+                create_paper("Scaling Laws for Neural Language Models"),
+                create_paper("Scaling laws for neural language models."),
+                create_paper("Scaling Laws for Neural Langauge Models"),
+                create_paper("Graph Neural Networks for Molecules"),
+            ]
+        )
+
+        assert resolver.clusters() == [[0, 1, 2], [3]]
+        assert resolver.match_scores[(0, 1)] >= resolver.similarity_threshold
+
+    def test_transitive_merge_across_identifier_and_title(self):
+        resolver = EntityResolver()
+        resolver.add_papers(
+            [
+                create_paper("Deep Residual Learning", doi="10.1/resnet"),
+                create_paper("Deep Residual Learning for Image Recognition"),
+                create_paper("Deep Residual Learning for Image Recognition", doi=""),
+                create_paper("ResNet", doi="10.1/RESNET"),
+            ]
+        )
+
+        assert resolver.same_entity(1, 2)
+        assert resolver.same_entity(0, 3)
+        assert not resolver.same_entity(0, 1)
+
+    def test_incremental_batches_match_single_pass(self):
+        papers = [
+            create_paper("Learning to Rank with Transformers", year=2022),
+            create_paper(
+                "Diffusion Models Beat GANs",
+                paper_id="s2-1",
+                collection_source="semantic_scholar",
+            ),
+            create_paper("Learning to rank with transformers", year=2022),
+            create_paper("Diffusion Models Beat GANs on Image Synthesis"),
+            create_paper("Different Paper", paper_id="s2-1", source="semantic_scholar"),
+        ]
+
+        single = EntityResolver()
+        single.add_papers(papers)
+
+        incremental = EntityResolver()
+        incremental.add_papers(papers[:2])
+        merges = incremental.add_papers(papers[2:])
+
+        assert merges == 2
+        assert incremental.clusters() == single.clusters()
+
+    def test_canonical_paper_is_most_cited(self):
+        resolver = EntityResolver()
+        resolver.add_papers(
+            [
+                create_paper("Same Title", doi="10.1/x", citation_count=5),
+                create_paper("Same Title", doi="10.1/x", citation_count=50),
+                create_paper("Same Title", doi="10.1/x"),
+            ]
+        )
+
+        (cluster,) = resolver.clusters()
+        assert resolver.canonical_paper(cluster).get_latest_citations_count() == 50
+
+
+class TestSimpleDeduplicator:
+    def test_deduplicate_papers(self):
+        papers = [
+            create_paper("Scaling Laws for Neural Language Models", citation_count=3),
+            create_paper("Graph Neural Networks for Molecules"),
+            create_paper("Scaling laws for neural language models", citation_count=9),
+        ]
+
+        result = SimpleDeduplicator().deduplicate_papers(papers)
+
+        assert result.original_count == 3
+        assert result.deduplicated_count == 2
+        assert result.unique_papers == [papers[2], papers[1]]
+        assert result.duplicate_groups == [[papers[0], papers[2]]]
+        assert list(result.similarity_scores) == ["0_2"]
+
+    def test_same_paper_twice(self):
+        paper = create_paper("A Paper")
+
+        result = SimpleDeduplicator().deduplicate_papers([paper, paper])
+
+        assert result.unique_papers == [paper]
@@ -270,10 +270,26 @@ class TestBaseScraper:
         scraper = MockScraperImpl()
         with patch("time.sleep") as mock_sleep:
             response = scraper._make_request("https://example.com")
+            scraper._make_request("https://example.com")
 
-        mock_sleep.assert_called_once_with(1.0)  # rate limit delay
-        mock_get.assert_called_once()
+        # The second request waits for the provider's rate limit delay
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.0, abs=0.05)
+        assert mock_get.call_count == 2
         assert response == mock_response
+        assert scraper.rate_limiter.provider == "test_scraper"
+
+    @patch("requests.Session.get")
+    def test_make_request_backs_off_after_errors(self, mock_get):
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.HTTPError("503")
+        mock_get.return_value = mock_response
+
+        scraper = MockScraperImpl()
+        with patch("time.sleep"), pytest.raises(requests.HTTPError):
+            scraper._make_request("https://example.com")
+
+        assert scraper.rate_limiter.consecutive_errors == 1
 
     def test_validate_venue_year(self):
         scraper = MockScraperImpl()
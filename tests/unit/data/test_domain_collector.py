@@ -0,0 +1,184 @@
+"""Unit tests for the concurrent domain collection of DomainCollector."""
+
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+from compute_forecast.pipeline.metadata_collection.collectors.collection_jobs import (
+    CollectionJobScheduler,
+)
+from compute_forecast.pipeline.metadata_collection.collectors.domain_collector import (
+    DomainCollector,
+)
+from compute_forecast.utils.rate_governor import RateGovernor
+
+SOURCES = ["google_scholar", "semantic_scholar", "openalex"]
+
+
+class FakePaperCollector:
+    """CitationCollector with simulated per-source search latency"""
+
+    def __init__(self, latency=0.0, failing_source=None):
+        self.sources = {name: object() for name in SOURCES}
+        self.latency = latency
+        self.failing_source = failing_source
+        self.calls = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _search(self, method, key, year, working_apis, **fields):
+        sources = working_apis or SOURCES
+        with self._lock:
+            self.calls[method] += 1
+        time.sleep(self.latency * len(sources))
+        papers = []
+        for source in sources:
+            if source == self.failing_source:
+                raise RuntimeError(f"{source} is down")
+            for i in range(2):
+                papers.append(
+                    {
+                        # Each search shares one title with the other sources
+                        "title": f"{key} {year} paper {i if i else source}",
+                        "citations": (hash((key, source, i)) % 50),
+                        "source": source,
+                        "year": year,
+                        **fields,
+                    }
+                )
+        return papers
+
+    def collect_from_venue_year(self, venue, year, threshold, working_apis=None):
+        return self._search("venue", venue, year, working_apis)
+
+    def collect_from_venue_year_with_keywords(
+        self, venue, year, keywords, domain, working_apis=None
+    ):
+        return self._search(
+            "venue_keywords", f"{domain} {venue}", year, working_apis, domain=domain
+        )
+
+    def collect_from_keywords(self, keywords, year, domain, working_apis=None):
+        return self._search("keywords", domain, year, working_apis, domain=domain)
+
+
+def make_executor(paper_collector, domains=("Robotics", "Computer Vision")):
+    strategy = SimpleNamespace(
+        primary_venues=[SimpleNamespace(venue_name=name) for name in ("CoRL", "RSS")]
+    )
+    return SimpleNamespace(
+        paper_collector=paper_collector,
+        working_apis=None,
+        get_domains_from_analysis=lambda: list(domains),
+        collection_strategy_optimizer=SimpleNamespace(
+            generate_collection_strategy=lambda domain: strategy
+        ),
+        get_citation_threshold=lambda year: 0,
+        computational_analyzer=SimpleNamespace(
+            analyze_paper_content=lambda paper: {"computational_richness": 0.5}
+        ),
+        venue_classifier=SimpleNamespace(
+            get_venue_computational_score=lambda venue: 0.7
+        ),
+        rate_limiter=SimpleNamespace(wait=lambda operation: None),
+    )
+
+
+def make_scheduler(**kwargs):
+    return CollectionJobScheduler(
+        governor=RateGovernor(),
+        source_rate_limits={name: 1000.0 for name in SOURCES},
+        **kwargs,
+    )
+
+
+def comparable(papers):
+    return [
+        {k: v for k, v in paper.items() if k != "collection_timestamp"}
+        for paper in papers
+    ]
+
+
+class TestConcurrentDomainCollection:
+    def test_matches_serial_collection(self):
+        executor = make_executor(FakePaperCollector())
+        collector = DomainCollector(executor)
+
+        results = collector.execute_domain_collection(
+            target_per_domain_year=20, scheduler=make_scheduler(max_workers=4)
+        )
+
+        serial = DomainCollector(executor)
+        expected = []
+        for domain in ("Robotics", "Computer Vision"):
+            for year in range(2019, 2025):
+                expected.extend(
+                    serial.enrich_papers_with_analysis(
+                        serial.collect_domain_year_papers(domain, year, 20),
+                        domain,
+                        year,
+                    )
+                )
+
+        assert comparable(results["raw_papers"]) == comparable(expected)
+        assert results["collection_stats"]["Robotics"][2019] == 20
+        assert sum(results["source_distribution"].values()) == len(expected)
+        assert results["failed_searches"] == []
+
+    def test_direct_search_only_below_target(self):
+        paper_collector = FakePaperCollector()
+        collector = DomainCollector(make_executor(paper_collector, ["Robotics"]))
+
+        collector.execute_domain_collection(
+            target_per_domain_year=5, scheduler=make_scheduler()
+        )
+        assert paper_collector.calls["keywords"] == 0
+
+        collector.execute_domain_collection(
+            target_per_domain_year=1000, scheduler=make_scheduler()
+        )
+        # One backup search per source and year
+        assert paper_collector.calls["keywords"] == 3 * 6
+
+    def test_sources_are_searched_concurrently(self):
+        latency = 0.01
+        paper_collector = FakePaperCollector(latency=latency)
+        collector = DomainCollector(make_executor(paper_collector, ["Robotics"]))
+        scheduler = make_scheduler(max_workers=8, source_concurrency={"openalex": 2})
+
+        start = time.monotonic()
+        results = collector.execute_domain_collection(
+            target_per_domain_year=8, scheduler=scheduler
+        )
+        elapsed = time.monotonic() - start
+
+        searches = sum(paper_collector.calls.values())
+        # 6 years of 7 venues on 3 sources
+        assert searches == 6 * 7 * 3
+        assert len(results["raw_papers"]) == 6 * 8
+        # The slowest sources run one search at a time, 42 searches each
+        assert elapsed < searches * latency / 2
+        assert scheduler.peak_in_flight == {
+            "google_scholar": 1,
+            "semantic_scholar": 1,
+            "openalex": 2,
+        }
+
+    def test_failed_source_is_recorded(self):
+        collector = DomainCollector(
+            make_executor(FakePaperCollector(failing_source="openalex"), ["Robotics"])
+        )
+
+        results = collector.execute_domain_collection(
+            target_per_domain_year=8, scheduler=make_scheduler()
+        )
+
+        failures = results["failed_searches"]
+        assert len(failures) == 6 * 7
+        assert {failure["source"] for failure in failures} == {"openalex"}
+        assert {failure["method"] for failure in failures} == {
+            "venue_search",
+            "keyword_search",
+        }
+        assert all(paper["source"] != "openalex" for paper in results["raw_papers"])
+        assert results["collection_stats"]["Robotics"][2024] == 8
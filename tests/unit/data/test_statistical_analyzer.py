@@ -0,0 +1,125 @@
+"""Unit tests for StatisticalAnalyzer."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from compute_forecast.pipeline.metadata_collection.analysis import (
+    StatisticalAnalyzer,
+)
+
+
+def make_papers():
+    return [
+        {
+            "paper_id": "1",
+            "venue": "NeurIPS",
+            "year": 2021,
+            "citation_count": 100,
+            "author_count": 4,
+            "page_count": 10,
+        },
+        {
+            "paper_id": "2",
+            "venue": "neurips",
+            "year": 2022,
+            "citation_count": 10,
+            "author_count": 1,
+        },
+        {
+            "paper_id": "3",
+            "venue": "NeurIPS",
+            "year": 2023,
+            "citation_count": 3,
+            "author_count": 2,
+            "page_count": 8,
+        },
+        {"paper_id": "4", "venue": "ICML", "year": 2022, "citation_count": None},
+        {"paper_id": "5", "venue": "ICML", "year": 2023, "citation_count": 8},
+        {"paper_id": "6", "year": 1800, "citation_count": 1},
+    ]
+
+
+class TestStatisticalAnalyzer:
+    @pytest.fixture
+    def analyzer(self):
+        return StatisticalAnalyzer()
+
+    def test_paper_collection(self, analyzer):
+        stats = analyzer.analyze_paper_collection(make_papers())
+
+        assert stats.total_papers == 6
+        assert stats.citation_stats["total_citations"] == 122
+        assert stats.citation_stats["max"] == 100.0
+        assert stats.author_stats["single_author_papers"] == 1
+        assert stats.venue_distribution == {"NeurIPS": 2, "neurips": 1, "ICML": 2}
+        assert stats.year_distribution == {2021: 1, 2022: 2, 2023: 2}
+        assert stats.temporal_coverage == 3
+        # Average citations fall from 100 in 2021 to 5.5 in 2023
+        assert stats.citation_growth_rate == pytest.approx((5.5 / 100) ** 0.5 - 1)
+
+    def test_venue_specific(self, analyzer):
+        stats = analyzer.analyze_venue_specific(make_papers(), "NeurIPS")
+
+        assert stats.total_papers == 3
+        assert stats.years_covered == [2021, 2022, 2023]
+        assert stats.impact_metrics["h_index"] == 3
+        assert stats.impact_metrics["high_impact_papers"] == 1
+        assert stats.citation_metrics["peak_year"] == 2021
+        assert stats.citation_metrics["citation_growth_trend"] == "decreasing"
+        assert stats.author_metrics["estimated_unique_authors"] == 4
+        assert stats.quality_metrics["poor_papers"] == 2
+
+    def test_compare_venues_matches_single_venue_analysis(self, analyzer):
+        papers = make_papers()
+
+        comparison = analyzer.compare_venues(papers, ["NeurIPS", "ICML", "Missing"])
+
+        fresh = StatisticalAnalyzer()
+        for venue, stats in comparison.items():
+            assert stats.to_dict() == (
+                fresh.analyze_venue_specific(papers, venue).to_dict()
+            )
+        assert comparison["Missing"].total_papers == 0
+
+    def test_h_index_and_skewness(self, analyzer):
+        assert analyzer._calculate_h_index([10, 8, 5, 4, 3]) == 4
+        assert analyzer._calculate_h_index([0, 0]) == 0
+        assert analyzer._calculate_h_index([]) == 0
+        assert analyzer._calculate_skewness([1, 1, 1]) == 0.0
+        assert analyzer._calculate_skewness([1, 2, 3, 10]) > 0
+
+    def test_cache_is_keyed_by_content(self, analyzer):
+        papers = make_papers()
+        first = analyzer.analyze_paper_collection(papers)
+
+        assert analyzer.analyze_paper_collection(make_papers()) is first
+
+        # Same length and paper IDs, different citations
+        papers[0]["citation_count"] = 1000
+        changed = analyzer.analyze_paper_collection(papers)
+        assert changed is not first
+        assert changed.citation_stats["max"] == 1000.0
+
+    def test_cache_evicts_least_recently_used(self):
+        analyzer = StatisticalAnalyzer(max_cache_entries=2)
+        collections = [
+            [{"paper_id": "1", "citation_count": count}] for count in range(3)
+        ]
+
+        first = analyzer.analyze_paper_collection(collections[0])
+        analyzer.analyze_paper_collection(collections[1])
+        # Using the first collection again makes the second the oldest
+        assert analyzer.analyze_paper_collection(collections[0]) is first
+        analyzer.analyze_paper_collection(collections[2])
+
+        assert len(analyzer.analysis_cache) == 2
+        assert analyzer.analyze_paper_collection(collections[0]) is first
+
+    def test_expired_results_are_recomputed(self, analyzer):
+        papers = make_papers()
+        first = analyzer.analyze_paper_collection(papers)
+        key = next(iter(analyzer.analysis_cache))
+        analyzer.analysis_cache[key] = (datetime.now() - timedelta(hours=2), first)
+
+        assert analyzer.analyze_paper_collection(papers) is not first
@@ -23,6 +23,9 @@ from compute_forecast.pipeline.analysis.computational.extraction_protocol import
     ExtractionPhase,
     ExtractionDecisionTree,
 )
+from compute_forecast.pipeline.analysis.computational.section_index import (
+    SectionIndex,
+)
 
 
 @pytest.fixture
@@ -359,6 +362,27 @@ class TestExtractionProtocol:
         nonexistent_content = extraction_protocol._find_section_content("nonexistent")
         assert nonexistent_content == ""
 
+    def test_find_section_content_prefers_heading(self):
+        """Test that a section heading wins over an earlier mention."""
+        content = (
+            "Abstract\nOur results section shows large gains.\n\n"
+            "4 Results\nWe trained for 10 days on TPUs.\n"
+        )
+        protocol = ExtractionProtocol(content, "heading_paper", "test_analyst")
+
+        results_content = protocol._find_section_content("results")
+        assert results_content.startswith("Results")
+        assert "10 days" in results_content
+
+    def test_section_index_rebuilt_on_content_change(self, extraction_protocol):
+        """Test that the section index follows changes of the paper content."""
+        index = extraction_protocol.section_index
+        assert extraction_protocol.section_index is index
+
+        extraction_protocol.paper_content = "Trained on A100 GPUs."
+        assert extraction_protocol.section_index is not index
+        assert extraction_protocol._extract_hardware_specs()["gpu_type"] == "A100"
+
     def test_extract_hardware_specs(self, extraction_protocol):
         """Test hardware specification extraction."""
         hardware_info = extraction_protocol._extract_hardware_specs()
@@ -538,3 +562,77 @@ class TestExtractionProtocolEdgeCases:
         results = extraction_protocol.phase2_automated_extraction(mock_analyzer)
         assert "confidence_score" in results
         assert results["confidence_score"] == 0.0
+
+
+class TestSectionIndex:
+    """Test the section segmentation index."""
+
+    def test_headings(self):
+        """Test detection of plain and numbered section headings."""
+        index = SectionIndex(
+            "Abstract\nWe study scaling.\n3.1 Experimental Setup\n"
+            "This long sentence, with commas, is not a heading.\nII. Results\n"
+        )
+
+        assert [h.title for h in index.headings] == [
+            "Abstract",
+            "Experimental Setup",
+            "Results",
+        ]
+        assert index.find_heading("setup").title == "Experimental Setup"
+        assert index.find_heading("conclusion") is None
+
+    def test_wrapped_body_lines_are_not_headings(self):
+        """Test that short capitalized lines need numbering or a section name."""
+        index = SectionIndex(
+            "2 Method\nWe train a large network.\n"
+            "Implementation of the model uses\nmixed precision.\n\n"
+            "3 Scaling Behaviour\nLoss falls with compute.\n"
+            "4 Training\nWe train for 5 days.\n"
+        )
+
+        assert [h.title for h in index.headings] == [
+            "Method",
+            "Scaling Behaviour",
+            "Training",
+        ]
+        assert index.find_heading("implementation") is None
+
+    def test_find_matches_str_find(self):
+        """Test that token table lookups agree with scanning the text."""
+        content = (
+            "Introduction\nWe pretrain RoBERTa on 8 V100 GPUs, 960 GPU-hours "
+            "in total (tab. 2).\nEstimated cost was $2,880 for gpu hours.\n"
+        )
+        index = SectionIndex(content)
+
+        for term in [
+            "gpu",
+            "gpus",
+            "bert",
+            "v100",
+            "gpu-hours",
+            "gpu hours",
+            "tab.",
+            "$",
+            "2,880",
+            "in total",
+            " total",
+            "hours.",
+            "tpu",
+            "a100",
+        ]:
+            assert index.find(term) == index.content_lower.find(term), term
+
+    def test_find_and_section_at(self):
+        """Test term lookups and mapping positions to sections."""
+        index = SectionIndex(
+            "Introduction\nWe use GPUs.\nMethod\nTraining took 5 days."
+        )
+
+        position = index.find("days")
+        assert position == index.content.lower().find("days")
+        assert index.contains("gpus")
+        assert not index.contains("tpu")
+        assert index.section_at(position).title == "Method"
+        assert index.section_at(0).title == "Introduction"
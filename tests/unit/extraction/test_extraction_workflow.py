@@ -0,0 +1,82 @@
+"""Tests for the batch extraction workflow runner."""
+
+import pytest
+
+from compute_forecast.pipeline.analysis.computational.extraction_workflow import (
+    ExtractionWorkflowOrchestrator,
+    WorkflowStatus,
+)
+
+PAPER_CONTENT = (
+    "We trained our model on 64 NVIDIA A100 GPUs for 168 hours. "
+    "The model has 13 billion parameters and uses the Transformer architecture. "
+) * 3
+
+
+def paper_stream(count, pulled):
+    """Yield papers, recording how many have been read."""
+    for i in range(count):
+        pulled.append(i)
+        yield f"paper_{i}", PAPER_CONTENT
+
+
+@pytest.fixture
+def orchestrator():
+    return ExtractionWorkflowOrchestrator()
+
+
+def test_batch_inline_streams_results_to_disk(orchestrator, tmp_path):
+    pulled = []
+    results = orchestrator.run_extraction_batch(
+        paper_stream(3, pulled), "analyst", output_path=tmp_path, max_workers=0
+    )
+
+    first = next(results)
+    # Papers are read lazily and finished workflows are not retained
+    assert pulled == [0]
+    assert orchestrator.active_workflows == {}
+    assert first.overall_status == WorkflowStatus.COMPLETED
+
+    remaining = list(results)
+    assert [r.paper_id for r in [first] + remaining] == [
+        "paper_0",
+        "paper_1",
+        "paper_2",
+    ]
+    summaries = sorted(p.name for p in (tmp_path / "summaries").iterdir())
+    assert len(summaries) == 3
+    assert all(name.startswith("paper_") for name in summaries)
+
+
+def test_batch_process_pool_bounds_in_flight(orchestrator, tmp_path):
+    pulled = []
+    results = orchestrator.run_extraction_batch(
+        paper_stream(6, pulled),
+        "analyst",
+        output_path=tmp_path,
+        max_workers=2,
+        max_in_flight=2,
+    )
+
+    first = next(results)
+    assert len(pulled) <= 3
+    assert len(orchestrator.active_workflows) <= 2
+
+    completed = [first] + list(results)
+    assert sorted(r.paper_id for r in completed) == [f"paper_{i}" for i in range(6)]
+    assert all(r.overall_status == WorkflowStatus.COMPLETED for r in completed)
+    assert all(r.steps[1].result["confidence_score"] >= 0 for r in completed)
+    assert orchestrator.active_workflows == {}
+    assert len(list((tmp_path / "summaries").iterdir())) == 6
+
+
+def test_batch_failed_workflow_is_saved(orchestrator, tmp_path):
+    results = list(
+        orchestrator.run_extraction_batch(
+            [("empty", "   ")], "analyst", output_path=tmp_path, max_workers=0
+        )
+    )
+
+    assert results[0].overall_status == WorkflowStatus.FAILED
+    assert "Paper content is empty" in results[0].steps[-1].errors
+    assert len(list((tmp_path / "summaries").iterdir())) == 1
@@ -382,14 +382,16 @@ class TestEnhancedCollectionOrchestrator:
         )
 
         # Collect from single source
-        orchestrator._collect_from_source_with_rate_limit(
-            "semantic_scholar", sample_query
-        )
+        with patch("time.sleep") as mock_sleep:
+            orchestrator._collect_from_source_with_rate_limit(
+                "semantic_scholar", sample_query
+            )
 
-        # Verify rate limiting was called
+        # Verify rate limiting was called and its wait applied
         orchestrator.rate_limiter.wait_if_needed.assert_called_once_with(
             "semantic_scholar"
         )
+        mock_sleep.assert_called_once_with(2.5)
         orchestrator.rate_limiter.record_request.assert_called_once()
 
     def test_query_with_keywords(self, orchestrator, sample_query):
@@ -0,0 +1,164 @@
+"""
+Unit tests for the append-only session checkpoint log.
+"""
+
+from datetime import datetime, timedelta
+
+from compute_forecast.pipeline.metadata_collection.collectors.session_log import (
+    SessionLog,
+)
+from compute_forecast.pipeline.metadata_collection.collectors.state_management import (
+    StateManager,
+)
+from compute_forecast.pipeline.metadata_collection.collectors.state_structures import (
+    CheckpointData,
+    VenueConfig,
+)
+
+VENUES = [(f"venue_{i}", 2000 + i % 25) for i in range(500)]
+
+
+def make_checkpoint(step: int, session_id: str = "session") -> CheckpointData:
+    """Checkpoint after completing the first ``step`` venues of VENUES"""
+    completed = VENUES[:step]
+    return CheckpointData(
+        checkpoint_id=f"checkpoint_{step}",
+        session_id=session_id,
+        checkpoint_type="venue_completed",
+        timestamp=datetime(2024, 1, 1) + timedelta(minutes=step),
+        venues_completed=completed,
+        venues_in_progress=VENUES[step : step + 1],
+        venues_not_started=VENUES[step + 1 :],
+        papers_collected=10 * step,
+        papers_by_venue={venue: {year: 10} for venue, year in completed},
+        last_successful_operation=f"step_{step}",
+        api_health_status={},
+        rate_limit_status={},
+    )
+
+
+def segments(log_dir):
+    return sorted(log_dir.glob("segment_*.log"))
+
+
+class TestSessionLog:
+    def test_round_trip(self, tmp_path):
+        log = SessionLog(tmp_path)
+        for step in range(5):
+            log.append(make_checkpoint(step))
+        log.close()
+
+        reopened = SessionLog(tmp_path)
+        for step in (4, 1):
+            checkpoint = reopened.get(f"checkpoint_{step}")
+            assert checkpoint.to_dict() == make_checkpoint(step).to_dict()
+            assert checkpoint.validate_integrity()
+        assert reopened.latest().checkpoint_id == "checkpoint_4"
+        assert [cp.papers_collected for cp in reopened.checkpoints()] == [
+            0,
+            10,
+            20,
+            30,
+            40,
+        ]
+        assert reopened.venue_states()[VENUES[0]].status == "venues_completed"
+
+    def test_record_size_follows_changes(self, tmp_path):
+        log = SessionLog(tmp_path)
+        log.append(make_checkpoint(0))
+        first_size = segments(tmp_path)[0].stat().st_size
+        log.append(make_checkpoint(1))
+        delta_size = segments(tmp_path)[0].stat().st_size - first_size
+
+        # Completing one venue rewrites two venue entries, not all 500
+        assert delta_size < first_size / 20
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        log = SessionLog(tmp_path)
+        log.append(make_checkpoint(0))
+        log.append(make_checkpoint(1))
+        log.close()
+        with open(segments(tmp_path)[0], "ab") as f:
+            f.write(b"\x00\x00\x01\x00partial")
+
+        reopened = SessionLog(tmp_path)
+        assert reopened.latest().checkpoint_id == "checkpoint_1"
+        reopened.append(make_checkpoint(2))
+        reopened.close()
+
+        assert SessionLog(tmp_path).latest().to_dict() == make_checkpoint(2).to_dict()
+
+    def test_corrupt_segment_keeps_valid_prefix(self, tmp_path):
+        log = SessionLog(tmp_path, segment_max_bytes=1, compact_after_segments=100)
+        for step in range(3):
+            log.append(make_checkpoint(step))
+        log.close()
+        second = segments(tmp_path)[1]
+        second.write_bytes(second.read_bytes()[:-5] + b"xxxxx")
+
+        reopened = SessionLog(tmp_path)
+
+        assert [entry.checkpoint_id for entry in reopened.entries()] == ["checkpoint_0"]
+        assert list(tmp_path.glob("*.corrupt"))
+        reopened.append(make_checkpoint(3))
+        assert reopened.get("checkpoint_3").validate_integrity()
+
+    def test_drop_and_compact(self, tmp_path):
+        log = SessionLog(tmp_path)
+        for step in range(6):
+            log.append(make_checkpoint(step))
+        assert log.drop(["checkpoint_0", "checkpoint_1", "missing"]) == 2
+        log.compact()
+        log.append(make_checkpoint(6))
+        log.close()
+
+        reopened = SessionLog(tmp_path)
+        assert len(segments(tmp_path)) == 1
+        assert [entry.checkpoint_id for entry in reopened.entries()] == [
+            f"checkpoint_{step}" for step in range(2, 7)
+        ]
+        assert reopened.get("checkpoint_3").to_dict() == make_checkpoint(3).to_dict()
+
+    def test_segments_are_compacted(self, tmp_path):
+        log = SessionLog(tmp_path, segment_max_bytes=1, compact_after_segments=3)
+        for step in range(10):
+            log.append(make_checkpoint(step))
+
+        assert len(segments(tmp_path)) <= 3
+        assert len(log.entries()) == 10
+        assert log.get("checkpoint_5").to_dict() == make_checkpoint(5).to_dict()
+
+    def test_interrupted_compaction_leftovers_are_ignored(self, tmp_path):
+        log = SessionLog(tmp_path)
+        for step in range(3):
+            log.append(make_checkpoint(step))
+        leftover = segments(tmp_path)[0].read_bytes()
+        log.compact()
+        log.close()
+        # A crash before the old segments were deleted
+        (tmp_path / "segment_00000000.log").write_bytes(leftover)
+
+        reopened = SessionLog(tmp_path)
+        assert len(reopened.entries()) == 3
+        assert len(segments(tmp_path)) == 1
+
+
+class TestStateManagerLog:
+    def test_progress_survives_restart(self, tmp_path):
+        manager = StateManager(base_state_dir=tmp_path)
+        session_id = manager.create_session(
+            target_venues=[VenueConfig(venue_name="venue_0", target_years=[2000])],
+            target_years=[2000],
+            collection_config={},
+        )
+        checkpoint = make_checkpoint(1, session_id)
+        checkpoint_id = manager.save_checkpoint(session_id, checkpoint)
+
+        restarted = StateManager(base_state_dir=tmp_path)
+        session = restarted.get_session_status(session_id)
+
+        assert session.last_checkpoint_id == checkpoint_id
+        assert session.venues_completed == [("venue_0", 2000)]
+        assert session.total_papers_collected == 10
+        latest = restarted.load_latest_checkpoint(session_id)
+        assert latest.checkpoint_id == checkpoint_id
@@ -0,0 +1,168 @@
+"""Tests for cursor-paged, bounded streaming collection to JSONL."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from compute_forecast.pipeline.metadata_collection.collectors.enhanced_orchestrator_streaming import (
+    EnhancedCollectionOrchestratorStreaming,
+)
+from compute_forecast.pipeline.metadata_collection.collectors.streaming_sink import (
+    PaperIdentityStore,
+)
+from compute_forecast.pipeline.metadata_collection.models import (
+    APIResponse,
+    Author,
+    CollectionQuery,
+    Paper,
+    ResponseMetadata,
+)
+
+
+def make_paper(index: int, prefix: str = "Paper", **kwargs) -> Paper:
+    return Paper(
+        title=f"{prefix} number {index}",
+        authors=[Author(name="Test Author")],
+        venue="ICML",
+        year=2023,
+        **kwargs,
+    )
+
+
+class FakeCursorSource:
+    """Source serving fixed pages through cursors"""
+
+    supports_cursor_pagination = True
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.cursors = []
+
+    def search_papers(self, query, year, limit=500, offset=0, cursor=None):
+        self.cursors.append(cursor)
+        index = 0 if cursor == "*" else int(cursor)
+        next_cursor = str(index + 1) if index + 1 < len(self.pages) else None
+        return APIResponse(
+            success=True,
+            papers=self.pages[index],
+            metadata=ResponseMetadata(
+                total_results=sum(len(page) for page in self.pages),
+                returned_count=len(self.pages[index]),
+                query_used=query,
+                response_time_ms=1.0,
+                api_name="fake",
+                timestamp=datetime.now(),
+                next_cursor=next_cursor,
+            ),
+        )
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = EnhancedCollectionOrchestratorStreaming(
+        batch_size=10, max_memory_papers=3
+    )
+    orchestrator.rate_limiter.wait_if_needed = lambda source_name: 0.0
+    return orchestrator
+
+
+class TestStreamingCollection:
+    def test_cursor_pagination(self, orchestrator):
+        source = FakeCursorSource(
+            [
+                [make_paper(i) for i in range(page * 5, page * 5 + 5)]
+                for page in range(3)
+            ]
+        )
+        orchestrator.sources = {"semantic_scholar": source}
+        query = CollectionQuery(domain="ml", year=2023, max_results=12)
+
+        batches = list(
+            orchestrator._stream_from_source_paginated("semantic_scholar", query)
+        )
+
+        assert [len(batch) for batch in batches] == [5, 5, 2]
+        assert source.cursors == ["*", "1", "2"]
+
+    def test_collect_to_jsonl_deduplicates_across_sources(self, orchestrator, tmp_path):
+        orchestrator.sources = {
+            "semantic_scholar": FakeCursorSource(
+                [
+                    [
+                        make_paper(
+                            i, paper_id=f"s2-{i}", collection_source="semantic_scholar"
+                        )
+                        for i in range(4)
+                    ]
+                ]
+            ),
+            "openalex": FakeCursorSource(
+                [
+                    [make_paper(i) for i in range(2, 6)],
+                    [
+                        make_paper(
+                            9,
+                            paper_id="s2-0",
+                            prefix="Renamed",
+                            source="semantic_scholar",
+                        )
+                    ],
+                ]
+            ),
+        }
+        query = CollectionQuery(domain="ml", year=2023, max_results=100)
+        output_path = tmp_path / "papers.jsonl"
+
+        result = orchestrator.collect_to_jsonl(query, output_path)
+
+        titles = [json.loads(line)["title"] for line in output_path.open()]
+        assert result.total_papers_processed == 9
+        assert result.duplicates_removed == 3
+        assert sorted(titles) == [f"Paper number {i}" for i in range(6)]
+        assert sum(result.source_counts.values()) == 6
+
+        # A second run with the same identity store skips collected papers
+        rerun = orchestrator.collect_to_jsonl(query, output_path)
+        assert rerun.duplicates_removed == 9
+        assert len(output_path.read_text().splitlines()) == 6
+
+    @pytest.mark.asyncio
+    async def test_merge_queue_applies_backpressure(self, orchestrator):
+        pages = [
+            [make_paper(i) for i in range(page * 10, page * 10 + 10)]
+            for page in range(5)
+        ]
+        orchestrator.sources = {"openalex": FakeCursorSource(pages)}
+        query = CollectionQuery(domain="ml", year=2023, max_results=50)
+
+        stream = orchestrator._merge_source_streams(query, ["openalex"])
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        # The producer stalls on the full queue instead of fetching all pages
+        assert first[0] == "openalex"
+        assert len(orchestrator.sources["openalex"].cursors) < len(pages)
+
+
+class TestPaperIdentityStore:
+    def test_identifier_and_title_keys(self, tmp_path):
+        store = PaperIdentityStore(tmp_path / "ids.db")
+
+        assert store.add_if_new(make_paper(1, doi="10.1/X"))
+        assert not store.add_if_new(make_paper(2, doi="https://doi.org/10.1/x"))
+        assert not store.add_if_new(make_paper(1))
+        assert store.add_if_new(make_paper(3))
+        # Scraper ids only identify papers of the same scraper
+        assert store.add_if_new(make_paper(4, paper_id="7", collection_source="pmlr"))
+        assert store.add_if_new(make_paper(5, paper_id="7", collection_source="cvf"))
+        assert not store.add_if_new(
+            make_paper(6, paper_id="7", collection_source="pmlr")
+        )
+        assert store.add_if_new(make_paper(7, paper_id="7"))
+        assert store.add_if_new(make_paper(8, paper_id="7"))
+        store.close()
+
+        reopened = PaperIdentityStore(tmp_path / "ids.db")
+        assert not reopened.add_if_new(make_paper(3))
+        reopened.close()
@@ -0,0 +1,49 @@
+"""Tests for the metrics notifications of the workflow coordinator."""
+
+from unittest.mock import Mock
+
+from compute_forecast.orchestration.core.workflow_coordinator import (
+    WorkflowCoordinator,
+)
+
+
+def run_workflow(metrics_collector, venues=("ICML", "ICLR"), years=(2023,)):
+    deduplicator = Mock()
+    deduplicator.deduplicate_papers.return_value = Mock(
+        original_count=10, deduplicated_count=10
+    )
+    state_manager = Mock()
+
+    WorkflowCoordinator().execute_venue_collection_workflow(
+        session_id="session",
+        venues=list(venues),
+        years=list(years),
+        api_engine=Mock(),
+        state_manager=state_manager,
+        venue_normalizer=Mock(),
+        deduplicator=deduplicator,
+        citation_analyzer=Mock(),
+        metrics_collector=metrics_collector,
+    )
+    return state_manager
+
+
+def test_checkpoints_and_venue_progress_notify_metrics_collector():
+    metrics_collector = Mock()
+
+    state_manager = run_workflow(metrics_collector)
+
+    # Workflow start and end, plus start and completion of each venue
+    assert state_manager.save_checkpoint.call_count == 6
+    assert metrics_collector.notify_checkpoint_written.call_count == 6
+    # Start and end of each venue
+    assert metrics_collector.notify_venue_progress_changed.call_count == 4
+
+
+def test_collectors_without_notifications_are_supported():
+    metrics_collector = Mock(spec=["record_venue_completion"])
+
+    state_manager = run_workflow(metrics_collector)
+
+    assert state_manager.save_checkpoint.call_count == 6
+    assert metrics_collector.record_venue_completion.call_count == 2
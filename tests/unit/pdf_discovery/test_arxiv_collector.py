@@ -1,6 +1,7 @@
 """Tests for ArXiv PDF collector."""
 
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from datetime import datetime
 
@@ -309,6 +310,9 @@ class TestArXivPDFCollector:
             ),
         ]
 
+        # Exercise the per-paper path rather than the batch API lookups
+        collector.supports_batch = False
+
         with patch.object(collector, "_discover_single") as mock_discover:
             mock_discover.side_effect = [
                 PDFRecord(
@@ -333,6 +337,135 @@ class TestArXivPDFCollector:
             assert collector.get_statistics()["failed"] == 1
 
 
+def atom_feed(*entries, authors=("Some Author",)) -> bytes:
+    """Build an arXiv Atom response from (id_url, title) pairs."""
+    author_xml = "".join(f"<author><name>{name}</name></author>" for name in authors)
+    body = "".join(
+        f"<entry><id>{entry_id}</id><title>{title}</title>{author_xml}</entry>"
+        for entry_id, title in entries
+    )
+    return (
+        f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Query</title>{body}</feed>'
+    ).encode()
+
+
+class TestArXivBatchDiscovery:
+    """Test bulk arXiv ID resolution and combined title searches."""
+
+    @pytest.fixture
+    def collector(self):
+        collector = ArXivPDFCollector()
+        collector.rate_limiter.min_interval = 0
+        return collector
+
+    def make_paper(self, paper_id, title, arxiv_id=None):
+        paper = create_test_paper(
+            paper_id=paper_id,
+            title=title,
+            authors=[Author(name="Some Author")],
+            year=2020,
+            venue="Venue",
+            citation_count=0,
+        )
+        paper.arxiv_id = arxiv_id
+        return paper
+
+    @patch("requests.get")
+    def test_ids_resolved_in_one_request(self, mock_get, collector):
+        papers = [
+            self.make_paper("p1", "First", "1706.03762v2"),
+            self.make_paper("p2", "Second", "1512.03385"),
+            self.make_paper("p3", "Missing", "2101.99999"),
+        ]
+        mock_get.return_value = Mock(
+            content=atom_feed(
+                ("http://arxiv.org/abs/1706.03762v7", "First"),
+                ("http://arxiv.org/abs/1512.03385v1", "Second"),
+                ("http://arxiv.org/api/errors#incorrect_id_format", "Error"),
+            )
+        )
+
+        results = collector.discover_pdfs(papers)
+
+        assert mock_get.call_count == 1
+        params = mock_get.call_args[1]["params"]
+        assert params["id_list"] == "1706.03762,1512.03385,2101.99999"
+        assert set(results) == {"p1", "p2"}
+        assert results["p1"].pdf_url == "https://arxiv.org/pdf/1706.03762.pdf"
+        assert results["p1"].confidence_score == 0.95
+        assert results["p1"].version_info["original_version"] == "v2"
+        assert results["p1"].version_info["latest_version"] == "v7"
+        assert results["p2"].confidence_score == 0.8
+        assert collector.get_statistics()["failed"] == 1
+
+    @patch("requests.get")
+    def test_titles_searched_in_combined_query(self, mock_get, collector):
+        papers = [
+            self.make_paper("p1", "Attention Is All You Need"),
+            self.make_paper("p2", "Deep Residual Learning: for Images"),
+            self.make_paper("p3", "Not On ArXiv"),
+        ]
+        mock_get.return_value = Mock(
+            content=atom_feed(
+                (
+                    "http://arxiv.org/abs/1512.03385v1",
+                    "Deep Residual Learning for\n Images",
+                ),
+                ("http://arxiv.org/abs/1706.03762v7", "Attention Is All You Need"),
+            )
+        )
+
+        results = collector.discover_pdfs(papers)
+
+        assert mock_get.call_count == 1
+        query = mock_get.call_args[1]["params"]["search_query"]
+        assert query.count(" OR ") == 2
+        assert '(ti:"deep residual learning for images" AND au:"author")' in query
+        assert results["p1"].version_info["arxiv_id"] == "1706.03762"
+        assert results["p2"].version_info["arxiv_id"] == "1512.03385"
+        assert "p3" not in results
+        assert all(r.confidence_score <= 0.8 for r in results.values())
+
+    @patch("requests.get")
+    def test_batch_search_requires_exact_title_and_author(self, mock_get, collector):
+        papers = [
+            self.make_paper("p1", "Learning"),
+            self.make_paper("p2", "Attention Is All You Need"),
+        ]
+        mock_get.return_value = Mock(
+            content=atom_feed(
+                ("http://arxiv.org/abs/1512.03385v1", "Deep Residual Learning"),
+                ("http://arxiv.org/abs/1706.03762v7", "Attention Is All You Need"),
+                authors=("Ashish Vaswani",),
+            )
+        )
+
+        results = collector.discover_pdfs(papers)
+
+        query = mock_get.call_args[1]["params"]["search_query"]
+        assert '(ti:"attention is all you need" AND au:"author")' in query
+        # A longer title containing "learning" and a different author don't match
+        assert results == {}
+
+    @patch("requests.get")
+    def test_failed_id_lookup_falls_back_to_title_search(self, mock_get, collector):
+        paper = self.make_paper("p1", "Attention Is All You Need", "1706.03762")
+        mock_get.side_effect = [
+            requests.ConnectionError("unreachable"),
+            Mock(
+                content=atom_feed(
+                    ("http://arxiv.org/abs/1706.03762v7", "Attention Is All You Need")
+                )
+            ),
+        ]
+
+        results = collector.discover_pdfs([paper])
+
+        assert mock_get.call_count == 2
+        assert "search_query" in mock_get.call_args[1]["params"]
+        assert results["p1"].version_info["arxiv_id"] == "1706.03762"
+
+
 class TestArXivIDExtraction:
     """Test arXiv ID extraction patterns."""
 
@@ -333,3 +333,80 @@ class TestOpenReviewPDFCollector:
         assert initial_stats["attempted"] == 0
         assert initial_stats["successful"] == 0
         assert initial_stats["failed"] == 0
+
+
+def create_submission(index: int, title: str) -> Mock:
+    """Create a mock OpenReview submission."""
+    submission = Mock()
+    submission.id = f"forum_{index}"
+    submission.forum = f"forum_{index}"
+    submission.content = {
+        "title": {"value": title},
+        "authors": {"value": [f"Author {index}"]},
+    }
+    return submission
+
+
+class TestOpenReviewVenueIndex:
+    """Test the per-venue submission index used for title matching."""
+
+    @pytest.fixture
+    def submissions(self):
+        return [create_submission(i, f"Submission Number {i}") for i in range(1500)]
+
+    @patch("openreview.api.OpenReviewClient")
+    def test_batch_fetches_each_venue_once(self, mock_client_class, submissions):
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        mock_client.get_all_notes.return_value = submissions
+
+        collector = OpenReviewPDFCollector()
+        papers = [
+            create_test_paper(
+                paper_id=f"p{i}",
+                title=title,
+                authors=[Author(name=f"Author {i}")],
+                venue="ICLR",
+                year=2024,
+                citation_count=0,
+            )
+            for i, title in [
+                (3, "Submission Number 3"),
+                (1200, "submission number 1200."),  # Beyond the old 1000 limit
+                (42, "Submision Number 42"),  # Fuzzy match
+            ]
+        ]
+
+        results = collector.discover_pdfs(papers)
+
+        assert mock_client.get_all_notes.call_count == 1
+        assert {k: v.version_info["forum_id"] for k, v in results.items()} == {
+            "p3": "forum_3",
+            "p1200": "forum_1200",
+            "p42": "forum_42",
+        }
+        assert collector.get_statistics()["successful"] == 3
+
+    @patch("openreview.api.OpenReviewClient")
+    def test_index_cached_on_disk(self, mock_client_class, submissions, tmp_path):
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        mock_client.get_all_notes.return_value = submissions[:10]
+
+        paper = create_test_paper(
+            paper_id="p5",
+            title="Submission Number 5",
+            authors=[Author(name="Author 5")],
+            venue="ICLR",
+            year=2024,
+            citation_count=0,
+        )
+
+        first = OpenReviewPDFCollector(index_cache_dir=str(tmp_path))
+        assert first._discover_single(paper).version_info["forum_id"] == "forum_5"
+        assert (tmp_path / "openreview_ICLR_2024.json").exists()
+
+        # A new collector loads the index from disk instead of the API
+        second = OpenReviewPDFCollector(index_cache_dir=str(tmp_path))
+        assert second._discover_single(paper).version_info["forum_id"] == "forum_5"
+        assert mock_client.get_all_notes.call_count == 1
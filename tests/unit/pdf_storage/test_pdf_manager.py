@@ -210,5 +210,107 @@ class TestPDFManager(unittest.TestCase):
         self.assertTrue(stats["drive_connected"])
 
 
+class TestPDFManagerLRUCache(unittest.TestCase):
+    """Test LRU eviction, pinning and watermarks of the local cache."""
+
+    def setUp(self):
+        self.mock_drive_store = Mock()
+        self.mock_drive_store.upload_pdf.side_effect = lambda paper_id, *_: paper_id
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(self.source_dir, ignore_errors=True)
+
+    def create_manager(self, max_bytes, **kwargs):
+        return PDFManager(
+            self.mock_drive_store,
+            cache_dir=str(self.temp_dir),
+            max_cache_size_gb=max_bytes / 1024**3,
+            **kwargs,
+        )
+
+    def store(self, manager, paper_id, size=100):
+        pdf_path = self.source_dir / f"{paper_id}.pdf"
+        pdf_path.write_bytes(b"x" * size)
+        self.assertTrue(manager.store_pdf(paper_id, pdf_path))
+
+    def cached_ids(self, manager):
+        return {p.stem for p in manager.cache_manager.list_cached_files()}
+
+    def test_evicts_least_recently_used(self):
+        manager = self.create_manager(300)
+        for paper_id in ["a", "b", "c"]:
+            self.store(manager, paper_id)
+
+        # Reading "a" makes "b" the least recently used
+        manager.get_pdf_for_analysis("a")
+        self.store(manager, "d")
+
+        self.assertEqual(self.cached_ids(manager), {"a", "c", "d"})
+        self.assertEqual(manager.cache_index.total_bytes, 300)
+
+    def test_leased_pdf_is_not_evicted(self):
+        manager = self.create_manager(200)
+        self.store(manager, "a")
+        self.store(manager, "b")
+
+        with manager.lease_pdf("a") as path:
+            self.store(manager, "c")
+            self.assertTrue(path.exists())
+            self.assertEqual(self.cached_ids(manager), {"a", "c"})
+
+        self.assertFalse(manager.cache_index.is_pinned("a"))
+
+    def test_watermarks(self):
+        manager = self.create_manager(
+            1000, cache_high_watermark=0.5, cache_low_watermark=0.2
+        )
+        for paper_id in ["a", "b", "c", "d", "e"]:
+            self.store(manager, paper_id)
+        self.assertEqual(len(self.cached_ids(manager)), 5)
+
+        # Crossing the high watermark shrinks the cache to the low watermark
+        self.store(manager, "f")
+        self.assertEqual(self.cached_ids(manager), {"e", "f"})
+
+    def test_index_built_from_existing_cache(self):
+        (self.temp_dir / "old.pdf").write_bytes(b"x" * 100)
+        (self.temp_dir / "new.pdf").write_bytes(b"x" * 100)
+        self.mock_drive_store.upload_pdf.side_effect = None
+        with open(self.temp_dir / "pdf_metadata.json", "w") as f:
+            json.dump(
+                {
+                    "old": {"last_accessed": "2024-01-01T00:00:00"},
+                    "new": {"last_accessed": "2024-06-01T00:00:00"},
+                },
+                f,
+            )
+
+        manager = self.create_manager(200)
+        self.assertEqual(manager.cache_index.total_bytes, 200)
+
+        self.mock_drive_store.upload_pdf.side_effect = lambda paper_id, *_: paper_id
+        self.store(manager, "newest")
+        self.assertEqual(self.cached_ids(manager), {"new", "newest"})
+
+    def test_background_eviction(self):
+        manager = self.create_manager(200, background_eviction=True)
+        try:
+            for paper_id in ["a", "b", "c"]:
+                self.store(manager, paper_id)
+
+            deadline = datetime.now() + timedelta(seconds=5)
+            while len(self.cached_ids(manager)) > 2 and datetime.now() < deadline:
+                manager._eviction_event.wait(0.01)
+            self.assertEqual(self.cached_ids(manager), {"b", "c"})
+        finally:
+            manager.close()
+        self.assertIsNone(manager._eviction_thread)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,204 @@
+"""Unit tests for the streaming collection quality checks."""
+
+import dataclasses
+import json
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from compute_forecast.quality.core.interfaces import QualityConfig
+from compute_forecast.quality.stages.collection import CollectionQualityChecker
+from compute_forecast.quality.stages.collection import loader as loader_module
+from compute_forecast.quality.stages.collection.loader import CollectionDataLoader
+from compute_forecast.quality.stages.collection.validators import (
+    AccuracyValidator,
+    CompletenessValidator,
+    ConsistencyValidator,
+    CoverageValidator,
+)
+
+
+def make_papers(prefix, count):
+    papers = []
+    for i in range(count):
+        paper = {
+            "id": f"{prefix}{i}",
+            "title": f"Paper {i % 7}",
+            "authors": [{"name": "Jane Doe"}] if i % 5 else [{"name": ""}],
+            "venue": ["ICML", "icml", "NeurIPS"][i % 3],
+            "year": [2020, 2023, "20x1", 1900][i % 4],
+            "collection_source": ["a", "b"][i % 2],
+        }
+        if i % 2:
+            paper["abstract"] = "Abstract"
+            paper["pdf_url"] = "https://example.org/paper.pdf" if i % 3 else "nope"
+        if i % 4 == 1:
+            paper["doi"] = "10.1234/abc" if i % 8 == 1 else "doi"
+        papers.append(paper)
+    return papers
+
+
+def comparable_result(result):
+    return (
+        result.check_name,
+        result.passed,
+        result.score,
+        [
+            (issue.level, issue.field, issue.message, issue.details)
+            for issue in result.issues
+        ],
+    )
+
+
+def comparable_report(report):
+    results = []
+    for result in report.check_results:
+        metrics = dict(result.metrics)
+        if "collection_metrics" in metrics:
+            metrics["collection_metrics"] = dataclasses.replace(
+                metrics["collection_metrics"], quality_check_timestamp=None
+            )
+        results.append((comparable_result(result), metrics))
+    return report.overall_score, results
+
+
+def write_collection(tmp_path, sizes):
+    data_dir = tmp_path / "collection"
+    data_dir.mkdir()
+    for index, size in enumerate(sizes):
+        papers = make_papers(f"f{index}-", size)
+        # Exercise the list and wrapped file formats
+        data = papers if index % 2 else {"papers": papers}
+        (data_dir / f"papers_{index}.json").write_text(json.dumps(data))
+    return data_dir
+
+
+class TestIncrementalValidators:
+    @pytest.mark.parametrize(
+        "validator_class",
+        [
+            CompletenessValidator,
+            ConsistencyValidator,
+            AccuracyValidator,
+            CoverageValidator,
+        ],
+    )
+    @pytest.mark.parametrize("batch_size", [1, 4, 29])
+    def test_batches_match_single_pass(self, validator_class, batch_size):
+        papers = make_papers("p", 60)
+        config = QualityConfig(stage="collection")
+        validator = validator_class()
+
+        accumulator = validator.create_accumulator(config)
+        for start in range(0, len(papers), batch_size):
+            accumulator.add(papers[start : start + batch_size])
+
+        assert comparable_result(accumulator.result()) == comparable_result(
+            validator.validate(papers, config)
+        )
+
+    def test_duplicate_examples_keep_global_indices(self):
+        papers = make_papers("p", 10)
+        accumulator = ConsistencyValidator().create_accumulator(
+            QualityConfig(stage="collection")
+        )
+        accumulator.add(papers[:7])
+        accumulator.add(papers[7:])
+
+        issues = accumulator.result().issues
+        summary = next(i for i in issues if i.field == "duplicate_summary")
+        examples = [i for i in issues if i.field == "duplicates"]
+        assert summary.details["total_duplicates"] == 3
+        assert [e.details["paper_1"]["index"] for e in examples] == [7, 8, 9]
+        assert [e.details["paper_2"]["index"] for e in examples] == [0, 1, 2]
+
+
+class TestCollectionDataLoader:
+    def test_batches_follow_file_order(self, tmp_path):
+        data_dir = write_collection(tmp_path, [5, 0, 12, 3])
+        files = sorted(data_dir.glob("*.json"))
+        expected = [
+            paper["id"]
+            for file_path in files
+            for batch in CollectionDataLoader(max_workers=0).iter_batches([file_path])
+            for paper in batch
+        ]
+
+        for loader in [
+            CollectionDataLoader(max_workers=0, batch_size=4),
+            CollectionDataLoader(max_workers=3, max_in_flight=2, batch_size=4),
+            # Every file is parsed in a worker process
+            CollectionDataLoader(max_workers=2, batch_size=4, large_file_bytes=1),
+        ]:
+            batches = list(loader.iter_batches(files))
+            assert all(1 <= len(batch) <= 4 for batch in batches)
+            assert [paper["id"] for batch in batches for paper in batch] == expected
+            assert loader.source_files == [str(path) for path in files]
+            assert loader.paper_count == 20
+
+    def test_failed_files_are_skipped(self, tmp_path, capsys):
+        data_dir = write_collection(tmp_path, [3, 4])
+        bad_file = data_dir / "broken.json"
+        bad_file.write_text("{not json")
+        files = sorted(data_dir.glob("*.json"))
+
+        loader = CollectionDataLoader(max_workers=2)
+        papers = [paper for batch in loader.iter_batches(files) for paper in batch]
+
+        assert len(papers) == 7
+        assert [path for path, _ in loader.failed_files] == [str(bad_file)]
+        assert "Warning: Could not load" in capsys.readouterr().out
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            list(loader.iter_batches([bad_file], skip_failed=False))
+
+    def test_worker_processes_are_spawned(self, tmp_path):
+        data_dir = write_collection(tmp_path, [3, 4])
+        files = sorted(data_dir.glob("*.json"))
+        loader = CollectionDataLoader(max_workers=2, large_file_bytes=1)
+
+        with patch.object(
+            loader_module, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool_class:
+            papers = [paper for batch in loader.iter_batches(files) for paper in batch]
+
+        # Forking while the loader's threads run could deadlock the workers
+        assert len(papers) == 7
+        assert pool_class.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+
+class TestStreamingCheck:
+    @pytest.mark.parametrize(
+        "custom_params",
+        [
+            {"max_workers": 0, "batch_size": 7},
+            {"max_workers": 2, "max_in_flight": 1, "batch_size": 1000},
+        ],
+    )
+    def test_matches_loaded_data_check(self, tmp_path, custom_params):
+        data_dir = write_collection(tmp_path, [9, 14, 0, 30])
+        checker = CollectionQualityChecker()
+
+        for skip_checks in ([], ["coverage"], ["completeness", "accuracy"]):
+            config = QualityConfig(
+                stage="collection",
+                skip_checks=skip_checks,
+                custom_params=custom_params,
+            )
+            streamed = checker.check(data_dir, config)
+            loaded = checker._check_loaded(data_dir, config)
+
+            assert len(streamed.check_results) == 4 - len(skip_checks)
+            assert comparable_report(streamed) == comparable_report(loaded)
+
+        metrics = streamed.check_results[0].metrics["collection_metrics"]
+        assert metrics.total_papers_collected == 53
+
+    def test_directory_without_papers(self, tmp_path):
+        data_dir = write_collection(tmp_path, [0, 0])
+
+        with pytest.raises(ValueError, match="No valid papers found"):
+            CollectionQualityChecker().check(
+                data_dir, QualityConfig(stage="collection")
+            )
@@ -285,6 +285,71 @@ class TestMetricsCollector:
         assert collector.collection_stats["metrics_collected"] > 0
         assert len(collector.metrics_buffer.metrics) > 0
 
+    def test_slow_source_does_not_delay_snapshot(self):
+        """Test snapshots are assembled from cached samples while running"""
+        collector = MetricsCollector(collection_interval_seconds=0.1)
+
+        state_manager = Mock()
+        state_manager.get_statistics.return_value = {"checkpoints_created": 3}
+
+        collector.start_collection(None, state_manager, {}, {})
+        try:
+            # Wait for the first state sample
+            deadline = time.time() + 5
+            while "state" not in collector._source_cache and time.time() < deadline:
+                time.sleep(0.01)
+
+            def slow_statistics():
+                time.sleep(3)
+                return {"checkpoints_created": 4}
+
+            state_manager.get_statistics.side_effect = slow_statistics
+            collector.notify_checkpoint_written()
+
+            start_time = time.time()
+            metrics = collector.collect_metrics()
+            assert time.time() - start_time < 1.0
+            assert metrics.state_metrics.checkpoints_created == 3
+        finally:
+            collector.stop_collection()
+
+    def test_event_driven_source_resampled_on_notify(self):
+        """Test state metrics are resampled when a checkpoint is written"""
+        collector = MetricsCollector(collection_interval_seconds=0.1)
+
+        state_manager = Mock()
+        state_manager.get_statistics.return_value = {"checkpoints_created": 1}
+
+        collector.start_collection(None, state_manager, {}, {})
+        try:
+            deadline = time.time() + 5
+            while "state" not in collector._source_cache and time.time() < deadline:
+                time.sleep(0.01)
+            assert state_manager.get_statistics.call_count == 1
+
+            state_manager.get_statistics.return_value = {"checkpoints_created": 2}
+            collector.notify_checkpoint_written()
+
+            deadline = time.time() + 5
+            while (
+                collector._source_cache["state"].checkpoints_created != 2
+                and time.time() < deadline
+            ):
+                time.sleep(0.01)
+
+            assert collector._source_cache["state"].checkpoints_created == 2
+            assert state_manager.get_statistics.call_count == 2
+            # Snapshots are assembled from the resampled value
+            metrics = collector.collect_metrics()
+            assert metrics.state_metrics.checkpoints_created == 2
+            assert state_manager.get_statistics.call_count == 2
+            sampler_threads = list(collector._sampler_threads.values())
+        finally:
+            collector.stop_collection()
+
+        assert sampler_threads
+        assert not any(thread.is_alive() for thread in sampler_threads)
+
     def _create_test_metrics(
         self, papers_collected: int, papers_per_minute: float
     ) -> SystemMetrics:
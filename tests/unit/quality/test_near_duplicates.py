@@ -0,0 +1,143 @@
+"""Unit tests for near-duplicate detection in collection quality checks."""
+
+import pytest
+
+from compute_forecast.quality.core.interfaces import QualityConfig
+from compute_forecast.quality.stages.collection.near_duplicates import (
+    NearDuplicateDetector,
+    first_author_key,
+    normalize_title,
+)
+from compute_forecast.quality.stages.collection.validators import (
+    ConsistencyValidator,
+)
+
+TITLE = "Scaling Diffusion Models to Web-Scale Image Classification"
+
+
+def make_paper(title, author="Jane Doe", year=2023, venue="ICML"):
+    return {
+        "title": title,
+        "authors": [{"name": author}, {"name": "John Roe"}],
+        "year": year,
+        "venue": venue,
+    }
+
+
+class TestNormalization:
+    def test_normalize_title(self):
+        assert normalize_title("Écoles: A Study (Extended Abstract)") == (
+            "ecoles a study"
+        )
+        assert normalize_title("BERT [arXiv v2]") == "bert"
+        assert normalize_title("Graph-Nets, Revisited!") == "graph nets revisited"
+        assert normalize_title("") == ""
+
+    def test_first_author_key(self):
+        assert first_author_key(make_paper(TITLE, "Jane Q. Doe")) == "doe"
+        assert first_author_key(make_paper(TITLE, "Doe, Jane")) == "doe"
+        assert first_author_key({"authors": ["J. Doe"]}) == "doe"
+        assert first_author_key({"authors": []}) == ""
+
+
+class TestNearDuplicateDetector:
+    @pytest.mark.parametrize(
+        "variant",
+        [
+            TITLE.upper(),
+            TITLE + " (Extended Abstract)",
+            TITLE.replace("Classification", "Clasification"),
+            TITLE.replace(" to ", ": to "),
+        ],
+    )
+    def test_perturbed_titles_are_clustered(self, variant):
+        detector = NearDuplicateDetector()
+        detector.add(0, make_paper(TITLE), {"id": "a"})
+        detector.add(1, make_paper("Rethinking Fairness for Robotics"), {"id": "b"})
+        pairs = detector.add(2, make_paper(variant, year=2024), {"id": "c"})
+
+        assert [(pair.first, pair.second) for pair in pairs] == [(0, 2)]
+        [cluster] = detector.clusters()
+        assert cluster.indices == [0, 2]
+        assert cluster.papers == [{"id": "a"}, {"id": "c"}]
+        assert cluster.min_similarity >= 0.8
+
+    def test_confidence_from_authors_and_years(self):
+        detector = NearDuplicateDetector()
+        detector.add(0, make_paper(TITLE), {})
+        same_paper = detector.add(1, make_paper(TITLE + "."), {})
+        other_authors = detector.add(
+            2, make_paper(TITLE + "!", author="Ann Smith", year=2019), {}
+        )
+
+        assert same_paper[0].confidence == "high"
+        assert {pair.confidence for pair in other_authors} == {"low"}
+
+        # Low confidence pairs are left out of clusters by default
+        [cluster] = detector.clusters()
+        assert cluster.indices == [0, 1]
+        assert cluster.confidence == "high"
+        assert detector.clusters(min_confidence="low")[0].indices == [0, 1, 2]
+
+        unknown = NearDuplicateDetector()
+        unknown.add(0, make_paper(TITLE), {})
+        assert unknown.add(1, {"title": TITLE + "?"}, {})[0].confidence == "medium"
+
+    def test_threshold(self):
+        title = "Learning Embeddings for Question Answering using Transformers"
+        other = "Learning Embeddings for Machine Translation using Transformers"
+        loose = NearDuplicateDetector(threshold=0.4)
+        strict = NearDuplicateDetector()
+        for detector in (loose, strict):
+            detector.add(0, make_paper(title), {})
+            detector.add(1, make_paper(other), {})
+
+        assert len(loose.clusters()) == 1
+        assert strict.clusters() == []
+        with pytest.raises(ValueError):
+            NearDuplicateDetector(threshold=0)
+
+    def test_signatures_are_deterministic(self):
+        first, second = NearDuplicateDetector(), NearDuplicateDetector()
+        first.add(0, make_paper(TITLE), {})
+        second.add(0, make_paper(TITLE), {})
+        first.add(1, make_paper(TITLE.lower() + " v2"), {})
+        second.add(1, make_paper(TITLE.lower() + " v2"), {})
+
+        assert first.pairs == second.pairs
+
+
+class TestConsistencyNearDuplicates:
+    def papers(self):
+        return [
+            make_paper(TITLE),
+            make_paper(TITLE),
+            make_paper(TITLE + " (Poster)", year=2024),
+            make_paper("Towards Better Optimization in Medical Imaging"),
+        ]
+
+    def test_near_duplicates_are_reported(self):
+        config = QualityConfig(stage="collection")
+        result = ConsistencyValidator().validate(self.papers(), config)
+
+        fields = [issue.field for issue in result.issues]
+        assert fields.count("duplicates") == 1
+        summary = result.issues[fields.index("near_duplicate_summary")]
+        assert summary.details["near_duplicates"] == 1
+        assert summary.details["clusters_by_confidence"] == {"medium": 0, "high": 1}
+        example = result.issues[fields.index("near_duplicates")]
+        assert example.details["indices"] == [0, 2]
+        assert example.details["confidence"] == "high"
+
+    def test_threshold_from_config(self):
+        disabled = QualityConfig(
+            stage="collection", thresholds={"near_duplicate_similarity": 0}
+        )
+        result = ConsistencyValidator().validate(self.papers(), disabled)
+        enabled = ConsistencyValidator().validate(
+            self.papers(), QualityConfig(stage="collection")
+        )
+
+        assert "near_duplicate_summary" not in [i.field for i in result.issues]
+        # The near duplicate counts against the duplicate score
+        assert enabled.score < result.score
@@ -0,0 +1,117 @@
+"""Import-time budget of the cf CLI entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from compute_forecast.pipeline.metadata_collection.sources.scrapers.registry import (
+    ScraperRegistry,
+)
+
+PACKAGE_ROOT = Path(__file__).parent.parent.parent
+
+# Cumulative import time of compute_forecast.cli.main, in microseconds. The
+# entry point itself needs little more than typer; the budget leaves room for
+# slow CI machines while catching eager imports of the pipeline.
+IMPORT_BUDGET_US = 1_500_000
+
+# Modules only the commands themselves need
+DEFERRED_MODULES = [
+    "compute_forecast.cli.commands.collect",
+    "compute_forecast.cli.commands.consolidate_parallel",
+    "compute_forecast.cli.commands.download",
+    "compute_forecast.cli.commands.quality",
+    "compute_forecast.monitoring",
+    "compute_forecast.orchestration",
+    "bs4",
+    "openreview",
+    "pandas",
+    "sklearn",
+]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map module names to cumulative import time from -X importtime output"""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestCLIImportTime:
+    def test_cli_entry_point_import_budget(self):
+        result = run_python(
+            "-X", "importtime", "-c", "import compute_forecast.cli.main"
+        )
+        assert result.returncode == 0, result.stderr
+
+        times = parse_importtime(result.stderr)
+        assert times["compute_forecast.cli.main"] < IMPORT_BUDGET_US
+
+        eager = [module for module in DEFERRED_MODULES if module in times]
+        assert eager == []
+
+    def test_version_does_not_load_commands(self):
+        result = run_python(
+            "-c",
+            "import sys\n"
+            "from compute_forecast.cli.main import main\n"
+            "sys.argv = ['cf', '--version']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])",
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "compute-forecast" in result.stdout
+        assert result.stdout.strip().endswith("[]")
+
+
+class TestLazyScraperRegistry:
+    def test_scrapers_are_imported_on_first_use(self):
+        result = run_python(
+            "-c",
+            "import sys\n"
+            "from compute_forecast.pipeline.metadata_collection.sources.scrapers"
+            ".registry import ScraperRegistry\n"
+            "registry = ScraperRegistry()\n"
+            "print('bs4' in sys.modules, 'CVFScraper' in registry._scrapers)",
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["False", "True"]
+
+    def test_register_entry_point(self):
+        registry = ScraperRegistry()
+        registry.register_scraper(
+            "CustomScraper",
+            ".conference_scrapers.cvf_scraper:CVFScraper",
+        )
+
+        assert "CustomScraper" in registry.get_available_scrapers()
+        assert registry._scrapers["CustomScraper"].__name__ == "CVFScraper"
+
+    def test_unknown_entry_point(self):
+        registry = ScraperRegistry()
+        registry.register_scraper("Broken", "missing_module:Scraper")
+
+        assert registry._scrapers.get("Broken") is None
+        with pytest.raises(KeyError):
+            registry._scrapers["Broken"]
@@ -0,0 +1,187 @@
+"""Tests for the process-wide adaptive rate-limit governor."""
+
+import multiprocessing
+import time
+from email.utils import formatdate
+
+import pytest
+
+from compute_forecast.pipeline.metadata_collection.collectors.rate_limit_manager import (
+    RateLimitManager,
+)
+from compute_forecast.pipeline.metadata_collection.models import APIConfig
+from compute_forecast.pipeline.pdf_acquisition.discovery.utils.rate_limiter import (
+    RateLimiter,
+)
+from compute_forecast.utils.rate_governor import (
+    RateGovernor,
+    get_rate_governor,
+    parse_retry_after,
+)
+
+
+def reserve_slots(state_dir, count, queue):
+    governor = RateGovernor(state_dir=state_dir)
+    governor.register("shared", 20.0)
+    queue.put([governor.reserve("shared") for _ in range(count)])
+
+
+class TestRateGovernor:
+    def test_paces_after_burst(self):
+        governor = RateGovernor()
+        governor.register("api", 10.0, burst=2)
+
+        waits = [governor.reserve("api") for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_acquire_sleeps_for_reservation(self):
+        governor = RateGovernor()
+        governor.register("api", 20.0)
+
+        start = time.monotonic()
+        for _ in range(3):
+            governor.acquire("api")
+
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+    def test_most_conservative_registration_wins(self):
+        governor = RateGovernor()
+        governor.register("openalex", 10.0)
+        governor.register("openalex", 1.0)
+        governor.register("openalex", 5.0)
+
+        metrics = governor.metrics()["openalex"]
+        assert metrics.configured_rate == 1.0
+        assert metrics.current_rate == 1.0
+
+    def test_unregistered_provider(self):
+        governor = RateGovernor()
+
+        with pytest.raises(ValueError):
+            governor.reserve("missing")
+        assert governor.blocked_for("missing") == 0.0
+
+    def test_aimd_adaptation(self):
+        governor = RateGovernor(increase_fraction=0.1)
+        governor.register("api", 10.0)
+
+        governor.record_response("api", 429)
+        # Throttles within one request interval lower the rate once
+        governor.record_response("api", 429)
+        assert governor.metrics()["api"].current_rate == 5.0
+
+        for _ in range(3):
+            governor.record_response("api", 200)
+        assert governor.metrics()["api"].current_rate == pytest.approx(8.0)
+
+        for _ in range(5):
+            governor.record_response("api", 200)
+        metrics = governor.metrics()["api"]
+        assert metrics.current_rate == 10.0
+        assert metrics.throttled == 2
+        assert metrics.successes == 8
+
+    def test_retry_after_pauses_provider(self):
+        governor = RateGovernor()
+        governor.register("api", 100.0)
+
+        governor.record_response("api", 429, {"Retry-After": "0.3"})
+
+        assert governor.blocked_for("api") == pytest.approx(0.3, abs=0.05)
+        assert governor.reserve("api") == pytest.approx(0.3, abs=0.05)
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == (
+            pytest.approx(30, abs=2)
+        )
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_async(self):
+        governor = RateGovernor()
+        governor.register("api", 20.0)
+
+        await governor.acquire_async("api")
+        waited = await governor.acquire_async("api")
+
+        assert waited == pytest.approx(0.05, abs=0.01)
+
+    def test_state_shared_between_processes(self, tmp_path):
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [
+            context.Process(target=reserve_slots, args=(str(tmp_path), 5, queue))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        waits = sorted(queue.get(timeout=60) + queue.get(timeout=60))
+        for worker in workers:
+            worker.join(timeout=60)
+
+        # Ten slots at 20 per second span half a second across both processes
+        assert max(waits) >= 0.35
+
+    def test_metrics_count_waits(self):
+        governor = RateGovernor()
+        governor.register("api", 10.0)
+        governor.reserve("api")
+        governor.reserve("api")
+
+        metrics = governor.metrics()["api"]
+        assert metrics.requests == 2
+        assert metrics.average_wait_seconds == pytest.approx(0.05, abs=0.01)
+
+
+class TestGovernedClients:
+    def test_provider_limiters_share_budget(self):
+        first = RateLimiter.per_second(10.0, provider="core")
+        second = RateLimiter.per_second(10.0, provider="core")
+
+        first.wait()
+        start = time.monotonic()
+        second.wait()
+
+        assert time.monotonic() - start >= 0.08
+
+    def test_rate_limit_manager_honours_retry_after(self):
+        config = APIConfig(
+            requests_per_window=100,
+            base_delay_seconds=0.1,
+            max_delay_seconds=60.0,
+            health_degradation_threshold=0.8,
+            burst_allowance=20,
+        )
+        governor = get_rate_governor()
+        governor.register("openalex", 10.0)
+        manager = RateLimitManager({"openalex": config})
+
+        governor.record_response("openalex", 429, {"Retry-After": "5"})
+
+        assert manager.wait_if_needed("openalex") == pytest.approx(5.0, abs=0.1)
+        # The client takes its own slots, the manager does not take another
+        assert "openalex" not in manager.governed_apis
+        assert governor.metrics()["openalex"].requests == 0
+
+    def test_rate_limit_manager_takes_slots_of_ungoverned_apis(self):
+        config = APIConfig(
+            requests_per_window=30,
+            base_delay_seconds=0.1,
+            max_delay_seconds=60.0,
+            health_degradation_threshold=0.8,
+            burst_allowance=2,
+        )
+        manager = RateLimitManager({"crossref": config})
+
+        waits = [manager.wait_if_needed("crossref") for _ in range(3)]
+
+        assert manager.governed_apis == {"crossref"}
+        assert get_rate_governor().metrics()["crossref"].requests == 3
+        # 30 requests per 5 minutes, after a burst of 2
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(10.0, abs=0.1)
@@ -0,0 +1,217 @@
+"""
+Unit tests for the statistical performance regression harness
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from compute_forecast.testing.integration.pipeline_test_framework import (
+    PipelineConfig,
+    PipelinePhase,
+)
+from compute_forecast.testing.integration.regression_statistics import (
+    bootstrap_change_interval,
+    combine_verdicts,
+    compare_samples,
+    mann_whitney_u,
+)
+from compute_forecast.testing.integration.repeated_runs import RepeatedRunner
+from compute_forecast.testing.integration.test_scenarios.performance_regression import (
+    PerformanceBaseline,
+    PerformanceRegressionTestScenario,
+    measure_pipeline_run,
+)
+
+
+def small_config():
+    return PipelineConfig(
+        test_data_size=20,
+        phases_to_test=[PipelinePhase.EXTRACTION, PipelinePhase.ANALYSIS],
+    )
+
+
+def make_run(scale, rng, phase_scale=None):
+    """Measurement of one run with timings around scale"""
+    execution_time = scale * rng.normal(1.0, 0.03)
+    phase_time = (phase_scale or scale) * rng.normal(0.5, 0.015)
+    return {
+        "success": True,
+        "papers_processed": 1000,
+        "execution_time_seconds": execution_time,
+        "peak_memory_mb": 100 * rng.normal(1.0, 0.01),
+        "throughput_papers_per_second": 1000 / execution_time,
+        "cpu_utilization": 50.0,
+        "memory_efficiency": 10.0,
+        "phases": {
+            "collection": {"duration": phase_time, "peak_memory": 100.0},
+            "analysis": {"duration": 0.1 * rng.normal(1.0, 0.03), "peak_memory": 100.0},
+        },
+    }
+
+
+class TestStatistics:
+    """Test the U test, bootstrap interval and verdicts"""
+
+    def test_mann_whitney_exact(self):
+        """Exact p-values for small samples without ties"""
+        u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        assert u == 0
+        assert p == pytest.approx(2 / 252)
+
+        u, p = mann_whitney_u([1, 5, 3, 8, 2, 9], [4, 6, 7, 10, 11])
+        assert u == 7
+        assert p == pytest.approx(0.17749, abs=1e-4)
+
+    def test_mann_whitney_ties(self):
+        """Normal approximation with tie correction"""
+        u, p = mann_whitney_u([1, 2, 3, 4, 5], [3, 4, 5, 6, 7])
+        assert u == 4.5
+        assert p == pytest.approx(0.11385, abs=1e-4)
+        assert mann_whitney_u([2, 2, 2], [2, 2, 2]) == (4.5, 1.0)
+
+    def test_bootstrap_interval(self):
+        """Interval covers the true relative change"""
+        rng = np.random.default_rng(3)
+        baseline = rng.normal(1.0, 0.05, 15)
+        current = rng.normal(1.2, 0.06, 15)
+
+        low, high = bootstrap_change_interval(baseline, current)
+        assert low < 0.2 < high
+        assert low > 0
+
+    def test_noise_is_not_a_regression(self):
+        """Samples from the same distribution compare as unchanged"""
+        rng = np.random.default_rng(0)
+        verdicts = [
+            compare_samples(
+                "time", rng.normal(1, 0.1, 7), rng.normal(1, 0.1, 7)
+            ).verdict
+            for _ in range(40)
+        ]
+        assert verdicts.count("regression") <= 2
+
+    def test_verdicts(self):
+        rng = np.random.default_rng(1)
+        baseline = rng.normal(1.0, 0.02, 7)
+        slower = rng.normal(1.3, 0.02, 7)
+
+        assert compare_samples("time", baseline, slower).verdict == "regression"
+        assert compare_samples("time", slower, baseline).verdict == "improvement"
+        assert (
+            compare_samples("throughput", baseline, slower, lower_is_better=False)
+        ).verdict == "improvement"
+        # Significant but below the minimum effect
+        slightly_slower = baseline * 1.02
+        assert compare_samples("time", baseline, slightly_slower).verdict == "unchanged"
+        assert compare_samples("time", [1.0, 1.1], slower).verdict == "inconclusive"
+
+        assert combine_verdicts(["unchanged", "improvement", "regression"]) == (
+            "regression"
+        )
+        assert combine_verdicts([]) is None
+
+
+class TestRepeatedRunner:
+    """Test repeated pipeline measurements"""
+
+    def test_in_process_runs(self):
+        runner = RepeatedRunner(repetitions=3, warmup=1, isolate=False)
+        runs = runner.run(measure_pipeline_run, small_config())
+
+        assert len(runs) == 3
+        for run in runs:
+            assert run["papers_processed"] == 20
+            assert set(run["phases"]) == {"extraction", "analysis"}
+            assert run["execution_time_seconds"] > 0
+
+    def test_isolated_runs(self):
+        runner = RepeatedRunner(repetitions=2, warmup=0, isolate=True)
+        runs = runner.run(measure_pipeline_run, small_config())
+
+        assert [run["papers_processed"] for run in runs] == [20, 20]
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            RepeatedRunner(repetitions=0)
+        with pytest.raises(ValueError):
+            RepeatedRunner(warmup=-1)
+
+
+class TestRegressionAnalysis:
+    """Test baseline storage and per-phase verdicts"""
+
+    def scenario(self, tmp_path, baseline_runs):
+        baseline_file = tmp_path / "baseline.json"
+        scenario = PerformanceRegressionTestScenario(str(baseline_file))
+        baseline = scenario._measure_current_performance(baseline_runs)
+        scenario._save_baseline(baseline)
+        return PerformanceRegressionTestScenario(str(baseline_file))
+
+    def test_baseline_stores_distributions(self, tmp_path):
+        rng = np.random.default_rng(0)
+        scenario = self.scenario(tmp_path, [make_run(1.0, rng) for _ in range(7)])
+
+        data = json.loads((tmp_path / "baseline.json").read_text())
+        assert data["repetitions"] == 7
+        assert len(data["samples"]["execution_time_seconds"]) == 7
+        assert len(data["phase_samples"]["collection"]["duration"]) == 7
+        assert scenario.baseline.phase_metrics["collection"]["duration"] == (
+            pytest.approx(np.median(data["phase_samples"]["collection"]["duration"]))
+        )
+
+    def test_phase_regression(self, tmp_path):
+        rng = np.random.default_rng(0)
+        scenario = self.scenario(tmp_path, [make_run(1.0, rng) for _ in range(7)])
+        current = scenario._measure_current_performance(
+            [make_run(1.0, rng, phase_scale=1.5) for _ in range(7)]
+        )
+
+        result = scenario._analyze_regression(current, 1.0)
+
+        assert result.phase_verdicts == {
+            "analysis": "unchanged",
+            "collection": "regression",
+        }
+        assert not result.success
+        assert result.critical_issues[0].startswith(
+            "Critical regression in collection_duration: +5"
+        )
+        assert "95% CI" in result.critical_issues[0]
+
+    def test_noise_passes(self, tmp_path):
+        rng = np.random.default_rng(1)
+        scenario = self.scenario(tmp_path, [make_run(1.0, rng) for _ in range(7)])
+        current = scenario._measure_current_performance(
+            [make_run(1.0, rng) for _ in range(7)]
+        )
+
+        result = scenario._analyze_regression(current, 1.0)
+
+        assert result.success
+        assert set(result.phase_verdicts.values()) == {"unchanged"}
+
+    def test_single_run_baseline(self, tmp_path):
+        """Baselines without samples are compared by value"""
+        rng = np.random.default_rng(2)
+        baseline = PerformanceRegressionTestScenario(
+            str(tmp_path / "unused.json")
+        )._measure_current_performance([make_run(1.0, rng)])
+        data = baseline.to_dict()
+        for key in ("repetitions", "samples", "phase_samples"):
+            del data[key]
+        (tmp_path / "baseline.json").write_text(json.dumps(data))
+
+        scenario = PerformanceRegressionTestScenario(str(tmp_path / "baseline.json"))
+        assert isinstance(scenario.baseline, PerformanceBaseline)
+        current = scenario._measure_current_performance(
+            [make_run(2.0, rng) for _ in range(5)]
+        )
+
+        result = scenario._analyze_regression(current, 1.0)
+
+        execution_time = result.regression_analysis[0]
+        assert execution_time.is_regression
+        assert execution_time.p_value is None
+        assert result.phase_verdicts["collection"] == "regression"